@@ -0,0 +1,54 @@
+"""Measure the throughput of streaming the ABox and TBox axioms of an Ontology from the owlready2 quadstore.
+
+The axioms of Ontology are read from the quadstore in batches of --batch_size rows while they are consumed. For each
+method the time until the first axiom, the number of axioms per second and the peak Python memory (tracemalloc) are
+reported. With --sync the same is measured for SyncOntology, which maps the axioms that OWLAPI collects.
+
+Example:
+    python axiom_streaming_benchmark.py --path_kb ../KGs/Family/family-benchmark_rich_background.owl --sync
+"""
+import argparse
+import time
+import tracemalloc
+
+from owlapy.owl_ontology import Ontology, SyncOntology
+
+
+def measure(axioms):
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for _ in axioms:
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, first or 0.0, elapsed, peak
+
+
+def run(path_kb: str, batch_size: int, sync: bool):
+    ontologies = {"Ontology": Ontology(path_kb)}
+    if sync:
+        ontologies["SyncOntology"] = SyncOntology(path_kb)
+    print(f"Ontology: {path_kb}, batch size: {batch_size}")
+    print(f"{'backend':>12} | {'axioms':>5} | {'count':>9} | {'first (s)':>9} | {'time (s)':>9} | {'axioms/s':>10} | "
+          f"{'peak memory (MB)':>16}")
+    for name, ontology in ontologies.items():
+        for kind in ("abox", "tbox"):
+            method = getattr(ontology, f"get_{kind}_axioms")
+            axioms = method(batch_size=batch_size) if isinstance(ontology, Ontology) else method()
+            count, first, elapsed, peak = measure(axioms)
+            print(f"{name:>12} | {kind:>5} | {count:>9} | {first:>9.3f} | {elapsed:>9.3f} | "
+                  f"{count / elapsed if elapsed > 0 else 0:>10.0f} | {peak / 2 ** 20:>16.1f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--path_kb', type=str, default="../KGs/Family/family-benchmark_rich_background.owl")
+    parser.add_argument('--batch_size', type=int, default=10_000)
+    parser.add_argument('--sync', action='store_true', help="Also measure SyncOntology (requires a JVM)")
+    args = parser.parse_args()
+    run(args.path_kb, args.batch_size, args.sync)
@@ -0,0 +1,56 @@
+"""Compare adding ABox assertions one after the other with add_axiom against bulk_add_axioms.
+
+The assertions are generated on the fly: every new individual gets a class assertion, an object property assertion to
+another new individual and a data property assertion, using the classes and properties of the ontology.
+
+Example:
+    python bulk_ingest_benchmark.py --path_kb ../KGs/Family/family-benchmark_rich_background.owl \
+        --ontology Ontology --individuals 100000 --chunk_size 100000
+"""
+import argparse
+import time
+
+from owlapy.class_expression import OWLClass
+from owlapy.owl_axiom import OWLClassAssertionAxiom, OWLObjectPropertyAssertionAxiom, OWLDataPropertyAssertionAxiom
+from owlapy.owl_individual import OWLNamedIndividual
+from owlapy.owl_literal import OWLLiteral
+from owlapy.owl_ontology import Ontology, SyncOntology
+from owlapy.owl_property import OWLObjectProperty, OWLDataProperty
+
+
+def assertions(n: int):
+    ns = "http://example.com/bulk#"
+    for i in range(n):
+        ind = OWLNamedIndividual(f"{ns}i{i}")
+        yield OWLClassAssertionAxiom(ind, OWLClass(f"{ns}C{i % 10}"))
+        yield OWLObjectPropertyAssertionAxiom(ind, OWLObjectProperty(f"{ns}r{i % 5}"),
+                                              OWLNamedIndividual(f"{ns}i{i + 1}"))
+        yield OWLDataPropertyAssertionAxiom(ind, OWLDataProperty(f"{ns}d{i % 5}"), OWLLiteral(i))
+
+
+def load(ontology: str, path: str):
+    return Ontology(path) if ontology == "Ontology" else SyncOntology(path)
+
+
+def run(path: str, ontology: str, individuals: int, chunk_size: int, skip_add_axiom: bool):
+    print(f"{ontology}, {3 * individuals} assertions")
+    if not skip_add_axiom:
+        onto = load(ontology, path)
+        start = time.perf_counter()
+        onto.add_axiom(assertions(individuals))
+        elapsed = time.perf_counter() - start
+        print(f"add_axiom:       {elapsed:>9.2f} s ({3 * individuals / elapsed:>10.0f} axioms/s)")
+    onto = load(ontology, path)
+    stats = onto.bulk_add_axioms(assertions(individuals), chunk_size=chunk_size, show_progress=True)
+    print(f"bulk_add_axioms: {stats.seconds:>9.2f} s ({stats.axioms_per_second:>10.0f} axioms/s)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--path_kb', type=str, default="../KGs/Family/family-benchmark_rich_background.owl")
+    parser.add_argument('--ontology', type=str, default="Ontology", choices=["Ontology", "SyncOntology"])
+    parser.add_argument('--individuals', type=int, default=100_000, help='Number of new individuals.')
+    parser.add_argument('--chunk_size', type=int, default=100_000)
+    parser.add_argument('--skip_add_axiom', action='store_true', help='Only measure bulk_add_axioms.')
+    args = parser.parse_args()
+    run(args.path_kb, args.ontology, args.individuals, args.chunk_size, args.skip_add_axiom)
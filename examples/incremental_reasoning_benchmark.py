@@ -0,0 +1,75 @@
+"""Compare rebuilding a SyncReasoner after every ABox update with flushing an incremental reasoner.
+
+Every round adds a batch of new individuals with class and object property assertions to the ontology and then
+retrieves the instances of a class, once with a SyncReasoner created from scratch and once with a single reasoner
+created with incremental=True that is flushed after the update.
+
+Example:
+    python incremental_reasoning_benchmark.py --path_kb ../KGs/Family/family-benchmark_rich_background.owl \
+        --reasoner Pellet --rounds 10 --batch_size 100
+"""
+import argparse
+import time
+
+from owlapy.class_expression import OWLClass
+from owlapy.owl_axiom import OWLClassAssertionAxiom, OWLObjectPropertyAssertionAxiom
+from owlapy.owl_individual import OWLNamedIndividual
+from owlapy.owl_ontology import SyncOntology
+from owlapy.owl_reasoner import SyncReasoner
+
+
+def abox_update(ontology: SyncOntology, round_: int, batch_size: int):
+    classes = sorted(ontology.classes_in_signature())
+    properties = sorted(ontology.object_properties_in_signature())
+    individuals = sorted(ontology.individuals_in_signature())
+    axioms = []
+    for i in range(batch_size):
+        ind = OWLNamedIndividual(f"http://example.com/incremental#r{round_}_i{i}")
+        axioms.append(OWLClassAssertionAxiom(ind, classes[(round_ + i) % len(classes)]))
+        if properties and individuals:
+            axioms.append(OWLObjectPropertyAssertionAxiom(ind, properties[i % len(properties)],
+                                                          individuals[(round_ * batch_size + i) % len(individuals)]))
+    return axioms
+
+
+def run(path: str, reasoner: str, rounds: int, batch_size: int, query: OWLClass = None):
+    rebuild_ontology, incremental_ontology = SyncOntology(path), SyncOntology(path)
+    if query is None:
+        query = sorted(rebuild_ontology.classes_in_signature())[0]
+    incremental_reasoner = SyncReasoner(incremental_ontology, reasoner=reasoner, incremental=True)
+    incremental_reasoner.instances(query)
+
+    rebuild_times, incremental_times = [], []
+    for round_ in range(rounds):
+        axioms = abox_update(rebuild_ontology, round_, batch_size)
+
+        rebuild_ontology.add_axiom(axioms)
+        start = time.perf_counter()
+        expected = SyncReasoner(rebuild_ontology, reasoner=reasoner).instances(query)
+        rebuild_times.append(time.perf_counter() - start)
+
+        incremental_ontology.add_axiom(axioms)
+        start = time.perf_counter()
+        incremental_reasoner.flush()
+        actual = incremental_reasoner.instances(query)
+        incremental_times.append(time.perf_counter() - start)
+        assert actual == expected, f"Results differ in round {round_}"
+
+    print(f"Reasoner: {reasoner}, rounds: {rounds}, new individuals per round: {batch_size}")
+    print(f"{'round':>5} | {'rebuild (s)':>11} | {'incremental (s)':>15}")
+    for round_, (r, i) in enumerate(zip(rebuild_times, incremental_times)):
+        print(f"{round_:>5} | {r:>11.4f} | {i:>15.4f}")
+    print(f"{'total':>5} | {sum(rebuild_times):>11.4f} | {sum(incremental_times):>15.4f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--path_kb', type=str, default="../KGs/Family/family-benchmark_rich_background.owl")
+    parser.add_argument('--reasoner', type=str, default="Pellet",
+                        choices=["HermiT", "Pellet", "Openllet", "JFact", "ELK", "Structural"])
+    parser.add_argument('--rounds', type=int, default=10, help='Number of ABox updates.')
+    parser.add_argument('--batch_size', type=int, default=100, help='Number of new individuals per update.')
+    parser.add_argument('--query', type=str, default=None, help='IRI of the class whose instances are retrieved.')
+    args = parser.parse_args()
+    run(args.path_kb, args.reasoner, args.rounds, args.batch_size,
+        OWLClass(args.query) if args.query is not None else None)
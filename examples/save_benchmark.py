@@ -0,0 +1,53 @@
+"""Compare saving a SyncOntology to N-Triples/N-Quads through rdflib with writing the triples directly from the axioms.
+
+The rdflib path saves the ontology to a temporary RDF/XML file through OWLAPI, parses that file into an rdflib graph
+and serialises the graph again. The direct path maps one axiom after the other and writes its triples right away.
+Both files are written to --out_dir, the time and the peak Python memory (tracemalloc) of each path are reported.
+
+Example:
+    python save_benchmark.py --path_kb ../KGs/Family/family-benchmark_rich_background.owl --format nt --repeats 3
+"""
+import argparse
+import os
+import time
+import tracemalloc
+
+from owlapy.owl_ontology import SyncOntology, _RDFLIB_FORMATS, _STREAM_FORMATS
+
+
+def measure(save, path: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    save(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, os.path.getsize(path)
+
+
+def run(path_kb: str, document_format: str, out_dir: str, repeats: int):
+    rdflib_format = _RDFLIB_FORMATS[document_format]
+    stream_format = _STREAM_FORMATS[rdflib_format]
+    ontology = SyncOntology(path_kb)
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {"rdflib": os.path.join(out_dir, f"rdflib.{stream_format}"),
+             "direct": os.path.join(out_dir, f"direct.{stream_format}")}
+    saves = {"rdflib": lambda p: ontology._save_via_rdflib(p, rdflib_format),
+             "direct": lambda p: ontology._save_via_stream_writer(p, stream_format)}
+
+    print(f"Ontology: {path_kb}, axioms: {ontology.owlapi_ontology.getAxiomCount()}, format: {rdflib_format}")
+    print(f"{'path':>6} | {'run':>3} | {'time (s)':>9} | {'peak memory (MB)':>16} | {'file (MB)':>9}")
+    for run_ in range(repeats):
+        for name in ("rdflib", "direct"):
+            elapsed, peak, size = measure(saves[name], paths[name])
+            print(f"{name:>6} | {run_:>3} | {elapsed:>9.3f} | {peak / 2 ** 20:>16.1f} | {size / 2 ** 20:>9.1f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--path_kb', type=str, default="../KGs/Family/family-benchmark_rich_background.owl")
+    parser.add_argument('--format', type=str, default="nt", choices=["nt", "ntriples", "nt11", "nq", "nquads"])
+    parser.add_argument('--out_dir', type=str, default="save_benchmark")
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+    run(args.path_kb, args.format, args.out_dir, args.repeats)
@@ -0,0 +1,95 @@
+"""Compare StructuralReasoner on the owlready2 quadstore (Ontology) with the NumPy triple store (TripleStoreOntology).
+
+The ontology is loaded into both backends from the same N-Triples file (other formats are converted with rdflib first,
+or a synthetic ABox is generated with --synthetic_individuals). The triple store is also saved to --store_dir and
+memory-mapped from there. For each backend the load time and the time to retrieve the instances of all named classes
+and of an existential restriction over every object property and class is reported, with cold reasoner caches, and
+the retrieved instances are checked to be equal.
+
+Example:
+    python triple_store_benchmark.py --path_kb ../KGs/Family/family-benchmark_rich_background.owl
+    python triple_store_benchmark.py --synthetic_individuals 100000
+"""
+import argparse
+import os
+import random
+import time
+
+import rdflib
+
+from owlapy.class_expression import OWLObjectSomeValuesFrom
+from owlapy.owl_ontology import Ontology, TripleStoreOntology
+from owlapy.owl_reasoner import StructuralReasoner
+
+
+def generate(path: str, n_individuals: int, n_classes: int = 20, n_properties: int = 5, seed: int = 1):
+    """Write a synthetic ontology with a class tree, object property and data property assertions."""
+    rnd = random.Random(seed)
+    ns = "http://example.com/synthetic#"
+    rdf_type = f"<{rdflib.RDF.type}>"
+    with open(path, "w", encoding="utf-8") as f:
+        for c in range(n_classes):
+            f.write(f"<{ns}C{c}> {rdf_type} <{rdflib.OWL.Class}> .\n")
+            if c > 0:
+                f.write(f"<{ns}C{c}> <{rdflib.RDFS.subClassOf}> <{ns}C{(c - 1) // 2}> .\n")
+        for p in range(n_properties):
+            f.write(f"<{ns}p{p}> {rdf_type} <{rdflib.OWL.ObjectProperty}> .\n")
+        f.write(f"<{ns}age> {rdf_type} <{rdflib.OWL.DatatypeProperty}> .\n")
+        for i in range(n_individuals):
+            f.write(f"<{ns}i{i}> {rdf_type} <{rdflib.OWL.NamedIndividual}> .\n")
+            f.write(f"<{ns}i{i}> {rdf_type} <{ns}C{rnd.randrange(n_classes)}> .\n")
+            for _ in range(2):
+                f.write(f"<{ns}i{i}> <{ns}p{rnd.randrange(n_properties)}> <{ns}i{rnd.randrange(n_individuals)}> .\n")
+            f.write(f'<{ns}i{i}> <{ns}age> "{rnd.randrange(100)}"^^<{rdflib.XSD.integer}> .\n')
+
+
+def retrieve(ontology) -> tuple:
+    reasoner = StructuralReasoner(ontology)
+    classes = list(ontology.classes_in_signature())
+    ces = classes + [OWLObjectSomeValuesFrom(p, c) for p in ontology.object_properties_in_signature()
+                     for c in classes]
+    start = time.perf_counter()
+    instances = {ce: frozenset(reasoner.instances(ce)) for ce in ces}
+    return time.perf_counter() - start, instances
+
+
+def timed(f):
+    start = time.perf_counter()
+    ret = f()
+    return time.perf_counter() - start, ret
+
+
+def run(path_kb: str, store_dir: str, synthetic_individuals: int):
+    os.makedirs(store_dir, exist_ok=True)
+    if synthetic_individuals:
+        path_kb = os.path.join(store_dir, "synthetic.nt")
+        generate(path_kb, synthetic_individuals)
+    elif os.path.splitext(path_kb)[1].lower() not in (".nt", ".ntriples"):
+        path_nt = os.path.join(store_dir, "ontology.nt")
+        rdflib.Graph().parse(path_kb).serialize(path_nt, format="nt", encoding="utf-8")
+        path_kb = path_nt
+
+    results = dict()
+    load, ontology = timed(lambda: Ontology(path_kb))
+    results["owlready2"] = (load, *retrieve(ontology))
+    load, ontology = timed(lambda: TripleStoreOntology(path_kb))
+    results["triple store"] = (load, *retrieve(ontology))
+    ontology.save(os.path.join(store_dir, "store"))
+    load, ontology = timed(lambda: TripleStoreOntology(os.path.join(store_dir, "store")))
+    results["mmap store"] = (load, *retrieve(ontology))
+
+    print(f"Ontology: {path_kb}, triples: {len(ontology)}, class expressions: {len(results['owlready2'][2])}")
+    print(f"{'backend':>12} | {'load (s)':>9} | {'retrieval (s)':>13} | same instances")
+    for name, (load, retrieval, instances) in results.items():
+        same = instances == results["owlready2"][2]
+        print(f"{name:>12} | {load:>9.3f} | {retrieval:>13.3f} | {same}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--path_kb', type=str, default="../KGs/Family/family-benchmark_rich_background.owl")
+    parser.add_argument('--store_dir', type=str, default="triple_store_benchmark")
+    parser.add_argument('--synthetic_individuals', type=int, default=0,
+                        help="Generate a synthetic ABox with this many individuals instead of loading --path_kb")
+    args = parser.parse_args()
+    run(args.path_kb, args.store_dir, args.synthetic_individuals)
@@ -1,7 +1,7 @@
 """OWL Reasoner"""
 from abc import ABCMeta, abstractmethod
 from inspect import signature
-from typing import Iterable
+from typing import Iterable, List, FrozenSet, Tuple, Optional
 import logging
 
 from owlapy.class_expression import OWLClassExpression
@@ -12,6 +12,7 @@ from owlapy.abstracts.abstract_owl_ontology import AbstractOWLOntology
 from owlapy.owl_property import OWLObjectPropertyExpression, OWLDataProperty, OWLObjectProperty
 from owlapy.owl_individual import OWLNamedIndividual
 from owlapy.owl_literal import OWLLiteral
+from owlapy.utils import TimeoutResult
 
 logger = logging.getLogger(__name__)
 
@@ -393,6 +394,58 @@ class AbstractOWLReasoner(metaclass=ABCMeta):
             if not direct:
                 logger.warning("indirect not implemented")
 
+    # default
+    def instances_batch(self, ces: Iterable[OWLClassExpression], direct: bool = False, timeout: int = 1000) \
+            -> List[FrozenSet[OWLNamedIndividual]]:
+        """Gets the individuals which are instances of each of the specified class expressions.
+
+        Args:
+            ces: The class expressions whose instances are to be retrieved.
+            direct: Specifies if the direct instances should be retrieved (True), or if all instances should be
+                retrieved (False).
+            timeout: Time limit in seconds until results must be returned, else an empty
+                :class:`owlapy.utils.TimeoutResult` is returned for the expression.
+
+        Returns:
+            The instances of each class expression (see :func:`AbstractOWLReasoner.instances`), in the order of ces.
+        """
+        ret = []
+        for ce in ces:
+            inds = self.instances(ce, direct, timeout)
+            ret.append(inds if isinstance(inds, TimeoutResult) else frozenset(inds))
+        return ret
+
+    # default
+    def count_instances_batch(self, ces: Iterable[OWLClassExpression], direct: bool = False,
+                              timeout: int = 1000) -> List[Optional[int]]:
+        """Gets the number of instances of each of the specified class expressions.
+
+        Args:
+            ces: The class expressions whose instances are to be counted.
+            direct: Specifies if the direct instances should be counted (True), or if all instances should be
+                counted (False).
+            timeout: Time limit in seconds until results must be returned, else None is returned for the expression.
+
+        Returns:
+            The number of instances of each class expression, in the order of ces. None marks an expression whose
+            retrieval timed out, so that it is not mistaken for an expression without instances.
+        """
+        return [None if isinstance(inds, TimeoutResult) else len(inds)
+                for inds in self.instances_batch(ces, direct, timeout)]
+
+    # default
+    def class_hierarchy_down(self) -> Iterable[Tuple[OWLClass, Iterable[OWLClass]]]:
+        """Gets the direct named sub classes of every class in the signature of the root ontology.
+
+        Used to build a :class:`owlapy.owl_hierarchy.ClassHierarchy`. Reasoners that can read all sub class relations
+        at once should override this to avoid one :func:`AbstractOWLReasoner.sub_classes` call per class.
+
+        Returns:
+            Pairs of a class and its direct named sub classes.
+        """
+        for c in set(self.get_root_ontology().classes_in_signature()):
+            yield c, self.sub_classes(c, direct=True)
+
     # default
     def all_data_property_values(self, pe: OWLDataProperty, direct: bool = True, inds=None) -> Iterable[OWLLiteral]:
         """Gets all values for the given data property expression that appear in the knowledge base.
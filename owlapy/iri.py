@@ -73,6 +73,10 @@ class IRI(OWLAnnotationSubject, OWLAnnotationValue, metaclass=_meta_IRI):
     def __repr__(self):
         return f"IRI({repr(self._namespace)}, {repr(self._remainder)})"
 
+    def __reduce__(self):
+        # go through the constructor so that the namespace is interned again, __eq__ relies on it
+        return IRI, (self._namespace, self._remainder, True)
+
     def __eq__(self, other):
         if type(other) is type(self):
             return self._namespace is other._namespace and self._remainder == other._remainder
@@ -1,7 +1,9 @@
 """Classes representing hierarchy in OWL."""
 
 from abc import ABCMeta, abstractmethod
-from typing import Dict, Iterable, Tuple, overload, TypeVar, Generic, Type, cast, Optional, FrozenSet, Set
+from typing import Dict, Iterable, List, Tuple, overload, TypeVar, Generic, Type, cast, Optional, FrozenSet, Set
+
+import numpy as np
 
 from owlapy.class_expression import OWLClass, OWLThing, OWLNothing
 from owlapy.meta_classes import HasIRI
@@ -20,18 +22,18 @@ class AbstractHierarchy(Generic[_S], metaclass=ABCMeta):
         hierarchy_down: A downwards hierarchy given as a mapping of Entities to sub-entities.
         reasoner: Alternatively, a reasoner whose root_ontology is queried for entities.
         """
-    __slots__ = '_Type', '_ent_set', '_parents_map', '_parents_map_trans', '_children_map', '_children_map_trans', \
-                '_leaf_set', '_root_set', \
-        # '_eq_set'
+    __slots__ = '_Type', '_ent_set', '_ents', '_ids', '_parents', '_parents_trans', '_children', '_children_trans', \
+                '_leaf_set', '_root_set'
 
     _ent_set: FrozenSet[_S]
-    _parents_map: Dict[_S, Set[_S]]  # Entity => parent entities
-    _parents_map_trans: Dict[_S, Set[_S]]  # Entity => parent entities
-    _children_map: Dict[_S, Set[_S]]  # Entity => child entities
-    _children_map_trans: Dict[_S, Set[_S]]  # Entity => child entities
-    # _eq_set: Dict[_S, Set[_S]]  # Entity => equivalent entities  # TODO
-    _root_set: Set[_S]  # root entities
-    _leaf_set: Set[_S]  # leaf entities
+    _ents: Tuple[_S, ...]  # id => entity
+    _ids: Dict[_S, int]  # entity => id
+    _parents: '_IdRelation'  # id => ids of parent entities
+    _parents_trans: '_IdRelation'  # id => ids of parent entities
+    _children: '_IdRelation'  # id => ids of child entities
+    _children_trans: '_IdRelation'  # id => ids of child entities
+    _root_set: FrozenSet[_S]  # root entities
+    _leaf_set: FrozenSet[_S]  # leaf entities
 
     @overload
     def __init__(self, factory: Type[_S], hierarchy_down: Iterable[Tuple[_S, Iterable[_S]]]):
@@ -104,42 +106,43 @@ class AbstractHierarchy(Generic[_S], metaclass=ABCMeta):
         return type(self).restrict(self, remove=remove, allow=allow)
 
     def _init(self, hierarchy_down: Iterable[Tuple[_S, Iterable[_S]]]) -> None:
-        self._parents_map_trans = dict()
-        self._children_map_trans = dict()
-        # self._eq_set = dict()
-
         ent_to_sub_entities = dict(hierarchy_down)
         self._ent_set = frozenset(ent_to_sub_entities.keys())
-
-        for ent, sub_it in ent_to_sub_entities.items():
-            self._children_map_trans[ent] = set(sub_it)
-            self._parents_map_trans[ent] = set()  # create empty parent entry for all classes
-
+        self._ents = tuple(ent_to_sub_entities.keys())
+        self._ids = {ent: i for i, ent in enumerate(self._ents)}
+        ids = self._ids
+        direct = [np.unique(np.fromiter((ids[sub] for sub in sub_it), dtype=np.int32))
+                  for sub_it in ent_to_sub_entities.values()]
         del ent_to_sub_entities  # exhausted
 
-        # calculate transitive children
-        for ent in self._children_map_trans:
-            _children_transitive(self._children_map_trans, ent=ent, seen_set=set())
-
-        # TODO handling of eq_sets
-        # sccs = list(_strongly_connected_components(self._children_map_trans))
-        # for scc in sccs:
-        #     sub_entities = 0
-        #     for ent_enc in iter_bits(scc):
-        #         self._eq_set[ent_enc] = scc
-        #         sub_entities |= self._children_map_trans[ent_enc]
-        #         del self._children_map_trans[ent_enc]
-        #         del self._parents_map_trans[ent_enc]
-        #     self._children_map_trans[scc] = sub_entities
-        #     self._parents_map_trans[scc] = 0
-
-        # fill transitive parents
-        for ent, sub_entities in self._children_map_trans.items():
-            for sub in sub_entities:
-                self._parents_map_trans[sub] |= {ent}
-
-        self._children_map, self._leaf_set = _reduce_transitive(self._children_map_trans, self._parents_map_trans)
-        self._parents_map, self._root_set = _reduce_transitive(self._parents_map_trans, self._children_map_trans)
+        n = len(self._ents)
+        children_trans, cyclic = _transitive_closure(direct)
+        self._children_trans = _IdRelation.from_rows(children_trans)
+        self._parents_trans = self._children_trans.transpose(n)
+
+        # Without cycles the direct children are the given sub entities that are not reachable through another one
+        children = []
+        for i, sub in enumerate(direct):
+            if cyclic[i] or cyclic[children_trans[i]].any():
+                children.append(_reduce_row(children_trans[i], self._children_trans))
+            else:
+                reachable = [children_trans[j] for j in sub.tolist()]
+                children.append(np.setdiff1d(sub, np.concatenate(reachable), assume_unique=True) if reachable else sub)
+        self._children = _IdRelation.from_rows(children)
+        parents = self._children.transpose(n)
+        parents_rows = [parents.row(i) for i in range(n)]
+        for i in range(n):
+            if cyclic[i] or cyclic[self._parents_trans.row(i)].any():
+                parents_rows[i] = _reduce_row(self._parents_trans.row(i), self._parents_trans)
+        self._parents = _IdRelation.from_rows(parents_rows)
+
+        ents = self._ents
+        self._leaf_set = frozenset(ents[i] for i in np.flatnonzero(self._children.sizes() == 0))
+        self._root_set = frozenset(ents[i] for i in np.flatnonzero(self._parents.sizes() == 0))
+
+    def _entities(self, relation: '_IdRelation', entity: _S) -> Iterable[_S]:
+        ents = self._ents
+        return (ents[i] for i in relation.row(self._ids[entity]).tolist())
 
     def parents(self, entity: _S, direct: bool = True) -> Iterable[_S]:
         """Parents of an entity.
@@ -161,9 +164,9 @@ class AbstractHierarchy(Generic[_S], metaclass=ABCMeta):
             yield from {}
         else:
             if not direct:
-                yield from self._parents_map_trans[entity]
+                yield from self._entities(self._parents_trans, entity)
             else:
-                yield from self._parents_map[entity]
+                yield from self._entities(self._parents, entity)
 
     def is_parent_of(self, a: _S, b: _S) -> bool:
         """if A is a parent of B.
@@ -174,9 +177,8 @@ class AbstractHierarchy(Generic[_S], metaclass=ABCMeta):
             return True
         if a == type(self).get_top_entity():
             return True
-        if {a} & self._parents_map_trans[b]:
-            return True
-        return False
+        a_id = self._ids.get(a)
+        return a_id is not None and self._parents_trans.contains(self._ids[b], a_id)
 
     def is_child_of(self, a: _S, b: _S) -> bool:
         """If A is a child of B.
@@ -187,9 +189,8 @@ class AbstractHierarchy(Generic[_S], metaclass=ABCMeta):
             return True
         if a == type(self).get_bottom_entity():
             return True
-        if {a} & self._children_map_trans[b]:
-            return True
-        return False
+        a_id = self._ids.get(a)
+        return a_id is not None and self._children_trans.contains(self._ids[b], a_id)
 
     def children(self, entity: _S, direct: bool = True) -> Iterable[_S]:
         """Children of an entity.
@@ -211,9 +212,9 @@ class AbstractHierarchy(Generic[_S], metaclass=ABCMeta):
             yield from {}
         else:
             if not direct:
-                yield from self._children_map_trans[entity]
+                yield from self._entities(self._children_trans, entity)
             else:
-                yield from self._children_map[entity]
+                yield from self._entities(self._children, entity)
 
     def siblings(self, entity: _S) -> Iterable[_S]:
         seen_set = {entity}
@@ -228,13 +229,13 @@ class AbstractHierarchy(Generic[_S], metaclass=ABCMeta):
 
     def roots(self, of: Optional[_S] = None) -> Iterable[_S]:
         if of is not None and of != type(self).get_bottom_entity():
-            yield from self._root_set & self._parents_map_trans[of]
+            yield from self._root_set.intersection(self._entities(self._parents_trans, of))
         else:
             yield from self._root_set
 
     def leaves(self, of: Optional[_S] = None) -> Iterable[_S]:
         if of is not None and of != type(self).get_top_entity():
-            yield from self._leaf_set & self._children_map_trans[of]
+            yield from self._leaf_set.intersection(self._entities(self._children_trans, of))
         else:
             yield from self._leaf_set
 
@@ -262,10 +263,7 @@ class ClassHierarchy(AbstractHierarchy[OWLClass]):
         return OWLNothing
 
     def _hierarchy_down_generator(self, reasoner: AbstractOWLReasoner) -> Iterable[Tuple[OWLClass, Iterable[OWLClass]]]:
-        clss = set(reasoner.get_root_ontology().classes_in_signature())
-        # clss.add(OWLNothing)
-        yield from ((_, reasoner.sub_classes(_, direct=True))
-                    for _ in clss)
+        yield from reasoner.class_hierarchy_down()
 
     def sub_classes(self, entity: OWLClass, direct: bool = True) -> Iterable[OWLClass]:
         yield from self.children(entity, direct)
@@ -430,3 +428,112 @@ def _reduce_transitive(hier: Dict[_S, Set[_S]], hier_inverse: Dict[_S, Set[_S]])
         if not direct_set:
             leaf_set |= {ent}
     return result_hier, frozenset(leaf_set)
+
+
+class _IdRelation:
+    """Relation between entity ids in compressed sparse row form, the ids related to an id are sorted."""
+    __slots__ = 'indptr', 'indices'
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray):
+        self.indptr = indptr
+        self.indices = indices
+
+    @classmethod
+    def from_rows(cls, rows: List[np.ndarray]) -> '_IdRelation':
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(r) for r in rows], out=indptr[1:])
+        indices = np.concatenate(rows).astype(np.int32, copy=False) if rows else np.empty(0, dtype=np.int32)
+        return cls(indptr, indices)
+
+    def row(self, i: int) -> np.ndarray:
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def sizes(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def contains(self, i: int, j: int) -> bool:
+        r = self.row(i)
+        k = np.searchsorted(r, j)
+        return bool(k < len(r) and r[k] == j)
+
+    def transpose(self, n: int) -> '_IdRelation':
+        rows = np.repeat(np.arange(len(self.indptr) - 1, dtype=np.int32), self.sizes())
+        # stable sort by the related id keeps the ids of each transposed row sorted
+        order = np.argsort(self.indices, kind='stable')
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.indices, minlength=n), out=indptr[1:])
+        return _IdRelation(indptr, rows[order])
+
+
+def _transitive_closure(direct: List[np.ndarray]) -> Tuple[List[np.ndarray], np.ndarray]:
+    """Compute the ids reachable from every id.
+
+    The strongly connected components are found with an iterative version of Tarjan's algorithm, which completes them
+    in reverse topological order so that the reachable ids of a component are the union of those of its successors.
+
+    Args:
+        direct: id => sorted ids of the direct successors.
+
+    Returns:
+        id => sorted reachable ids (including the id itself if it lies on a cycle).
+        Mask of the ids that lie on a cycle.
+    """
+    n = len(direct)
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack: List[int] = []
+    closure: List[Optional[np.ndarray]] = [None] * n
+    cyclic = np.zeros(n, dtype=bool)
+    counter = 0
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            v, k = work[-1]
+            if index[v] == -1:
+                index[v] = low[v] = counter
+                counter += 1
+                stack.append(v)
+                on_stack[v] = True
+            succ = direct[v]
+            if k < len(succ):
+                work[-1] = (v, k + 1)
+                w = int(succ[k])
+                if index[w] == -1:
+                    work.append((w, 0))
+                elif on_stack[w]:
+                    low[v] = min(low[v], index[w])
+                continue
+            work.pop()
+            if work:
+                u = work[-1][0]
+                low[u] = min(low[u], low[v])
+            if low[v] == index[v]:
+                component = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    component.append(w)
+                    if w == v:
+                        break
+                parts = [direct[w] for w in component]
+                parts.extend(closure[c] for w in component for c in direct[w].tolist() if closure[c] is not None)
+                reachable = np.unique(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int32)
+                for w in component:
+                    closure[w] = reachable
+                if len(component) > 1 or (len(reachable) and v in reachable):
+                    cyclic[component] = True
+    return closure, cyclic
+
+
+def _reduce_row(reachable: np.ndarray, trans: _IdRelation) -> np.ndarray:
+    """Ids of reachable that are not reachable from another id of reachable (see :func:`_reduce_transitive`)."""
+    indirect = []
+    for j in reachable.tolist():
+        r = trans.row(j)
+        indirect.append(r[r != j])
+    if not indirect:
+        return reachable
+    return np.setdiff1d(reachable, np.concatenate(indirect), assume_unique=True)
@@ -1,12 +1,19 @@
 """OWL Ontology"""
 from functools import singledispatchmethod, singledispatch
 from itertools import chain, islice, combinations
+import time
 import types
 from types import MappingProxyType
-from typing import Final, cast, Iterable, List, Optional, Tuple, Union, Dict, Any
+from collections import Counter, deque
+from typing import Final, cast, Iterable, List, Mapping, Optional, Tuple, Union, Dict, Any, NamedTuple, FrozenSet, \
+    Deque
 import logging
+import sqlite3
+import re
+from abc import ABCMeta, abstractmethod
 
 import jpype
+import numpy as np
 import owlready2
 import rdflib
 from pandas import Timedelta
@@ -17,7 +24,7 @@ from owlapy.owl_datatype import OWLDatatype
 from owlapy.owl_individual import OWLNamedIndividual, OWLIndividual
 from owlapy.owl_literal import IntegerOWLDatatype, DoubleOWLDatatype, BooleanOWLDatatype, StringOWLDatatype, \
     DateOWLDatatype, DateTimeOWLDatatype, DurationOWLDatatype, OWLLiteral
-from owlapy.owl_object import OWLObject
+from owlapy.owl_object import OWLObject, OWLEntity
 from owlapy.iri import IRI
 from owlapy.class_expression import OWLClass, OWLThing, OWLClassExpression, OWLObjectComplementOf, OWLObjectUnionOf, \
     OWLObjectIntersectionOf, OWLObjectSomeValuesFrom, OWLObjectAllValuesFrom, OWLObjectExactCardinality, \
@@ -29,6 +36,7 @@ from owlapy.owl_property import OWLDataProperty, OWLObjectProperty, OWLPropertyE
     OWLObjectPropertyExpression, OWLDataPropertyExpression, OWLProperty
 from datetime import date, datetime
 from owlready2 import destroy_entity, AllDisjoint, AllDifferent, GeneralClassAxiom
+from owlready2 import base as _o2base
 from owlapy.owl_axiom import OWLObjectPropertyRangeAxiom, OWLAxiom, OWLSubClassOfAxiom, OWLEquivalentClassesAxiom, \
     OWLDisjointUnionAxiom, OWLAnnotationAssertionAxiom, OWLAnnotationProperty, OWLSubPropertyAxiom, \
     OWLPropertyRangeAxiom, OWLClassAssertionAxiom, OWLDeclarationAxiom, OWLObjectPropertyAssertionAxiom, \
@@ -41,6 +49,7 @@ from owlapy.owl_axiom import OWLObjectPropertyRangeAxiom, OWLAxiom, OWLSubClassO
     OWLDifferentIndividualsAxiom, OWLDisjointClassesAxiom, OWLSameIndividualAxiom, OWLClassAxiom, \
     OWLDataPropertyDomainAxiom, OWLDataPropertyRangeAxiom, OWLObjectPropertyDomainAxiom, OWLSubPropertyChainAxiom
 from owlapy.static_funcs import startJVM
+from owlapy.triple_store import TripleStore, decode_literal
 from owlapy.vocab import OWLFacet
 import os
 import json
@@ -104,6 +113,131 @@ _RDFLIB_FORMATS: Final = MappingProxyType({
 # instead of a plain Graph.
 _RDFLIB_CONJUNCTIVE_FORMATS: Final = frozenset({"trix", "nquads"})
 
+# rdflib formats that SyncOntology.save writes directly from the axioms with an RDFStreamWriter
+_STREAM_FORMATS: Final = MappingProxyType({"ntriples": "nt", "nt11": "nt", "nquads": "nq"})
+
+# Number of changes kept in the change log of an Ontology. Consumers that fall further behind have to start over.
+_CHANGE_LOG_MAXLEN: Final = 100_000
+
+# Number of rows fetched at once when Ontology streams axioms from the quadstore
+_QUADSTORE_BATCH_SIZE: Final = 10_000
+# Number of entities a stream of axioms keeps to reuse them in the following axioms
+_STREAM_ENTITY_CACHE_SIZE: Final = 100_000
+
+
+class OntologyChange(NamedTuple):
+    """An axiom that was added to or removed from an ontology, together with the entities it refers to."""
+    axiom: OWLAxiom
+    added: bool
+    entities: FrozenSet[OWLEntity]
+
+
+def _entity_factory(typ: type, maxsize: int = _STREAM_ENTITY_CACHE_SIZE):
+    """Get a function that creates entities of a type from their IRI and reuses the last maxsize of them."""
+    cache = dict()
+
+    def entity(iri: str):
+        e = cache.get(iri)
+        if e is None:
+            if len(cache) >= maxsize:
+                cache.clear()
+            e = cache[iri] = typ(iri)
+        return e
+    return entity
+
+
+class OntologySignature(NamedTuple):
+    """Named entities declared in an ontology at one revision, see :meth:`Ontology.signature`."""
+    revision: int
+    classes: Tuple[OWLClass, ...]
+    object_properties: Tuple[OWLObjectProperty, ...]
+    data_properties: Tuple[OWLDataProperty, ...]
+    individuals: Tuple[OWLNamedIndividual, ...]
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Number of entities of each kind."""
+        return {"classes": len(self.classes), "object_properties": len(self.object_properties),
+                "data_properties": len(self.data_properties), "individuals": len(self.individuals)}
+
+
+class OntologyStatistics(NamedTuple):
+    """Number of triples, axioms and entities of an ontology, see :meth:`Ontology.statistics`.
+
+    Axiom types are named like the OWL API axiom types, e.g. ``"ClassAssertion"`` or ``"SubClassOf"``. Entities are
+    counted under the keys of :attr:`OntologySignature.counts`.
+    """
+    triples: Optional[int]
+    axioms_per_type: Mapping[str, int]
+    entities: Mapping[str, int]
+
+    @property
+    def axioms(self) -> int:
+        """Total number of axioms."""
+        return sum(self.axioms_per_type.values())
+
+
+class IngestStats(NamedTuple):
+    """Number of axioms added by a bulk ingest and the time it took."""
+    axioms: int
+    seconds: float
+
+    @property
+    def axioms_per_second(self) -> float:
+        return self.axioms / self.seconds if self.seconds > 0 else float("inf")
+
+
+def _ingest(axioms: Iterable[OWLAxiom], chunk_size: int, add_chunk, show_progress: bool) -> IngestStats:
+    """Pass the axioms to add_chunk in lists of chunk_size axioms and measure the throughput."""
+    from tqdm import tqdm
+
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    axioms = iter(axioms)
+    count = 0
+    start = time.perf_counter()
+    with tqdm(unit=" axioms", disable=not show_progress) as progress:
+        while chunk := list(islice(axioms, chunk_size)):
+            add_chunk(chunk)
+            count += len(chunk)
+            progress.update(len(chunk))
+    stats = IngestStats(count, time.perf_counter() - start)
+    logger.info("Added %d axioms in %.2f s (%.0f axioms/s)", stats.axioms, stats.seconds, stats.axioms_per_second)
+    return stats
+
+
+_slot_names_cache: Dict[type, Tuple[str, ...]] = dict()
+
+
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    names = _slot_names_cache.get(cls)
+    if names is None:
+        names = []
+        for c in cls.__mro__:
+            slots = c.__dict__.get('__slots__', ())
+            names.extend((slots,) if isinstance(slots, str) else slots)
+        names = tuple(n for n in names if n != '_annotations')
+        _slot_names_cache[cls] = names
+    return names
+
+
+def _entities_of(o: OWLObject) -> FrozenSet[OWLEntity]:
+    """Collect the entities that appear in an axiom or class expression."""
+    ret = set()
+    stack = [o]
+    while stack:
+        x = stack.pop()
+        if isinstance(x, OWLEntity):
+            ret.add(x)
+        elif isinstance(x, OWLObject):
+            for name in _slot_names(type(x)):
+                v = getattr(x, name, None)
+                if isinstance(v, OWLObject):
+                    stack.append(v)
+                elif isinstance(v, (list, tuple, set, frozenset)):
+                    stack.extend(v)
+    return frozenset(ret)
+
 
 class OWLOntologyID:
     """An object that identifies an ontology. Since OWL 2, ontologies do not have to have an ontology IRI, or if they
@@ -864,11 +998,365 @@ def _(axiom: OWLSubPropertyChainAxiom, ontology: AbstractOWLOntology, world: owl
                 super_property_x.property_chain.remove(pc)
                 break
 
-class Ontology(AbstractOWLOntology):
-    __slots__ = '_iri', '_world', '_onto', 'is_modified'
+class _QuadstoreBulkLoader:
+    """Writes class and property assertions about named entities straight into the owlready2 quadstore.
+
+    The triples are the same as the ones :func:`_add_axiom` writes through owlready2 entities, including the
+    declarations of new entities, but every chunk is written with a few executemany calls.
+    """
+    __slots__ = '_world', '_onto', '_storids', '_declared'
+
+    def __init__(self, world: owlready2.World, onto: owlready2.Ontology):
+        self._world = world
+        self._onto = onto
+        self._storids: Dict[str, int] = dict()
+        self._declared = set()  # storids of the entities that have a type
+
+    def add(self, axioms: List[OWLAxiom]) -> List[Tuple[OWLAxiom, Optional[FrozenSet[OWLEntity]]]]:
+        """Write the assertions among the axioms.
+
+        Args:
+            axioms: Axioms to add.
+
+        Returns:
+            The axioms in their original order, paired with their entities if they were written and None otherwise.
+        """
+        db = self._onto.graph.db
+        storids, declared = self._storids, self._declared
+        current_resource = db.execute("SELECT current_resource FROM store").fetchone()[0]
+        new_resources, objs, datas, typed, touched, properties = [], [], [], [], set(), []
+        ret = []
+
+        def declare(entity: OWLEntity, entity_type: int) -> int:
+            nonlocal current_resource
+            iri = entity.str
+            s = storids.get(iri)
+            if s is None:
+                r = db.execute("SELECT storid FROM resources WHERE iri=? LIMIT 1", (iri,)).fetchone()
+                if r is None:
+                    current_resource += 1
+                    s = current_resource
+                    new_resources.append((s, iri))
+                else:
+                    s = r[0]
+                storids[iri] = s
+                if r is not None and db.execute("SELECT 1 FROM objs WHERE s=? AND p=? LIMIT 1",
+                                                (s, _o2base.rdf_type)).fetchone() is not None:
+                    declared.add(s)
+            if s not in declared:
+                objs.append((s, _o2base.rdf_type, entity_type))
+                if entity_type == _o2base.owl_class:
+                    objs.append((s, _o2base.rdfs_subclassof, _o2base.owl_thing))
+                elif entity_type == _o2base.owl_named_individual:
+                    objs.append((s, _o2base.rdf_type, _o2base.owl_thing))
+                else:
+                    properties.append(s)
+                declared.add(s)
+            return s
+
+        for axiom in axioms:
+            axiom_type = type(axiom)
+            if axiom_type is OWLClassAssertionAxiom:
+                individual, cls = axiom.get_individual(), axiom.get_class_expression()
+                if type(cls) is not OWLClass or cls.is_owl_thing() or cls.is_owl_nothing() \
+                        or not isinstance(individual, OWLNamedIndividual):
+                    ret.append((axiom, None))
+                    continue
+                s = declare(individual, _o2base.owl_named_individual)
+                objs.append((s, _o2base.rdf_type, declare(cls, _o2base.owl_class)))
+                typed.append((s,))
+                touched.add(s)
+                ret.append((axiom, frozenset((individual, cls))))
+            elif axiom_type is OWLObjectPropertyAssertionAxiom:
+                subject, property_, object_ = axiom.get_subject(), axiom.get_property(), axiom.get_object()
+                if type(property_) is not OWLObjectProperty or not isinstance(subject, OWLNamedIndividual) \
+                        or not isinstance(object_, OWLNamedIndividual):
+                    ret.append((axiom, None))
+                    continue
+                s = declare(subject, _o2base.owl_named_individual)
+                p = declare(property_, _o2base.owl_object_property)
+                o = declare(object_, _o2base.owl_named_individual)
+                objs.append((s, p, o))
+                touched.update((s, o))
+                ret.append((axiom, frozenset((subject, property_, object_))))
+            elif axiom_type is OWLDataPropertyAssertionAxiom:
+                subject, property_ = axiom.get_subject(), axiom.get_property()
+                if type(property_) is not OWLDataProperty or not isinstance(subject, OWLNamedIndividual):
+                    ret.append((axiom, None))
+                    continue
+                s = declare(subject, _o2base.owl_named_individual)
+                p = declare(property_, _o2base.owl_data_property)
+                literal = axiom.get_object()
+                datas.append((s, p, *_o2base.to_literal(literal.to_python())))
+                touched.add(s)
+                ret.append((axiom, frozenset((subject, property_, literal.get_datatype()))))
+            else:
+                ret.append((axiom, None))
+
+        c = self._onto.graph.c
+        with self._world:
+            if new_resources:
+                db.executemany("INSERT INTO resources VALUES (?,?)", new_resources)
+                db.execute("UPDATE store SET current_resource=?", (current_resource,))
+            db.executemany(f"INSERT OR IGNORE INTO objs VALUES ({c},?,?,?)", objs)
+            db.executemany(f"INSERT OR IGNORE INTO datas VALUES ({c},?,?,?,?)", datas)
+            # a class assertion replaces owl:Thing in the types of an individual, see _add_axiom
+            db.executemany(f"DELETE FROM objs WHERE c={c} AND s=? AND p={_o2base.rdf_type} "
+                           f"AND o={_o2base.owl_thing}", typed)
+        # owlready2 entities cache their types and property values, the next lookup has to load them again
+        for s in touched:
+            self._world._entities.pop(s, None)
+        # owlready2 resolves property attributes of individuals only for properties it has loaded
+        for p in properties:
+            self._world._get_by_storid(p)
+        return ret
+
+    def finish(self):
+        """Update the statistics the SQLite query planner uses for the quadstore."""
+        self._world.graph.analyze()
+
+
+# Types of an entity declaration => axiom type of a property characteristic or key of the entity counts
+_DECLARATION_TYPES: Final = MappingProxyType({
+    namespaces.OWL.ns + "Class": "classes",
+    namespaces.OWL.ns + "ObjectProperty": "object_properties",
+    namespaces.OWL.ns + "DatatypeProperty": "data_properties",
+    namespaces.OWL.ns + "NamedIndividual": "individuals",
+    namespaces.OWL.ns + "AnnotationProperty": None,
+    namespaces.RDFS.ns + "Datatype": None,
+})
+_CHARACTERISTIC_TYPES: Final = MappingProxyType({
+    namespaces.OWL.ns + "FunctionalProperty": "Functional{}Property",
+    namespaces.OWL.ns + "InverseFunctionalProperty": "InverseFunctionalObjectProperty",
+    namespaces.OWL.ns + "TransitiveProperty": "TransitiveObjectProperty",
+    namespaces.OWL.ns + "SymmetricProperty": "SymmetricObjectProperty",
+    namespaces.OWL.ns + "AsymmetricProperty": "AsymmetricObjectProperty",
+    namespaces.OWL.ns + "ReflexiveProperty": "ReflexiveObjectProperty",
+    namespaces.OWL.ns + "IrreflexiveProperty": "IrreflexiveObjectProperty",
+})
+_NARY_TYPES: Final = MappingProxyType({
+    namespaces.OWL.ns + "AllDisjointClasses": "DisjointClasses",
+    namespaces.OWL.ns + "AllDifferent": "DifferentIndividuals",
+    namespaces.OWL.ns + "AllDisjointProperties": "Disjoint{}Properties",
+})
+# Predicates of axioms between classes or individuals
+_AXIOM_PREDICATES: Final = MappingProxyType({
+    namespaces.RDFS.ns + "subClassOf": "SubClassOf",
+    namespaces.OWL.ns + "equivalentClass": "EquivalentClasses",
+    namespaces.OWL.ns + "disjointWith": "DisjointClasses",
+    namespaces.OWL.ns + "disjointUnionOf": "DisjointUnion",
+    namespaces.OWL.ns + "hasKey": "HasKey",
+    namespaces.OWL.ns + "sameAs": "SameIndividual",
+    namespaces.OWL.ns + "differentFrom": "DifferentIndividuals",
+    namespaces.OWL.ns + "propertyChainAxiom": "SubPropertyChainOf",
+})
+# Predicates of axioms about properties, formatted with the kind of the subject property
+_PROPERTY_AXIOM_PREDICATES: Final = MappingProxyType({
+    namespaces.RDFS.ns + "subPropertyOf": "Sub{}PropertyOf",
+    namespaces.RDFS.ns + "domain": "{}PropertyDomain",
+    namespaces.RDFS.ns + "range": "{}PropertyRange",
+    namespaces.OWL.ns + "equivalentProperty": "Equivalent{}Properties",
+    namespaces.OWL.ns + "propertyDisjointWith": "Disjoint{}Properties",
+})
+_PROPERTY_KINDS: Final = MappingProxyType({
+    namespaces.OWL.ns + "ObjectProperty": "Object",
+    namespaces.OWL.ns + "DatatypeProperty": "Data",
+    namespaces.OWL.ns + "AnnotationProperty": "Annotation",
+})
+# Annotation properties that owlready2 knows without a declaration
+_BUILTIN_ANNOTATION_PROPERTIES: Final = (
+    namespaces.RDFS.ns + "label",
+    namespaces.RDFS.ns + "comment",
+    namespaces.RDFS.ns + "seeAlso",
+    namespaces.RDFS.ns + "isDefinedBy",
+    namespaces.OWL.ns + "versionInfo",
+    namespaces.OWL.ns + "deprecated",
+    namespaces.OWL.ns + "priorVersion",
+    namespaces.OWL.ns + "backwardCompatibleWith",
+    namespaces.OWL.ns + "incompatibleWith",
+)
+_VOCABULARY_NAMESPACES: Final = (namespaces.OWL.ns, namespaces.RDFS.ns, namespaces.RDF.ns)
+
+
+def _quadstore_statistics(world: owlready2.World, onto: owlready2.Ontology) -> OntologyStatistics:
+    """Count the triples, axioms and declared entities of an ontology with aggregate queries on the quadstore.
+
+    Axioms are recognised by their main triple as in the mapping of OWL 2 to RDF graphs, e.g. a triple with
+    rdfs:subClassOf for SubClassOf or a triple with an object property for ObjectPropertyAssertion.
+    """
+    db = world.graph.db
+    c = onto.graph.c
+
+    def storids(iris) -> Dict[int, str]:
+        ret = dict()
+        for iri in iris:
+            storid = world._abbreviate(iri, False)
+            if storid is not None:
+                ret[storid] = iri
+        return ret
+
+    declaration_types, characteristic_types, nary_types, axiom_predicates, property_predicates, property_kinds = \
+        (storids(m) for m in (_DECLARATION_TYPES, _CHARACTERISTIC_TYPES, _NARY_TYPES, _AXIOM_PREDICATES,
+                              _PROPERTY_AXIOM_PREDICATES, _PROPERTY_KINDS))
+    rdf_type_ = world._abbreviate(namespaces.RDF.ns + "type")
+    inverse_of = world._abbreviate(namespaces.OWL.ns + "inverseOf", False)
+    # property => Object, Data or Annotation, properties declared in other ontologies of the world are included
+    kinds = {p: "Annotation" for p in storids(_BUILTIN_ANNOTATION_PROPERTIES)}
+    if property_kinds:
+        kinds.update((p, _PROPERTY_KINDS[property_kinds[o]]) for p, o in db.execute(
+            f"SELECT s, o FROM objs WHERE p=? AND o IN ({','.join('?' * len(property_kinds))})",
+            (rdf_type_, *property_kinds)))
+
+    axioms = Counter()
+    entities = dict.fromkeys(("classes", "object_properties", "data_properties", "individuals"), 0)
+    triples = 0
+    # one scan per table, grouped by the predicate, the type of rdf:type triples and the subject of property axioms
+    by_subject = ",".join(map(str, property_predicates)) or "NULL"
+    characteristics = ",".join(map(str, characteristic_types)) or "NULL"
+    for table in ("objs", "datas"):
+        query = (f"SELECT p, CASE WHEN p={rdf_type_} THEN o END, "
+                 f"CASE WHEN p IN ({by_subject}) OR (p={rdf_type_} AND o IN ({characteristics})) THEN s END, "
+                 f"s > 0, COUNT(*) FROM {table} {{}} WHERE c=? GROUP BY 1, 2, 3, 4")
+        try:
+            # scanning the covering index is faster than looking up the rows of the ontology by the index on c
+            rows = db.execute(query.format(f"INDEXED BY index_{table}_op"), (c,)).fetchall()
+        except sqlite3.OperationalError:
+            rows = db.execute(query.format(""), (c,)).fetchall()
+        for p, o, s, named, n in rows:
+            triples += n
+            if p == rdf_type_ and table == "objs":
+                if o in declaration_types:
+                    if named:
+                        axioms["Declaration"] += n
+                        key = _DECLARATION_TYPES[declaration_types[o]]
+                        if key is not None:
+                            entities[key] += n
+                elif o in nary_types:
+                    axioms[_NARY_TYPES[nary_types[o]].format("Object")] += n
+                elif o in characteristic_types:
+                    # characteristics and axioms about a property depend on the kind of property
+                    axioms[_CHARACTERISTIC_TYPES[characteristic_types[o]].format(kinds.get(s, "Object"))] += n
+                elif named and (o < 0 or not world._unabbreviate(o).startswith(_VOCABULARY_NAMESPACES)):
+                    axioms["ClassAssertion"] += n
+            elif p in property_predicates:
+                axioms[_PROPERTY_AXIOM_PREDICATES[property_predicates[p]].format(kinds.get(s, "Object"))] += n
+            elif p in axiom_predicates:
+                axioms[_AXIOM_PREDICATES[axiom_predicates[p]]] += n
+            elif p == inverse_of:
+                # an anonymous subject is an inverse property expression and not an axiom
+                if named:
+                    axioms["InverseObjectProperties"] += n
+            elif named:
+                kind = kinds.get(p)
+                if kind == "Annotation":
+                    axioms["AnnotationAssertion"] += n
+                elif kind == "Object" and table == "objs":
+                    axioms["ObjectPropertyAssertion"] += n
+                elif kind == "Data" and table == "datas":
+                    axioms["DataPropertyAssertion"] += n
+    # annotations of the ontology itself are not axioms
+    for table in ("objs", "datas"):
+        for p, n in db.execute(f"SELECT p, COUNT(*) FROM {table} WHERE s=? AND c=? GROUP BY p", (onto.storid, c)):
+            if kinds.get(p) == "Annotation":
+                axioms["AnnotationAssertion"] -= n
+    return OntologyStatistics(triples, MappingProxyType({k: n for k, n in axioms.items() if n > 0}),
+                              MappingProxyType(entities))
+
+
+class _StructuralReasonerBackend(metaclass=ABCMeta):
+    """Lookups of named entities and assertions that :class:`owlapy.owl_reasoner.StructuralReasoner` answers its
+    queries with.
+
+    Implemented on owlready2 by :class:`Ontology` and on the integer triples by :class:`TripleStoreOntology`. Entities
+    that are unknown to the ontology have no related entities. Term ids are only comparable within one ontology.
+    """
+    __slots__ = ()
+
+    @abstractmethod
+    def _types(self, ind: OWLNamedIndividual, direct: bool) -> Iterable[OWLClass]:
+        """Get the named classes of the individual, only the asserted ones if direct."""
+        pass
+
+    @abstractmethod
+    def _class_instances(self, c: OWLClass) -> Iterable[OWLNamedIndividual]:
+        """Get the individuals of the named class c (which is not owl:Thing) and of its sub classes."""
+        pass
+
+    @abstractmethod
+    def _direct_super(self, e: Union[OWLClass, OWLProperty], only_named: bool = True) \
+            -> Iterable[Union[OWLClassExpression, OWLProperty]]:
+        """Get the direct super classes of a class or the direct named super properties of a property."""
+        pass
+
+    @abstractmethod
+    def _direct_sub(self, e: Union[OWLClass, OWLProperty]) -> Iterable[Union[OWLClass, OWLProperty]]:
+        """Get the direct named sub classes of a class or the direct named sub properties of a property."""
+        pass
+
+    @abstractmethod
+    def _sub_class_edges(self) -> Iterable[Tuple[OWLClass, Iterable[OWLClass]]]:
+        """Get every class in the signature together with its direct named sub classes."""
+        pass
+
+    @abstractmethod
+    def _equivalents(self, e: Union[OWLClass, OWLProperty, OWLNamedIndividual], only_named: bool = True) \
+            -> Iterable[Union[OWLClassExpression, OWLProperty, OWLNamedIndividual]]:
+        """Get the equivalent classes or properties, or the same individuals, of e (without e itself)."""
+        pass
+
+    @abstractmethod
+    def _disjoints(self, e: Union[OWLClass, OWLProperty, OWLNamedIndividual], only_named: bool = True) \
+            -> Iterable[Union[OWLClassExpression, OWLProperty, OWLNamedIndividual]]:
+        """Get the classes or properties that are asserted to be disjoint with e, or the individuals that are
+        asserted to be different from e."""
+        pass
+
+    @abstractmethod
+    def _inverse_property(self, p: OWLObjectProperty) -> Optional[OWLObjectProperty]:
+        """Get the named inverse property of p, None if there is none."""
+        pass
+
+    @abstractmethod
+    def _property_values(self, ind: OWLNamedIndividual, pe: OWLPropertyExpression, direct: bool) \
+            -> Iterable[Union[OWLNamedIndividual, OWLLiteral]]:
+        """Get the values of the property expression for the individual, including those of its sub properties if
+        not direct."""
+        pass
+
+    @abstractmethod
+    def _property_assertions(self, pe: OWLPropertyExpression, sub_properties: Iterable[OWLPropertyExpression]) \
+            -> Iterable[Tuple[OWLNamedIndividual, Union[OWLNamedIndividual, OWLLiteral]]]:
+        """Get the subject/value pairs of all assertions of the property expression and of the given sub property
+        expressions of it, with subject and value swapped for the assertions of the named property of an inverse
+        property."""
+        pass
+
+    @abstractmethod
+    def _term_id(self, e: OWLEntity) -> Optional[int]:
+        """Get the term id of the entity, used by :func:`_assertion_term_pairs`."""
+        pass
+
+    @abstractmethod
+    def _term_individual(self, i: int) -> Optional[OWLNamedIndividual]:
+        """Get the individual of a term id, None if the term is not an individual."""
+        pass
+
+    @abstractmethod
+    def _assertion_term_pairs(self, properties: Iterable[OWLObjectProperty]) -> Iterable[Tuple[int, int]]:
+        """Get the subject/object term ids of the assertions of the object properties and, swapped, of their named
+        inverse properties."""
+        pass
+
+
+class Ontology(AbstractOWLOntology, _StructuralReasonerBackend):
+    __slots__ = '_iri', '_world', '_onto', 'is_modified', '_change_log', '_revision', '_signature', '_statistics'
 
     _onto: owlready2.Ontology
     is_modified: bool
+    _change_log: Deque[OntologyChange]
+    _revision: int
+    _signature: Optional[OntologySignature]
+    _statistics: Optional[Tuple[int, OntologyStatistics]]
 
     def __init__(self, ontology_iri: IRI | str, load: bool = True, world_store=None):
         """Represents an Ontology in Ontolearn.
@@ -883,6 +1371,10 @@ class Ontology(AbstractOWLOntology):
         else:
             self._world = owlready2.World(filename=world_store)
         self.is_modified = False
+        self._change_log = deque(maxlen=_CHANGE_LOG_MAXLEN)
+        self._revision = 0
+        self._signature = None
+        self._statistics = None
 
         if isinstance(ontology_iri, str):
             onto = self._world.get_ontology(ontology_iri)
@@ -894,42 +1386,248 @@ class Ontology(AbstractOWLOntology):
         self._onto = onto
 
     def __len__(self) -> int:
-        return len([t for t in self._onto.get_triples()])
+        if self._statistics is None or self._statistics[0] != self._revision:
+            # counting the triples alone only reads the index of the ontology column
+            db, c = self._world.graph.db, self._onto.graph.c
+            return sum(db.execute(f"SELECT COUNT(*) FROM {table} WHERE c=?", (c,)).fetchone()[0]
+                       for table in ("objs", "datas"))
+        return self._statistics[1].triples
+
+    def statistics(self) -> OntologyStatistics:
+        """Get the number of triples, of axioms per axiom type and of declared entities of this ontology.
+
+        The numbers are computed with aggregate queries on the owlready2 quadstore and kept until the ontology is
+        modified. Axioms are counted by their main triple, so e.g. an axiom annotation does not count as an axiom.
+        """
+        if self._statistics is None or self._statistics[0] != self._revision:
+            self._statistics = self._revision, _quadstore_statistics(self._world, self._onto)
+        return self._statistics[1]
+
+    def signature(self) -> OntologySignature:
+        """Get the named entities declared in this ontology.
+
+        The signature is read from owlready2 once and kept until the ontology is modified through
+        :meth:`add_axiom`, :meth:`bulk_add_axioms` or :meth:`remove_axiom`. Entities that were already in the previous
+        signature are reused, so the same objects are returned across revisions.
+        """
+        signature = self._signature
+        if signature is None or signature.revision != self._revision:
+            previous = {e.str: e for e in chain(*signature[1:])} if signature is not None else dict()
+
+            def entities(typ, xs):
+                return tuple(e if (e := previous.get(x.iri)) is not None and type(e) is typ else typ(IRI.create(x.iri))
+                             for x in xs)
+
+            signature = OntologySignature(self._revision,
+                                          entities(OWLClass, self._onto.classes()),
+                                          entities(OWLObjectProperty, self._onto.object_properties()),
+                                          entities(OWLDataProperty, self._onto.data_properties()),
+                                          entities(OWLNamedIndividual, self._onto.individuals()))
+            self._signature = signature
+        return signature
 
     def classes_in_signature(self) -> Iterable[OWLClass]:
-        for c in self._onto.classes():
-            yield OWLClass(IRI.create(c.iri))
+        yield from self.signature().classes
 
     def data_properties_in_signature(self) -> Iterable[OWLDataProperty]:
-        for dp in self._onto.data_properties():
-            yield OWLDataProperty(IRI.create(dp.iri))
+        yield from self.signature().data_properties
 
     def object_properties_in_signature(self) -> Iterable[OWLObjectProperty]:
-        for op in self._onto.object_properties():
-            yield OWLObjectProperty(IRI.create(op.iri))
+        yield from self.signature().object_properties
 
     def properties_in_signature(self) -> Iterable[OWLProperty]:
         yield from self.object_properties_in_signature()
         yield from self.data_properties_in_signature()
 
     def individuals_in_signature(self) -> Iterable[OWLNamedIndividual]:
-        for i in self._onto.individuals():
-            yield OWLNamedIndividual(IRI.create(i.iri))
+        yield from self.signature().individuals
 
-    def get_abox_axioms(self) -> Iterable:
-        raise NotImplementedError("will be implemented in future")
+    def _select(self, query: str, params: tuple, batch_size: int) -> Iterable[tuple]:
+        """Run a query on the quadstore and yield its rows, fetching batch_size rows at a time.
 
-    def get_tbox_axioms(self) -> Iterable:
-        # @TODO: CD: Return all information between owl classes, e.g. subclass or disjoint
-        raise NotImplementedError("will be implemented in future")
+        The rows are read while they are consumed, the ontology must not be modified in the meantime.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        cursor = self._world.graph.db.execute(query, params)
+        try:
+            while rows := cursor.fetchmany(batch_size):
+                yield from rows
+        finally:
+            cursor.close()
 
-    def get_abox_axioms_between_individuals(self) -> Iterable:
-        # @TODO: CD: Return all information between owl_individuals, i.e., triples with object properties
-        raise NotImplementedError("will be implemented in future")
+    def _storid(self, iri: str) -> int:
+        """Get the storid of an IRI, -1 (which no triple has as predicate) if the world does not know it."""
+        storid = self._world._abbreviate(iri, False)
+        return storid if storid is not None else -1
 
-    def get_abox_axioms_between_individuals_and_classes(self) -> Iterable:
-        # @TODO: CD: Return all type information about individuals, i.e., individual type Class
-        raise NotImplementedError("will be implemented in future")
+    def _class_expression(self, storid: int, iri: Optional[str]) -> OWLClassExpression:
+        # named classes are created from the IRI of the row, only blank nodes need owlready2
+        if iri is not None:
+            return OWLClass(iri)
+        return _parse_concept_to_owlapy(self._onto._parse_bnode(storid))
+
+    def _declared(self, entity_type: int) -> str:
+        return f"(SELECT s FROM objs WHERE p={_o2base.rdf_type} AND o={entity_type})"
+
+    def get_abox_axioms(self, batch_size: int = _QUADSTORE_BATCH_SIZE) -> Iterable[OWLAxiom]:
+        """Get the ABox axioms of this ontology, read from the quadstore while they are consumed.
+
+        These are class assertions, object and data property assertions between named individuals, and
+        SameIndividual and DifferentIndividuals axioms of two individuals.
+
+        Args:
+            batch_size: Number of rows fetched from the quadstore at once.
+        """
+        # the individuals are shared by the assertions of all kinds
+        individual = _entity_factory(OWLNamedIndividual)
+        yield from self._class_assertions(batch_size, individual)
+        yield from self._object_property_assertions(batch_size, individual)
+        yield from self._data_property_assertions(batch_size, individual)
+        same_as, different_from = self._storid(namespaces.OWL.ns + "sameAs"), \
+            self._storid(namespaces.OWL.ns + "differentFrom")
+        for p, s_iri, o_iri in self._select(
+                "SELECT q.p, rs.iri, ro.iri FROM objs q JOIN resources rs ON rs.storid=q.s "
+                "JOIN resources ro ON ro.storid=q.o WHERE q.c=? AND q.p IN (?, ?)",
+                (self._onto.graph.c, same_as, different_from), batch_size):
+            individuals = [individual(s_iri), individual(o_iri)]
+            yield OWLSameIndividualAxiom(individuals) if p == same_as else OWLDifferentIndividualsAxiom(individuals)
+        # owlready2 writes DifferentIndividuals as an owl:AllDifferent with a list of members
+        yield from (OWLDifferentIndividualsAxiom([individual(x.iri) for x in members])
+                    for members in self._lists_of(namespaces.OWL.ns + "AllDifferent", batch_size))
+
+    def _lists_of(self, typ: str, batch_size: int) -> Iterable[list]:
+        """Get the owlready2 entities or constructs in the member lists of the blank nodes of a type, e.g.
+        owl:AllDisjointClasses."""
+        members = self._storid(namespaces.OWL.ns + "members")
+        distinct_members = self._storid(namespaces.OWL.ns + "distinctMembers")
+        for s, in self._select(f"SELECT s FROM objs WHERE c=? AND p={_o2base.rdf_type} AND o=?",
+                               (self._onto.graph.c, self._storid(typ)), batch_size):
+            bnode = self._onto._get_obj_triple_sp_o(s, members) or self._onto._get_obj_triple_sp_o(s, distinct_members)
+            yield self._onto._parse_list(bnode)
+
+    def get_abox_axioms_between_individuals(self, batch_size: int = _QUADSTORE_BATCH_SIZE) \
+            -> Iterable[OWLObjectPropertyAssertionAxiom]:
+        """Get the object property assertions between named individuals, read from the quadstore while they are
+        consumed.
+
+        Args:
+            batch_size: Number of rows fetched from the quadstore at once.
+        """
+        return self._object_property_assertions(batch_size, _entity_factory(OWLNamedIndividual))
+
+    def _object_property_assertions(self, batch_size: int, individual) -> Iterable[OWLObjectPropertyAssertionAxiom]:
+        properties = dict()
+        for s_iri, p, o_iri in self._select(
+                "SELECT rs.iri, q.p, ro.iri FROM objs q JOIN resources rs ON rs.storid=q.s "
+                "JOIN resources ro ON ro.storid=q.o "
+                f"WHERE q.c=? AND q.p IN {self._declared(_o2base.owl_object_property)}",
+                (self._onto.graph.c,), batch_size):
+            property_ = properties.get(p)
+            if property_ is None:
+                property_ = properties[p] = OWLObjectProperty(self._world._unabbreviate(p))
+            yield OWLObjectPropertyAssertionAxiom(individual(s_iri), property_, individual(o_iri))
+
+    def get_abox_axioms_between_individuals_and_classes(self, batch_size: int = _QUADSTORE_BATCH_SIZE) \
+            -> Iterable[OWLClassAssertionAxiom]:
+        """Get the class assertions of named individuals, read from the quadstore while they are consumed.
+
+        The class is a named class or a class expression. owlready2 types new individuals as owl:Thing, these
+        assertions are left out.
+
+        Args:
+            batch_size: Number of rows fetched from the quadstore at once.
+        """
+        return self._class_assertions(batch_size, _entity_factory(OWLNamedIndividual))
+
+    def _class_assertions(self, batch_size: int, individual) -> Iterable[OWLClassAssertionAxiom]:
+        classes = dict()
+        for s_iri, o, o_iri in self._select(
+                "SELECT rs.iri, q.o, ro.iri FROM objs q JOIN resources rs ON rs.storid=q.s "
+                "LEFT JOIN resources ro ON ro.storid=q.o "
+                f"WHERE q.c=? AND q.p={_o2base.rdf_type} AND (q.o < 0 OR q.o IN {self._declared(_o2base.owl_class)})",
+                (self._onto.graph.c,), batch_size):
+            cls = classes.get(o)
+            if cls is None:
+                cls = classes[o] = self._class_expression(o, o_iri)
+            yield OWLClassAssertionAxiom(individual(s_iri), cls)
+
+    def _data_property_assertions(self, batch_size: int, individual) -> Iterable[OWLDataPropertyAssertionAxiom]:
+        properties = dict()
+        for s_iri, p, o, d in self._select(
+                "SELECT rs.iri, q.p, q.o, q.d FROM datas q JOIN resources rs ON rs.storid=q.s "
+                f"WHERE q.c=? AND q.p IN {self._declared(_o2base.owl_data_property)}",
+                (self._onto.graph.c,), batch_size):
+            property_ = properties.get(p)
+            if property_ is None:
+                property_ = properties[p] = OWLDataProperty(self._world._unabbreviate(p))
+            yield OWLDataPropertyAssertionAxiom(individual(s_iri), property_, OWLLiteral(_o2base.from_literal(o, d)))
+
+    def get_tbox_axioms(self, batch_size: int = _QUADSTORE_BATCH_SIZE) -> Iterable[OWLAxiom]:
+        """Get the TBox axioms of this ontology, read from the quadstore while they are consumed.
+
+        Like the TBox of OWLAPI, these are the SubClassOf, EquivalentClasses, DisjointClasses and DisjointUnion
+        axioms, the domains and ranges of object and data properties, and the functional and inverse functional
+        properties.
+
+        Args:
+            batch_size: Number of rows fetched from the quadstore at once.
+        """
+        c = self._onto.graph.c
+        equivalent_class = self._storid(namespaces.OWL.ns + "equivalentClass")
+        disjoint_with = self._storid(namespaces.OWL.ns + "disjointWith")
+        disjoint_union = self._storid(namespaces.OWL.ns + "disjointUnionOf")
+        for s, s_iri, p, o, o_iri in self._select(
+                "SELECT q.s, rs.iri, q.p, q.o, ro.iri FROM objs q LEFT JOIN resources rs ON rs.storid=q.s "
+                "LEFT JOIN resources ro ON ro.storid=q.o WHERE q.c=? AND q.p IN (?, ?, ?, ?)",
+                (c, _o2base.rdfs_subclassof, equivalent_class, disjoint_with, disjoint_union), batch_size):
+            if p == disjoint_union:
+                yield OWLDisjointUnionAxiom(OWLClass(s_iri), [_parse_concept_to_owlapy(x)
+                                                              for x in self._onto._parse_list(o)])
+                continue
+            sub, sup = self._class_expression(s, s_iri), self._class_expression(o, o_iri)
+            if p == _o2base.rdfs_subclassof:
+                yield OWLSubClassOfAxiom(sub, sup)
+            elif p == equivalent_class:
+                yield OWLEquivalentClassesAxiom([sub, sup])
+            else:
+                yield OWLDisjointClassesAxiom([sub, sup])
+        for members in self._lists_of(namespaces.OWL.ns + "AllDisjointClasses", batch_size):
+            yield OWLDisjointClassesAxiom([_parse_concept_to_owlapy(x) for x in members])
+        yield from self._property_tbox_axioms(batch_size)
+
+    def _property_tbox_axioms(self, batch_size: int) -> Iterable[OWLAxiom]:
+        c = self._onto.graph.c
+        db = self._world.graph.db
+        object_properties = {s for s, in db.execute(self._declared(_o2base.owl_object_property)[1:-1])}
+        data_properties = {s for s, in db.execute(self._declared(_o2base.owl_data_property)[1:-1])}
+        functional = self._storid(namespaces.OWL.ns + "FunctionalProperty")
+        inverse_functional = self._storid(namespaces.OWL.ns + "InverseFunctionalProperty")
+        for s, s_iri, p, o, o_iri in self._select(
+                "SELECT q.s, rs.iri, q.p, q.o, ro.iri FROM objs q JOIN resources rs ON rs.storid=q.s "
+                "LEFT JOIN resources ro ON ro.storid=q.o "
+                f"WHERE q.c=? AND (q.p IN ({_o2base.rdf_domain}, {_o2base.rdf_range}) "
+                f"OR (q.p={_o2base.rdf_type} AND q.o IN (?, ?)))",
+                (c, functional, inverse_functional), batch_size):
+            if s in object_properties:
+                property_ = OWLObjectProperty(s_iri)
+                if p == _o2base.rdf_domain:
+                    yield OWLObjectPropertyDomainAxiom(property_, self._class_expression(o, o_iri))
+                elif p == _o2base.rdf_range:
+                    yield OWLObjectPropertyRangeAxiom(property_, self._class_expression(o, o_iri))
+                elif o == functional:
+                    yield OWLFunctionalObjectPropertyAxiom(property_)
+                else:
+                    yield OWLInverseFunctionalObjectPropertyAxiom(property_)
+            elif s in data_properties:
+                property_ = OWLDataProperty(s_iri)
+                if p == _o2base.rdf_domain:
+                    yield OWLDataPropertyDomainAxiom(property_, self._class_expression(o, o_iri))
+                elif p == _o2base.rdf_range:
+                    yield OWLDataPropertyRangeAxiom(property_, OWLDatatype(IRI.create(o_iri)) if o_iri is not None
+                                                    else _parse_datarange_to_owlapy(self._onto._parse_bnode(o)))
+                elif o == functional:
+                    yield OWLFunctionalDataPropertyAxiom(property_)
 
     # @TODO:CD:Unsure it is working
     def equivalent_classes_axioms(self, c: OWLClass) -> Iterable[OWLEquivalentClassesAxiom]:
@@ -1017,17 +1715,80 @@ class Ontology(AbstractOWLOntology):
         self.is_modified = True
         if isinstance(axiom, OWLAxiom):
             _add_axiom(axiom, self, self._world)
+            self._log_change(axiom, True)
         else:
             for ax in axiom:
                 _add_axiom(ax, self, self._world)
+                self._log_change(ax, True)
+
+    def bulk_add_axioms(self, axioms: Iterable[OWLAxiom], chunk_size: int = 100_000,
+                        show_progress: bool = False) -> IngestStats:
+        """Add a large number of axioms, e.g. from a generator, in chunks.
+
+        Class assertions with a named class and object and data property assertions between named individuals are
+        written straight into the owlready2 quadstore with one executemany per chunk. All other axioms are added like
+        :meth:`add_axiom` does. owlready2 entities obtained before the ingest may not reflect the new assertions, look
+        them up again afterwards.
+
+        Args:
+            axioms: Axioms to add, consumed lazily.
+            chunk_size: Number of axioms written at once.
+            show_progress: Show a progress bar with the number of added axioms and the throughput.
+
+        Returns:
+            Number of added axioms and the time it took.
+        """
+        loader = _QuadstoreBulkLoader(self._world, self._onto)
+
+        def add_chunk(chunk: List[OWLAxiom]):
+            self.is_modified = True
+            for ax, entities in loader.add(chunk):
+                if entities is None:
+                    _add_axiom(ax, self, self._world)
+                    self._log_change(ax, True)
+                else:
+                    self._change_log.append(OntologyChange(ax, True, entities))
+                    self._revision += 1
+
+        try:
+            return _ingest(axioms, chunk_size, add_chunk, show_progress)
+        finally:
+            loader.finish()
 
     def remove_axiom(self, axiom: Union[OWLAxiom, Iterable[OWLAxiom]]):
         self.is_modified = True
         if isinstance(axiom, OWLAxiom):
             _remove_axiom(axiom, self, self._world)
+            self._log_change(axiom, False)
         else:
             for ax in axiom:
                 _remove_axiom(ax, self, self._world)
+                self._log_change(ax, False)
+
+    def _log_change(self, axiom: OWLAxiom, added: bool):
+        self._change_log.append(OntologyChange(axiom, added, _entities_of(axiom)))
+        self._revision += 1
+
+    @property
+    def revision(self) -> int:
+        """Number of axiom additions and removals applied to this ontology so far."""
+        return self._revision
+
+    def changes_since(self, revision: int) -> Optional[List[OntologyChange]]:
+        """Get the changes applied to this ontology after the given revision.
+
+        Args:
+            revision: A revision previously obtained from :attr:`Ontology.revision`.
+
+        Returns:
+            The changes in the order they were applied or None if they are no longer available in the change log.
+        """
+        n = self._revision - revision
+        if n <= 0:
+            return []
+        if n > len(self._change_log):
+            return None
+        return list(islice(self._change_log, len(self._change_log) - n, None))
 
     def save(self, path: Union[str, IRI] = None, inplace: bool = False, document_format: Optional[str] = None):
         """Save the ontology to a file, optionally in a different serialisation format.
@@ -1154,6 +1915,179 @@ class Ontology(AbstractOWLOntology):
             if os.path.exists(tmp_path):
                 os.remove(tmp_path)
 
+    def _types(self, ind: OWLNamedIndividual, direct: bool) -> Iterable[OWLClass]:
+        i: owlready2.Thing = self._world[ind.str]
+        for c in i.is_a if direct else i.INDIRECT_is_a:
+            if isinstance(c, owlready2.ThingClass):
+                yield OWLClass(IRI.create(c.iri))
+            # Anonymous classes are ignored
+
+    def _class_instances(self, c: OWLClass) -> Iterable[OWLNamedIndividual]:
+        c_x: owlready2.ThingClass = self._world[c.str]
+        for i in c_x.instances(world=self._world):
+            if isinstance(i, owlready2.Thing):
+                yield OWLNamedIndividual(IRI.create(i.iri))
+
+    @staticmethod
+    def _named_properties(typ: type, ps_x: Iterable) -> List[OWLProperty]:
+        """Get the owlready2 properties of the same kind as typ as entities of type typ."""
+        cls_x = owlready2.ObjectPropertyClass if typ is OWLObjectProperty else owlready2.DataPropertyClass
+        return [typ(IRI.create(p_x.iri)) for p_x in ps_x if isinstance(p_x, cls_x)]
+
+    def _direct_super(self, e: Union[OWLClass, OWLProperty], only_named: bool = True) \
+            -> Iterable[Union[OWLClassExpression, OWLProperty]]:
+        e_x = self._world[e.str]
+        if isinstance(e, OWLClass):
+            return [_parse_concept_to_owlapy(sc) for sc in e_x.is_a
+                    if isinstance(sc, owlready2.ThingClass) or
+                    (not only_named and isinstance(sc, owlready2.ClassConstruct))]
+        return self._named_properties(type(e), set(e_x.is_a))
+
+    def _direct_sub(self, e: Union[OWLClass, OWLProperty]) -> Iterable[Union[OWLClass, OWLProperty]]:
+        e_x = self._world[e.str]
+        if isinstance(e, OWLClass):
+            # Subclasses will only return named classes
+            return [OWLClass(IRI.create(sc.iri)) for sc in e_x.subclasses(world=self._world)
+                    if isinstance(sc, owlready2.ThingClass)]
+        return self._named_properties(type(e), set(e_x.subclasses(world=self._world)))
+
+    def _sub_class_edges(self) -> Iterable[Tuple[OWLClass, Iterable[OWLClass]]]:
+        # read the classes of the ontology and all named sub class relations of the world (like
+        # owlready2.ThingClass.subclasses) with one query each instead of one query per class, and without loading the
+        # owlready2 entities
+        graph = self._world.graph
+        classes: Dict[int, OWLClass] = {
+            storid: OWLClass(IRI.create(iri)) for storid, iri in graph.execute(
+                "SELECT q.s, r.iri FROM objs q JOIN resources r ON r.storid = q.s "
+                "WHERE q.c = ? AND q.p = ? AND q.o = ? AND q.s > 0",
+                (self._onto.graph.c, _o2base.rdf_type, _o2base.owl_class))}
+        subs: Dict[int, set] = {storid: set() for storid in classes}
+        for s, o in graph.execute("SELECT s, o FROM objs WHERE p = ? AND s > 0 AND o > 0",
+                                  (_o2base.rdfs_subclassof,)):
+            if o in subs and s in classes:
+                subs[o].add(classes[s])
+        for storid, c in classes.items():
+            yield c, subs[storid]
+
+    def _equivalents(self, e: Union[OWLClass, OWLProperty, OWLNamedIndividual], only_named: bool = True) \
+            -> Iterable[Union[OWLClassExpression, OWLProperty, OWLNamedIndividual]]:
+        e_x = self._world[e.str]
+        if isinstance(e, OWLNamedIndividual):
+            yield from (OWLNamedIndividual(IRI.create(d_i.iri)) for d_i in e_x.equivalent_to
+                        if isinstance(d_i, owlready2.Thing))
+        elif isinstance(e, OWLProperty):
+            yield from self._named_properties(type(e), e_x.INDIRECT_equivalent_to)
+        else:
+            seen_set = {e}
+            for eq_x in e_x.INDIRECT_equivalent_to:
+                eq = _parse_concept_to_owlapy(eq_x)
+                if (isinstance(eq, OWLClass) or
+                    (isinstance(eq, OWLClassExpression) and not only_named)) and eq not in seen_set:
+                    seen_set.add(eq)
+                    yield eq
+                # Workaround for problems in owlready2. It does not always recognize equivalent complex class
+                # expressions through INDIRECT_equivalent_to. Maybe it will work as soon as owlready2 adds support for
+                # EquivalentClasses general class axioms.
+                if not only_named and isinstance(eq_x, owlready2.ThingClass):
+                    for eq_2_x in eq_x.equivalent_to:
+                        eq_2 = _parse_concept_to_owlapy(eq_2_x)
+                        if eq_2 not in seen_set:
+                            seen_set.add(eq_2)
+                            yield eq_2
+
+    def _disjoints(self, e: Union[OWLClass, OWLProperty, OWLNamedIndividual], only_named: bool = True) \
+            -> Iterable[Union[OWLClassExpression, OWLProperty, OWLNamedIndividual]]:
+        e_x = self._world[e.str]
+        if isinstance(e, OWLNamedIndividual):
+            return [OWLNamedIndividual(IRI.create(d_i.iri))
+                    for d_i in chain.from_iterable(map(lambda x: x.entities, e_x.differents()))
+                    if isinstance(d_i, owlready2.Thing) and e_x != d_i]
+        if isinstance(e, OWLProperty):
+            return self._named_properties(type(e), [p_x for disjoint in self._onto.disjoint_properties()
+                                                    if e_x in disjoint.entities for p_x in disjoint.entities
+                                                    if p_x != e_x])
+        return [_parse_concept_to_owlapy(d_x)
+                for d_x in chain.from_iterable(map(lambda d: d.entities, e_x.disjoints()))
+                if d_x != e_x and (isinstance(d_x, owlready2.ThingClass) or
+                                   (isinstance(d_x, owlready2.ClassConstruct) and not only_named))]
+
+    def _inverse_property(self, p: OWLObjectProperty) -> Optional[OWLObjectProperty]:
+        inverse_x = self._world[p.str].inverse_property
+        return OWLObjectProperty(IRI.create(inverse_x.iri)) if inverse_x is not None else None
+
+    def _property_values(self, ind: OWLNamedIndividual, pe: OWLPropertyExpression, direct: bool) \
+            -> Iterable[Union[OWLNamedIndividual, OWLLiteral]]:
+        if isinstance(pe, OWLDataProperty):
+            i: owlready2.Thing = self._world[ind.str]
+            p: owlready2.DataPropertyClass = self._world[pe.str]
+            retrieval_func = p._get_values_for_individual if direct else p._get_indirect_values_for_individual
+            for val in retrieval_func(i):
+                yield OWLLiteral(val)
+        elif isinstance(pe, OWLObjectProperty):
+            i: owlready2.Thing = self._world[ind.str]
+            p: owlready2.ObjectPropertyClass = self._world[pe.str]
+            # Recommended to use direct=False because _get_values_for_individual does not give consistent result
+            # for the case when there are equivalent object properties. At least until this is fixed on owlready2.
+            retieval_func = p._get_values_for_individual if direct else p._get_indirect_values_for_individual
+            for val in retieval_func(i):
+                yield OWLNamedIndividual(IRI.create(val.iri))
+        elif isinstance(pe, OWLObjectInverseOf):
+            p: owlready2.ObjectPropertyClass = self._world[pe.get_named_property().str]
+            inverse_p = p.inverse_property
+            # If the inverse property is explicitly defined we can take shortcut
+            if inverse_p is not None:
+                yield from self._property_values(ind, OWLObjectProperty(IRI.create(inverse_p.iri)), direct)
+            else:
+                if not direct:
+                    raise NotImplementedError('Indirect values of inverse properties are only implemented if the '
+                                              'inverse property is explicitly defined in the ontology.'
+                                              f'Property: {pe}')
+                i: owlready2.Thing = self._world[ind.str]
+                for val in p._get_inverse_values_for_individual(i):
+                    yield OWLNamedIndividual(IRI.create(val.iri))
+        else:
+            raise NotImplementedError(pe)
+
+    def _property_assertions(self, pe: OWLPropertyExpression, sub_properties: Iterable[OWLPropertyExpression]) \
+            -> Iterable[Tuple[OWLNamedIndividual, Union[OWLNamedIndividual, OWLLiteral]]]:
+        # _x => owlready2 objects
+        relations = []
+        for p in chain((pe,), sub_properties):
+            if isinstance(p, OWLObjectInverseOf):
+                relations.append((o_x, s_x) for s_x, o_x in self._world[p.get_named_property().str].get_relations())
+            else:
+                relations.append(self._world[p.str].get_relations())
+        data = isinstance(pe, OWLDataProperty)
+        for s_x, o_x in chain.from_iterable(relations):
+            if isinstance(s_x, owlready2.Thing):
+                if data:
+                    yield OWLNamedIndividual(IRI.create(s_x.iri)), OWLLiteral(o_x)
+                elif isinstance(o_x, owlready2.Thing):
+                    yield OWLNamedIndividual(IRI.create(s_x.iri)), OWLNamedIndividual(IRI.create(o_x.iri))
+
+    def _term_id(self, e: OWLEntity) -> Optional[int]:
+        return self._storid(e.str)
+
+    def _term_individual(self, i: int) -> Optional[OWLNamedIndividual]:
+        if i > 0:  # negative storids are blank nodes
+            x = self._world._get_by_storid(i)
+            if isinstance(x, owlready2.Thing):
+                return OWLNamedIndividual(IRI.create(x.iri))
+        return None
+
+    def _assertion_term_pairs(self, properties: Iterable[OWLObjectProperty]) -> Iterable[Tuple[int, int]]:
+        # in the same way as owlready2 get_relations
+        world = self._world
+        for p in properties:
+            p_x = world[p.str]
+            if p_x is None:
+                continue
+            for s, _, o in world._get_obj_triples_spo_spo(None, p_x.storid, None):
+                yield s, o
+            if p_x.inverse_property is not None:
+                for s, _, o in world._get_obj_triples_spo_spo(None, p_x.inverse_property.storid, None):
+                    yield o, s
+
     def get_original_iri(self):
         """Get the IRI argument that was used to create this ontology."""
         return self._iri
@@ -1206,6 +2140,7 @@ class SyncOntology(AbstractOWLOntology):
         else:  # means we are loading an existing ontology
             self.owlapi_ontology = self.owlapi_manager.loadOntologyFromOntologyDocument(File(file_path))
         self.mapper = OWLAPIMapper()
+        self._revision = 0
 
     def __eq__(self, other):
         if isinstance(other, SyncOntology):
@@ -1271,6 +2206,30 @@ class SyncOntology(AbstractOWLOntology):
         """
         return self.mapper.map_(self.owlapi_ontology.getSignature(self._get_imports_enum(include_imports_closure)))
 
+    def statistics(self, include_imports_closure: bool = True) -> OntologyStatistics:
+        """Get the number of axioms per axiom type and of entities of this ontology.
+
+        The numbers are read from the axiom and signature indexes of OWLAPI without mapping any axiom. OWLAPI does
+        not keep triples, so the number of triples is None.
+
+        Args:
+            include_imports_closure: Whether to include/exclude imports from searches.
+        """
+        # noinspection PyUnresolvedReferences
+        from org.semanticweb.owlapi.model import AxiomType
+        imports = self._get_imports_enum(include_imports_closure)
+        axioms = dict()
+        for axiom_type in AxiomType.AXIOM_TYPES:
+            n = int(self.owlapi_ontology.getAxiomCount(axiom_type, imports))
+            if n:
+                axioms[str(axiom_type.getName())] = n
+        entities = {"classes": self.owlapi_ontology.getClassesInSignature(imports),
+                    "object_properties": self.owlapi_ontology.getObjectPropertiesInSignature(imports),
+                    "data_properties": self.owlapi_ontology.getDataPropertiesInSignature(imports),
+                    "individuals": self.owlapi_ontology.getIndividualsInSignature(imports)}
+        return OntologyStatistics(None, MappingProxyType(axioms),
+                                  MappingProxyType({k: int(v.size()) for k, v in entities.items()}))
+
     def get_abox_axioms(self, include_imports_closure: bool = True) -> Iterable[OWLAxiom]:
         """Get all ABox axioms.
 
@@ -1308,13 +2267,42 @@ class SyncOntology(AbstractOWLOntology):
     def get_ontology_id(self) -> OWLOntologyID:
         return self.mapper.map_(self.owlapi_ontology.getOntologyID())
 
+    @property
+    def revision(self) -> int:
+        """Number of add_axiom, bulk_add_axioms and remove_axiom calls on this ontology so far.
+
+        Changes made directly on :attr:`owlapi_ontology` are not counted."""
+        return self._revision
+
     def add_axiom(self, axiom: Union[OWLAxiom, Iterable[OWLAxiom]]):
+        self._revision += 1
         if isinstance(axiom, OWLAxiom):
             self.owlapi_ontology.addAxiom(self.mapper.map_(axiom))
         else:
             self.owlapi_ontology.addAxioms(self.mapper.map_(axiom))
 
+    def bulk_add_axioms(self, axioms: Iterable[OWLAxiom], chunk_size: int = 100_000,
+                        show_progress: bool = False) -> IngestStats:
+        """Add a large number of axioms, e.g. from a generator, in chunks.
+
+        Every chunk is mapped with :meth:`OWLAPIMapper.map_axioms`, copied into a Java list in a single call and
+        added to the ontology with one addAxioms call, reusing the entities in the mapper cache across chunks.
+
+        Args:
+            axioms: Axioms to add, consumed lazily.
+            chunk_size: Number of axioms added at once.
+            show_progress: Show a progress bar with the number of added axioms and the throughput.
+
+        Returns:
+            Number of added axioms and the time it took.
+        """
+        self._revision += 1
+        return _ingest(axioms, chunk_size,
+                       lambda chunk: self.owlapi_ontology.addAxioms(self.mapper.map_axioms(chunk)),
+                       show_progress)
+
     def remove_axiom(self, axiom: Union[OWLAxiom, Iterable[OWLAxiom]]):
+        self._revision += 1
         if isinstance(axiom, OWLAxiom):
             self.owlapi_ontology.removeAxiom(self.mapper.map_(axiom))
         else:
@@ -1342,7 +2330,11 @@ class SyncOntology(AbstractOWLOntology):
 
         **rdflib-backed formats** – the ontology is first saved as RDF/XML by
         OWL API to a temporary file, loaded by rdflib, re-serialised in the
-        requested format, then the temporary file is deleted:
+        requested format, then the temporary file is deleted. N-Triples and
+        N-Quads are instead written in one pass over the axioms with an
+        :class:`~owlapy.rdf_writer.RDFStreamWriter` (falling back to rdflib if
+        the ontology contains axioms it cannot write), the N-Quads graph is
+        the ontology IRI:
 
         =============================  ==========================================
         Format string(s)               Serialisation
@@ -1380,6 +2372,13 @@ class SyncOntology(AbstractOWLOntology):
 
         # ── rdflib-backed path ──────────────────────────────────────────────
         if fmt_key is not None and fmt_key in _RDFLIB_FORMATS:
+            stream_format = _STREAM_FORMATS.get(_RDFLIB_FORMATS[fmt_key])
+            if stream_format is not None:
+                try:
+                    self._save_via_stream_writer(path, stream_format)
+                    return
+                except NotImplementedError as e:
+                    logger.info(f"Saving via rdflib, the axioms cannot be written directly: {e}")
             self._save_via_rdflib(path, _RDFLIB_FORMATS[fmt_key])
             return
 
@@ -1411,6 +2410,48 @@ class SyncOntology(AbstractOWLOntology):
         with FileOutputStream(File(path)) as fos:
             self.owlapi_manager.saveOntology(self.owlapi_ontology, owlapi_format, fos)
 
+    def _save_via_stream_writer(self, path: str, rdf_format: str) -> None:
+        """Save by writing the triples of the ontology header and of one axiom after the other, so that the memory use
+        does not grow with the size of the ontology.
+
+        The file is written next to *path* and only moved there once complete.
+
+        Args:
+            path: Destination file path.
+            rdf_format: :class:`~owlapy.rdf_writer.RDFStreamWriter` format, "nt" or "nq".
+
+        Raises:
+            NotImplementedError: If the ontology contains axioms that cannot be written as RDF.
+        """
+        from owlapy.rdf_writer import RDFStreamWriter, RDF_TYPE, OWL_ONTOLOGY, OWL_VERSION_IRI, OWL_IMPORTS
+        from owlapy.owlapi_mapper import LexicalOWLAPIMapper
+
+        # literals are written with their lexical form and datatype, self.mapper converts them to Python values
+        mapper = LexicalOWLAPIMapper()
+        ontology_id = self.get_ontology_id()
+        ontology_iri = ontology_id.get_ontology_iri()
+        tmp_path = f"{path}.tmp"
+        print(f"Saving Ontology into {path}")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as out:
+                writer = RDFStreamWriter(out, rdf_format,
+                                         graph=ontology_iri.as_str() if ontology_iri is not None else None)
+                subject = writer.iri(ontology_iri.as_str()) if ontology_iri is not None else writer.bnode()
+                writer.triple(subject, writer.iri(RDF_TYPE), writer.iri(OWL_ONTOLOGY))
+                if ontology_id.get_version_iri() is not None:
+                    writer.triple(subject, writer.iri(OWL_VERSION_IRI),
+                                  writer.iri(ontology_id.get_version_iri().as_str()))
+                for declaration in self.owlapi_ontology.getImportsDeclarations():
+                    writer.triple(subject, writer.iri(OWL_IMPORTS), writer.iri(str(declaration.getIRI())))
+                for annotation in self.owlapi_ontology.getAnnotations():
+                    writer.annotation(subject, mapper.map_(annotation))
+                for axiom in self.owlapi_ontology.axioms().iterator():
+                    writer.write(mapper.map_(axiom))
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     def _save_via_rdflib(self, path: str, rdflib_format: str) -> None:
         """Save using rdflib as the serialiser.
 
@@ -1457,108 +2498,191 @@ class SyncOntology(AbstractOWLOntology):
                 os.remove(tmp_path)
 
 
+class _NTriplesSink:
+    """Collects the triples of an rdflib N-Triples parser."""
+    __slots__ = 'triples',
+
+    def __init__(self):
+        self.triples = []
+
+    def triple(self, s, p, o):
+        self.triples.append((s, p, o))
+
+
+# N-Triples line between IRIs or with a literal object, without escapes and blank nodes
+_NT_SIMPLE_LINE: Final = re.compile(r'<([^<>"\s]*)>[ \t]+<([^<>"\s]*)>[ \t]+'
+                                    r'(?:<([^<>"\s]*)>|"([^"]*)"(?:\^\^<([^<>"\s]*)>|@([a-zA-Z]+(?:-[a-zA-Z0-9]+)*))?)'
+                                    r'[ \t]*\.[ \t]*$')
+
+
+def _stream_ntriples(path: str, lines_per_chunk: int = 10_000) -> Iterable[Tuple[rdflib.term.Node, rdflib.URIRef,
+                                                                                  rdflib.term.Node]]:
+    """Parse an N-Triples file chunk by chunk, so that at most lines_per_chunk triples are held in memory.
+
+    Lines between IRIs or with a literal object that contain no escapes and no blank nodes are matched with a
+    regular expression, the others are parsed with rdflib.
+    """
+    from io import StringIO
+    from rdflib.plugins.parsers.ntriples import W3CNTriplesParser
+
+    sink = _NTriplesSink()
+    parser = W3CNTriplesParser(sink, bnode_context=dict())
+    URIRef, Literal = rdflib.URIRef, rdflib.Literal
+    with open(path, encoding="utf-8") as f:
+        while lines := list(islice(f, lines_per_chunk)):
+            other = []
+            for line in lines:
+                m = _NT_SIMPLE_LINE.match(line) if "\\" not in line else None
+                if m is None:
+                    other.append(line)
+                    continue
+                if other:  # keep the order of the file
+                    parser.parse(StringIO("".join(other)))
+                    other.clear()
+                s, p, o, lexical, datatype, language = m.groups()
+                if o is not None:
+                    sink.triples.append((URIRef(s), URIRef(p), URIRef(o)))
+                else:
+                    sink.triples.append((URIRef(s), URIRef(p), Literal(lexical, lang=language, datatype=datatype)))
+            if other:
+                parser.parse(StringIO("".join(other)))
+            yield from sink.triples
+            sink.triples.clear()
+
+
 class RDFLibOntology(AbstractOWLOntology):
 
-    def __init__(self, path: str, load: bool = True):
+    def __init__(self, path: str, load: bool = True, streaming: bool = False):
+        """Ontology backed by an rdflib graph.
+
+        Args:
+            path: Path of the ontology file.
+            load: Whether to load the ontology or not.
+            streaming: Do not keep the graph in memory. Only the signature and the number of triples are kept and the
+                file, which has to be in N-Triples, is parsed again chunk by chunk whenever axioms are requested.
+        """
         if load:
             assert os.path.exists(path)
             import rdflib
 
-            self.rdflib_graph = rdflib.Graph().parse(path)
-            self.str_owl_classes = [x.n3()[1:-1] for x in self.rdflib_graph.subjects(rdflib.RDF.type, rdflib.OWL.Class) if not isinstance(x, rdflib.term.BNode)]
-            self.str_owl_individuals = [x.n3()[1:-1] for x in self.rdflib_graph.subjects(rdflib.RDF.type, rdflib.OWL.NamedIndividual) if not isinstance(x, rdflib.term.BNode)]
+            self.path = path
+            self.streaming = streaming
+            if streaming:
+                if os.path.splitext(path)[1].lower() not in (".nt", ".ntriples"):
+                    raise ValueError(f"Streaming requires an N-Triples file, got {path}. Convert it first, "
+                                     f"e.g. with SyncOntology.save(path, document_format='nt').")
+                self.rdflib_graph = None
+            else:
+                self.rdflib_graph = rdflib.Graph().parse(path)
+            self.str_owl_classes = set()
+            self.str_owl_individuals = set()
+            self._str_object_properties = set()
+            self._str_data_properties = set()
+            signatures = {rdflib.OWL.Class: self.str_owl_classes,
+                          rdflib.OWL.NamedIndividual: self.str_owl_individuals,
+                          rdflib.OWL.ObjectProperty: self._str_object_properties,
+                          rdflib.OWL.DatatypeProperty: self._str_data_properties}
+            # a streamed file is read in full here anyway, so its triples are counted for __len__ on the way
+            n_triples = 0
+            for s, p, o in self._triples((None, None, None) if streaming else (None, rdflib.RDF.type, None)):
+                n_triples += 1
+                if p != rdflib.RDF.type:
+                    continue
+                signature = signatures.get(o)
+                if signature is not None and isinstance(s, rdflib.URIRef):
+                    signature.add(str(s))
+            self._n_triples = n_triples if streaming else None
         else:  # create a blank rdf ontology
             raise NotImplementedError("Currently supports only loading an existing ontology")
 
+    def _triples(self, pattern=(None, None, None)):
+        if not self.streaming:
+            yield from self.rdflib_graph.triples(pattern)
+            return
+        s_, p_, o_ = pattern
+        for s, p, o in _stream_ntriples(self.path):
+            if (s_ is None or s == s_) and (p_ is None or p == p_) and (o_ is None or o == o_):
+                yield s, p, o
+
     def __len__(self) -> int:
-        return len(self.rdflib_graph)
+        if not self.streaming:
+            return len(self.rdflib_graph)
+        return self._n_triples
 
     def get_tbox_axioms(self) -> Iterable[OWLSubClassOfAxiom | OWLEquivalentClassesAxiom]:
-        results = []
-        for owl_class in self.rdflib_graph.subjects(rdflib.RDF.type, rdflib.OWL.Class):
-            if isinstance(owl_class, rdflib.term.URIRef):
-                str_owl_class = owl_class.n3()[1:-1]
-                for (_, p, o) in self.rdflib_graph.triples(triple=(owl_class, None, None)):
-                    if isinstance(o, rdflib.term.BNode):
-                        continue
-                    str_iri_predicate = p.n3()
-                    str_iri_object = o.n3()[1:-1]
-                    if str_iri_predicate == "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>":
-                        # Ignore for the timebing
-                        axiom = OWLDeclarationAxiom(OWLClass(str_owl_class))
-                    elif str_iri_predicate == "<http://www.w3.org/2000/01/rdf-schema#subClassOf>":
-                        axiom = OWLSubClassOfAxiom(sub_class=OWLClass(str_owl_class),
-                                                   super_class=OWLClass(str_iri_object))
-
-                    elif str_iri_predicate == "<http://www.w3.org/2002/07/owl#equivalentClass>":
-                        axiom = OWLEquivalentClassesAxiom([OWLClass(str_owl_class), OWLClass(str_iri_object)])
-                    else:
-                        raise NotImplementedError(f"{str_iri_predicate} unsure")
-                    if axiom:
-                        results.append(axiom)
-        return results
+        classes = self.str_owl_classes
+        for (s, p, o) in self._triples():
+            if not isinstance(s, rdflib.URIRef) or isinstance(o, rdflib.BNode):
+                continue
+            str_owl_class = str(s)
+            if str_owl_class not in classes:
+                continue
+            if p == rdflib.RDF.type:
+                # Ignore for the timebing
+                yield OWLDeclarationAxiom(OWLClass(str_owl_class))
+            elif p == rdflib.RDFS.subClassOf:
+                yield OWLSubClassOfAxiom(sub_class=OWLClass(str_owl_class), super_class=OWLClass(str(o)))
+            elif p == rdflib.OWL.equivalentClass:
+                yield OWLEquivalentClassesAxiom([OWLClass(str_owl_class), OWLClass(str(o))])
+            else:
+                raise NotImplementedError(f"{p.n3()} unsure")
 
     def get_abox_axioms(self) -> Iterable:
-        results=[]
-        for owl_individual in self.rdflib_graph.subjects(rdflib.RDF.type, rdflib.OWL.NamedIndividual):
-            if isinstance(owl_individual, rdflib.term.URIRef):
-                str_owl_individual = owl_individual.n3()[1:-1]
-                for (_, p, o) in self.rdflib_graph.triples(triple=(owl_individual,None, None)):
-                    if isinstance(o, rdflib.term.BNode):
-                        continue
-                    str_iri_predicate = p.n3()[1:-1]
-                    str_iri_object = o.n3()[1:-1]
-                    axiom=None
-                    if str_iri_predicate == "http://www.w3.org/1999/02/22-rdf-syntax-ns#type":
-                        if str_iri_object in self.str_owl_classes:
-                            axiom = OWLClassAssertionAxiom(OWLNamedIndividual(str_owl_individual), OWLClass(str_iri_object))
-                        elif str_iri_object == "http://www.w3.org/2002/07/owl#NamedIndividual":
-                            # axiom= OWLDeclarationAxiom(OWLNamedIndividual(str_owl_individual))
-                            continue
-                        else:
-                            raise RuntimeError(f"Incorrect Parsing:\t{str_owl_individual}\t{str_iri_predicate}\t{str_iri_object}")
-                    elif str_iri_object in self.str_owl_individuals:
-                        axiom = OWLObjectPropertyAssertionAxiom(OWLNamedIndividual(str_owl_individual),
-                                                                             OWLObjectProperty(str_iri_predicate),
-                                                                             OWLNamedIndividual(str_iri_object))
-                    else:
-
-                        raise NotImplementedError("")
-                    if axiom:
-                        results.append(axiom)
-        return results
+        classes, individuals = self.str_owl_classes, self.str_owl_individuals
+        # entities of the few classes and properties, and of the subject that the previous triples were about
+        owl_classes, object_properties, data_properties = dict(), dict(), dict()
+        last_subject = owl_individual = None
+        for (s, p, o) in self._triples():
+            if not isinstance(s, rdflib.URIRef) or isinstance(o, rdflib.BNode):
+                continue
+            if s != last_subject:
+                str_owl_individual = str(s)
+                if str_owl_individual not in individuals:
+                    continue
+                last_subject, owl_individual = s, OWLNamedIndividual(str_owl_individual)
+            if p == rdflib.RDF.type:
+                str_iri_object = str(o)
+                if str_iri_object in classes:
+                    owl_class = owl_classes.get(str_iri_object)
+                    if owl_class is None:
+                        owl_class = owl_classes[str_iri_object] = OWLClass(str_iri_object)
+                    yield OWLClassAssertionAxiom(owl_individual, owl_class)
+                elif o != rdflib.OWL.NamedIndividual:
+                    raise RuntimeError(f"Incorrect Parsing:\t{owl_individual.str}\t{p}\t{o}")
+            elif isinstance(o, rdflib.Literal):
+                data_property = data_properties.get(p)
+                if data_property is None:
+                    data_property = data_properties[p] = OWLDataProperty(str(p))
+                literal = OWLLiteral(str(o), OWLDatatype(IRI.create(str(o.datatype)))) \
+                    if o.datatype is not None else OWLLiteral(str(o))
+                yield OWLDataPropertyAssertionAxiom(owl_individual, data_property, literal)
+            elif str(o) in individuals:
+                object_property = object_properties.get(p)
+                if object_property is None:
+                    object_property = object_properties[p] = OWLObjectProperty(str(p))
+                yield OWLObjectPropertyAssertionAxiom(owl_individual, object_property, OWLNamedIndividual(str(o)))
+            else:
+                raise NotImplementedError("")
 
     def classes_in_signature(self) -> Iterable[OWLClass]:
-        raise NotImplementedError()
-        for c in self._onto.classes():
-            yield OWLClass(IRI.create(c.iri))
+        for c in self.str_owl_classes:
+            yield OWLClass(c)
 
     def data_properties_in_signature(self) -> Iterable[OWLDataProperty]:
-        raise NotImplementedError()
-
-        for dp in self._onto.data_properties():
-            yield OWLDataProperty(IRI.create(dp.iri))
+        for dp in self._str_data_properties:
+            yield OWLDataProperty(dp)
 
     def object_properties_in_signature(self) -> Iterable[OWLObjectProperty]:
-        raise NotImplementedError()
-
-        for op in self._onto.object_properties():
-            yield OWLObjectProperty(IRI.create(op.iri))
+        for op in self._str_object_properties:
+            yield OWLObjectProperty(op)
 
     def properties_in_signature(self) -> Iterable[OWLProperty]:
-        raise NotImplementedError()
-
         yield from self.object_properties_in_signature()
         yield from self.data_properties_in_signature()
 
     def individuals_in_signature(self) -> Iterable[OWLNamedIndividual]:
-        raise NotImplementedError()
-
-        for (s,p,o) in self.rdflib_graph.subjects(rdflib.RDF.type, rdflib.OWL.NamedIndividual):
-            print(s,p,o)
-        # for i in self._onto.individuals():
-        #    yield OWLNamedIndividual(IRI.create(i.iri))
-
+        for i in self.str_owl_individuals:
+            yield OWLNamedIndividual(i)
 
     def get_abox_axioms_between_individuals(self)->Iterable:
         # @TODO: CD: Return all information between owl_individuals, i.e., triples with object properties
@@ -1700,6 +2824,447 @@ class RDFLibOntology(AbstractOWLOntology):
         return f'RDFLibOntology({self._onto.base_iri}, loaded:{self._onto.loaded})'
 
 
+class TripleStoreOntology(AbstractOWLOntology, _StructuralReasonerBackend):
+    """Read-only ontology backed by a :class:`owlapy.triple_store.TripleStore` of dictionary-encoded triples.
+
+    Only the ids of the classes, properties and individuals in the signature are computed when the ontology is opened,
+    entities and axioms are created when they are requested. :class:`owlapy.owl_reasoner.StructuralReasoner` answers
+    its queries on the integer triples directly. Class expressions are not decoded from the blank nodes of the store,
+    so only axioms between named entities are available.
+    """
+    __slots__ = 'path', 'store', '_ids', '_entities', '_literals', '_classes', '_individuals', '_object_properties', \
+        '_data_properties'
+
+    def __init__(self, path: str, mmap: bool = True):
+        """Open an ontology as a triple store.
+
+        Args:
+            path: Path of an N-Triples file or of a directory that a store was saved to with
+                :func:`TripleStoreOntology.save`.
+            mmap: Whether to memory-map the arrays of a saved store instead of reading them into memory.
+        """
+        self.path = path
+        if os.path.isdir(path):
+            self.store = TripleStore.load(path, mmap=mmap)
+        elif os.path.splitext(path)[1].lower() in (".nt", ".ntriples"):
+            self.store = TripleStore.from_rdf(_stream_ntriples(path))
+        else:
+            raise ValueError(f"TripleStoreOntology requires an N-Triples file or a saved store, got {path}. Convert it "
+                             f"first, e.g. with SyncOntology.save(path, document_format='nt').")
+        self._ids: Dict[str, Optional[int]] = dict()
+        self._entities: Dict[Tuple[type, int], OWLEntity] = dict()
+        self._literals: Dict[int, OWLLiteral] = dict()
+        self._classes = self._typed(rdflib.OWL.Class)
+        self._object_properties = self._typed(rdflib.OWL.ObjectProperty)
+        self._data_properties = self._typed(rdflib.OWL.DatatypeProperty)
+        individuals = self._typed(rdflib.OWL.NamedIndividual)
+        t = self._id(rdflib.RDF.type)
+        if t is not None:
+            s, _, o = self.store.match(None, t)
+            individuals = np.union1d(individuals, s[np.isin(o, self._classes) & self.store.is_iri(s)])
+        self._individuals = individuals
+
+    def _id(self, iri: str) -> Optional[int]:
+        try:
+            return self._ids[iri]
+        except KeyError:
+            i = self._ids[iri] = self.store.id_of(iri)
+            return i
+
+    def _typed(self, type_iri: str) -> np.ndarray:
+        """Get the sorted ids of the IRIs that have the given rdf:type."""
+        t, c = self._id(rdflib.RDF.type), self._id(type_iri)
+        if t is None or c is None:
+            return np.empty(0, dtype=self.store.spo.dtype)
+        s = self.store.subjects(t, c)
+        return s[self.store.is_iri(s)]
+
+    def _entity(self, typ: type, i: int):
+        e = self._entities.get((typ, i))
+        if e is None:
+            e = self._entities[(typ, i)] = typ(IRI.create(self.store.term(i)))
+        return e
+
+    def _individual(self, i: int) -> OWLNamedIndividual:
+        return self._entity(OWLNamedIndividual, i)
+
+    def _literal(self, i: int) -> OWLLiteral:
+        lit = self._literals.get(i)
+        if lit is None:
+            lexical, datatype, _ = decode_literal(self.store.term(i))
+            if datatype is None:
+                lit = OWLLiteral(lexical)
+            else:
+                # parse the datatypes known to owlready2 in the same way, so that the literals equal those of Ontology
+                abbrev = _o2base._universal_iri_2_abbrev.get(datatype)
+                try:
+                    lit = OWLLiteral(_o2base.from_literal(lexical, abbrev)) if abbrev is not None else None
+                except ValueError:
+                    lit = None
+                if lit is None:
+                    lit = OWLLiteral(lexical, OWLDatatype(IRI.create(datatype)))
+            self._literals[i] = lit
+        return lit
+
+    def _linked(self, i: int, predicate: str, inverse: bool = False) -> np.ndarray:
+        """Get the IRI ids that are objects of (i, predicate, ?), or subjects of (?, predicate, i) if inverse."""
+        p = self._id(predicate)
+        if p is None:
+            return np.empty(0, dtype=self.store.spo.dtype)
+        ids = self.store.subjects(p, i) if inverse else self.store.objects(i, p)
+        return ids[self.store.is_iri(ids)]
+
+    def _closure(self, ids: Iterable[int], steps: Iterable[Tuple[str, bool]]) -> set:
+        """Get the ids together with all IRI ids reachable from them over the (predicate, inverse) steps."""
+        steps = list(steps)
+        seen = set(ids)
+        todo = list(seen)
+        while todo:
+            i = todo.pop()
+            for predicate, inverse in steps:
+                for j in self._linked(i, predicate, inverse).tolist():
+                    if j not in seen:
+                        seen.add(j)
+                        todo.append(j)
+        return seen
+
+    def _named(self, e: OWLEntity, predicate: str, typ: type, inverse: bool = False, symmetric: bool = False,
+               transitive: bool = False) -> list:
+        """Get the named entities that are linked to e by the predicate, as entities of type typ.
+
+        Args:
+            e: The entity.
+            predicate: IRI of the predicate.
+            typ: Entity type of the result.
+            inverse: Follow the predicate from object to subject.
+            symmetric: Follow the predicate in both directions.
+            transitive: Follow the predicate transitively.
+        """
+        i = self._id(e.str)
+        if i is None:
+            return []
+        steps = [(predicate, inverse)]
+        if symmetric:
+            steps.append((predicate, not inverse))
+        if transitive:
+            ids = self._closure((i,), steps)
+        else:
+            ids = set(chain.from_iterable(self._linked(i, p, inv).tolist() for p, inv in steps))
+        ids.discard(i)
+        return [self._entity(typ, j) for j in sorted(ids)]
+
+    def _instance_ids(self, c: OWLClass) -> np.ndarray:
+        """Get the sorted ids of the individuals of c, its named sub classes and its equivalent classes."""
+        if c.is_owl_thing():
+            return self._individuals
+        i, t = self._id(c.str), self._id(rdflib.RDF.type)
+        if i is None or t is None:
+            return np.empty(0, dtype=self.store.spo.dtype)
+        classes = self._closure((i,), ((rdflib.RDFS.subClassOf, True), (rdflib.OWL.equivalentClass, False),
+                                       (rdflib.OWL.equivalentClass, True)))
+        ids = np.unique(np.concatenate([self.store.subjects(t, k) for k in classes]))
+        return ids[self.store.is_iri(ids)]
+
+    def _type_ids(self, ind: OWLNamedIndividual, direct: bool) -> List[int]:
+        """Get the ids of the asserted classes of the individual, and of all their super classes if not direct."""
+        i = self._id(ind.str)
+        if i is None:
+            return []
+        ids = self._linked(i, rdflib.RDF.type)
+        ids = ids[np.isin(ids, self._classes)].tolist()
+        if not direct:
+            ids = sorted(self._closure(ids, ((rdflib.RDFS.subClassOf, False), (rdflib.OWL.equivalentClass, False),
+                                             (rdflib.OWL.equivalentClass, True))))
+        return ids
+
+    def _inverse_ids(self, i: int) -> set:
+        return set(self._linked(i, rdflib.OWL.inverseOf).tolist()) | set(
+            self._linked(i, rdflib.OWL.inverseOf, inverse=True).tolist())
+
+    def _assertion_pairs(self, properties: Iterable[OWLProperty]) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the subject and object ids of the assertions of the properties.
+
+        Assertions of the named inverse properties of object properties are included with subject and object swapped,
+        like owlready2 does. Only objects that are IRIs (for object properties) or literals (for data properties) are
+        returned.
+        """
+        store = self.store
+        subjects, objects = [], []
+        for p in properties:
+            i = self._id(p.str)
+            if i is None:
+                continue
+            parts = [store.match(None, i)[::2]]
+            if isinstance(p, OWLObjectProperty):
+                parts.extend(store.match(None, j)[::-2] for j in self._inverse_ids(i))
+            for s, o in parts:
+                mask = store.is_iri(s) & (store.is_iri(o) if isinstance(p, OWLObjectProperty) else store.is_literal(o))
+                subjects.append(s[mask])
+                objects.append(o[mask])
+        if not subjects:
+            return np.empty(0, dtype=store.spo.dtype), np.empty(0, dtype=store.spo.dtype)
+        return np.concatenate(subjects), np.concatenate(objects)
+
+    def _value_ids(self, ind: OWLNamedIndividual, properties: Iterable[OWLProperty], inverse: bool = False) \
+            -> np.ndarray:
+        """Get the sorted ids of the values of the properties for the individual, or of the subjects that have the
+        individual as value if inverse (see :func:`TripleStoreOntology._assertion_pairs`)."""
+        store = self.store
+        i = self._id(ind.str)
+        parts = []
+        for p in properties if i is not None else ():
+            j = self._id(p.str)
+            if j is None:
+                continue
+            values = [store.subjects(j, i) if inverse else store.objects(i, j)]
+            if isinstance(p, OWLObjectProperty):
+                values.extend(store.objects(i, k) if inverse else store.subjects(k, i) for k in self._inverse_ids(j))
+            for v in values:
+                parts.append(v[store.is_iri(v) if isinstance(p, OWLObjectProperty) else store.is_literal(v)])
+        if not parts:
+            return np.empty(0, dtype=store.spo.dtype)
+        return np.unique(np.concatenate(parts))
+
+    def _types(self, ind: OWLNamedIndividual, direct: bool) -> Iterable[OWLClass]:
+        classes = [self._entity(OWLClass, i) for i in self._type_ids(ind, direct)]
+        # like owlready2, individuals without a class are instances of owl:Thing
+        if not classes or not direct:
+            classes.append(OWLThing)
+        return dict.fromkeys(classes)
+
+    def _class_instances(self, c: OWLClass) -> Iterable[OWLNamedIndividual]:
+        return map(self._individual, self._instance_ids(c).tolist())
+
+    def _direct_super(self, e: Union[OWLClass, OWLProperty], only_named: bool = True) \
+            -> Iterable[Union[OWLClassExpression, OWLProperty]]:
+        if isinstance(e, OWLClass):
+            supers = self._named(e, rdflib.RDFS.subClassOf, OWLClass)
+            # owl:Thing if it has none, like in owlready2
+            return supers if supers or e.is_owl_thing() else [OWLThing]
+        return self._named(e, rdflib.RDFS.subPropertyOf, type(e))
+
+    def _direct_sub(self, e: Union[OWLClass, OWLProperty]) -> Iterable[Union[OWLClass, OWLProperty]]:
+        if isinstance(e, OWLClass):
+            subs = self._named(e, rdflib.RDFS.subClassOf, OWLClass, inverse=True)
+            # the classes without a super class are sub classes of owl:Thing, like in owlready2
+            if e.is_owl_thing():
+                subs.extend(k for k in self.classes_in_signature()
+                            if not self._named(k, rdflib.RDFS.subClassOf, OWLClass))
+            return subs
+        return self._named(e, rdflib.RDFS.subPropertyOf, type(e), inverse=True)
+
+    def _sub_class_edges(self) -> Iterable[Tuple[OWLClass, Iterable[OWLClass]]]:
+        for c in self.classes_in_signature():
+            yield c, set(self._named(c, rdflib.RDFS.subClassOf, OWLClass, inverse=True))
+
+    def _equivalents(self, e: Union[OWLClass, OWLProperty, OWLNamedIndividual], only_named: bool = True) \
+            -> Iterable[Union[OWLClassExpression, OWLProperty, OWLNamedIndividual]]:
+        if isinstance(e, OWLNamedIndividual):
+            predicate = rdflib.OWL.sameAs
+        elif isinstance(e, OWLProperty):
+            predicate = rdflib.OWL.equivalentProperty
+        else:
+            predicate = rdflib.OWL.equivalentClass
+        return self._named(e, predicate, type(e), symmetric=True, transitive=True)
+
+    def _disjoints(self, e: Union[OWLClass, OWLProperty, OWLNamedIndividual], only_named: bool = True) \
+            -> Iterable[Union[OWLClassExpression, OWLProperty, OWLNamedIndividual]]:
+        if isinstance(e, OWLNamedIndividual):
+            predicate = rdflib.OWL.differentFrom
+        elif isinstance(e, OWLProperty):
+            predicate = rdflib.OWL.propertyDisjointWith
+        else:
+            predicate = rdflib.OWL.disjointWith
+        return self._named(e, predicate, type(e), symmetric=True)
+
+    def _inverse_property(self, p: OWLObjectProperty) -> Optional[OWLObjectProperty]:
+        inverses = self._named(p, rdflib.OWL.inverseOf, OWLObjectProperty, symmetric=True)
+        return inverses[0] if inverses else None
+
+    def _sub_properties_and_self(self, pe: OWLProperty) -> list:
+        return [pe, *self._named(pe, rdflib.RDFS.subPropertyOf, type(pe), inverse=True, transitive=True)]
+
+    def _property_values(self, ind: OWLNamedIndividual, pe: OWLPropertyExpression, direct: bool) \
+            -> Iterable[Union[OWLNamedIndividual, OWLLiteral]]:
+        if not isinstance(pe, (OWLDataProperty, OWLObjectProperty, OWLObjectInverseOf)):
+            raise NotImplementedError(pe)
+        p = pe.get_named_property() if isinstance(pe, OWLObjectInverseOf) else pe
+        properties = [p] if direct else self._sub_properties_and_self(p)
+        values = self._value_ids(ind, properties, inverse=isinstance(pe, OWLObjectInverseOf))
+        return map(self._literal if isinstance(p, OWLDataProperty) else self._individual, values.tolist())
+
+    def _property_assertions(self, pe: OWLPropertyExpression, sub_properties: Iterable[OWLPropertyExpression]) \
+            -> Iterable[Tuple[OWLNamedIndividual, Union[OWLNamedIndividual, OWLLiteral]]]:
+        individual = self._individual
+        value = self._literal if isinstance(pe, OWLDataProperty) else individual
+        for p in chain((pe,), sub_properties):
+            if isinstance(p, OWLObjectInverseOf):
+                objects, subjects = self._assertion_pairs((p.get_named_property(),))
+            else:
+                subjects, objects = self._assertion_pairs((p,))
+            for s, o in zip(subjects.tolist(), objects.tolist()):
+                yield individual(s), value(o)
+
+    def _term_id(self, e: OWLEntity) -> Optional[int]:
+        return self._id(e.str)
+
+    def _term_individual(self, i: int) -> Optional[OWLNamedIndividual]:
+        # the assertion pairs only contain IRIs, which are all taken as individuals like owlready2 does
+        return self._individual(i)
+
+    def _assertion_term_pairs(self, properties: Iterable[OWLObjectProperty]) -> Iterable[Tuple[int, int]]:
+        subjects, objects = self._assertion_pairs(properties)
+        return zip(subjects.tolist(), objects.tolist())
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def classes_in_signature(self) -> Iterable[OWLClass]:
+        for i in self._classes.tolist():
+            yield self._entity(OWLClass, i)
+
+    def data_properties_in_signature(self) -> Iterable[OWLDataProperty]:
+        for i in self._data_properties.tolist():
+            yield self._entity(OWLDataProperty, i)
+
+    def object_properties_in_signature(self) -> Iterable[OWLObjectProperty]:
+        for i in self._object_properties.tolist():
+            yield self._entity(OWLObjectProperty, i)
+
+    def properties_in_signature(self) -> Iterable[OWLProperty]:
+        yield from self.object_properties_in_signature()
+        yield from self.data_properties_in_signature()
+
+    def individuals_in_signature(self) -> Iterable[OWLNamedIndividual]:
+        for i in self._individuals.tolist():
+            yield self._individual(i)
+
+    def get_tbox_axioms(self) -> Iterable[OWLAxiom]:
+        """Get the TBox axioms of this ontology, the same axiom types as :meth:`Ontology.get_tbox_axioms` returns.
+
+        Class expressions are not decoded from the blank nodes of the store, so only the axioms between named classes
+        and datatypes are returned.
+        """
+        for c in self.classes_in_signature():
+            for sc in self._named(c, rdflib.RDFS.subClassOf, OWLClass):
+                yield OWLSubClassOfAxiom(sub_class=c, super_class=sc)
+            for ec in self._named(c, rdflib.OWL.equivalentClass, OWLClass):
+                yield OWLEquivalentClassesAxiom([c, ec])
+            for dc in self._named(c, rdflib.OWL.disjointWith, OWLClass):
+                yield OWLDisjointClassesAxiom([c, dc])
+        functional, inverse_functional = self._id(rdflib.OWL.FunctionalProperty), \
+            self._id(rdflib.OWL.InverseFunctionalProperty)
+        for op in self.object_properties_in_signature():
+            for dom in self._named(op, rdflib.RDFS.domain, OWLClass):
+                yield OWLObjectPropertyDomainAxiom(op, dom)
+            for rng in self._named(op, rdflib.RDFS.range, OWLClass):
+                yield OWLObjectPropertyRangeAxiom(op, rng)
+            types = self._linked(self._id(op.str), rdflib.RDF.type).tolist()
+            if functional in types:
+                yield OWLFunctionalObjectPropertyAxiom(op)
+            if inverse_functional in types:
+                yield OWLInverseFunctionalObjectPropertyAxiom(op)
+        for dp in self.data_properties_in_signature():
+            for dom in self._named(dp, rdflib.RDFS.domain, OWLClass):
+                yield OWLDataPropertyDomainAxiom(dp, dom)
+            for rng in self._named(dp, rdflib.RDFS.range, OWLDatatype):
+                yield OWLDataPropertyRangeAxiom(dp, rng)
+            if functional in self._linked(self._id(dp.str), rdflib.RDF.type).tolist():
+                yield OWLFunctionalDataPropertyAxiom(dp)
+
+    def get_abox_axioms(self) -> Iterable[OWLAxiom]:
+        store = self.store
+        s, p, o = store.spo
+        mask = np.isin(s, self._individuals)
+        t = self._id(rdflib.RDF.type)
+        object_properties = {i: self._entity(OWLObjectProperty, i) for i in self._object_properties.tolist()}
+        data_properties = {i: self._entity(OWLDataProperty, i) for i in self._data_properties.tolist()}
+        classes = set(self._classes.tolist())
+        is_iri = store.is_iri(o)
+        for s_, p_, o_, iri in zip(s[mask].tolist(), p[mask].tolist(), o[mask].tolist(), is_iri[mask].tolist()):
+            if p_ == t:
+                if o_ in classes:
+                    yield OWLClassAssertionAxiom(self._individual(s_), self._entity(OWLClass, o_))
+            elif p_ in object_properties and iri:
+                yield OWLObjectPropertyAssertionAxiom(self._individual(s_), object_properties[p_],
+                                                      self._individual(o_))
+            elif p_ in data_properties and not iri:
+                yield OWLDataPropertyAssertionAxiom(self._individual(s_), data_properties[p_], self._literal(o_))
+
+    def equivalent_classes_axioms(self, c: OWLClass) -> Iterable[OWLEquivalentClassesAxiom]:
+        for ec in self._named(c, rdflib.OWL.equivalentClass, OWLClass, symmetric=True):
+            yield OWLEquivalentClassesAxiom([c, ec])
+
+    def general_class_axioms(self) -> Iterable[OWLClassAxiom]:
+        # class expressions are not decoded from the blank nodes of the store
+        yield from ()
+
+    def _super_properties_and_self(self, pe: OWLProperty) -> list:
+        return [pe, *self._named(pe, rdflib.RDFS.subPropertyOf, type(pe), transitive=True)]
+
+    def data_property_domain_axioms(self, pe: OWLDataProperty) -> Iterable[OWLDataPropertyDomainAxiom]:
+        domains = {d for p in self._super_properties_and_self(pe) for d in self._named(p, rdflib.RDFS.domain, OWLClass)}
+        if len(domains) == 0:
+            yield OWLDataPropertyDomainAxiom(pe, OWLThing)
+        for dom in domains:
+            yield OWLDataPropertyDomainAxiom(pe, dom)
+
+    def data_property_range_axioms(self, pe: OWLDataProperty) -> Iterable[OWLDataPropertyRangeAxiom]:
+        for p in self._super_properties_and_self(pe):
+            for rng in self._named(p, rdflib.RDFS.range, OWLDatatype):
+                yield OWLDataPropertyRangeAxiom(pe, rng)
+
+    def object_property_domain_axioms(self, pe: OWLObjectProperty) -> Iterable[OWLObjectPropertyDomainAxiom]:
+        domains = {d for p in self._super_properties_and_self(pe) for d in self._named(p, rdflib.RDFS.domain, OWLClass)}
+        if len(domains) == 0:
+            yield OWLObjectPropertyDomainAxiom(pe, OWLThing)
+        for dom in domains:
+            yield OWLObjectPropertyDomainAxiom(pe, dom)
+
+    def object_property_range_axioms(self, pe: OWLObjectProperty) -> Iterable[OWLObjectPropertyRangeAxiom]:
+        ranges = {r for p in self._super_properties_and_self(pe) for r in self._named(p, rdflib.RDFS.range, OWLClass)}
+        if len(ranges) == 0:
+            yield OWLObjectPropertyRangeAxiom(pe, OWLThing)
+        for rng in ranges:
+            yield OWLObjectPropertyRangeAxiom(pe, rng)
+
+    def get_ontology_id(self) -> OWLOntologyID:
+        ontologies = self._typed(rdflib.OWL.Ontology)
+        if len(ontologies) == 0:
+            return OWLOntologyID()
+        i = int(ontologies[0])
+        versions = self._linked(i, _VERSION_IRI.as_str())
+        return OWLOntologyID(IRI.create(self.store.term(i)),
+                             IRI.create(self.store.term(int(versions[0]))) if len(versions) else None)
+
+    @property
+    def revision(self) -> int:
+        """Always 0, the ontology cannot be changed."""
+        return 0
+
+    def add_axiom(self, axiom: Union[OWLAxiom, Iterable[OWLAxiom]]):
+        raise NotImplementedError("TripleStoreOntology is read-only")
+
+    def remove_axiom(self, axiom: Union[OWLAxiom, Iterable[OWLAxiom]]):
+        raise NotImplementedError("TripleStoreOntology is read-only")
+
+    def save(self, path: str):
+        """Save the triple store into a directory, from which it can be memory-mapped by
+        :class:`TripleStoreOntology`."""
+        self.store.save(path)
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            return self.store is other.store or self.store.content_hash() == other.store.content_hash()
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(("TripleStoreOntology", self.store.content_hash()))
+
+    def __repr__(self):
+        return f'TripleStoreOntology({self.path}, triples:{len(self.store)})'
+
+
 OWLREADY2_FACET_KEYS = MappingProxyType({
     OWLFacet.MIN_INCLUSIVE: "min_inclusive",
     OWLFacet.MIN_EXCLUSIVE: "min_exclusive",
@@ -2214,6 +3779,31 @@ class NeuralOntology(AbstractOWLOntology):
                 self.model.predict_topk(h=h, r=r, t=t, topk=topk, batch_size=self.batch_size) for top_entity, score in
                 row if score >= self.gamma and is_valid_entity(top_entity)]
 
+    def predict_batch(self, h: Optional[List[str]] = None, r: List[str] = None, t: Optional[List[str]] = None) \
+            -> List[List[Tuple[str, float]]]:
+        """Predict the missing entity of several queries of the same shape with a single predict_topk call.
+
+        Either h (tail prediction) or t (head prediction) is None, the other one and r hold one entry per query.
+
+        Returns:
+            One row of predictions with a score of at least gamma per query, in the order of the queries. Queries
+            with an entity or relation that is unknown to the model get an empty row.
+        """
+        given = t if h is None else h
+        known = [i for i, (e, ri) in enumerate(zip(given, r))
+                 if ri in self.model.relation_to_idx and e in self.model.entity_to_idx]
+        rows = [[] for _ in r]
+        if not known:
+            return rows
+        given = [given[i] for i in known]
+        result = self.model.predict_topk(h=None if h is None else given, r=[r[i] for i in known],
+                                         t=given if h is None else None, topk=len(self.model.entity_to_idx),
+                                         batch_size=self.batch_size)
+        for i, row in zip(known, result):
+            rows[i] = [(top_entity, score) for top_entity, score in row
+                       if score >= self.gamma and is_valid_entity(top_entity)]
+        return rows
+
     def classes_in_signature(self) -> List[OWLClass]:
         return [OWLClass(top_entity) for top_entity, score in self.predict(h=None,
                                                                            r=self.STR_IRI_TYPE,
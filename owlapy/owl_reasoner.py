@@ -1,18 +1,31 @@
 """OWL Reasoner"""
 import os
+import hashlib
+import mmap
 import operator
+import pickle
+import queue
+import tempfile
+import threading
+import weakref
 import logging
 import owlready2
+import numpy as np
 import json
+import re
 import subprocess
 import sys
 
+from array import array
 from collections import defaultdict, Counter
-from functools import singledispatchmethod, reduce, cached_property
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from functools import singledispatchmethod, reduce, cached_property, wraps
 from itertools import chain, repeat
 from types import MappingProxyType, FunctionType
 from typing import (DefaultDict,Generator, Iterable, Dict, Mapping, Set, Type, TypeVar, Optional, FrozenSet, Union,
-                    List, Tuple)
+                    List, Tuple, Final)
 
 from owlapy.class_expression import OWLClassExpression, OWLObjectSomeValuesFrom, OWLObjectUnionOf, \
     OWLObjectIntersectionOf, OWLObjectComplementOf, OWLObjectAllValuesFrom, OWLObjectOneOf, OWLObjectHasValue, \
@@ -20,19 +33,23 @@ from owlapy.class_expression import OWLClassExpression, OWLObjectSomeValuesFrom,
     OWLDataSomeValuesFrom, OWLDataOneOf, OWLDatatypeRestriction, OWLFacetRestriction, OWLDataHasValue, \
     OWLDataAllValuesFrom, OWLNothing, OWLThing, OWLDataMinCardinality, OWLDataMaxCardinality, OWLDataExactCardinality
 from owlapy.class_expression import OWLClass
+from owlapy import namespaces
 from owlapy.iri import IRI
-from owlapy.owl_axiom import OWLAxiom, OWLSubClassOfAxiom
+from owlapy.owl_axiom import OWLAxiom, OWLSubClassOfAxiom, OWLClassAssertionAxiom, OWLObjectPropertyAssertionAxiom, \
+    OWLDataPropertyAssertionAxiom, OWLSubObjectPropertyOfAxiom, OWLSubDataPropertyOfAxiom
 from owlapy.owl_data_ranges import OWLDataComplementOf, OWLDataUnionOf, OWLDataIntersectionOf
 from owlapy.owl_datatype import OWLDatatype
-from owlapy.owl_object import OWLEntity
-from owlapy.owl_ontology import Ontology, _parse_concept_to_owlapy, SyncOntology, NeuralOntology
+from owlapy.owl_object import OWLEntity, OWLObject
+from owlapy.owl_ontology import Ontology, SyncOntology, NeuralOntology, TripleStoreOntology, _StructuralReasonerBackend
 from owlapy.abstracts.abstract_owl_ontology import AbstractOWLOntology
 from owlapy.owl_property import OWLObjectPropertyExpression, OWLDataProperty, OWLObjectProperty, OWLObjectInverseOf, \
     OWLPropertyExpression, OWLDataPropertyExpression, OWLProperty
 from owlapy.owl_individual import OWLNamedIndividual
 from owlapy.owl_literal import OWLLiteral, OWLBottomObjectProperty, OWLTopObjectProperty, OWLBottomDataProperty, \
-    OWLTopDataProperty
-from owlapy.utils import run_with_timeout
+    OWLTopDataProperty, FloatSpecialValue
+from owlapy.vocab import OWLFacet
+from owlapy.utils import run_with_timeout, check_timeout, LRUCache, TimeoutResult
+from owlapy.rdf_writer import RDFStreamWriter, RDF_STREAM_FORMATS, RDF_TYPE
 from owlapy.abstracts.abstract_owl_reasoner import AbstractOWLReasoner
 from jpype import JClass
 
@@ -42,11 +59,676 @@ logger = logging.getLogger(__name__)
 _P = TypeVar('_P', bound=OWLPropertyExpression)
 
 
+class _IndividualIndex:
+    """Dense integer ids for named individuals.
+
+    Sets of individuals are encoded as python ints where bit i is set iff the individual with id i is contained.
+    """
+    __slots__ = '_inds', '_ids', '_n_signature'
+
+    def __init__(self, individuals: Iterable[OWLNamedIndividual]):
+        self._inds: List[OWLNamedIndividual] = []
+        self._ids: Dict[OWLNamedIndividual, int] = dict()
+        for ind in individuals:
+            self.id_of(ind)
+        self._n_signature = len(self._inds)
+
+    def __len__(self):
+        return len(self._inds)
+
+    def id_of(self, ind: OWLNamedIndividual) -> int:
+        """Get the id of an individual, assigning a new one if the individual is not indexed yet."""
+        i = self._ids.get(ind)
+        if i is None:
+            i = len(self._inds)
+            self._ids[ind] = i
+            self._inds.append(ind)
+        return i
+
+    def individual(self, i: int) -> OWLNamedIndividual:
+        return self._inds[i]
+
+    def all_bits(self) -> int:
+        """Bitset of all individuals in the signature of the ontology."""
+        return (1 << self._n_signature) - 1
+
+    def ids_to_bits(self, ids: Iterable[int]) -> int:
+        return _ids_to_bits(ids, len(self._inds))
+
+    def to_bits(self, individuals: Iterable[OWLNamedIndividual]) -> int:
+        return self.ids_to_bits(map(self.id_of, individuals))
+
+    def iter_ids(self, bits: int) -> Iterable[int]:
+        return _iter_bit_ids(bits)
+
+    def from_bits(self, bits: int) -> FrozenSet[OWLNamedIndividual]:
+        inds = self._inds
+        return frozenset(inds[i] for i in _iter_bit_ids(bits))
+
+
+def _ids_to_bits(ids: Iterable[int], size: int) -> int:
+    """Build the bitset of the given ids, size is a hint for the largest id."""
+    buf = bytearray((size >> 3) + 1)
+    for i in ids:
+        if (i >> 3) >= len(buf):
+            buf.extend(bytes((i >> 3) + 1 - len(buf)))
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, 'little')
+
+
+def _iter_bit_ids(bits: int) -> Iterable[int]:
+    """Iterate over the ids contained in a bitset in ascending order."""
+    buf = bits.to_bytes((bits.bit_length() + 7) >> 3, 'little')
+    for byte_idx, byte in enumerate(buf):
+        while byte:
+            low = byte & -byte
+            yield (byte_idx << 3) + low.bit_length() - 1
+            byte ^= low
+
+
+class _RetrievalSnapshot:
+    """Read-only copy of the class and object property indexes of a :class:`StructuralReasoner`.
+
+    Individuals are represented by their ids and sets of individuals by bitsets, so that the snapshot can be pickled
+    compactly and evaluated without access to the ontology.
+    """
+    __slots__ = 'n_individuals', 'n_signature', 'individual_ids', 'classes', 'obj_prop', 'negation_default', \
+        '_obj_prop_inv'
+
+    def __init__(self, individual_iris: List[str], n_signature: int, classes: Dict[str, int],
+                 obj_prop: Dict[str, Dict[int, int]], negation_default: bool):
+        """
+        Args:
+            individual_iris: IRIs of the individuals by id, starting with the individuals in the signature.
+            n_signature: Number of individuals in the signature of the ontology.
+            classes: Class IRI => bitset of instances.
+            obj_prop: Object property IRI => { subject id => bitset of objects }.
+            negation_default: Whether a missing fact means it is false.
+        """
+        self.n_individuals = len(individual_iris)
+        self.n_signature = n_signature
+        self.individual_ids = {iri: i for i, iri in enumerate(individual_iris)}
+        self.classes = classes
+        self.obj_prop = obj_prop
+        self.negation_default = negation_default
+        self._obj_prop_inv = dict()
+
+    def __getstate__(self):
+        return (self.n_individuals, self.n_signature, self.individual_ids, self.classes, self.obj_prop,
+                self.negation_default)
+
+    def __setstate__(self, state):
+        (self.n_individuals, self.n_signature, self.individual_ids, self.classes, self.obj_prop,
+         self.negation_default) = state
+        self._obj_prop_inv = dict()
+
+    def all_bits(self) -> int:
+        return (1 << self.n_signature) - 1
+
+    def _individual_id(self, ind: OWLNamedIndividual) -> int:
+        i = self.individual_ids.get(ind.str)
+        if i is None:
+            raise NotImplementedError(ind)
+        return i
+
+    def _prop_values(self, pe: OWLObjectPropertyExpression) -> Dict[int, int]:
+        """Get the subject id => bitset of objects mapping of an object property expression."""
+        name = pe.get_named_property().str
+        if name not in self.obj_prop:
+            raise NotImplementedError(pe)
+        if not isinstance(pe, OWLObjectInverseOf):
+            return self.obj_prop[name]
+        if name not in self._obj_prop_inv:
+            inv: DefaultDict[int, List[int]] = defaultdict(list)
+            for s, o_bits in self.obj_prop[name].items():
+                for o in _iter_bit_ids(o_bits):
+                    inv[o].append(s)
+            self._obj_prop_inv[name] = {o: _ids_to_bits(subs, self.n_individuals) for o, subs in inv.items()}
+        return self._obj_prop_inv[name]
+
+    def _some_values(self, pe: OWLObjectPropertyExpression, filler_bits: int, min_count: int = 1,
+                     max_count: Optional[int] = None) -> int:
+        ops = self._prop_values(pe)
+        if min_count == 1 and max_count is None:
+            return _ids_to_bits((s for s, o_bits in ops.items() if o_bits & filler_bits), self.n_individuals)
+        ret = []
+        for s, o_bits in ops.items():
+            count = (o_bits & filler_bits).bit_count()
+            if count >= min_count and (max_count is None or count <= max_count):
+                ret.append(s)
+        return _ids_to_bits(ret, self.n_individuals)
+
+    @singledispatchmethod
+    def evaluate(self, ce: OWLClassExpression) -> int:
+        """Get the bitset of instances of a class expression.
+
+        Raises:
+            NotImplementedError: If the class expression refers to data properties or entities that are not part of
+                the snapshot.
+        """
+        raise NotImplementedError(ce)
+
+    @evaluate.register
+    def _(self, c: OWLClass) -> int:
+        if c.is_owl_thing():
+            return self.all_bits()
+        if c.is_owl_nothing():
+            return 0
+        bits = self.classes.get(c.str)
+        if bits is None:
+            raise NotImplementedError(c)
+        return bits
+
+    @evaluate.register
+    def _(self, ce: OWLObjectUnionOf) -> int:
+        return reduce(operator.or_, map(self.evaluate, ce.operands()))
+
+    @evaluate.register
+    def _(self, ce: OWLObjectIntersectionOf) -> int:
+        return reduce(operator.and_, map(self.evaluate, ce.operands()))
+
+    @evaluate.register
+    def _(self, ce: OWLObjectComplementOf) -> int:
+        if not self.negation_default:
+            raise NotImplementedError(ce)
+        return self.all_bits() ^ self.evaluate(ce.get_operand())
+
+    @evaluate.register
+    def _(self, ce: OWLObjectSomeValuesFrom) -> int:
+        return self._some_values(ce.get_property(), self.evaluate(ce.get_filler()))
+
+    @evaluate.register
+    def _(self, ce: OWLObjectAllValuesFrom) -> int:
+        return self.evaluate(
+            OWLObjectSomeValuesFrom(
+                property=ce.get_property(),
+                filler=ce.get_filler().get_object_complement_of().get_nnf()
+            ).get_object_complement_of())
+
+    @evaluate.register
+    def _(self, ce: OWLObjectOneOf) -> int:
+        return _ids_to_bits(map(self._individual_id, ce.individuals()), self.n_individuals)
+
+    @evaluate.register
+    def _(self, ce: OWLObjectHasValue) -> int:
+        return self.evaluate(ce.as_some_values_from())
+
+    @evaluate.register(OWLObjectMinCardinality)
+    @evaluate.register(OWLObjectExactCardinality)
+    def _(self, ce: OWLObjectCardinalityRestriction) -> int:
+        min_count = ce.get_cardinality()
+        max_count = min_count if isinstance(ce, OWLObjectExactCardinality) else None
+        return self._some_values(ce.get_property(), self.evaluate(ce.get_filler()), min_count, max_count)
+
+    @evaluate.register
+    def _(self, ce: OWLObjectMaxCardinality) -> int:
+        return self.all_bits() ^ self.evaluate(OWLObjectMinCardinality(cardinality=ce.get_cardinality() + 1,
+                                                                       property=ce.get_property(),
+                                                                       filler=ce.get_filler()))
+
+
+# Snapshot of the worker process, loaded once by _init_snapshot_worker
+_worker_snapshot: Optional[_RetrievalSnapshot] = None
+
+
+def _init_snapshot_worker(path: str):
+    global _worker_snapshot
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        _worker_snapshot = pickle.loads(mm)
+
+
+def _evaluate_in_worker(ce: OWLClassExpression) -> Optional[array]:
+    """Get the ids of the instances of a class expression or None if it cannot be evaluated on the snapshot."""
+    try:
+        bits = _worker_snapshot.evaluate(ce)
+    except NotImplementedError:
+        return None
+    return array('I', _iter_bit_ids(bits))
+
+
+class _SnapshotPool:
+    """Process pool whose workers evaluate class expressions on a snapshot that is shipped to them once via mmap."""
+
+    def __init__(self, snapshot: _RetrievalSnapshot, individuals: List[OWLNamedIndividual], revision: int,
+                 processes: Optional[int]):
+        self.individuals = individuals
+        self.revision = revision
+        self.processes = processes
+        with tempfile.NamedTemporaryFile(prefix='owlapy-snapshot-', delete=False) as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            path = f.name
+        executor = ProcessPoolExecutor(max_workers=processes, initializer=_init_snapshot_worker, initargs=(path,))
+        self.executor = executor
+        self._finalizer = weakref.finalize(self, _SnapshotPool._cleanup, executor, path)
+
+    @staticmethod
+    def _cleanup(executor: ProcessPoolExecutor, path: str):
+        executor.shutdown(wait=True, cancel_futures=True)
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def map(self, ces: List[OWLClassExpression], chunksize: int) -> Iterable[Optional[array]]:
+        return self.executor.map(_evaluate_in_worker, ces, chunksize=chunksize)
+
+    def close(self):
+        self._finalizer()
+
+
+class _ObjectPropertyCSR:
+    """Compressed sparse row adjacency of object property assertions over dense individual ids.
+
+    The forward and inverse adjacency of a property are built in one pass over the term ids of its assertions in the
+    ontology, so that no OWLNamedIndividual has to be created per edge.
+    """
+    __slots__ = '_ontology', 'individuals', '_ids', '_term_to_id', '_forward', '_inverse'
+
+    def __init__(self, ontology: _StructuralReasonerBackend, individuals: Iterable[OWLNamedIndividual]):
+        self._ontology = ontology
+        self.individuals: List[OWLNamedIndividual] = []
+        self._ids: Dict[OWLNamedIndividual, int] = dict()
+        # term id => individual id, None if the term is not an individual
+        self._term_to_id: Dict[int, Optional[int]] = dict()
+        for ind in individuals:
+            self._term_to_id[ontology._term_id(ind)] = self._add(ind)
+        # ObjectProperty => (indptr, indices)
+        self._forward: Dict[OWLObjectProperty, Tuple[np.ndarray, np.ndarray]] = dict()
+        self._inverse: Dict[OWLObjectProperty, Tuple[np.ndarray, np.ndarray]] = dict()
+
+    def _add(self, ind: OWLNamedIndividual) -> int:
+        i = self._ids.get(ind)
+        if i is None:
+            i = self._ids[ind] = len(self.individuals)
+            self.individuals.append(ind)
+        return i
+
+    def _id_of_term(self, term: int) -> Optional[int]:
+        try:
+            return self._term_to_id[term]
+        except KeyError:
+            pass
+        ind = self._ontology._term_individual(term)
+        i = self._term_to_id[term] = self._add(ind) if ind is not None else None
+        return i
+
+    def build(self, p: OWLObjectProperty, sub_properties: Iterable[OWLObjectProperty]):
+        subjects = array('q')
+        objects = array('q')
+        id_of = self._id_of_term
+        for s_term, o_term in self._ontology._assertion_term_pairs(chain((p,), sub_properties)):
+            s = id_of(s_term)
+            if s is None:
+                continue
+            o = id_of(o_term)
+            if o is None:
+                continue
+            subjects.append(s)
+            objects.append(o)
+        n = max(len(self.individuals), 1)
+        # sorting the encoded pairs groups them by subject and removes duplicate assertions
+        pairs = np.unique(np.frombuffer(subjects, dtype=np.int64) * n + np.frombuffer(objects, dtype=np.int64))
+        self._forward[p] = self._to_csr(pairs // n, pairs % n, n)
+        inverse_pairs = np.sort((pairs % n) * n + pairs // n)
+        self._inverse[p] = self._to_csr(inverse_pairs // n, inverse_pairs % n, n)
+
+    @staticmethod
+    def _to_csr(rows: np.ndarray, cols: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+        return indptr, cols
+
+    def has(self, p: OWLObjectProperty) -> bool:
+        return p in self._forward
+
+    def invalidate(self, p: OWLObjectProperty):
+        self._forward.pop(p, None)
+        self._inverse.pop(p, None)
+
+    def some_values(self, pe: OWLObjectPropertyExpression, filler_inds: Iterable[OWLNamedIndividual],
+                    min_count: int = 1, max_count: Optional[int] = None) -> FrozenSet[OWLNamedIndividual]:
+        """Get all subjects that have between min_count and max_count of filler_inds as values of pe."""
+        if isinstance(pe, OWLObjectInverseOf):
+            indptr, indices = self._inverse[pe.get_named_property()]
+        else:
+            indptr, indices = self._forward[pe]
+        mask = np.zeros(len(self.individuals), dtype=bool)
+        ids = self._ids
+        mask[[ids[i] for i in filler_inds if i in ids]] = True
+
+        # number of filler values per subject
+        hits = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(mask[indices], out=hits[1:])
+        counts = hits[indptr[1:]] - hits[indptr[:-1]]
+        # only subjects that have a value for the property at all
+        if min_count > 0:
+            selected = counts >= min_count
+        else:
+            selected = indptr[1:] > indptr[:-1]
+        if max_count is not None:
+            selected &= counts <= max_count
+        individuals = self.individuals
+        return frozenset(individuals[i] for i in np.flatnonzero(selected))
+
+
+_EPOCH_NAIVE: Final = datetime(1970, 1, 1)
+_EPOCH_AWARE: Final = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND: Final = timedelta(microseconds=1)
+_RANGE_FACETS: Final = frozenset((OWLFacet.MIN_INCLUSIVE, OWLFacet.MIN_EXCLUSIVE,
+                                  OWLFacet.MAX_INCLUSIVE, OWLFacet.MAX_EXCLUSIVE))
+
+
+def _column_value(v) -> Optional[Tuple[str, Union[int, float]]]:
+    """Map the python value of a literal to (kind, number) so that numbers of the same kind are ordered like the
+    values, None if the value cannot be stored in a column."""
+    t = type(v)
+    if t is int:
+        return ('int', v) if -2 ** 63 <= v < 2 ** 63 else None
+    if t is float:
+        return 'float', v
+    if t is datetime:
+        if v.tzinfo is None:
+            return 'datetime', (v - _EPOCH_NAIVE) // _MICROSECOND
+        # aware datetimes are compared by their UTC instant but cannot be compared to naive ones
+        return 'datetime_tz', (v - _EPOCH_AWARE) // _MICROSECOND
+    if t is date:
+        return 'date', v.toordinal()
+    return None
+
+
+class _DataPropertyColumns:
+    """Sorted value columns of the assertions of one data property.
+
+    There is one column per literal type and datatype holding the numeric and date values in ascending order together
+    with the ids of their subjects, so that range facets and value lookups are binary searches. Literal types whose
+    values cannot be mapped to numbers are marked as unsupported and have to be evaluated on the literals.
+    """
+    __slots__ = 'subjects', '_columns', '_unsupported'
+
+    def __init__(self, values: Mapping[OWLNamedIndividual, Set[OWLLiteral]]):
+        self.subjects: List[OWLNamedIndividual] = list(values.keys())
+        groups: Dict[Tuple[type, OWLDatatype], Tuple[Set[str], List[Union[int, float]], List[int]]] = dict()
+        self._unsupported: Set[Tuple[type, OWLDatatype]] = set()
+        for sid, literals in enumerate(values.values()):
+            for lit in literals:
+                key = type(lit), lit.get_datatype()
+                if key in self._unsupported:
+                    continue
+                v = lit.to_python()
+                if isinstance(v, FloatSpecialValue):
+                    # NaN and infinities are neither equal nor comparable to any literal
+                    continue
+                cv = _column_value(v)
+                if cv is None:
+                    self._unsupported.add(key)
+                    groups.pop(key, None)
+                    continue
+                kinds, vals, sids = groups.setdefault(key, (set(), [], []))
+                kinds.add(cv[0])
+                vals.append(cv[1])
+                sids.append(sid)
+        # Literal type, datatype => (kind, sorted values, subject ids)
+        self._columns: Dict[Tuple[type, OWLDatatype], Tuple[str, np.ndarray, np.ndarray]] = dict()
+        for key, (kinds, vals, sids) in groups.items():
+            if len(kinds) != 1:
+                self._unsupported.add(key)
+                continue
+            kind = next(iter(kinds))
+            arr = np.asarray(vals, dtype=np.float64 if kind == 'float' else np.int64)
+            order = np.argsort(arr, kind='stable')
+            self._columns[key] = kind, arr[order], np.asarray(sids, dtype=np.int64)[order]
+
+    def individuals(self, sids: Iterable[np.ndarray]) -> Set[OWLNamedIndividual]:
+        subjects = self.subjects
+        return {subjects[i] for arr in sids for i in np.unique(arr)}
+
+    def equal(self, literal: OWLLiteral) -> Optional[np.ndarray]:
+        """Get the ids of the subjects that have this literal as value, None if it cannot be looked up here."""
+        key = type(literal), literal.get_datatype()
+        if key in self._unsupported:
+            return None
+        column = self._columns.get(key)
+        if column is None:
+            return np.empty(0, dtype=np.int64)
+        kind, vals, sids = column
+        cv = _column_value(literal.to_python())
+        if cv is None or cv[0] != kind:
+            return None
+        return sids[np.searchsorted(vals, cv[1], side='left'):np.searchsorted(vals, cv[1], side='right')]
+
+    def restriction(self, dr: OWLDatatypeRestriction) -> Optional[List[np.ndarray]]:
+        """Get the ids of the subjects that have a value in the datatype restriction, None if it cannot be evaluated
+        here."""
+        datatype = dr.get_datatype()
+        if any(key[1] == datatype for key in self._unsupported):
+            return None
+        facets = dr.get_facet_restrictions()
+        if any(res.get_facet() not in _RANGE_FACETS for res in facets):
+            return None
+        ret = []
+        for (lit_type, dt), (kind, vals, sids) in self._columns.items():
+            if dt != datatype:
+                continue
+            lo, hi = 0, len(vals)
+            for res in facets:
+                v = res.get_facet_value()
+                if type(v) is not lit_type:
+                    # literals of different types never compare successfully
+                    lo, hi = 0, 0
+                    break
+                cv = _column_value(v.to_python())
+                if cv is None or cv[0] != kind:
+                    return None
+                facet = res.get_facet()
+                if facet == OWLFacet.MIN_INCLUSIVE:
+                    lo = max(lo, int(np.searchsorted(vals, cv[1], side='left')))
+                elif facet == OWLFacet.MIN_EXCLUSIVE:
+                    lo = max(lo, int(np.searchsorted(vals, cv[1], side='right')))
+                elif facet == OWLFacet.MAX_INCLUSIVE:
+                    hi = min(hi, int(np.searchsorted(vals, cv[1], side='right')))
+                else:
+                    hi = min(hi, int(np.searchsorted(vals, cv[1], side='left')))
+            if lo < hi:
+                ret.append(sids[lo:hi])
+        return ret
+
+
+def _ontology_content_hash(ontology: Union[Ontology, TripleStoreOntology]) -> str:
+    """Order independent hash of the triples of an owlready2 backed ontology.
+
+    Resources are hashed by IRI (blank nodes by their storid), so the hash is the same whenever the same document is
+    loaded into a fresh world. A triple store is stored in a canonical order and hashed as it is.
+    """
+    if isinstance(ontology, TripleStoreOntology):
+        return ontology.store.content_hash()
+    graph = ontology._world.graph
+    c = ontology._onto.graph.c
+    h = 0
+    for row in chain(
+            graph.execute("SELECT COALESCE(rs.iri, q.s), COALESCE(rp.iri, q.p), COALESCE(ro.iri, q.o) FROM objs q "
+                          "LEFT JOIN resources rs ON rs.storid = q.s LEFT JOIN resources rp ON rp.storid = q.p "
+                          "LEFT JOIN resources ro ON ro.storid = q.o WHERE q.c = ?", (c,)),
+            graph.execute("SELECT COALESCE(rs.iri, q.s), COALESCE(rp.iri, q.p), q.o, COALESCE(rd.iri, q.d) FROM datas q "
+                          "LEFT JOIN resources rs ON rs.storid = q.s LEFT JOIN resources rp ON rp.storid = q.p "
+                          "LEFT JOIN resources rd ON rd.storid = q.d WHERE q.c = ?", (c,))):
+        h += int.from_bytes(hashlib.blake2b(repr(row).encode(), digest_size=16).digest(), 'little')
+    return format(h & ((1 << 128) - 1), '032x')
+
+
+class _MappedArrayFile:
+    """Memory-mapped file of a json header and one dimensional arrays.
+
+    The file starts with a magic number, a format version and a json header, followed by 64 byte aligned arrays. The
+    arrays are used in place on the mapped file. Subclasses set the magic number, version and name of the format.
+    """
+    MAGIC: bytes
+    VERSION: int
+    NAME: str
+    _ALIGN: Final = 64
+
+    __slots__ = '_file', '_mm', 'header', '_arrays'
+
+    def __init__(self, path: str):
+        """
+        Raises:
+            ValueError: If the file has a different format or was written with a different format version.
+        """
+        self._file = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is not a {self.NAME}")
+        mm = self._mm
+        if mm[:8] != self.MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a {self.NAME}")
+        version, header_len = np.frombuffer(mm, dtype='<u4', count=2, offset=8)
+        if version != self.VERSION:
+            self.close()
+            raise ValueError(f"{path} has {self.NAME} format version {version}, expected {self.VERSION}")
+        self.header = json.loads(bytes(mm[16:16 + header_len]))
+        self._arrays: Dict[str, np.ndarray] = {
+            name: np.frombuffer(mm, dtype=dtype, count=count, offset=offset)
+            for name, (offset, dtype, count) in self.header['arrays'].items()}
+
+    @classmethod
+    def write(cls, path: str, header: dict, arrays: Dict[str, np.ndarray]):
+        """Write a file, replacing an existing file only once the new one is complete.
+
+        Args:
+            path: File to write.
+            header: Json serializable metadata, the array layout is added to it.
+            arrays: Name => one dimensional array.
+        """
+        layout = dict()
+        offset = 0
+        for name, arr in arrays.items():
+            layout[name] = (offset, arr.dtype.str, len(arr))
+            offset += -(-arr.nbytes // cls._ALIGN) * cls._ALIGN
+        # the array offsets depend on the header size, so shift them once the header is known
+        header_bytes = json.dumps(dict(header, arrays=layout)).encode()
+        start = -(-(16 + len(header_bytes) + 64) // cls._ALIGN) * cls._ALIGN
+        layout = {name: (start + off, dtype, count) for name, (off, dtype, count) in layout.items()}
+        header_bytes = json.dumps(dict(header, arrays=layout)).encode()
+        assert 16 + len(header_bytes) <= start
+
+        tmp = f'{path}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(cls.MAGIC)
+            f.write(np.array([cls.VERSION, len(header_bytes)], dtype='<u4').tobytes())
+            f.write(header_bytes)
+            for name, arr in arrays.items():
+                f.write(bytes(layout[name][0] - f.tell()))
+                f.write(np.ascontiguousarray(arr).tobytes())
+        os.replace(tmp, path)
+
+    def close(self):
+        # drop the views on the mapped file before closing it
+        self._arrays = dict()
+        try:
+            self._mm.close()
+        except BufferError:
+            # arrays handed out are still alive, the mapping is released together with them
+            pass
+        self._file.close()
+
+    def _row(self, name: str, i: int) -> np.ndarray:
+        indptr = self._arrays[f'{name}_indptr']
+        return self._arrays[f'{name}_indices'][indptr[i]:indptr[i + 1]]
+
+
+class _ReasonerIndexFile(_MappedArrayFile):
+    """Memory-mapped snapshot of the class, object property and class hierarchy indexes of a
+    :class:`StructuralReasoner`.
+
+    Individuals are only created for the entries that are looked up.
+    """
+    MAGIC: Final = b'OWLAPYRI'
+    VERSION: Final = 1
+    NAME: Final = 'reasoner index'
+
+    __slots__ = '_individuals', '_class_ids', '_obj_prop_ids'
+
+    def __init__(self, path: str):
+        """
+        Raises:
+            ValueError: If the file is not a reasoner index or was written with a different format version.
+        """
+        super().__init__(path)
+        self._individuals: List[Optional[OWLNamedIndividual]] = [None] * self.header['n_individuals']
+        self._class_ids: Dict[str, int] = {iri: i for i, iri in enumerate(self.header['classes'])}
+        self._obj_prop_ids: Dict[str, int] = {iri: i for i, iri in enumerate(self.header['object_properties'])}
+
+    def _individual(self, i: int) -> OWLNamedIndividual:
+        ind = self._individuals[i]
+        if ind is None:
+            offsets = self._arrays['individual_offsets']
+            iri = bytes(self._arrays['individual_iris'][offsets[i]:offsets[i + 1]]).decode()
+            ind = self._individuals[i] = OWLNamedIndividual(IRI.create(iri))
+        return ind
+
+    def instances(self, c: OWLClass) -> Optional[FrozenSet[OWLNamedIndividual]]:
+        """Get the instances of a named class, None if the class is not part of the index."""
+        i = self._class_ids.get(c.str)
+        if i is None or i >= self.header['n_indexed_classes']:
+            return None
+        return frozenset(map(self._individual, self._row('instances', i).tolist()))
+
+    def _hierarchy(self, name: str, c: OWLClass) -> Optional[List[OWLClass]]:
+        i = self._class_ids.get(c.str)
+        if i is None or i >= self.header['n_indexed_classes']:
+            return None
+        classes = self.header['classes']
+        return [OWLClass(IRI.create(classes[j])) for j in self._row(name, i).tolist()]
+
+    def sub_classes(self, c: OWLClass) -> Optional[List[OWLClass]]:
+        """Get the direct named sub classes of a named class, None if the class is not part of the index."""
+        return self._hierarchy('sub_classes', c)
+
+    def super_classes(self, c: OWLClass) -> Optional[List[OWLClass]]:
+        """Get the direct named super classes of a named class, None if the class is not part of the index."""
+        return self._hierarchy('super_classes', c)
+
+    def object_property_values(self, pe: OWLObjectPropertyExpression) \
+            -> Optional[Dict[OWLNamedIndividual, Set[OWLNamedIndividual]]]:
+        """Get the individual => individuals mapping of an object property expression, None if the property is not
+        part of the index."""
+        k = self._obj_prop_ids.get(pe.get_named_property().str)
+        if k is None:
+            return None
+        subjects = self._arrays[f'obj_prop_{k}_subjects']
+        objects = self._arrays[f'obj_prop_{k}_objects']
+        if isinstance(pe, OWLObjectInverseOf):
+            subjects, objects = objects, subjects
+        opc: DefaultDict[OWLNamedIndividual, Set[OWLNamedIndividual]] = defaultdict(set)
+        individual = self._individual
+        for s, o in zip(subjects.tolist(), objects.tolist()):
+            opc[individual(s)].add(individual(o))
+        return opc
+
+
+def _synchronized(method):
+    """Run a method of StructuralReasoner while holding the lock of the reasoner.
+
+    A query that timed out keeps running on the worker pool of :func:`owlapy.utils.run_with_timeout` until its next
+    :func:`owlapy.utils.check_timeout`, the lock keeps it from filling the caches while the next query reads them.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class StructuralReasoner(AbstractOWLReasoner):
     """Tries to check instances fast (but maybe incomplete)."""
 
     def __init__(self, ontology: Union[AbstractOWLOntology, str], *, class_cache: bool = True,
-                 property_cache: bool = True, negation_default: bool = True, sub_properties: bool = False):
+                 property_cache: bool = True, negation_default: bool = True, sub_properties: bool = False,
+                 bitset_retrieval: bool = False, expression_cache: bool = False,
+                 expression_cache_maxsize: Optional[int] = 1024, expression_cache_maxbytes: Optional[int] = None,
+                 csr_index: bool = False, data_columns: bool = False):
         """Fast instance checker.
 
         Args:
@@ -54,26 +736,62 @@ class StructuralReasoner(AbstractOWLReasoner):
             property_cache: Whether to cache property values.
             negation_default: Whether to assume a missing fact means it is false ("closed world view").
             sub_properties: Whether to take sub properties into account for the
-                :func:`StructuralReasoner.instances` retrieval.
+                :func:`StructuralReasoner.instances` retrieval. The sub properties of an inverse property without a
+                named inverse are the inverses of the sub properties of its named property.
+            bitset_retrieval: Whether to evaluate class expressions over bitsets of dense individual ids instead of
+                sets of individuals in :func:`StructuralReasoner.instances`.
+            expression_cache: Whether to memoize the instances of complex class expressions (named classes are covered
+                by the class cache) so that sub-expressions shared between queries are only retrieved once.
+            expression_cache_maxsize: Maximum number of class expressions in the expression cache, None for no limit.
+            expression_cache_maxbytes: Maximum estimated size in bytes of the cached instance sets, None for no limit.
+            csr_index: Whether to evaluate object property restrictions on a compressed sparse row index of the
+                property assertions (only used together with the property cache).
+            data_columns: Whether to evaluate data property restrictions by binary search over sorted columns of the
+                numeric and date values of the property (only used together with the property cache).
             """
         if isinstance(ontology, str):
             ontology = Ontology(ontology)
 
         super().__init__(ontology)
-        assert isinstance(ontology, Ontology)
-        self._world: owlready2.World = ontology._world
-        self._ontology: Ontology = ontology
+        # the entities and assertions are looked up through the _StructuralReasonerBackend interface of the ontology
+        assert isinstance(ontology, _StructuralReasonerBackend)
+        self._ontology: Union[Ontology, TripleStoreOntology] = ontology
         self.class_cache: bool = class_cache
         self._property_cache: bool = property_cache
         self._negation_default: bool = negation_default
         self._sub_properties: bool = sub_properties
+        self._bitset_retrieval: bool = bitset_retrieval
+        self._csr_index: bool = csr_index
+        self._data_columns: bool = data_columns
+        self._expression_cache_enabled: bool = expression_cache
+        self._expression_cache_maxsize: Optional[int] = expression_cache_maxsize
+        self._expression_cache_maxbytes: Optional[int] = expression_cache_maxbytes
+        self._snapshot_pool: Optional[_SnapshotPool] = None
+        self._index_file: Optional[_ReasonerIndexFile] = None
         self.__warned: int = 0
+        # held while the caches are read or written by a query, see _synchronized
+        self._lock = threading.RLock()
         self._init()
 
     def _init(self):
+        # Revision of the ontology the caches are in sync with
+        self._revision: int = self._ontology.revision
+        # Individual => id, only valid for the current query if the caches are disabled
+        self._ind_index: Optional[_IndividualIndex] = None
+        # Revision of the ontology and all its individuals
+        self._individuals: Optional[Tuple[int, FrozenSet[OWLNamedIndividual]]] = None
+        # Class expression => bitset of individuals, only set while a batch is evaluated
+        self._bits_memo: Optional[Dict[OWLClassExpression, int]] = None
+        # Class expression => individuals
+        self._expression_cache: Optional[LRUCache[OWLClassExpression, FrozenSet[OWLNamedIndividual]]] = None
+        if self._expression_cache_enabled:
+            self._expression_cache = LRUCache(maxsize=self._expression_cache_maxsize,
+                                              maxbytes=self._expression_cache_maxbytes)
         if self.class_cache:
             # Class => individuals
             self._cls_to_ind: Dict[OWLClass, FrozenSet[OWLNamedIndividual]] = {}
+            # Class => bitset of individuals
+            self._cls_to_bits: Dict[OWLClass, int] = {}
 
         if self._property_cache:
             # ObjectProperty => { individual => individuals }
@@ -82,6 +800,12 @@ class StructuralReasoner(AbstractOWLReasoner):
             self._obj_prop_inv: Dict[OWLObjectProperty, Mapping[OWLNamedIndividual, Set[OWLNamedIndividual]]] = dict()
             # DataProperty => { individual => literals }
             self._data_prop: Dict[OWLDataProperty, Mapping[OWLNamedIndividual, Set[OWLLiteral]]] = dict()
+            # ObjectPropertyExpression => { individual id => bitset of individuals }
+            self._obj_prop_bits: Dict[OWLObjectPropertyExpression, Mapping[int, int]] = dict()
+            # ObjectProperty => adjacency over individual ids, created on first use
+            self._obj_prop_csr: Optional[_ObjectPropertyCSR] = None
+            # DataProperty => sorted value columns, created on first use
+            self._data_prop_cols: Dict[OWLDataProperty, _DataPropertyColumns] = dict()
         else:
             self._has_prop: Mapping[Type[_P], Dict[_P, FrozenSet[OWLNamedIndividual]]] = {
                 OWLDataProperty: {},
@@ -89,10 +813,108 @@ class StructuralReasoner(AbstractOWLReasoner):
                 OWLObjectInverseOf: {},
             }
 
+    def _all_individuals(self) -> FrozenSet[OWLNamedIndividual]:
+        revision = self._ontology.revision
+        if self._individuals is None or self._individuals[0] != revision:
+            self._individuals = revision, frozenset(self._ontology.individuals_in_signature())
+        return self._individuals[1]
+
+    @_synchronized
     def reset(self):
         """The reset method shall reset any cached state."""
+        self.close_parallel_pool()
+        self._close_index_file()
         self._init()
 
+    def _apply_changes(self):
+        """Invalidate the cached entries affected by the changes to the ontology since the caches were last synced.
+
+        Class and property assertions only drop the entries of the touched classes and properties (and of the super
+        classes and properties that inherit their instances), any other change resets all caches.
+        """
+        revision = self._ontology.revision
+        if revision == self._revision:
+            return
+        # the loaded index would refill the invalidated entries with stale values
+        self._close_index_file()
+        changes = self._ontology.changes_since(self._revision)
+        if changes is None or not all(isinstance(ch.axiom, (OWLClassAssertionAxiom, OWLObjectPropertyAssertionAxiom,
+                                                             OWLDataPropertyAssertionAxiom)) for ch in changes):
+            self.reset()
+            return
+        self._revision = revision
+
+        classes = {OWLThing}
+        obj_props = set()
+        data_props = set()
+        for ch in changes:
+            for e in ch.entities:
+                if isinstance(e, OWLClass):
+                    classes.add(e)
+                elif isinstance(e, OWLObjectProperty):
+                    obj_props.add(e)
+                elif isinstance(e, OWLDataProperty):
+                    data_props.add(e)
+        classes = self._owlready_ancestors(classes, OWLClass)
+        obj_props = self._owlready_ancestors(obj_props, OWLObjectProperty)
+        data_props = self._owlready_ancestors(data_props, OWLDataProperty)
+
+        # the signature might have changed, so the individual ids are not valid anymore
+        self._ind_index = None
+        if self._expression_cache is not None:
+            self._expression_cache.cache_clear()
+        if self.class_cache:
+            for c in classes:
+                self._cls_to_ind.pop(c, None)
+            self._cls_to_bits.clear()
+        if self._property_cache:
+            for p in obj_props:
+                self._obj_prop.pop(p, None)
+                self._obj_prop_inv.pop(p, None)
+                if self._obj_prop_csr is not None:
+                    self._obj_prop_csr.invalidate(p)
+            for p in data_props:
+                self._data_prop.pop(p, None)
+                self._data_prop_cols.pop(p, None)
+            self._obj_prop_bits.clear()
+        else:
+            for p in obj_props:
+                self._has_prop[OWLObjectProperty].pop(p, None)
+                self._has_prop[OWLObjectInverseOf].pop(p.get_inverse_property(), None)
+            for p in data_props:
+                self._has_prop[OWLDataProperty].pop(p, None)
+
+    def _owlready_ancestors(self, entities: Set[OWLEntity], typ: Type[OWLEntity]) -> Set[OWLEntity]:
+        """Get the entities together with all their ancestors (and inverse properties) according to owlready2.
+
+        Only an :class:`Ontology` can be changed, so the entities are always looked up in its owlready2 world.
+        """
+        ret = set(entities)
+        for e in entities:
+            if e == OWLThing:
+                continue
+            e_x = self._ontology._world[e.str]
+            if e_x is None:
+                continue
+            for a_x in e_x.ancestors():
+                if isinstance(a_x, owlready2.EntityClass) and a_x.iri is not None:
+                    ret.add(typ(IRI.create(a_x.iri)))
+                    inverse_x = getattr(a_x, 'inverse_property', None)
+                    if inverse_x is not None:
+                        ret.add(typ(IRI.create(inverse_x.iri)))
+        return ret
+
+    def expression_cache_info(self):
+        """Report the statistics of the expression cache.
+
+        Returns:
+            Named tuple of hits, misses, maxsize, currsize, maxbytes and currbytes or None if the expression cache is
+            disabled.
+        """
+        if self._expression_cache is None:
+            return None
+        return self._expression_cache.cache_info()
+
     def data_property_domains(self, pe: OWLDataProperty, direct: bool = False) -> Iterable[OWLClassExpression]:
         domains = {d.get_domain() for d in self.get_root_ontology().data_property_domain_axioms(pe)}
         sub_domains = set(chain.from_iterable([self.sub_classes(d) for d in domains]))
@@ -124,22 +946,7 @@ class StructuralReasoner(AbstractOWLReasoner):
     def equivalent_classes(self, ce: OWLClassExpression, only_named: bool = True) -> Iterable[OWLClassExpression]:
         seen_set = {ce}
         if isinstance(ce, OWLClass):
-            c_x: owlready2.ThingClass = self._world[ce.str]
-            for eq_x in c_x.INDIRECT_equivalent_to:
-                eq = _parse_concept_to_owlapy(eq_x)
-                if (isinstance(eq, OWLClass) or
-                    (isinstance(eq, OWLClassExpression) and not only_named)) and eq not in seen_set:
-                    seen_set.add(eq)
-                    yield eq
-                # Workaround for problems in owlready2. It does not always recognize equivalent complex class
-                # expressions through INDIRECT_equivalent_to. Maybe it will work as soon as owlready2 adds support for
-                # EquivalentClasses general class axioms.
-                if not only_named and isinstance(eq_x, owlready2.ThingClass):
-                    for eq_2_x in eq_x.equivalent_to:
-                        eq_2 = _parse_concept_to_owlapy(eq_2_x)
-                        if eq_2 not in seen_set:
-                            seen_set.add(eq_2)
-                            yield eq_2
+            yield from self._ontology._equivalents(ce, only_named)
         elif isinstance(ce, OWLClassExpression):
             # Extend as soon as owlready2 supports EquivalentClasses general class axioms
             # Slow but works. No better way to do this in owlready2 without using the reasoners at the moment.
@@ -157,21 +964,17 @@ class StructuralReasoner(AbstractOWLReasoner):
 
     def _find_disjoint_classes(self, ce: OWLClassExpression, only_named: bool = True, seen_set=None):
         if isinstance(ce, OWLClass):
-            c_x: owlready2.ThingClass = self._world[ce.str]
-            for d_x in chain.from_iterable(map(lambda d: d.entities, c_x.disjoints())):
-                if d_x != c_x and (isinstance(d_x, owlready2.ThingClass) or
-                                   (isinstance(d_x, owlready2.ClassConstruct) and not only_named)):
-                    d_owlapy = _parse_concept_to_owlapy(d_x)
-                    seen_set.add(d_owlapy)
-                    yield d_owlapy
-                    for c in self.equivalent_classes(d_owlapy, only_named=only_named):
-                        if c not in seen_set:
-                            seen_set.add(c)
-                            yield c
-                    for c in self.sub_classes(d_owlapy, only_named=only_named):
-                        if c not in seen_set:
-                            seen_set.add(c)
-                            yield c
+            for d_owlapy in self._ontology._disjoints(ce, only_named):
+                seen_set.add(d_owlapy)
+                yield d_owlapy
+                for c in self.equivalent_classes(d_owlapy, only_named=only_named):
+                    if c not in seen_set:
+                        seen_set.add(c)
+                        yield c
+                for c in self.sub_classes(d_owlapy, only_named=only_named):
+                    if c not in seen_set:
+                        seen_set.add(c)
+                        yield c
         elif isinstance(ce, OWLClassExpression):
             # Extend as soon as owlready2 supports DisjointClasses general class axioms
             # Slow but works. No better way to do this in owlready2 without using the reasoners at the moment.
@@ -195,72 +998,265 @@ class StructuralReasoner(AbstractOWLReasoner):
                 yield from self._find_disjoint_classes(c, only_named=only_named, seen_set=seen_set)
 
     def different_individuals(self, ind: OWLNamedIndividual) -> Iterable[OWLNamedIndividual]:
-        i: owlready2.Thing = self._world[ind.str]
-        yield from (OWLNamedIndividual(IRI.create(d_i.iri))
-                    for d_i in chain.from_iterable(map(lambda x: x.entities, i.differents()))
-                    if isinstance(d_i, owlready2.Thing) and i != d_i)
+        yield from self._ontology._disjoints(ind)
 
     def same_individuals(self, ind: OWLNamedIndividual) -> Iterable[OWLNamedIndividual]:
-        i: owlready2.Thing = self._world[ind.str]
-        yield from (OWLNamedIndividual(IRI.create(d_i.iri)) for d_i in i.equivalent_to
-                    if isinstance(d_i, owlready2.Thing))
+        yield from self._ontology._equivalents(ind)
 
     def data_property_values(self, e: OWLEntity, pe: OWLDataProperty, direct: bool = True) \
             -> Iterable[OWLLiteral]:
-        i: owlready2.Thing = self._world[e.str]
-        p: owlready2.DataPropertyClass = self._world[pe.str]
-        retrieval_func = p._get_values_for_individual if direct else p._get_indirect_values_for_individual
-        for val in retrieval_func(i):
-            yield OWLLiteral(val)
+        yield from self._ontology._property_values(e, pe, direct)
 
     def all_data_property_values(self, pe: OWLDataProperty, direct: bool = True) -> Iterable[OWLLiteral]:
-        p: owlready2.DataPropertyClass = self._world[pe.str]
-        relations = p.get_relations()
-        if not direct:
-            indirect_relations = chain.from_iterable(
-                map(lambda x: self._world[x.str].get_relations(),
-                    self.sub_data_properties(pe, direct=False)))
-            relations = chain(relations, indirect_relations)
-        for _, val in relations:
-            yield OWLLiteral(val)
+        sub_properties = () if direct else self.sub_data_properties(pe, direct=False)
+        for _, val in self._ontology._property_assertions(pe, sub_properties):
+            yield val
 
     def object_property_values(self, ind: OWLNamedIndividual, pe: OWLObjectPropertyExpression, direct: bool = False) \
             -> Iterable[OWLNamedIndividual]:
-        if isinstance(pe, OWLObjectProperty):
-            i: owlready2.Thing = self._world[ind.str]
-            p: owlready2.ObjectPropertyClass = self._world[pe.str]
-            # Recommended to use direct=False because _get_values_for_individual does not give consistent result
-            # for the case when there are equivalent object properties. At least until this is fixed on owlready2.
-            retieval_func = p._get_values_for_individual if direct else p._get_indirect_values_for_individual
-            for val in retieval_func(i):
-                yield OWLNamedIndividual(IRI.create(val.iri))
-        elif isinstance(pe, OWLObjectInverseOf):
-            p: owlready2.ObjectPropertyClass = self._world[pe.get_named_property().str]
-            inverse_p = p.inverse_property
-            # If the inverse property is explicitly defined we can take shortcut
-            if inverse_p is not None:
-                yield from self.object_property_values(ind, OWLObjectProperty(IRI.create(inverse_p.iri)), direct)
-            else:
-                if not direct:
-                    raise NotImplementedError('Indirect values of inverse properties are only implemented if the '
-                                              'inverse property is explicitly defined in the ontology.'
-                                              f'Property: {pe}')
-                i: owlready2.Thing = self._world[ind.str]
-                for val in p._get_inverse_values_for_individual(i):
-                    yield OWLNamedIndividual(IRI.create(val.iri))
-        else:
+        if not isinstance(pe, (OWLObjectProperty, OWLObjectInverseOf)):
             raise NotImplementedError(pe)
+        yield from self._ontology._property_values(ind, pe, direct)
 
     def _instances(self, ce: OWLClassExpression, direct: bool = False) -> Iterable[OWLNamedIndividual]:
         if direct:
             if not self.__warned & 2:
                 logger.warning("direct not implemented")
                 self.__warned |= 2
-        temp = self._find_instances(ce)
+        if self._bitset_retrieval:
+            # _instances_bits creates the individual index, so it has to run before the index is looked up
+            bits = self._instances_bits(ce)
+            temp = self._ind_index.from_bits(bits)
+        else:
+            temp = self._find_instances(ce)
         yield from temp
 
+    def _instances_bits(self, ce: OWLClassExpression) -> int:
+        self._apply_changes()
+        if self._ind_index is None or not self.class_cache:
+            self._ind_index = _IndividualIndex(self._ontology.individuals_in_signature())
+            # ids are not comparable between different indexes, so drop every bitset of the old one
+            if self._bits_memo is not None:
+                self._bits_memo.clear()
+            if self.class_cache:
+                self._cls_to_bits.clear()
+            if self._property_cache:
+                self._obj_prop_bits.clear()
+        return self._find_instances_bits(ce)
+
+    @_synchronized
+    def _instances_set(self, ce: OWLClassExpression, direct: bool = False) -> FrozenSet[OWLNamedIndividual]:
+        return frozenset(self._instances(ce, direct))
+
     def instances(self, ce: OWLClassExpression, direct: bool = False, timeout: int = 1000):
-        return run_with_timeout(self._instances, timeout, (ce, direct))
+        # materialize the instances inside the worker so that the timeout applies to the retrieval
+        return run_with_timeout(self._instances_set, timeout, (ce, direct))
+
+    def instances_batch(self, ces: Iterable[OWLClassExpression], direct: bool = False, timeout: int = 1000) \
+            -> List[FrozenSet[OWLNamedIndividual]]:
+        ces = list(ces)
+        ret = run_with_timeout(self._instances_batch, timeout, (ces, direct, False))
+        if isinstance(ret, TimeoutResult):
+            return [TimeoutResult() for _ in ces]
+        return ret
+
+    def count_instances_batch(self, ces: Iterable[OWLClassExpression], direct: bool = False,
+                              timeout: int = 1000) -> List[Optional[int]]:
+        ces = list(ces)
+        ret = run_with_timeout(self._instances_batch, timeout, (ces, direct, True))
+        if isinstance(ret, TimeoutResult):
+            return [None for _ in ces]
+        return ret
+
+    @_synchronized
+    def instances_parallel(self, ces: Iterable[OWLClassExpression], processes: Optional[int] = None,
+                           chunksize: int = 16) -> List[FrozenSet[OWLNamedIndividual]]:
+        """Get the instances of many class expressions in parallel on a pool of worker processes.
+
+        A snapshot of the class and object property indexes is shipped to the workers once and reused until the
+        ontology changes or :func:`StructuralReasoner.close_parallel_pool` is called. The workers return the instances
+        as arrays of individual ids. Class expressions that cannot be evaluated on the snapshot (e.g. data property
+        restrictions) are retrieved in this process instead.
+
+        Args:
+            ces: The class expressions whose instances are to be retrieved.
+            processes: Number of worker processes, None for the number of CPUs.
+            chunksize: Number of class expressions sent to a worker at once.
+
+        Returns:
+            The instances of each class expression, in the order of ces.
+        """
+        ces = list(ces)
+        pool = self._get_snapshot_pool(processes)
+        individuals = pool.individuals
+        ret = []
+        for ce, ids in zip(ces, pool.map(ces, chunksize)):
+            if ids is None:
+                ret.append(self._instances_set(ce))
+            else:
+                ret.append(frozenset(individuals[i] for i in ids))
+        return ret
+
+    def close_parallel_pool(self):
+        """Shut down the worker processes used by :func:`StructuralReasoner.instances_parallel`."""
+        if self._snapshot_pool is not None:
+            self._snapshot_pool.close()
+            self._snapshot_pool = None
+
+    @_synchronized
+    def save_index(self, path: str):
+        """Save the class, object property and class hierarchy indexes to a file that can be loaded by
+        :func:`StructuralReasoner.load_index` to skip warming up the caches after a restart.
+
+        The instances of all classes and the values of all object properties in the signature are retrieved first, so
+        saving warms the caches of this reasoner as a side effect. Object property values are only saved if the
+        property cache is enabled.
+
+        Args:
+            path: File to write, an existing file is replaced.
+        """
+        self._apply_changes()
+        index = _IndividualIndex(self._ontology.individuals_in_signature())
+        classes = list(self._ontology.classes_in_signature())
+        class_ids = {c: i for i, c in enumerate(classes)}
+
+        def class_id(c: OWLClass) -> int:
+            i = class_ids.get(c)
+            if i is None:
+                i = class_ids[c] = len(classes)
+                classes.append(c)
+            return i
+
+        n_indexed_classes = len(classes)
+        instances = []
+        sub_classes = []
+        super_classes = []
+        for c in classes[:n_indexed_classes]:
+            instances.append(sorted(map(index.id_of, self._find_instances(c))))
+            sub_classes.append([class_id(sc) for sc in self.sub_classes(c, direct=True) if isinstance(sc, OWLClass)])
+            super_classes.append([class_id(sc) for sc in self.super_classes(c, direct=True)])
+
+        arrays = dict()
+        for name, rows in (('instances', instances), ('sub_classes', sub_classes),
+                           ('super_classes', super_classes)):
+            arrays[f'{name}_indptr'] = np.cumsum([0, *map(len, rows)], dtype=np.int64)
+            arrays[f'{name}_indices'] = np.fromiter(chain.from_iterable(rows), dtype=np.int64)
+        obj_props = list(self._ontology.object_properties_in_signature()) if self._property_cache else []
+        for k, p in enumerate(obj_props):
+            self._lazy_cache_obj_prop(p)
+            pairs = [(index.id_of(s), index.id_of(o)) for s, o_set in self._obj_prop[p].items() for o in o_set]
+            arrays[f'obj_prop_{k}_subjects'] = np.fromiter((s for s, _ in pairs), dtype=np.int64, count=len(pairs))
+            arrays[f'obj_prop_{k}_objects'] = np.fromiter((o for _, o in pairs), dtype=np.int64, count=len(pairs))
+        iris = [index.individual(i).str.encode() for i in range(len(index))]
+        arrays['individual_offsets'] = np.cumsum([0, *map(len, iris)], dtype=np.int64)
+        arrays['individual_iris'] = np.frombuffer(b''.join(iris), dtype=np.uint8)
+
+        header = {
+            'ontology_hash': _ontology_content_hash(self._ontology),
+            'sub_properties': self._sub_properties,
+            'n_individuals': len(index),
+            'n_indexed_classes': n_indexed_classes,
+            'classes': [c.str for c in classes],
+            'object_properties': [p.str for p in obj_props],
+        }
+        _ReasonerIndexFile.write(path, header, arrays)
+
+    @_synchronized
+    def load_index(self, path: str, verify: bool = True) -> bool:
+        """Load an index saved by :func:`StructuralReasoner.save_index`.
+
+        The file is memory-mapped and the cache entries are created from it on first use. The index is dropped as soon
+        as the ontology changes.
+
+        Args:
+            path: File to load.
+            verify: Whether to check that the index was saved for the same ontology content. Skipping the check avoids
+                a pass over all triples of the ontology.
+
+        Returns:
+            True if the index was loaded, False if it does not exist, has a different format version or was saved for
+            a different ontology or configuration.
+        """
+        self._apply_changes()
+        try:
+            index_file = _ReasonerIndexFile(path)
+        except (OSError, ValueError) as e:
+            logger.info(f"Not loading reasoner index: {e}")
+            return False
+        header = index_file.header
+        if header['sub_properties'] != self._sub_properties or \
+                (verify and header['ontology_hash'] != _ontology_content_hash(self._ontology)):
+            logger.info(f"Not loading reasoner index: {path} was saved for a different ontology or configuration")
+            index_file.close()
+            return False
+        self._close_index_file()
+        self._init()
+        self._index_file = index_file
+        return True
+
+    def _close_index_file(self):
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+
+    def _get_snapshot_pool(self, processes: Optional[int]) -> _SnapshotPool:
+        self._apply_changes()
+        pool = self._snapshot_pool
+        if pool is not None and (pool.revision != self._ontology.revision or pool.processes != processes):
+            self.close_parallel_pool()
+            pool = None
+        if pool is None:
+            individuals = list(self._ontology.individuals_in_signature())
+            snapshot = self._create_snapshot(individuals)
+            pool = _SnapshotPool(snapshot, individuals, self._ontology.revision, processes)
+            self._snapshot_pool = pool
+        return pool
+
+    def _create_snapshot(self, individuals: List[OWLNamedIndividual]) -> _RetrievalSnapshot:
+        """Create a snapshot of the class and object property indexes.
+
+        Args:
+            individuals: The individuals in the signature. Individuals that only occur as property values are
+                appended to the list.
+        """
+        n_signature = len(individuals)
+        index = _IndividualIndex(individuals)
+        classes = {c.str: index.to_bits(self._find_instances(c)) for c in self._ontology.classes_in_signature()}
+        obj_prop = dict()
+        for p in self._ontology.object_properties_in_signature():
+            if self._property_cache:
+                self._lazy_cache_obj_prop(p)
+                ops = self._obj_prop[p]
+            else:
+                ops = {s: self.object_property_values(s, p, not self._sub_properties) for s in individuals}
+            values = {index.id_of(s): index.to_bits(o_set) for s, o_set in ops.items()}
+            obj_prop[p.str] = {s: o_bits for s, o_bits in values.items() if o_bits}
+        individuals.extend(index.individual(i) for i in range(n_signature, len(index)))
+        return _RetrievalSnapshot([ind.str for ind in individuals], n_signature, classes, obj_prop,
+                                  self._negation_default)
+
+    @_synchronized
+    def _instances_batch(self, ces: List[OWLClassExpression], direct: bool, count: bool) -> list:
+        """Evaluate a batch of class expressions in one task, sharing the results of common sub-expressions.
+
+        If the expression cache is disabled, a temporary unbounded one is used for the duration of the batch.
+        """
+        batch_cache = self._expression_cache is None
+        if batch_cache:
+            self._expression_cache = LRUCache()
+        if self._bitset_retrieval:
+            self._bits_memo = dict()
+        try:
+            if self._bitset_retrieval and count:
+                return [self._instances_bits(ce).bit_count() for ce in ces]
+            elif count:
+                return [len(self._find_instances(ce)) for ce in ces]
+            else:
+                return [frozenset(self._instances(ce, direct)) for ce in ces]
+        finally:
+            self._bits_memo = None
+            if batch_cache:
+                self._expression_cache = None
 
     def _sub_classes_recursive(self, ce: OWLClassExpression, seen_set: Set, only_named: bool = True) \
             -> Iterable[OWLClassExpression]:
@@ -281,11 +1277,8 @@ class StructuralReasoner(AbstractOWLReasoner):
                     yield from self._sub_classes_recursive(axiom.get_sub_class(), seen_set, only_named)
 
             if isinstance(c, OWLClass):
-                c_x: owlready2.EntityClass = self._world[c.str]
-                # Subclasses will only return named classes
-                for sc_x in c_x.subclasses(world=self._world):
-                    sc = _parse_concept_to_owlapy(sc_x)
-                    if isinstance(sc, OWLClass) and sc not in seen_set:
+                for sc in self._ontology._direct_sub(c):
+                    if sc not in seen_set:
                         seen_set.add(sc)
                         yield sc
                         yield from self._sub_classes_recursive(sc, seen_set, only_named=only_named)
@@ -320,11 +1313,13 @@ class StructuralReasoner(AbstractOWLReasoner):
                     if isinstance(axiom, OWLSubClassOfAxiom) and axiom.get_super_class() == ce:
                         yield axiom.get_sub_class()
             if isinstance(ce, OWLClass):
-                c_x: owlready2.ThingClass = self._world[ce.str]
-                # Subclasses will only return named classes
-                for sc in c_x.subclasses(world=self._world):
-                    if isinstance(sc, owlready2.ThingClass):
-                        yield OWLClass(IRI.create(sc.iri))
+                if self._index_file is not None:
+                    self._apply_changes()
+                    subs = self._index_file.sub_classes(ce) if self._index_file is not None else None
+                    if subs is not None:
+                        yield from subs
+                        return
+                yield from self._ontology._direct_sub(ce)
             elif isinstance(ce, OWLClassExpression):
                 # Slow but works. No better way to do this in owlready2 without using the reasoners at the moment.
                 for c in self._ontology.classes_in_signature():
@@ -333,6 +1328,12 @@ class StructuralReasoner(AbstractOWLReasoner):
             else:
                 raise ValueError(f'Sub classes retrieval not implemented for: {ce}')
 
+    def class_hierarchy_down(self) -> Iterable[Tuple[OWLClass, Iterable[OWLClass]]]:
+        # documented in parent
+        # the ontology reads all sub class relations at once instead of one query per class
+        self._apply_changes()
+        yield from self._ontology._sub_class_edges()
+
     def _super_classes_recursive(self, ce: OWLClassExpression, seen_set: Set, only_named: bool = True) \
             -> Iterable[OWLClassExpression]:
         # work around issue in class equivalence detection in Owlready2
@@ -341,9 +1342,7 @@ class StructuralReasoner(AbstractOWLReasoner):
                 seen_set.add(c)
                 yield c
             if isinstance(c, OWLClass):
-                c_x: owlready2.EntityClass = self._world[c.str]
-                for sc_x in c_x.is_a:
-                    sc = _parse_concept_to_owlapy(sc_x)
+                for sc in self._ontology._direct_super(c, only_named=False):
                     if (isinstance(sc, OWLClass) or isinstance(sc, OWLClassExpression)) and sc not in seen_set:
                         seen_set.add(sc)
                         # Return class expression if it is a named class or complex class expressions should be
@@ -379,11 +1378,13 @@ class StructuralReasoner(AbstractOWLReasoner):
             yield from self._super_classes_recursive(ce, seen_set, only_named=only_named)
         else:
             if isinstance(ce, OWLClass):
-                c_x: owlready2.ThingClass = self._world[ce.str]
-                for sc in c_x.is_a:
-                    if (isinstance(sc, owlready2.ThingClass) or
-                            (not only_named and isinstance(sc, owlready2.ClassConstruct))):
-                        yield _parse_concept_to_owlapy(sc)
+                if only_named and self._index_file is not None:
+                    self._apply_changes()
+                    supers = self._index_file.super_classes(ce) if self._index_file is not None else None
+                    if supers is not None:
+                        yield from supers
+                        return
+                yield from self._ontology._direct_super(ce, only_named)
             elif isinstance(ce, OWLClassExpression):
                 seen_set = set()
                 for axiom in self._ontology.general_class_axioms():
@@ -403,37 +1404,27 @@ class StructuralReasoner(AbstractOWLReasoner):
 
     def equivalent_object_properties(self, op: OWLObjectPropertyExpression) -> Iterable[OWLObjectPropertyExpression]:
         if isinstance(op, OWLObjectProperty):
-            p_x: owlready2.ObjectPropertyClass = self._world[op.str]
-            yield from (OWLObjectProperty(IRI.create(ep_x.iri)) for ep_x in p_x.INDIRECT_equivalent_to
-                        if isinstance(ep_x, owlready2.ObjectPropertyClass))
+            yield from self._ontology._equivalents(op)
         else:
             raise NotImplementedError("equivalent properties of inverse properties not yet implemented", op)
 
     def equivalent_data_properties(self, dp: OWLDataProperty) -> Iterable[OWLDataProperty]:
-        p_x: owlready2.DataPropertyClass = self._world[dp.str]
-        yield from (OWLDataProperty(IRI.create(ep_x.iri)) for ep_x in p_x.INDIRECT_equivalent_to
-                    if isinstance(ep_x, owlready2.DataPropertyClass))
+        yield from self._ontology._equivalents(dp)
 
     def _find_disjoint_object_properties(self, op: OWLObjectPropertyExpression, seen_set=None) \
             -> Iterable[OWLObjectPropertyExpression]:
         if isinstance(op, OWLObjectProperty):
-            p_x: owlready2.ObjectPropertyClass = self._world[op.str]
-            ont_x: owlready2.Ontology = self.get_root_ontology()._onto
-            for disjoint in ont_x.disjoint_properties():
-                if p_x in disjoint.entities:
-                    for o_p in disjoint.entities:
-                        if isinstance(o_p, owlready2.ObjectPropertyClass) and o_p != p_x:
-                            op_owlapy = OWLObjectProperty(IRI.create(o_p.iri))
-                            seen_set.add(op_owlapy)
-                            yield op_owlapy
-                            for o in self.equivalent_object_properties(op_owlapy):
-                                if o not in seen_set:
-                                    seen_set.add(o)
-                                    yield o
-                            for o in self.sub_object_properties(op_owlapy):
-                                if o not in seen_set:
-                                    seen_set.add(o)
-                                    yield o
+            for op_owlapy in self._ontology._disjoints(op):
+                seen_set.add(op_owlapy)
+                yield op_owlapy
+                for o in self.equivalent_object_properties(op_owlapy):
+                    if o not in seen_set:
+                        seen_set.add(o)
+                        yield o
+                for o in self.sub_object_properties(op_owlapy):
+                    if o not in seen_set:
+                        seen_set.add(o)
+                        yield o
         else:
             raise NotImplementedError("disjoint object properties of inverse properties not yet implemented", op)
 
@@ -452,23 +1443,17 @@ class StructuralReasoner(AbstractOWLReasoner):
                 yield from self._find_disjoint_object_properties(o, seen_set=seen_set)
 
     def _find_disjoint_data_properties(self, dp: OWLDataProperty, seen_set=None) -> Iterable[OWLDataProperty]:
-        p_x: owlready2.DataPropertyClass = self._world[dp.str]
-        ont_x: owlready2.Ontology = self.get_root_ontology()._onto
-        for disjoint in ont_x.disjoint_properties():
-            if p_x in disjoint.entities:
-                for d_p in disjoint.entities:
-                    if isinstance(d_p, owlready2.DataPropertyClass) and d_p != p_x:
-                        dp_owlapy = OWLDataProperty(IRI.create(d_p.iri))
-                        seen_set.add(dp_owlapy)
-                        yield dp_owlapy
-                        for d in self.equivalent_data_properties(dp_owlapy):
-                            if d not in seen_set:
-                                seen_set.add(d)
-                                yield d
-                        for d in self.sub_data_properties(dp_owlapy):
-                            if d not in seen_set:
-                                seen_set.add(d)
-                                yield d
+        for dp_owlapy in self._ontology._disjoints(dp):
+            seen_set.add(dp_owlapy)
+            yield dp_owlapy
+            for d in self.equivalent_data_properties(dp_owlapy):
+                if d not in seen_set:
+                    seen_set.add(d)
+                    yield d
+            for d in self.sub_data_properties(dp_owlapy):
+                if d not in seen_set:
+                    seen_set.add(d)
+                    yield d
 
     def disjoint_data_properties(self, dp: OWLDataProperty) -> Iterable[OWLDataProperty]:
         seen_set = set()
@@ -484,37 +1469,27 @@ class StructuralReasoner(AbstractOWLReasoner):
             if d != OWLDataProperty(IRI('http://www.w3.org/2002/07/owl#', 'DatatypeProperty')):
                 yield from self._find_disjoint_data_properties(d, seen_set=seen_set)
 
+    def _direct_sup_or_sub_properties(self, p: OWLProperty, super_or_sub: str) -> Iterable[OWLProperty]:
+        if super_or_sub == "super":
+            return self._ontology._direct_super(p)
+        return self._ontology._direct_sub(p)
+
     def _sup_or_sub_data_properties_recursive(self, dp: OWLDataProperty, seen_set: Set, super_or_sub="") \
             -> Iterable[OWLDataProperty]:
         for d in self.equivalent_data_properties(dp):
             if d not in seen_set:
                 seen_set.add(d)
                 yield d
-        p_x: owlready2.DataPropertyClass = self._world[dp.str]
-        assert isinstance(p_x, owlready2.DataPropertyClass)
-        if super_or_sub == "super":
-            dps = set(p_x.is_a)
-        else:
-            dps = set(p_x.subclasses(world=self._world))
-        for sp_x in dps:
-            if isinstance(sp_x, owlready2.DataPropertyClass):
-                sp = OWLDataProperty(IRI.create(sp_x.iri))
-                if sp not in seen_set:
-                    seen_set.add(sp)
-                    yield sp
-                    yield from self._sup_or_sub_data_properties_recursive(sp, seen_set, super_or_sub)
+        for sp in self._direct_sup_or_sub_properties(dp, super_or_sub):
+            if sp not in seen_set:
+                seen_set.add(sp)
+                yield sp
+                yield from self._sup_or_sub_data_properties_recursive(sp, seen_set, super_or_sub)
 
     def _sup_or_sub_data_properties(self, dp: OWLDataProperty, direct: bool = False, super_or_sub=""):
         assert isinstance(dp, OWLDataProperty)
         if direct:
-            p_x: owlready2.DataPropertyClass = self._world[dp.str]
-            if super_or_sub == "super":
-                dps = set(p_x.is_a)
-            else:
-                dps = set(p_x.subclasses(world=self._world))
-            for sp in dps:
-                if isinstance(sp, owlready2.DataPropertyClass):
-                    yield OWLDataProperty(IRI.create(sp.iri))
+            yield from self._direct_sup_or_sub_properties(dp, super_or_sub)
         else:
             seen_set = set()
             yield from self._sup_or_sub_data_properties_recursive(dp, seen_set, super_or_sub)
@@ -530,41 +1505,24 @@ class StructuralReasoner(AbstractOWLReasoner):
             if o not in seen_set:
                 seen_set.add(o)
                 yield o
-        p_x: owlready2.ObjectPropertyClass = self._world[op.str]
-        assert isinstance(p_x, owlready2.ObjectPropertyClass)
-        if super_or_sub == "super":
-            dps = set(p_x.is_a)
-        else:
-            dps = set(p_x.subclasses(world=self._world))
-        for sp_x in dps:
-            if isinstance(sp_x, owlready2.ObjectPropertyClass):
-                sp = OWLObjectProperty(IRI.create(sp_x.iri))
-                if sp not in seen_set:
-                    seen_set.add(sp)
-                    yield sp
-                    yield from self._sup_or_sub_object_properties_recursive(sp, seen_set, super_or_sub)
+        for sp in self._direct_sup_or_sub_properties(op, super_or_sub):
+            if sp not in seen_set:
+                seen_set.add(sp)
+                yield sp
+                yield from self._sup_or_sub_object_properties_recursive(sp, seen_set, super_or_sub)
 
     def _sup_or_sub_object_properties(self, op: OWLObjectPropertyExpression, direct: bool = False, super_or_sub="") \
             -> Iterable[OWLObjectPropertyExpression]:
         if isinstance(op, OWLObjectProperty):
             if direct:
-                p_x: owlready2.ObjectPropertyClass = self._world[op.str]
-                if super_or_sub == "super":
-                    dps = set(p_x.is_a)
-                else:
-                    dps = set(p_x.subclasses(world=self._world))
-                for sp in dps:
-                    if isinstance(sp, owlready2.ObjectPropertyClass):
-                        yield OWLObjectProperty(IRI.create(sp.iri))
+                yield from self._direct_sup_or_sub_properties(op, super_or_sub)
             else:
                 seen_set = set()
                 yield from self._sup_or_sub_object_properties_recursive(op, seen_set, super_or_sub)
         elif isinstance(op, OWLObjectInverseOf):
-            p: owlready2.ObjectPropertyClass = self._world[op.get_named_property().str]
-            inverse_p = p.inverse_property
+            inverse_p = self._ontology._inverse_property(op.get_named_property())
             if inverse_p is not None:
-                yield from self._sup_or_sub_object_properties(OWLObjectProperty(IRI.create(inverse_p.iri)), direct,
-                                                              super_or_sub)
+                yield from self._sup_or_sub_object_properties(inverse_p, direct, super_or_sub)
             else:
                 raise NotImplementedError(f'{super_or_sub} properties of inverse properties are only implemented if the'
                                           ' inverse property is explicitly defined in the ontology. '
@@ -593,17 +1551,7 @@ class StructuralReasoner(AbstractOWLReasoner):
         yield from self._sup_or_sub_object_properties(op, direct, "sub")
 
     def types(self, ind: OWLNamedIndividual, direct: bool = False) -> Iterable[OWLClass]:
-        i: owlready2.Thing = self._world[ind.str]
-        if direct:
-            for c in i.is_a:
-                if isinstance(c, owlready2.ThingClass):
-                    yield OWLClass(IRI.create(c.iri))
-                # Anonymous classes are ignored
-        else:
-            for c in i.INDIRECT_is_a:
-                if isinstance(c, owlready2.ThingClass):
-                    yield OWLClass(IRI.create(c.iri))
-                # Anonymous classes are ignored
+        yield from self._ontology._types(ind, direct)
 
     def get_root_ontology(self) -> AbstractOWLOntology:
         return self._ontology
@@ -621,39 +1569,36 @@ class StructuralReasoner(AbstractOWLReasoner):
         else:
             raise NotImplementedError
 
-        # Dict with Individual => Set[Individual]
-        opc: DefaultDict[OWLNamedIndividual, Set[OWLNamedIndividual]] = defaultdict(set)
-
-        # shortcut for owlready2
-        from owlapy.owl_ontology import Ontology
-        if isinstance(self._ontology, Ontology):
-            import owlready2
-            # _x => owlready2 objects
-            for l_x, r_x in self._retrieve_triples(pe):
+        if self._index_file is not None:
+            opc = self._index_file.object_property_values(pe)
+            if opc is not None:
                 if inverse:
-                    o_x = l_x
-                    s_x = r_x
+                    self._obj_prop_inv[pe.get_named_property()] = MappingProxyType(opc)
                 else:
-                    s_x = l_x
-                    o_x = r_x
-                if isinstance(s_x, owlready2.Thing) and isinstance(o_x, owlready2.Thing):
-                    s = OWLNamedIndividual(IRI.create(s_x.iri))
-                    o = OWLNamedIndividual(IRI.create(o_x.iri))
-                    if s not in opc:
-                        opc[s] = set()
-                    opc[s] |= {o}
-        else:
-            all_ = frozenset(self._ontology.individuals_in_signature())
-            for s in all_:
-                individuals = set(self.object_property_values(s, pe, not self._sub_properties))
-                if individuals:
-                    opc[s] = individuals
+                    self._obj_prop[pe] = MappingProxyType(opc)
+                return
+
+        # Dict with Individual => Set[Individual]
+        opc: DefaultDict[OWLNamedIndividual, Set[OWLNamedIndividual]] = defaultdict(set)
+        for s, o in self._property_assertions(pe):
+            opc[s].add(o)
 
         if inverse:
             self._obj_prop_inv[pe.get_named_property()] = MappingProxyType(opc)
         else:
             self._obj_prop[pe] = MappingProxyType(opc)
 
+    def _lazy_cache_obj_prop_csr(self, pe: OWLObjectPropertyExpression) -> _ObjectPropertyCSR:
+        """Make sure the compressed sparse row index contains the adjacency of this object property expression."""
+        csr = self._obj_prop_csr
+        if csr is None:
+            csr = self._obj_prop_csr = _ObjectPropertyCSR(self._ontology, self._ontology.individuals_in_signature())
+        p = pe.get_named_property()
+        if not csr.has(p):
+            subs = self.sub_object_properties(p, direct=False) if self._sub_properties else ()
+            csr.build(p, subs)
+        return csr
+
     def _some_values_subject_index(self, pe: OWLPropertyExpression) -> FrozenSet[OWLNamedIndividual]:
         if isinstance(pe, OWLDataProperty):
             typ = OWLDataProperty
@@ -665,44 +1610,20 @@ class StructuralReasoner(AbstractOWLReasoner):
             raise NotImplementedError
 
         if pe not in self._has_prop[typ]:
-            subs = set()
-
-            # shortcut for owlready2
-            from owlapy.owl_ontology import Ontology
-            if isinstance(self._ontology, Ontology):
-                import owlready2
-                # _x => owlready2 objects
-                for s_x, o_x in self._retrieve_triples(pe):
-                    if isinstance(pe, OWLObjectInverseOf):
-                        l_x = o_x
-                    else:
-                        l_x = s_x
-                    if isinstance(l_x, owlready2.Thing):
-                        subs |= {OWLNamedIndividual(IRI.create(l_x.iri))}
-            else:
-                if isinstance(pe, OWLDataProperty):
-                    func = self.data_property_values
-                else:
-                    func = self.object_property_values
-                all_ = frozenset(self._ontology.individuals_in_signature())
-                for s in all_:
-                    try:
-                        next(iter(func(s, pe, not self._sub_properties)))
-                        subs |= {s}
-                    except StopIteration:
-                        pass
-
-            self._has_prop[typ][pe] = frozenset(subs)
+            self._has_prop[typ][pe] = frozenset(s for s, _ in self._property_assertions(pe))
 
         return self._has_prop[typ][pe]
 
     def _find_some_values(self, pe: OWLObjectPropertyExpression, filler_inds: Set[OWLNamedIndividual],
                           min_count: int = 1, max_count: Optional[int] = None) -> FrozenSet[OWLNamedIndividual]:
         """Get all individuals that have one of filler_inds as their object property value."""
+        check_timeout()
         ret = set()
-        if self._ontology.is_modified and (self.class_cache or self._property_cache):
-            self.reset_and_disable_cache()
-        if self._property_cache:
+        self._apply_changes()
+        if self._property_cache and self._csr_index and \
+                not (self._sub_properties and isinstance(pe, OWLObjectInverseOf)):
+            return self._lazy_cache_obj_prop_csr(pe).some_values(pe, filler_inds, min_count, max_count)
+        elif self._property_cache:
             self._lazy_cache_obj_prop(pe)
 
             if isinstance(pe, OWLObjectInverseOf):
@@ -744,51 +1665,81 @@ class StructuralReasoner(AbstractOWLReasoner):
             return
 
         opc: Dict[OWLNamedIndividual, Set[OWLLiteral]] = dict()
-
-        # shortcut for owlready2
-        from owlapy.owl_ontology import Ontology
-        if isinstance(self._ontology, Ontology):
-            import owlready2
-            # _x => owlready2 objects
-            for s_x, o_x in self._retrieve_triples(pe):
-                if isinstance(s_x, owlready2.Thing):
-                    o_literal = OWLLiteral(o_x)
-                    s = OWLNamedIndividual(IRI.create(s_x.iri))
-                    if s not in opc:
-                        opc[s] = set()
-                    opc[s].add(o_literal)
-        else:
-            for s in self._ind_set:
-                values = set(self.data_property_values(s, pe))
-                if len(values) > 0:
-                    opc[s] = values
+        for s, o_literal in self._property_assertions(pe):
+            if s not in opc:
+                opc[s] = set()
+            opc[s].add(o_literal)
 
         self._data_prop[pe] = MappingProxyType(opc)
 
+    def _lazy_cache_data_prop_cols(self, pe: OWLDataProperty) -> _DataPropertyColumns:
+        """Get the sorted value columns of this data property, building them on first use."""
+        cols = self._data_prop_cols.get(pe)
+        if cols is None:
+            self._lazy_cache_data_prop(pe)
+            cols = self._data_prop_cols[pe] = _DataPropertyColumns(self._data_prop[pe])
+        return cols
+
+    def _find_data_values_columnar(self, pe: OWLDataProperty, filler: Union[OWLDataOneOf, OWLDatatypeRestriction]) \
+            -> Optional[FrozenSet[OWLNamedIndividual]]:
+        """Get all individuals that have a value of pe in the filler using the sorted value columns, None if the
+        filler cannot be evaluated on the columns."""
+        cols = self._lazy_cache_data_prop_cols(pe)
+        if isinstance(filler, OWLDatatypeRestriction):
+            sids = cols.restriction(filler)
+            return None if sids is None else frozenset(cols.individuals(sids))
+
+        sids = []
+        rest = set()
+        for v in filler.values():
+            r = cols.equal(v)
+            if r is None:
+                rest.add(v)
+            else:
+                sids.append(r)
+        ind = cols.individuals(sids)
+        if rest:
+            for s, literals in self._data_prop[pe].items():
+                if literals & rest:
+                    ind.add(s)
+        return frozenset(ind)
+
+    def _find_instances(self, ce: OWLClassExpression) -> FrozenSet[OWLNamedIndividual]:
+        """Get the instances of a class expression, looking them up in the expression cache if enabled."""
+        check_timeout()
+        self._apply_changes()
+        cache = self._expression_cache
+        if cache is None or isinstance(ce, OWLClass):
+            return self._find_instances_uncached(ce)
+        if ce in cache:
+            return cache[ce]
+        ret = self._find_instances_uncached(ce)
+        cache[ce] = ret
+        return ret
+
     # single dispatch is still not implemented in mypy, see https://github.com/python/mypy/issues/2904
     @singledispatchmethod
-    def _find_instances(self, ce: OWLClassExpression) -> FrozenSet[OWLNamedIndividual]:
+    def _find_instances_uncached(self, ce: OWLClassExpression) -> FrozenSet[OWLNamedIndividual]:
         raise NotImplementedError(ce)
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, c: OWLClass) -> FrozenSet[OWLNamedIndividual]:
-        if self._ontology.is_modified and (self.class_cache or self._property_cache):
-            self.reset_and_disable_cache()
+        self._apply_changes()
         if self.class_cache:
             self._lazy_cache_class(c)
             return self._cls_to_ind[c]
         else:
             return frozenset(self.get_instances_from_owl_class(c))
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, ce: OWLObjectUnionOf) -> FrozenSet[OWLNamedIndividual]:
         return reduce(operator.or_, map(self._find_instances, ce.operands()))
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, ce: OWLObjectIntersectionOf) -> FrozenSet[OWLNamedIndividual]:
         return reduce(operator.and_, map(self._find_instances, ce.operands()))
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, ce: OWLObjectSomeValuesFrom) -> FrozenSet[OWLNamedIndividual]:
         p = ce.get_property()
         assert isinstance(p, OWLObjectPropertyExpression)
@@ -801,10 +1752,10 @@ class StructuralReasoner(AbstractOWLReasoner):
 
         return ind
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, ce: OWLObjectComplementOf) -> FrozenSet[OWLNamedIndividual]:
         if self._negation_default:
-            all_ = frozenset(self._ontology.individuals_in_signature())
+            all_ = self._all_individuals()
             complement_ind = self._find_instances(ce.get_operand())
             return all_ ^ complement_ind
         else:
@@ -818,7 +1769,7 @@ class StructuralReasoner(AbstractOWLReasoner):
             # else:
             #     self._lazy_cache_negation
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, ce: OWLObjectAllValuesFrom) -> FrozenSet[OWLNamedIndividual]:
         return self._find_instances(
             OWLObjectSomeValuesFrom(
@@ -826,27 +1777,27 @@ class StructuralReasoner(AbstractOWLReasoner):
                 filler=ce.get_filler().get_object_complement_of().get_nnf()
             ).get_object_complement_of())
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, ce: OWLObjectOneOf) -> FrozenSet[OWLNamedIndividual]:
         return frozenset(ce.individuals())
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, ce: OWLObjectHasValue) -> FrozenSet[OWLNamedIndividual]:
         return self._find_instances(ce.as_some_values_from())
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, ce: OWLObjectMinCardinality) -> FrozenSet[OWLNamedIndividual]:
         return self._get_instances_object_card_restriction(ce)
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, ce: OWLObjectMaxCardinality) -> FrozenSet[OWLNamedIndividual]:
-        all_ = frozenset(self._ontology.individuals_in_signature())
+        all_ = self._all_individuals()
         min_ind = self._find_instances(OWLObjectMinCardinality(cardinality=ce.get_cardinality() + 1,
                                                                property=ce.get_property(),
                                                                filler=ce.get_filler()))
         return all_ ^ min_ind
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, ce: OWLObjectExactCardinality) -> FrozenSet[OWLNamedIndividual]:
         return self._get_instances_object_card_restriction(ce)
 
@@ -874,16 +1825,20 @@ class StructuralReasoner(AbstractOWLReasoner):
 
         return ind
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, ce: OWLDataSomeValuesFrom) -> FrozenSet[OWLNamedIndividual]:
         pe = ce.get_property()
         filler = ce.get_filler()
         assert isinstance(pe, OWLDataProperty)
 
-        if self._ontology.is_modified and (self.class_cache or self._property_cache):
-            self.reset_and_disable_cache()
+        self._apply_changes()
         property_cache = self._property_cache
 
+        if property_cache and self._data_columns and isinstance(filler, (OWLDataOneOf, OWLDatatypeRestriction)):
+            ind = self._find_data_values_columnar(pe, filler)
+            if ind is not None:
+                return ind
+
         if property_cache:
             self._lazy_cache_data_prop(pe)
             dps = self._data_prop[pe]
@@ -966,7 +1921,7 @@ class StructuralReasoner(AbstractOWLReasoner):
         r = frozenset(ind)
         return r
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, ce: OWLDataAllValuesFrom) -> FrozenSet[OWLNamedIndividual]:
         filler = ce.get_filler()
         if isinstance(filler, OWLDataComplementOf):
@@ -979,30 +1934,35 @@ class StructuralReasoner(AbstractOWLReasoner):
                 filler=filler
             ).get_object_complement_of())
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, ce: OWLDataHasValue) -> FrozenSet[OWLNamedIndividual]:
         return self._find_instances(ce.as_some_values_from())
 
     def _lazy_cache_class(self, c: OWLClass) -> None:
         if c in self._cls_to_ind:
             return
+        if self._index_file is not None:
+            temp = self._index_file.instances(c)
+            if temp is not None:
+                self._cls_to_ind[c] = temp
+                return
         temp = self.get_instances_from_owl_class(c)
         self._cls_to_ind[c] = frozenset(temp)
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, ce: OWLDataMinCardinality):
         return self._get_instances_data_card_restriction(ce)
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, ce: OWLDataMaxCardinality):
-        all_ = frozenset(self._ontology.individuals_in_signature())
+        all_ = self._all_individuals()
         min_ind = self._get_instances_data_card_restriction(
             OWLDataMinCardinality(cardinality=ce.get_cardinality() + 1,
                                   property=ce.get_property(),
                                   filler=ce.get_filler()))
         return all_ ^ min_ind
 
-    @_find_instances.register
+    @_find_instances_uncached.register
     def _(self, ce: OWLDataExactCardinality):
         return self._get_instances_data_card_restriction(ce)
 
@@ -1023,8 +1983,7 @@ class StructuralReasoner(AbstractOWLReasoner):
         assert min_count >= 0
         assert max_count is None or max_count >= 0
 
-        if self._ontology.is_modified and (self.class_cache or self._property_cache):
-            self.reset_and_disable_cache()
+        self._apply_changes()
         property_cache = self._property_cache
 
         if property_cache:
@@ -1170,49 +2129,389 @@ class StructuralReasoner(AbstractOWLReasoner):
         if c.is_owl_thing():
             yield from self._ontology.individuals_in_signature()
         elif isinstance(c, OWLClass):
-            c_x: owlready2.ThingClass = self._world[c.str]
-            for i in c_x.instances(world=self._world):
-                if isinstance(i, owlready2.Thing):
-                    yield OWLNamedIndividual(IRI.create(i.iri))
-
-    def _retrieve_triples(self, pe: OWLPropertyExpression) -> Iterable:
-        """Retrieve all subject/object pairs for the given property."""
+            yield from self._ontology._class_instances(c)
 
-        if isinstance(pe, OWLObjectPropertyExpression):
-            retrieval_func = self.sub_object_properties
-            p_x: owlready2.ObjectProperty = self._ontology._world[pe.get_named_property().str]
+    def _lazy_cache_obj_prop_bits(self, pe: OWLObjectPropertyExpression) -> Mapping[int, int]:
+        """Get the individual id => bitset of individuals mapping of this object property expression."""
+        if pe in self._obj_prop_bits:
+            return self._obj_prop_bits[pe]
+        self._lazy_cache_obj_prop(pe)
+        if isinstance(pe, OWLObjectInverseOf):
+            ops = self._obj_prop_inv[pe.get_named_property()]
         else:
-            retrieval_func = self.sub_data_properties
-            p_x: owlready2.DataProperty = self._ontology._world[pe.str]
+            ops = self._obj_prop[pe]
+        index = self._ind_index
+        opc = MappingProxyType({index.id_of(s): index.to_bits(o_set) for s, o_set in ops.items()})
+        self._obj_prop_bits[pe] = opc
+        return opc
+
+    def _find_some_values_bits(self, pe: OWLObjectPropertyExpression, filler_bits: int,
+                               min_count: int = 1, max_count: Optional[int] = None) -> int:
+        """Bitset variant of :func:`StructuralReasoner._find_some_values`."""
+        check_timeout()
+        index = self._ind_index
+        if not self._property_cache:
+            return index.to_bits(self._find_some_values(pe, index.from_bits(filler_bits), min_count, max_count))
+
+        ops = self._lazy_cache_obj_prop_bits(pe)
+        if min_count == 1 and max_count is None:
+            return index.ids_to_bits(s for s, o_bits in ops.items() if o_bits & filler_bits)
+        ret = []
+        for s, o_bits in ops.items():
+            count = (o_bits & filler_bits).bit_count()
+            if count >= min_count and (max_count is None or count <= max_count):
+                ret.append(s)
+        return index.ids_to_bits(ret)
+
+    def _find_instances_bits(self, ce: OWLClassExpression) -> int:
+        """Get the bitset of instances of a class expression, looking it up in the batch memo if set."""
+        memo = self._bits_memo
+        if memo is None or isinstance(ce, OWLClass):
+            return self._find_instances_bits_uncached(ce)
+        ret = memo.get(ce)
+        if ret is None:
+            ret = self._find_instances_bits_uncached(ce)
+            memo[ce] = ret
+        return ret
+
+    @singledispatchmethod
+    def _find_instances_bits_uncached(self, ce: OWLClassExpression) -> int:
+        # Data restrictions and other constructs are evaluated set-based and converted at the boundary
+        return self._ind_index.to_bits(self._find_instances(ce))
 
-        relations = p_x.get_relations()
+    @_find_instances_bits_uncached.register
+    def _(self, c: OWLClass) -> int:
+        if c.is_owl_thing():
+            return self._ind_index.all_bits()
+        if self.class_cache:
+            if c not in self._cls_to_bits:
+                self._cls_to_bits[c] = self._ind_index.to_bits(self._find_instances(c))
+            return self._cls_to_bits[c]
+        return self._ind_index.to_bits(self._find_instances(c))
+
+    @_find_instances_bits_uncached.register
+    def _(self, ce: OWLObjectUnionOf) -> int:
+        return reduce(operator.or_, map(self._find_instances_bits, ce.operands()))
+
+    @_find_instances_bits_uncached.register
+    def _(self, ce: OWLObjectIntersectionOf) -> int:
+        ret = None
+        for op in ce.operands():
+            bits = self._find_instances_bits(op)
+            ret = bits if ret is None else ret & bits
+            if not ret:
+                break
+        return ret
+
+    @_find_instances_bits_uncached.register
+    def _(self, ce: OWLObjectComplementOf) -> int:
+        if self._negation_default:
+            return self._ind_index.all_bits() ^ self._find_instances_bits(ce.get_operand())
+        return self._ind_index.to_bits(self._find_instances(ce))
+
+    @_find_instances_bits_uncached.register
+    def _(self, ce: OWLObjectSomeValuesFrom) -> int:
+        p = ce.get_property()
+        assert isinstance(p, OWLObjectPropertyExpression)
+        filler_bits = self._find_instances_bits(ce.get_filler())
+        return self._find_some_values_bits(p, filler_bits)
+
+    @_find_instances_bits_uncached.register
+    def _(self, ce: OWLObjectAllValuesFrom) -> int:
+        return self._find_instances_bits(
+            OWLObjectSomeValuesFrom(
+                property=ce.get_property(),
+                filler=ce.get_filler().get_object_complement_of().get_nnf()
+            ).get_object_complement_of())
+
+    @_find_instances_bits_uncached.register
+    def _(self, ce: OWLObjectOneOf) -> int:
+        return self._ind_index.to_bits(ce.individuals())
+
+    @_find_instances_bits_uncached.register
+    def _(self, ce: OWLObjectHasValue) -> int:
+        return self._find_instances_bits(ce.as_some_values_from())
+
+    @_find_instances_bits_uncached.register(OWLObjectMinCardinality)
+    @_find_instances_bits_uncached.register(OWLObjectExactCardinality)
+    def _(self, ce: OWLObjectCardinalityRestriction) -> int:
+        p = ce.get_property()
+        assert isinstance(p, OWLObjectPropertyExpression)
+        min_count = ce.get_cardinality()
+        max_count = min_count if isinstance(ce, OWLObjectExactCardinality) else None
+        filler_bits = self._find_instances_bits(ce.get_filler())
+        return self._find_some_values_bits(p, filler_bits, min_count=min_count, max_count=max_count)
+
+    @_find_instances_bits_uncached.register
+    def _(self, ce: OWLObjectMaxCardinality) -> int:
+        min_bits = self._find_instances_bits(OWLObjectMinCardinality(cardinality=ce.get_cardinality() + 1,
+                                                                     property=ce.get_property(),
+                                                                     filler=ce.get_filler()))
+        return self._ind_index.all_bits() ^ min_bits
+
+    def _property_assertions(self, pe: OWLPropertyExpression) \
+            -> Iterable[Tuple[OWLNamedIndividual, Union[OWLNamedIndividual, OWLLiteral]]]:
+        """Retrieve all subject/value pairs for the given property (and its sub properties if enabled)."""
+        sub_properties = ()
         if self._sub_properties:
-            # Retrieve the subject/object pairs for all sub properties of pe
-            indirect_relations = chain.from_iterable(
-                map(lambda x: self._ontology._world[x.str].get_relations(),
-                    retrieval_func(pe, direct=False)))
-            # If pe is an OWLObjectInverseOf we need to swap the pairs
-            if isinstance(pe, OWLObjectInverseOf):
-                indirect_relations = ((r[1], r[0]) for r in indirect_relations)
-            relations = chain(relations, indirect_relations)
-        yield from relations
+            if isinstance(pe, OWLObjectInverseOf) and \
+                    self._ontology._inverse_property(pe.get_named_property()) is None:
+                # without a named inverse property, the inverses of the sub properties are sub properties of pe
+                sub_properties = (p.get_inverse_property()
+                                  for p in self.sub_object_properties(pe.get_named_property(), direct=False))
+            elif isinstance(pe, OWLObjectPropertyExpression):
+                sub_properties = self.sub_object_properties(pe, direct=False)
+            else:
+                sub_properties = self.sub_data_properties(pe, direct=False)
+        return self._ontology._property_assertions(pe, sub_properties)
 
+    @_synchronized
     def reset_and_disable_cache(self):
         self.class_cache = False
         self._property_cache = False
+        self._expression_cache_enabled = False
         self.reset()
 
 
+# An entity as rendered by the OWLAPI SimpleRenderer: a full IRI or a name in one of the default prefixes
+_JAVA_ENTITY: Final = r'<([^<>\s]*)>|(owl|rdfs|rdf|xsd):([^\s,()<>\[\]]*)'
+_JAVA_ENTITY_RE: Final = re.compile(_JAVA_ENTITY)
+# Axioms between named entities that can be created from their rendering
+_JAVA_SIMPLE_AXIOM_RE: Final = re.compile(
+    rf'(ClassAssertion|SubClassOf|SubObjectPropertyOf|SubDataPropertyOf|ObjectPropertyAssertion)\(({_JAVA_ENTITY}) '
+    rf'({_JAVA_ENTITY})(?: ({_JAVA_ENTITY}))?\)')
+_JAVA_PREFIXES: Final = {ns.prefix: ns.ns for ns in (namespaces.OWL, namespaces.RDFS, namespaces.RDF, namespaces.XSD)}
+
+
+def _java_rendered_iri(m: re.Match, group: int) -> Optional[str]:
+    """Get the IRI of an entity matched by _JAVA_ENTITY starting at the given group, None if there is none."""
+    if m.group(group) is not None:
+        return m.group(group)
+    if m.group(group + 1) is not None:
+        return _JAVA_PREFIXES[m.group(group + 1)] + m.group(group + 2)
+    return None
+
+
+def _java_entity_iris(java_collection) -> Optional[List[str]]:
+    """Get the IRIs of a java collection of named OWLAPI entities.
+
+    The collection is rendered by a single toString call on the JVM instead of converting the entities one by one
+    through JPype.
+
+    Returns:
+        The IRIs in iteration order or None if the rendering could not be parsed (e.g. anonymous individuals), in which
+        case the entities have to be converted one by one.
+    """
+    rendering = str(java_collection)
+    matches = list(_JAVA_ENTITY_RE.finditer(rendering))
+    if len(matches) != java_collection.size() or rendering != f"[{', '.join(m.group(0) for m in matches)}]":
+        return None
+    return [_java_rendered_iri(m, 1) for m in matches]
+
+
+def _java_simple_axioms(java_axioms) -> Optional[List[OWLAxiom]]:
+    """Create the axioms of a java collection of OWLAPI axioms from the rendering of the whole collection.
+
+    Returns:
+        The axioms or None if the collection contains axioms that are not class assertions, sub class, sub property
+        or object property assertions between named entities, or axioms with annotations.
+    """
+    rendering = str(java_axioms)
+    matches = list(_JAVA_SIMPLE_AXIOM_RE.finditer(rendering))
+    if len(matches) != java_axioms.size() or rendering != f"[{', '.join(m.group(0) for m in matches)}]":
+        return None
+    ret = []
+    for m in matches:
+        kind = m.group(1)
+        a, b, c = _java_rendered_iri(m, 3), _java_rendered_iri(m, 7), _java_rendered_iri(m, 11)
+        if (c is None) != (kind != 'ObjectPropertyAssertion'):
+            return None
+        if kind == 'ClassAssertion':
+            ret.append(OWLClassAssertionAxiom(OWLNamedIndividual(b), OWLClass(a)))
+        elif kind == 'SubClassOf':
+            ret.append(OWLSubClassOfAxiom(OWLClass(a), OWLClass(b)))
+        elif kind == 'SubObjectPropertyOf':
+            ret.append(OWLSubObjectPropertyOfAxiom(OWLObjectProperty(a), OWLObjectProperty(b)))
+        elif kind == 'SubDataPropertyOf':
+            ret.append(OWLSubDataPropertyOfAxiom(OWLDataProperty(a), OWLDataProperty(b)))
+        else:
+            ret.append(OWLObjectPropertyAssertionAxiom(OWLNamedIndividual(b), OWLObjectProperty(a),
+                                                       OWLNamedIndividual(c)))
+    return ret
+
+
+# Number of axioms rendered by one toString call of _owlapi_ontology_hash
+_ONTOLOGY_HASH_CHUNK: Final = 4096
+
+
+def _owlapi_ontology_hash(owlapi_ontology) -> str:
+    """Hash of the axioms of the imports closure of an OWLAPI ontology.
+
+    The axioms are sorted and rendered on the JVM in chunks of _ONTOLOGY_HASH_CHUNK axioms, which are fed to the hash
+    one after the other, so the rendering of the whole ontology is never held in memory. The hash is the same whenever
+    the same document is loaded (except for ontologies with anonymous individuals, whose generated ids differ between
+    loads).
+    """
+    # noinspection PyUnresolvedReferences
+    from java.util import ArrayList, Collections
+    # noinspection PyUnresolvedReferences
+    from org.semanticweb.owlapi.model.parameters import Imports
+    axioms = ArrayList(owlapi_ontology.getAxioms(Imports.INCLUDED))
+    Collections.sort(axioms)
+    h = hashlib.blake2b(digest_size=16)
+    n = axioms.size()
+    for start in range(0, n, _ONTOLOGY_HASH_CHUNK):
+        h.update(str(axioms.subList(start, min(start + _ONTOLOGY_HASH_CHUNK, n)).toString()).encode())
+    return h.hexdigest()
+
+
+def _sync_ontology_key(ontology: SyncOntology) -> str:
+    """Key of the content of a SyncOntology that names its classification snapshot.
+
+    For an ontology loaded from a file and not changed since (its :attr:`SyncOntology.revision` is 0) the key hashes
+    the path, size and modification time of the file together with the axiom count of the imports closure, so
+    constructing a reasoner does not render all axioms. Ontologies that were changed in memory or not loaded from a
+    local file fall back to the full :func:`_owlapi_ontology_hash`.
+    """
+    # noinspection PyUnresolvedReferences
+    from org.semanticweb.owlapi.model.parameters import Imports
+    path = ontology.path.str if isinstance(ontology.path, IRI) else ontology.path
+    try:
+        st = os.stat(path) if ontology.load and ontology.revision == 0 else None
+    except (OSError, TypeError, ValueError):
+        st = None
+    if st is None:
+        return _owlapi_ontology_hash(ontology.owlapi_ontology)
+    key = (os.path.abspath(path), st.st_size, st.st_mtime_ns, ontology.owlapi_ontology.getAxiomCount(Imports.INCLUDED))
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+
+class _ClassificationSnapshot(_MappedArrayFile):
+    """Snapshot of the classification of a :class:`SyncReasoner`: the class and property hierarchies and the types of
+    the individuals.
+
+    The snapshot either lives in memory or is memory-mapped from a file. The IRIs of each kind of entity are stored in
+    one byte array, rows of the relations refer to the position of an entity in its table. Only the first
+    ``header['n_rows'][kind]`` entities of a table have rows, the others only occur in query results. Negative ids in
+    the object property relations stand for the inverse of the property with id ``-1 - i``.
+    """
+    MAGIC: Final = b'OWLAPYCS'
+    VERSION: Final = 1
+    NAME: Final = 'classification snapshot'
+
+    KINDS: Final = {'classes': OWLClass, 'object_properties': OWLObjectProperty, 'data_properties': OWLDataProperty,
+                    'individuals': OWLNamedIndividual}
+    # relation => (kind of the subject, kind of the entities in the rows)
+    RELATIONS: Final = {
+        'sub_classes_direct': ('classes', 'classes'),
+        'sub_classes': ('classes', 'classes'),
+        'super_classes_direct': ('classes', 'classes'),
+        'super_classes': ('classes', 'classes'),
+        'equivalent_classes': ('classes', 'classes'),
+        'sub_object_properties_direct': ('object_properties', 'object_properties'),
+        'sub_object_properties': ('object_properties', 'object_properties'),
+        'super_object_properties_direct': ('object_properties', 'object_properties'),
+        'super_object_properties': ('object_properties', 'object_properties'),
+        'sub_data_properties_direct': ('data_properties', 'data_properties'),
+        'sub_data_properties': ('data_properties', 'data_properties'),
+        'super_data_properties_direct': ('data_properties', 'data_properties'),
+        'super_data_properties': ('data_properties', 'data_properties'),
+        'types_direct': ('individuals', 'classes'),
+        'types': ('individuals', 'classes'),
+    }
+
+    __slots__ = '_ids', '_entities'
+
+    def __init__(self, path: str):
+        """
+        Raises:
+            ValueError: If the file is not a classification snapshot or was written with a different format version.
+        """
+        super().__init__(path)
+        self._init()
+
+    @classmethod
+    def from_arrays(cls, header: dict, arrays: Dict[str, np.ndarray]) -> '_ClassificationSnapshot':
+        """Create a snapshot in memory instead of mapping it from a file."""
+        snapshot = cls.__new__(cls)
+        snapshot._file = snapshot._mm = None
+        snapshot.header = header
+        snapshot._arrays = arrays
+        snapshot._init()
+        return snapshot
+
+    def _init(self):
+        self._ids: Dict[str, Optional[Dict[str, int]]] = dict.fromkeys(self.KINDS)
+        self._entities: Dict[str, List[Optional[OWLEntity]]] = {
+            kind: [None] * (len(self._arrays[f'{kind}_offsets']) - 1) for kind in self.KINDS}
+
+    def close(self):
+        if self._file is None:
+            self._arrays = dict()
+        else:
+            super().close()
+
+    def _iris(self, kind: str) -> List[str]:
+        offsets = self._arrays[f'{kind}_offsets'].tolist()
+        data = bytes(self._arrays[f'{kind}_iris'])
+        return [data[offsets[i]:offsets[i + 1]].decode() for i in range(len(offsets) - 1)]
+
+    def _entity(self, kind: str, i: int) -> OWLEntity:
+        if i < 0:
+            return OWLObjectInverseOf(self._entity(kind, -1 - i))
+        e = self._entities[kind][i]
+        if e is None:
+            offsets = self._arrays[f'{kind}_offsets']
+            iri = bytes(self._arrays[f'{kind}_iris'][offsets[i]:offsets[i + 1]]).decode()
+            e = self._entities[kind][i] = self.KINDS[kind](iri)
+        return e
+
+    def get(self, relation: str, entity: OWLEntity) -> Optional[List[OWLEntity]]:
+        """Get the entities related to a named entity.
+
+        Args:
+            relation: One of :attr:`RELATIONS`.
+            entity: The subject.
+
+        Returns:
+            The related entities or None if the relation is not part of the snapshot or the entity has no row in it.
+        """
+        if f'{relation}_indptr' not in self._arrays:
+            return None
+        subject_kind, kind = self.RELATIONS[relation]
+        ids = self._ids[subject_kind]
+        if ids is None:
+            # the lookup table is only needed for the kinds that are queried
+            ids = self._ids[subject_kind] = {iri: i for i, iri in enumerate(self._iris(subject_kind))}
+        i = ids.get(entity.str)
+        if i is None or i >= self.header['n_rows'][subject_kind]:
+            return None
+        return [self._entity(kind, j) for j in self._row(relation, i).tolist()]
+
+
 class SyncReasoner(AbstractOWLReasoner):
 
-    def __init__(self, ontology: Union[SyncOntology, str], reasoner="HermiT"):
+    def __init__(self, ontology: Union[SyncOntology, str], reasoner="HermiT", incremental: bool = False,
+                 snapshot_dir: Optional[str] = None):
         """
         OWL reasoner that syncs to other reasoners like HermiT,Pellet,etc.
 
+        Changes of the ontology are buffered by the reasoner and only taken into account after :meth:`flush`.
+
         Args:
             ontology(SyncOntology): Ontology that will be used by this reasoner.
                reasoner: Name of the reasoner. Possible values (case-sensitive): ["HermiT", "Pellet", "ELK", "JFact",
                "Openllet", "Structural"]. Default: "HermiT".
+            incremental: Configure the reasoner to process flushed changes incrementally where supported. ELK
+               updates its classification incrementally in any case, Pellet and Openllet update the completion graph
+               on ABox changes instead of checking consistency from scratch. For Pellet and Openllet this is a process
+               wide switch that applies to all their reasoners in the JVM until
+               :func:`set_openllet_incremental_consistency` switches it off. The other reasoners reload the ontology
+               on flush.
+            snapshot_dir: Directory of the classification snapshots written by :meth:`precompute`. If it holds a
+               snapshot for the same ontology and reasoner, hierarchy and types queries are answered from the
+               snapshot without classifying the ontology. Ontologies loaded from a file are matched by the path, size
+               and modification time of the file and their axiom count, other ontologies by a hash of their axioms.
         """
         assert reasoner in ["HermiT", "Pellet", "ELK", "JFact", "Openllet", "Structural"], \
             (f"'{reasoner}' is not implemented. Available reasoners: ['HermiT', 'Pellet', 'ELK', 'JFact', 'Openllet', "
@@ -1236,7 +2535,14 @@ class SyncReasoner(AbstractOWLReasoner):
         self._owlapi_ontology = self.ontology.get_owlapi_ontology()
         self.mapper = self.ontology.mapper
         self.inference_types_mapping = import_and_include_axioms_generators()
-        self._owlapi_reasoner = initialize_reasoner(reasoner, self._owlapi_ontology)
+        self.incremental = incremental
+        self._owlapi_reasoner = initialize_reasoner(reasoner, self._owlapi_ontology, incremental)
+        # additional reasoners over the same ontology for running axiom generators in parallel, created on demand
+        self._infer_reasoners = []
+        self.snapshot_dir = snapshot_dir
+        self._snapshot: Optional[_ClassificationSnapshot] = None
+        if snapshot_dir is not None:
+            self._load_snapshot()
 
     def _instances(self, ce: OWLClassExpression, direct=False) -> Set[OWLNamedIndividual]:
         """
@@ -1253,11 +2559,58 @@ class SyncReasoner(AbstractOWLReasoner):
         instances = self._owlapi_reasoner.getInstances(mapped_ce, direct)
         flattened_instances = instances.getFlattened()
         assert str(type(flattened_instances)) == "<java class 'java.util.LinkedHashSet'>"
+        iris = _java_entity_iris(flattened_instances)
+        if iris is not None:
+            return set(map(OWLNamedIndividual, iris))
         return {self.mapper.map_(ind) for ind in flattened_instances}
 
     def instances(self, ce: OWLClassExpression, direct: bool = False, timeout: int = 1000):
         return run_with_timeout(self._instances, timeout, (ce, direct))
 
+    def _instances_batch(self, ces: List[OWLClassExpression], direct: bool, count: bool) -> list:
+        """Get the instances of a batch of class expressions within a single worker task.
+
+        Duplicate class expressions are only sent to the reasoner once and every individual is converted from OWLAPI
+        only once per batch.
+        """
+        individuals: Dict[str, OWLNamedIndividual] = dict()
+        results: Dict[OWLClassExpression, Union[int, FrozenSet[OWLNamedIndividual]]] = dict()
+        for ce in ces:
+            if ce in results:
+                continue
+            check_timeout()
+            flattened_instances = self._owlapi_reasoner.getInstances(self.mapper.map_(ce), direct).getFlattened()
+            if count:
+                results[ce] = int(flattened_instances.size())
+                continue
+            iris = _java_entity_iris(flattened_instances)
+            if iris is None:
+                iris = [str(ind.toStringID()) for ind in flattened_instances]
+            inds = set()
+            for iri in iris:
+                owl_ind = individuals.get(iri)
+                if owl_ind is None:
+                    owl_ind = individuals[iri] = OWLNamedIndividual(IRI.create(iri))
+                inds.add(owl_ind)
+            results[ce] = frozenset(inds)
+        return [results[ce] for ce in ces]
+
+    def instances_batch(self, ces: Iterable[OWLClassExpression], direct: bool = False, timeout: int = 1000) \
+            -> List[FrozenSet[OWLNamedIndividual]]:
+        ces = list(ces)
+        ret = run_with_timeout(self._instances_batch, timeout, (ces, direct, False))
+        if isinstance(ret, TimeoutResult):
+            return [TimeoutResult() for _ in ces]
+        return ret
+
+    def count_instances_batch(self, ces: Iterable[OWLClassExpression], direct: bool = False,
+                              timeout: int = 1000) -> List[Optional[int]]:
+        ces = list(ces)
+        ret = run_with_timeout(self._instances_batch, timeout, (ces, direct, True))
+        if isinstance(ret, TimeoutResult):
+            return [None for _ in ces]
+        return ret
+
     def equivalent_classes(self, ce: OWLClassExpression):
         """
         Gets the set of named classes that are equivalent to the specified class expression with
@@ -1269,6 +2622,9 @@ class SyncReasoner(AbstractOWLReasoner):
         Returns:
             Equivalent classes of the given class expression.
         """
+        if (snapshot_classes := self._from_snapshot('equivalent_classes', ce)) is not None:
+            yield from snapshot_classes
+            return
         classes = self._owlapi_reasoner.getEquivalentClasses(self.mapper.map_(ce)).getEntities()
         yield from [self.mapper.map_(cls) for cls in classes]
 
@@ -1304,6 +2660,9 @@ class SyncReasoner(AbstractOWLReasoner):
         Returns:
             The subclasses of the given class expression depending on `direct` field.
         """
+        if (snapshot_classes := self._from_snapshot('sub_classes', ce, direct)) is not None:
+            yield from [cls for cls in snapshot_classes if include_bottom_entity or not cls.is_owl_nothing()]
+            return
         classes = list(self._owlapi_reasoner.getSubClasses(self.mapper.map_(ce), direct).getFlattened())
         if include_bottom_entity:
             yield from [self.mapper.map_(cls) for cls in classes]
@@ -1323,6 +2682,9 @@ class SyncReasoner(AbstractOWLReasoner):
         Returns:
             The subclasses of the given class expression depending on `direct` field.
         """
+        if (snapshot_classes := self._from_snapshot('super_classes', ce, direct)) is not None:
+            yield from snapshot_classes
+            return
         classes = self._owlapi_reasoner.getSuperClasses(self.mapper.map_(ce), direct).getFlattened()
         yield from [self.mapper.map_(cls) for cls in classes]
 
@@ -1406,6 +2768,9 @@ class SyncReasoner(AbstractOWLReasoner):
             expression, P, the set of reasoner axioms entails StrictSubObjectPropertyOf(P, pe).
             If pe is equivalent to owl:bottomObjectProperty then nothing will be returned.
         """
+        if (snapshot_properties := self._from_snapshot('sub_object_properties', p, direct)) is not None:
+            yield from [pe for pe in snapshot_properties if include_bottom_entity or pe != OWLBottomObjectProperty]
+            return
         if include_bottom_entity:
             yield from [self.mapper.map_(pe) for pe in
                         self._owlapi_reasoner.getSubObjectProperties(self.mapper.map_(p), direct).getFlattened()]
@@ -1427,6 +2792,9 @@ class SyncReasoner(AbstractOWLReasoner):
          Returns:
              Iterable of super properties.
          """
+        if (snapshot_properties := self._from_snapshot('super_object_properties', p, direct)) is not None:
+            yield from snapshot_properties
+            return
         yield from [self.mapper.map_(pe) for pe in
                     self._owlapi_reasoner.getSuperObjectProperties(self.mapper.map_(p), direct).getFlattened()]
 
@@ -1448,6 +2816,9 @@ class SyncReasoner(AbstractOWLReasoner):
         """
         if self.reasoner_name == "ELK":
             raise NotImplementedError("`getSubDataProperties` is not yet implemented by ELK!")
+        if (snapshot_properties := self._from_snapshot('sub_data_properties', p, direct)) is not None:
+            yield from [pe for pe in snapshot_properties if include_bottom_entity or pe != OWLBottomDataProperty]
+            return
         if include_bottom_entity:
             yield from [self.mapper.map_(pe) for pe in
                         self._owlapi_reasoner.getSubDataProperties(self.mapper.map_(p), direct).getFlattened()]
@@ -1470,6 +2841,9 @@ class SyncReasoner(AbstractOWLReasoner):
          """
         if self.reasoner_name == "ELK":
             raise NotImplementedError("`getSuperDataProperties` is not yet implemented by ELK!")
+        if (snapshot_properties := self._from_snapshot('super_data_properties', p, direct)) is not None:
+            yield from snapshot_properties
+            return
         yield from [self.mapper.map_(pe) for pe in
                     self._owlapi_reasoner.getSuperDataProperties(self.mapper.map_(p), direct).getFlattened()]
 
@@ -1546,9 +2920,12 @@ class SyncReasoner(AbstractOWLReasoner):
         """
         if self.reasoner_name == "ELK":
             raise NotImplementedError("`getObjectPropertyValues` is not yet implemented by ELK!")
-        yield from [self.mapper.map_(ind) for ind in
-                    self._owlapi_reasoner.getObjectPropertyValues(self.mapper.map_(i),
-                                                                  self.mapper.map_(p)).getFlattened()]
+        values = self._owlapi_reasoner.getObjectPropertyValues(self.mapper.map_(i), self.mapper.map_(p)).getFlattened()
+        iris = _java_entity_iris(values)
+        if iris is not None:
+            yield from map(OWLNamedIndividual, iris)
+        else:
+            yield from [self.mapper.map_(ind) for ind in values]
 
     def data_property_values(self, e: OWLEntity, p: OWLDataProperty):
         """Gets the data property values for the specified entity and data property expression.
@@ -1624,8 +3001,15 @@ class SyncReasoner(AbstractOWLReasoner):
             DirectClassAssertion(C, ind). If direct is False, each named class C where the set of reasoner axioms
             entails ClassAssertion(C, ind).
         """
-        yield from [self.mapper.map_(ind) for ind in
-                    self._owlapi_reasoner.getTypes(self.mapper.map_(individual), direct).getFlattened()]
+        if (snapshot_types := self._from_snapshot('types', individual, direct)) is not None:
+            yield from snapshot_types
+            return
+        types = self._owlapi_reasoner.getTypes(self.mapper.map_(individual), direct).getFlattened()
+        iris = _java_entity_iris(types)
+        if iris is not None:
+            yield from map(OWLClass, iris)
+        else:
+            yield from [self.mapper.map_(ind) for ind in types]
 
     def has_consistent_ontology(self) -> bool:
         """
@@ -1636,7 +3020,182 @@ class SyncReasoner(AbstractOWLReasoner):
         """
         return self._owlapi_reasoner.isConsistent()
 
-    def infer_axioms(self, inference_types: list[str]) -> Iterable[OWLAxiom]:
+    def has_pending_changes(self) -> bool:
+        """Whether the ontology was changed since the reasoner last took the changes into account.
+
+        Returns:
+            True if :meth:`flush` has changes to apply, False otherwise.
+        """
+        return not self._owlapi_reasoner.getPendingChanges().isEmpty()
+
+    def pending_changes(self) -> Tuple[Set[OWLAxiom], Set[OWLAxiom]]:
+        """Get the changes of the ontology that the reasoner did not take into account yet.
+
+        Returns:
+            The pending axiom additions and removals.
+        """
+        return (set(self.mapper.map_(self._owlapi_reasoner.getPendingAxiomAdditions())),
+                set(self.mapper.map_(self._owlapi_reasoner.getPendingAxiomRemovals())))
+
+    def flush(self, precompute: bool = False):
+        """Let the reasoner take the pending changes of the ontology into account.
+
+        The classification snapshot is dropped if there are pending changes, :meth:`precompute` creates a new one.
+
+        Args:
+            precompute: Update the class hierarchy and class assertions right away instead of on the next query that
+                needs them.
+        """
+        if self._snapshot is not None and self.has_pending_changes():
+            self._snapshot.close()
+            self._snapshot = None
+        for owlapi_reasoner in [self._owlapi_reasoner] + self._infer_reasoners:
+            owlapi_reasoner.flush()
+        if precompute:
+            # noinspection PyUnresolvedReferences
+            from org.semanticweb.owlapi.reasoner import InferenceType
+            self._owlapi_reasoner.precomputeInferences(InferenceType.CLASS_HIERARCHY, InferenceType.CLASS_ASSERTIONS)
+
+    def close(self):
+        """Dispose the OWLAPI reasoner and the additional reasoners created by :meth:`infer_axioms` for several
+        workers, and close the classification snapshot. The reasoner must not be used afterwards."""
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+        if self._owlapi_reasoner is not None:
+            for owlapi_reasoner in [self._owlapi_reasoner] + self._infer_reasoners:
+                owlapi_reasoner.dispose()
+            self._owlapi_reasoner = None
+            self._infer_reasoners.clear()
+
+    def precompute(self):
+        """Classify the ontology and take a snapshot of the class and property hierarchies and of the types of all
+        individuals.
+
+        Afterwards the hierarchy and types queries of named entities are answered from the snapshot. If the reasoner
+        has a snapshot directory, the snapshot is saved there so that reasoners created later for the same ontology
+        content and reasoner load it instead of classifying the ontology again. Pending changes of the ontology are
+        flushed first. Nothing is done if a snapshot is already in use.
+        """
+        if self.has_pending_changes():
+            self.flush()
+        if self._snapshot is not None:
+            return
+        # noinspection PyUnresolvedReferences
+        from org.semanticweb.owlapi.reasoner import InferenceType
+        inference_types = [InferenceType.CLASS_HIERARCHY, InferenceType.OBJECT_PROPERTY_HIERARCHY,
+                           InferenceType.CLASS_ASSERTIONS]
+        if self.reasoner_name != "ELK":
+            inference_types.append(InferenceType.DATA_PROPERTY_HIERARCHY)
+        self._owlapi_reasoner.precomputeInferences(*inference_types)
+        header, arrays = self._create_snapshot()
+        if self.snapshot_dir is None:
+            self._snapshot = _ClassificationSnapshot.from_arrays(header, arrays)
+            return
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        path = self._snapshot_path(header['ontology_key'])
+        _ClassificationSnapshot.write(path, header, arrays)
+        self._snapshot = _ClassificationSnapshot(path)
+
+    def _snapshot_path(self, ontology_key: str) -> str:
+        return os.path.join(self.snapshot_dir, f'{ontology_key}-{self.reasoner_name}.snapshot')
+
+    def _load_snapshot(self) -> bool:
+        path = self._snapshot_path(_sync_ontology_key(self.ontology))
+        try:
+            snapshot = _ClassificationSnapshot(path)
+        except (OSError, ValueError) as e:
+            logger.info(f"Not loading classification snapshot: {e}")
+            return False
+        self._snapshot = snapshot
+        return True
+
+    def _create_snapshot(self) -> Tuple[dict, Dict[str, np.ndarray]]:
+        """Collect the header and arrays of a :class:`_ClassificationSnapshot` from the classified ontology."""
+        # noinspection PyUnresolvedReferences
+        from org.semanticweb.owlapi.model.parameters import Imports
+        df = self._owlapi_manager.getOWLDataFactory()
+        ontology = self._owlapi_ontology
+        r = self._owlapi_reasoner
+        ids: Dict[str, Dict[str, int]] = {kind: dict() for kind in _ClassificationSnapshot.KINDS}
+
+        def id_of(kind: str, iri: str) -> int:
+            kind_ids = ids[kind]
+            i = kind_ids.get(iri)
+            if i is None:
+                i = kind_ids[iri] = len(kind_ids)
+            return i
+
+        def entity_ids(kind: str, java_entities) -> List[int]:
+            iris = _java_entity_iris(java_entities)
+            if iris is not None:
+                return [id_of(kind, iri) for iri in iris]
+            # inverse object properties cannot be parsed from the rendering
+            return [-1 - id_of(kind, str(e.getNamedProperty().toStringID())) if e.isAnonymous()
+                    else id_of(kind, str(e.toStringID())) for e in java_entities]
+
+        signatures = {
+            'classes': [df.getOWLThing(), df.getOWLNothing(), *ontology.getClassesInSignature(Imports.INCLUDED)],
+            'object_properties': [df.getOWLTopObjectProperty(), df.getOWLBottomObjectProperty(),
+                                  *ontology.getObjectPropertiesInSignature(Imports.INCLUDED)],
+            'data_properties': [df.getOWLTopDataProperty(), df.getOWLBottomDataProperty(),
+                                *ontology.getDataPropertiesInSignature(Imports.INCLUDED)],
+            'individuals': list(ontology.getIndividualsInSignature(Imports.INCLUDED)),
+        }
+        # the entities with rows come first in the tables
+        subjects = dict()
+        for kind, entities in signatures.items():
+            kind_subjects = subjects[kind] = []
+            for e in entities:
+                if id_of(kind, str(e.toStringID())) == len(kind_subjects):
+                    kind_subjects.append(e)
+        queries = {
+            'sub_classes_direct': lambda e: r.getSubClasses(e, True).getFlattened(),
+            'sub_classes': lambda e: r.getSubClasses(e, False).getFlattened(),
+            'super_classes_direct': lambda e: r.getSuperClasses(e, True).getFlattened(),
+            'super_classes': lambda e: r.getSuperClasses(e, False).getFlattened(),
+            'equivalent_classes': lambda e: r.getEquivalentClasses(e).getEntities(),
+            'sub_object_properties_direct': lambda e: r.getSubObjectProperties(e, True).getFlattened(),
+            'sub_object_properties': lambda e: r.getSubObjectProperties(e, False).getFlattened(),
+            'super_object_properties_direct': lambda e: r.getSuperObjectProperties(e, True).getFlattened(),
+            'super_object_properties': lambda e: r.getSuperObjectProperties(e, False).getFlattened(),
+            'types_direct': lambda e: r.getTypes(e, True).getFlattened(),
+            'types': lambda e: r.getTypes(e, False).getFlattened(),
+        }
+        if self.reasoner_name != "ELK":
+            queries.update({
+                'sub_data_properties_direct': lambda e: r.getSubDataProperties(e, True).getFlattened(),
+                'sub_data_properties': lambda e: r.getSubDataProperties(e, False).getFlattened(),
+                'super_data_properties_direct': lambda e: r.getSuperDataProperties(e, True).getFlattened(),
+                'super_data_properties': lambda e: r.getSuperDataProperties(e, False).getFlattened(),
+            })
+
+        arrays = dict()
+        for name, query in queries.items():
+            subject_kind, kind = _ClassificationSnapshot.RELATIONS[name]
+            rows = [entity_ids(kind, query(e)) for e in subjects[subject_kind]]
+            arrays[f'{name}_indptr'] = np.cumsum([0, *map(len, rows)], dtype=np.int64)
+            arrays[f'{name}_indices'] = np.fromiter(chain.from_iterable(rows), dtype=np.int64)
+        for kind, kind_ids in ids.items():
+            iris = [iri.encode() for iri in kind_ids]
+            arrays[f'{kind}_offsets'] = np.cumsum([0, *map(len, iris)], dtype=np.int64)
+            arrays[f'{kind}_iris'] = np.frombuffer(b''.join(iris), dtype=np.uint8)
+        header = {
+            'ontology_key': _sync_ontology_key(self.ontology),
+            'reasoner': self.reasoner_name,
+            'n_rows': {kind: len(entities) for kind, entities in subjects.items()},
+        }
+        return header, arrays
+
+    def _from_snapshot(self, relation: str, entity: OWLObject, direct: Optional[bool] = None) \
+            -> Optional[List[OWLEntity]]:
+        """Answer a query of a named entity from the classification snapshot, None if the reasoner has to be asked."""
+        if self._snapshot is None or not isinstance(entity, (OWLClass, OWLObjectProperty, OWLDataProperty,
+                                                              OWLNamedIndividual)):
+            return None
+        return self._snapshot.get(f'{relation}_direct' if direct else relation, entity)
+
+    def infer_axioms(self, inference_types: Union[str, list[str]], workers: int = 1) -> Iterable[OWLAxiom]:
         """
         Infer the specified inference type of axioms for the ontology managed by this instance's reasoner and
         return them.
@@ -1650,27 +3209,72 @@ class SyncReasoner(AbstractOWLReasoner):
              "InferredSubObjectPropertyAxiomGenerator","InferredDataPropertyCharacteristicAxiomGenerator",
              "InferredObjectPropertyCharacteristicAxiomGenerator"
              ]
+            workers: Number of axiom generators that run concurrently, each on its own reasoner instance over the
+                same ontology. The additional reasoners are created on first use and kept for later calls.
 
         Returns:
-            Iterable of inferred axioms.
+            Iterable of inferred axioms. Axioms inferred by several generators are returned only once.
         """
+        if isinstance(inference_types, str):
+            inference_types = [inference_types]
+        if workers > 1:
+            yield from self._infer_axioms_parallel(inference_types, workers)
+            return
         # noinspection PyUnresolvedReferences
         from java.util import ArrayList
         # noinspection PyUnresolvedReferences
         from org.semanticweb.owlapi.util import InferredOntologyGenerator
 
         generators = ArrayList()
-        for i in inference_types:
+        for i in dict.fromkeys(inference_types):
             if java_object := self.inference_types_mapping.get(i, None):
                 generators.add(java_object)
         iog = InferredOntologyGenerator(self._owlapi_reasoner, generators)
-        inferred_axioms = list(iog.getAxiomGenerators())
-        for ia in inferred_axioms:
-            for axiom in ia.createAxioms(self._owlapi_manager.getOWLDataFactory(), self._owlapi_reasoner):
-                yield self.mapper.map_(axiom)
+        data_factory = self._owlapi_manager.getOWLDataFactory()
+        yield from self._unique_inferred_axioms(ia.createAxioms(data_factory, self._owlapi_reasoner)
+                                                for ia in iog.getAxiomGenerators())
+
+    def _unique_inferred_axioms(self, generated: Iterable) -> Iterable[OWLAxiom]:
+        """Map the java axiom sets of several generators, skipping the axioms an earlier generator already returned."""
+        seen = set()
+        for axioms in generated:
+            simple_axioms = _java_simple_axioms(axioms)
+            for axiom in simple_axioms if simple_axioms is not None else map(self.mapper.map_, axioms):
+                if axiom not in seen:
+                    seen.add(axiom)
+                    yield axiom
+
+    def _infer_axioms_parallel(self, inference_types: list[str], workers: int) -> Iterable[OWLAxiom]:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # fresh generator instances, so that no generator object is shared between threads
+        generators_mapping = import_and_include_axioms_generators()
+        generators = [g for i in dict.fromkeys(inference_types) if (g := generators_mapping.get(i, None)) is not None]
+        if not generators:
+            return
+        workers = min(workers, len(generators))
+        while len(self._infer_reasoners) < workers - 1:
+            self._infer_reasoners.append(initialize_reasoner(self.reasoner_name, self._owlapi_ontology,
+                                                              self.incremental))
+        available = queue.SimpleQueue()
+        for r in [self._owlapi_reasoner] + self._infer_reasoners[:workers - 1]:
+            available.put(r)
+        data_factory = self._owlapi_manager.getOWLDataFactory()
+
+        def create_axioms(generator):
+            _attach_jvm_thread()
+            owlapi_reasoner = available.get()
+            try:
+                return generator.createAxioms(data_factory, owlapi_reasoner)
+            finally:
+                available.put(owlapi_reasoner)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="owlapy-infer") as executor:
+            # the JVM releases the GIL while reasoning, so the generators run in parallel
+            yield from self._unique_inferred_axioms(executor.map(create_axioms, generators))
 
     def infer_axioms_and_save(self, output_path: str = None, output_format: str = None,
-                              inference_types: list[str] = None):
+                              inference_types: list[str] = None, stream: bool = False):
         """
         Generates inferred axioms for the ontology managed by this instance's reasoner and saves them to a file.
         This function uses the OWL API to generate inferred class assertion axioms based on the ontology and reasoner
@@ -1682,7 +3286,10 @@ class SyncReasoner(AbstractOWLReasoner):
                 - "ttl" or "turtle" for Turtle format
                 - "rdf/xml" for RDF/XML format
                 - "owl/xml" for OWL/XML format
+                - "nt" or "ntriples" for N-Triples format (only with stream=True)
                 If not specified, the format of the original ontology is used.
+            stream: Write only the inferred axioms incrementally with bounded memory instead of adding them to the
+                ontology and saving it, see :meth:`stream_inferred_axioms`. Defaults to Turtle format.
             inference_types: Axiom inference types: Avaliable options (can set more than 1):
              ["InferredClassAssertionAxiomGenerator", "InferredSubClassAxiomGenerator",
              "InferredDisjointClassesAxiomGenerator", "InferredEquivalentClassAxiomGenerator",
@@ -1695,6 +3302,9 @@ class SyncReasoner(AbstractOWLReasoner):
         Returns:
             None (the file is saved to the specified directory)
         """
+        if stream:
+            self.stream_inferred_axioms(output_path, output_format or "ttl", inference_types)
+            return
         # noinspection PyUnresolvedReferences
         from java.io import File, FileOutputStream
         # noinspection PyUnresolvedReferences
@@ -1724,7 +3334,84 @@ class SyncReasoner(AbstractOWLReasoner):
                                           document_format,
                                           FileOutputStream(File(output_path).getAbsoluteFile()))
 
-    def generate_and_save_inferred_class_assertion_axioms(self, output="temp.ttl", output_format: str = None):
+    def stream_inferred_axioms(self, output_path: str, output_format: str = "nt", inference_types: list[str] = None,
+                               shard: bool = False, show_progress: bool = False) -> Dict[str, int]:
+        """Write inferred axioms to N-Triples or Turtle incrementally while they are generated.
+
+        Unlike :meth:`infer_axioms_and_save`, the inferred axioms are neither added to the ontology nor collected in
+        memory. Class assertions are computed and written one individual at a time, the other generators produce
+        axioms about the (comparatively small) TBox and RBox and are written as soon as each generator is done.
+
+        Args:
+            output_path: File to write to.
+            output_format: "nt"/"ntriples" or "ttl"/"turtle".
+            inference_types: Axiom inference types, see :meth:`infer_axioms`. Defaults to all of them.
+            shard: Write the axioms of every inference type to a separate file named after output_path with the
+                inference type appended to the file name, e.g. inferred_InferredSubClassAxiomGenerator.nt.
+            show_progress: Show a progress bar of the number of written axioms.
+
+        Returns:
+            Number of written axioms per inference type.
+        """
+        from tqdm import tqdm
+
+        if output_format.strip().lower() not in RDF_STREAM_FORMATS:
+            raise ValueError(f"Unsupported format '{output_format}' for streaming. "
+                             f"Supported formats: {', '.join(sorted(RDF_STREAM_FORMATS))}")
+        if inference_types is None:
+            inference_types = list(self.inference_types_mapping)
+        root, ext = os.path.splitext(output_path)
+        counts = dict()
+        file = writer = None
+        progress = tqdm(unit=" axioms", disable=not show_progress)
+        try:
+            for inference_type in inference_types:
+                generator = self.inference_types_mapping.get(inference_type, None)
+                if generator is None:
+                    logger.warning("Skipping unknown inference type %s", inference_type)
+                    continue
+                if writer is None or shard:
+                    if file is not None:
+                        file.close()
+                    file = open(f"{root}_{inference_type}{ext}" if shard else output_path, "w", encoding="utf-8",
+                                buffering=1 << 20)
+                    writer = RDFStreamWriter(file, output_format)
+                progress.set_description(inference_type)
+                count = 0
+                for n in self._write_inferred_axioms(inference_type, generator, writer):
+                    count += n
+                    progress.update(n)
+                counts[inference_type] = count
+        finally:
+            progress.close()
+            if file is not None:
+                file.close()
+        return counts
+
+    def _write_inferred_axioms(self, inference_type: str, generator, writer: RDFStreamWriter) -> Iterable[int]:
+        """Write the axioms of one inferred axiom generator, yielding the number of axioms written so far."""
+        if inference_type == "InferredClassAssertionAxiomGenerator":
+            # noinspection PyUnresolvedReferences
+            from org.semanticweb.owlapi.model.parameters import Imports
+            # same axioms as the generator, which collects the types of every individual of the imports closure
+            for ind in self._owlapi_ontology.getIndividualsInSignature(Imports.INCLUDED):
+                ind_iri = str(ind.toStringID())
+                types = self._owlapi_reasoner.getTypes(ind, False).getFlattened()
+                type_iris = _java_entity_iris(types)
+                if type_iris is None:
+                    type_iris = [str(t.toStringID()) for t in types]
+                for type_iri in type_iris:
+                    writer.iri_triple(ind_iri, RDF_TYPE, type_iri)
+                yield len(type_iris)
+        else:
+            axioms = generator.createAxioms(self._owlapi_manager.getOWLDataFactory(), self._owlapi_reasoner)
+            simple_axioms = _java_simple_axioms(axioms)
+            if simple_axioms is None:
+                simple_axioms = map(self.mapper.map_, axioms)
+            yield writer.write_all(simple_axioms)
+
+    def generate_and_save_inferred_class_assertion_axioms(self, output="temp.ttl", output_format: str = None,
+                                                          stream: bool = False):
         """
         Generates inferred class assertion axioms for the ontology managed by this instance's reasoner and saves them
         to a file. This function uses the OWL API to generate inferred class assertion axioms based on the ontology
@@ -1740,6 +3427,9 @@ class SyncReasoner(AbstractOWLReasoner):
             - "rdf/xml" for RDF/XML format
             - "owl/xml" for OWL/XML format
             If not specified, the format of the original ontology is used.
+        stream : bool, optional
+            Write only the inferred class assertions incrementally with bounded memory, in Turtle or N-Triples
+            ("nt") format. Default is False.
         Notes:
         ------
         - The function supports saving in multiple formats: Turtle, RDF/XML, and OWL/XML.
@@ -1751,7 +3441,7 @@ class SyncReasoner(AbstractOWLReasoner):
         >>> instance.generate_and_save_inferred_class_assertion_axioms(output="inferred_axioms.ttl", format="ttl")
         This will save the inferred class assertion axioms to the file "inferred_axioms.ttl" in Turtle format.
         """
-        self.infer_axioms_and_save(output, output_format, ["InferredClassAssertionAxiomGenerator"])
+        self.infer_axioms_and_save(output, output_format, ["InferredClassAssertionAxiomGenerator"], stream)
 
     def is_entailed(self, axiom: OWLAxiom) -> bool:
         """A convenience method that determines if the specified axiom is entailed by the set of reasoner axioms.
@@ -2250,8 +3940,151 @@ print(json.dumps(result))
         return self.ontology
 
 
-def initialize_reasoner(reasoner: str, owlapi_ontology):
+def _attach_jvm_thread():
+    """Attach the calling thread to the JVM as a daemon thread if it is not attached yet.
+
+    Daemon threads do not keep the JVM alive on shutdown, which matters for the worker threads of web servers.
+    """
+    # noinspection PyUnresolvedReferences
+    from java.lang import Thread
+    if not Thread.isAttached():
+        Thread.attachAsDaemon()
+
+
+class SyncReasonerPool:
+    """Fixed size pool of SyncReasoner instances for serving concurrent requests.
+
+    OWLAPI reasoners like HermiT and Pellet are not thread-safe, so every reasoner of the pool is used by at most one
+    thread at a time. A thread checks out a reasoner, queries it and checks it in again. The JVM releases the GIL
+    while reasoning, hence requests on different reasoners run in parallel.
+
+    Example:
+        >>> pool = SyncReasonerPool("KGs/Family/father.owl", reasoner="HermiT", size=4)
+        >>> with pool.checked_out() as reasoner:
+        ...     reasoner.instances(OWLClass("http://example.com/father#male"))
+    """
+    __slots__ = 'ontology', 'reasoner_name', '_reasoners', '_available'
+
+    def __init__(self, ontology: Union[SyncOntology, str], reasoner: str = "HermiT", size: Optional[int] = None,
+                 clone: bool = False):
+        """Create the reasoners of the pool.
+
+        Args:
+            ontology: Ontology that will be used by the reasoners.
+            reasoner: Name of the reasoner, see SyncReasoner.
+            size: Number of reasoners, defaults to the number of CPUs.
+            clone: Whether every reasoner gets its own copy of the ontology loaded from the same file. Otherwise all
+                reasoners share the given ontology, which must then not be modified while the pool is in use.
+        """
+        if size is None:
+            size = os.cpu_count() or 1
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        if isinstance(ontology, str):
+            ontology = SyncOntology(ontology)
+        if clone and not ontology.load:
+            raise ValueError("Only ontologies loaded from a file can be cloned")
+        self.ontology = ontology
+        self.reasoner_name = reasoner
+        self._reasoners: List[SyncReasoner] = []
+        for i in range(size):
+            onto = SyncOntology(ontology.path) if clone and i > 0 else ontology
+            self._reasoners.append(SyncReasoner(onto, reasoner=reasoner))
+        self._available: queue.SimpleQueue = queue.SimpleQueue()
+        for r in self._reasoners:
+            self._available.put(r)
+
+    def __len__(self) -> int:
+        return len(self._reasoners)
+
+    def checkout(self, timeout: Optional[float] = None) -> SyncReasoner:
+        """Take a reasoner out of the pool, waiting until one is available.
+
+        The calling thread is attached to the JVM. The reasoner must be given back with :meth:`checkin`.
+
+        Args:
+            timeout: Maximum number of seconds to wait for a reasoner, None to wait forever.
+
+        Returns:
+            A reasoner that is not used by any other thread.
+
+        Raises:
+            TimeoutError: If no reasoner became available within the timeout.
+        """
+        try:
+            reasoner = self._available.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No reasoner available after {timeout} seconds") from None
+        _attach_jvm_thread()
+        return reasoner
+
+    def checkin(self, reasoner: SyncReasoner):
+        """Give a reasoner obtained from :meth:`checkout` back to the pool."""
+        assert any(r is reasoner for r in self._reasoners), "Reasoner does not belong to this pool"
+        self._available.put(reasoner)
+
+    @contextmanager
+    def checked_out(self, timeout: Optional[float] = None):
+        """Context manager that checks out a reasoner and checks it in again on exit.
+
+        Args:
+            timeout: Maximum number of seconds to wait for a reasoner, None to wait forever.
+        """
+        reasoner = self.checkout(timeout)
+        try:
+            yield reasoner
+        finally:
+            self.checkin(reasoner)
+
+    def available(self) -> int:
+        """Number of reasoners that are currently not checked out."""
+        return self._available.qsize()
+
+    def close(self):
+        """Dispose all reasoners of the pool. The pool must not be used afterwards."""
+        for r in self._reasoners:
+            r.close()
+        self._reasoners.clear()
+
+
+# OpenlletOptions => value for incremental consistency checking
+_OPENLLET_INCREMENTAL_OPTIONS: Final = {"USE_COMPLETION_QUEUE": True, "USE_INCREMENTAL_CONSISTENCY": True,
+                                        "USE_SMART_RESTORE": False}
+# values of the options before incremental consistency checking was switched on, None while it is off
+_openllet_previous_options: Optional[Dict[str, bool]] = None
+
+
+def set_openllet_incremental_consistency(enabled: bool):
+    """Switch incremental consistency checking of Pellet/Openllet on or off, so that they update the completion graph
+    on ABox changes instead of checking consistency from scratch.
+
+    The options are static fields of OpenlletOptions and read while reasoning, so this is a process wide switch: it
+    applies to every Pellet and Openllet reasoner in the JVM, including the ones created before and the ones created
+    without ``incremental=True``. Switching it off restores the values the options had before it was switched on.
+
+    Args:
+        enabled: Whether to switch incremental consistency checking on.
+    """
+    global _openllet_previous_options
+    # noinspection PyUnresolvedReferences
+    from openllet.core import OpenlletOptions
+    if enabled and _openllet_previous_options is None:
+        _openllet_previous_options = {name: bool(getattr(OpenlletOptions, name))
+                                      for name in _OPENLLET_INCREMENTAL_OPTIONS}
+        for name, value in _OPENLLET_INCREMENTAL_OPTIONS.items():
+            setattr(OpenlletOptions, name, value)
+    elif not enabled and _openllet_previous_options is not None:
+        for name, value in _openllet_previous_options.items():
+            setattr(OpenlletOptions, name, value)
+        _openllet_previous_options = None
+
+
+def initialize_reasoner(reasoner: str, owlapi_ontology, incremental: bool = False):
     # () Create a reasoner using the ontology
+    if incremental and reasoner in ("Pellet", "Openllet") and _openllet_previous_options is None:
+        logger.warning("incremental=True switches on incremental consistency checking for all Pellet and Openllet "
+                       "reasoners of the JVM, call set_openllet_incremental_consistency(False) to switch it off.")
+        set_openllet_incremental_consistency(True)
     if reasoner == "HermiT":
         # noinspection PyUnresolvedReferences
         from org.semanticweb.HermiT import ReasonerFactory
@@ -2307,6 +4140,18 @@ def import_and_include_axioms_generators():
             "InferredObjectPropertyCharacteristicAxiomGenerator": InferredObjectPropertyCharacteristicAxiomGenerator()}
 
 
+class _EBRBatch:
+    """Predictions shared by the class expressions of one :meth:`EBR.instances_batch` call."""
+    __slots__ = 'instances', 'subjects', 'individuals'
+
+    def __init__(self):
+        # Class expression => individuals
+        self.instances: Dict[OWLClassExpression, FrozenSet[OWLNamedIndividual]] = dict()
+        # (Object property expression, object) => subjects of one predict_topk row
+        self.subjects: Dict[Tuple[OWLObjectPropertyExpression, OWLNamedIndividual], List[OWLNamedIndividual]] = dict()
+        self.individuals: Optional[FrozenSet[OWLNamedIndividual]] = None
+
+
 class EBR(AbstractOWLReasoner): # pragma: no cover
     """The Embedding-Based Reasoner uses neural embeddings to retrieve concept instances from knowledge bases. """
 
@@ -2326,6 +4171,7 @@ class EBR(AbstractOWLReasoner): # pragma: no cover
         self.gamma = ontology.gamma
         self.ontology = ontology
         self.model = ontology.model
+        self.__warned = False
 
     def __str__(self):
         return f"Embedding-Based Reasoner using: {self.model.model} with gamma: {self.gamma}"
@@ -2476,6 +4322,131 @@ class EBR(AbstractOWLReasoner): # pragma: no cover
 
     def instances(self, expression: OWLClassExpression, direct: bool = False, timeout: int = 1000) -> Generator[
         OWLNamedIndividual, None, None]:
+        if direct:
+            self._warn_direct()
+        yield from self._instances(expression)
+
+    def instances_batch(self, ces: Iterable[OWLClassExpression], direct: bool = False, timeout: int = 1000) \
+            -> List[FrozenSet[OWLNamedIndividual]]:
+        """Gets the instances of several class expressions.
+
+        The predictions of the whole batch are fused into a few predict_topk calls: one for the named classes and
+        their sub classes, and one per nesting depth of the object property restrictions and query shape (head or
+        tail prediction). Shared sub-expressions are only evaluated once. As in :meth:`instances`, direct is not
+        implemented: a warning is logged and all instances are returned.
+        """
+        ces = list(ces)
+        ret = run_with_timeout(self._instances_batch, timeout, (ces, direct))
+        if isinstance(ret, TimeoutResult):
+            return [TimeoutResult() for _ in ces]
+        return ret
+
+    def _warn_direct(self):
+        if not self.__warned:
+            logger.warning("direct not implemented")
+            self.__warned = True
+
+    def _batch_plan(self, ce: OWLClassExpression, classes: Set[OWLClass],
+                    lookups: Dict[Tuple[OWLObjectPropertyExpression, OWLClassExpression], Set[tuple]]) -> Set[tuple]:
+        """Collect the named classes and the (property, filler) lookups of the object property restrictions in ce.
+
+        Args:
+            ce: The class expression.
+            classes: Named classes in ce are added here.
+            lookups: Lookups in ce are added here, each one with the lookups nested in its filler.
+
+        Returns:
+            The lookups in ce.
+        """
+        if isinstance(ce, OWLClass):
+            classes.add(ce)
+            return set()
+        if isinstance(ce, OWLObjectOneOf):
+            return set()
+        if isinstance(ce, OWLObjectComplementOf):
+            return self._batch_plan(ce.get_operand(), classes, lookups)
+        if isinstance(ce, (OWLObjectIntersectionOf, OWLObjectUnionOf)):
+            return set().union(*(self._batch_plan(op, classes, lookups) for op in ce.operands()))
+        if isinstance(ce, OWLObjectAllValuesFrom):
+            filler = OWLObjectComplementOf(ce.get_filler())
+        elif isinstance(ce, (OWLObjectSomeValuesFrom, OWLObjectMinCardinality, OWLObjectMaxCardinality)):
+            filler = ce.get_filler()
+        else:
+            raise NotImplementedError(f"Instances for {type(ce)} are not implemented yet")
+        key = (ce.get_property(), filler)
+        if key not in lookups:
+            lookups[key] = self._batch_plan(filler, classes, lookups)
+        return lookups[key] | {key}
+
+    def _instances_batch(self, ces: List[OWLClassExpression], direct: bool) -> List[FrozenSet[OWLNamedIndividual]]:
+        batch = _EBRBatch()
+        classes: Set[OWLClass] = set()
+        lookups: Dict[Tuple[OWLObjectPropertyExpression, OWLClassExpression], Set[tuple]] = dict()
+        for ce in ces:
+            self._batch_plan(ce, classes, lookups)
+        if direct:
+            self._warn_direct()
+
+        # one head prediction (?, type, C) for every named class and sub class
+        check_timeout()
+        sub_classes = {c: self.sub_classes(c) for c in classes}
+        queries = list(classes.union(*sub_classes.values()))
+        rows = dict(zip(queries, self.ontology.predict_batch(h=None, r=[self.STR_IRI_TYPE] * len(queries),
+                                                             t=[c.str for c in queries])))
+        for c in classes:
+            batch.instances[c] = frozenset(OWLNamedIndividual(top_entity) for sc in [c] + sub_classes[c]
+                                           for top_entity, _ in rows[sc])
+
+        # the subjects of all lookups whose fillers can be evaluated, innermost first
+        done = set()
+        while len(done) < len(lookups):
+            check_timeout()
+            ready = [key for key, nested in lookups.items() if key not in done and nested <= done]
+            pairs = {(pe, obj) for pe, filler in ready for obj in self._retrieve(filler, batch)}
+            self._predict_subjects([pair for pair in pairs if pair not in batch.subjects], batch)
+            done.update(ready)
+
+        return [self._retrieve(ce, batch) for ce in ces]
+
+    def _predict_subjects(self, pairs: List[Tuple[OWLObjectPropertyExpression, OWLNamedIndividual]],
+                          batch: _EBRBatch):
+        """Predict the subjects of (property, object) pairs with one predict_topk call per query shape."""
+        heads = [(pe, obj) for pe, obj in pairs if not isinstance(pe, OWLObjectInverseOf)]
+        tails = [(pe, obj) for pe, obj in pairs if isinstance(pe, OWLObjectInverseOf)]
+        if heads:
+            for pair, row in zip(heads, self.ontology.predict_batch(h=None, r=[pe.str for pe, _ in heads],
+                                                                    t=[obj.str for _, obj in heads])):
+                batch.subjects[pair] = self._to_individuals(row)
+        if tails:
+            for pair, row in zip(tails, self.ontology.predict_batch(h=[obj.str for _, obj in tails],
+                                                                    r=[pe.get_inverse().str for pe, _ in tails],
+                                                                    t=None)):
+                batch.subjects[pair] = self._to_individuals(row)
+
+    def _retrieve(self, expression: OWLClassExpression, batch: Optional[_EBRBatch]) -> Set[OWLNamedIndividual]:
+        """Instances of a sub-expression, memoized in the batch if there is one."""
+        if batch is None:
+            return set(self._instances(expression))
+        ret = batch.instances.get(expression)
+        if ret is None:
+            ret = batch.instances[expression] = frozenset(self._instances(expression, batch))
+        return ret
+
+    def _all_individuals(self, batch: Optional[_EBRBatch]) -> Set[OWLNamedIndividual]:
+        if batch is None:
+            return set(self.individuals_in_signature())
+        if batch.individuals is None:
+            batch.individuals = frozenset(self.individuals_in_signature())
+        return batch.individuals
+
+    def _subjects(self, object_property: OWLObjectPropertyExpression, objs: Iterable[OWLNamedIndividual],
+                  batch: Optional[_EBRBatch]) -> List[OWLNamedIndividual]:
+        if batch is None:
+            return self.get_individuals_with_object_property(objs=list(objs), object_property=object_property)
+        return [s for obj in objs for s in batch.subjects.get((object_property, obj), ())]
+
+    def _instances(self, expression: OWLClassExpression, batch: Optional[_EBRBatch] = None) \
+            -> Generator[OWLNamedIndividual, None, None]:
         if isinstance(expression, OWLClass):
             """ Given an OWLClass A, retrieve its instances Retrieval(A)={ x | phi(x, type, A) ≥ γ } """
             yield from self.predict_individuals_of_owl_class(expression)
@@ -2484,8 +4455,8 @@ class EBR(AbstractOWLReasoner): # pragma: no cover
             Given an OWLObjectComplementOf ¬A, hence (A is an OWLClass),
             retrieve its instances => Retrieval(¬A)= All Instance Set-DIFF { x | phi(x, type, A) ≥ γ } """
             excluded_individuals: Set[OWLNamedIndividual]
-            excluded_individuals = set(self.instances(expression.get_operand()))
-            all_individuals = {i for i in self.individuals_in_signature()}
+            excluded_individuals = self._retrieve(expression.get_operand(), batch)
+            all_individuals = self._all_individuals(batch)
             yield from all_individuals - excluded_individuals
         elif isinstance(expression, OWLObjectIntersectionOf):
             """ Handling intersection of class expressions:
@@ -2497,7 +4468,7 @@ class EBR(AbstractOWLReasoner): # pragma: no cover
             #
             result = None
             for op in expression.operands():
-                retrieval_of_op = {_ for _ in self.instances(expression=op)}
+                retrieval_of_op = self._retrieve(op, batch)
                 if result is None:
                     result = retrieval_of_op
                 else:
@@ -2511,8 +4482,8 @@ class EBR(AbstractOWLReasoner): # pragma: no cover
             """
             object_property = expression.get_property()
             filler_expression = expression.get_filler()
-            yield from self.instances(OWLObjectComplementOf(
-                OWLObjectSomeValuesFrom(object_property, OWLObjectComplementOf(filler_expression))))
+            yield from self._retrieve(OWLObjectComplementOf(
+                OWLObjectSomeValuesFrom(object_property, OWLObjectComplementOf(filler_expression))), batch)
 
         elif isinstance(expression, OWLObjectMinCardinality) or isinstance(expression, OWLObjectSomeValuesFrom):
             """
@@ -2526,11 +4497,9 @@ class EBR(AbstractOWLReasoner): # pragma: no cover
             if isinstance(expression, OWLObjectMinCardinality):
                 cardinality = expression.get_cardinality()
 
-            object_individuals = self.instances(filler_expression)
+            object_individuals = self._retrieve(filler_expression, batch)
             result = Counter()
-            subjects = self.get_individuals_with_object_property(
-                objs=object_individuals,
-                object_property=object_property)
+            subjects = self._subjects(object_property, object_individuals, batch)
             # Update the counter for all subjects found
             result.update(subjects)
             # Yield only those individuals who meet the cardinality requirement
@@ -2543,16 +4512,13 @@ class EBR(AbstractOWLReasoner): # pragma: no cover
             cardinality = expression.get_cardinality()
 
             # Get all individuals that are instances of the filler expression.
-            object_individuals = list(self.instances(filler_expression))
+            object_individuals = self._retrieve(filler_expression, batch)
 
             # Initialize counts for every subject in the signature.
-            counts = {ind.str: (ind, 0) for ind in self.individuals_in_signature()}
+            counts = {ind.str: (ind, 0) for ind in self._all_individuals(batch)}
 
             # Retrieve all subjects related to any of the object individuals at once.
-            subject_individuals = self.get_individuals_with_object_property(
-                objs=object_individuals,
-                object_property=object_property
-            )
+            subject_individuals = self._subjects(object_property, object_individuals, batch)
 
             # Increment counts for each related subject.
             for subj in subject_individuals:
@@ -2570,7 +4536,7 @@ class EBR(AbstractOWLReasoner): # pragma: no cover
         elif isinstance(expression, OWLObjectUnionOf):
             result = None
             for op in expression.operands():
-                retrieval_of_op = {_ for _ in self.instances(expression=op)}
+                retrieval_of_op = self._retrieve(op, batch)
                 if result is None:
                     result = retrieval_of_op
                 else:
@@ -2600,19 +4566,22 @@ class EBR(AbstractOWLReasoner): # pragma: no cover
 
         if is_inverse:
             object_property = object_property.get_inverse()
-        return_subjects = list()
-        for entity, score in self.predict(
-                h=[obj.str for obj in objs] if is_inverse else None,
-                r=object_property.str,
-                t=None if is_inverse else [obj.str for obj in objs]):
+        return self._to_individuals(self.predict(
+            h=[obj.str for obj in objs] if is_inverse else None,
+            r=object_property.str,
+            t=None if is_inverse else [obj.str for obj in objs]))
+
+    @staticmethod
+    def _to_individuals(predictions: List[Tuple[str, float]]) -> List[OWLNamedIndividual]:
+        individuals = list()
+        for entity, score in predictions:
             try:
-                return_subjects.append(OWLNamedIndividual(entity))
+                individuals.append(OWLNamedIndividual(entity))
             except Exception as e:  # pragma: no cover
                 # Log the invalid IRI
                 print(f"Invalid IRI detected: {entity}, error: {e}")
                 continue
-
-        return return_subjects
+        return individuals
 
     def data_property_domains(self, pe: OWLDataProperty, direct: bool = False) -> Iterable[OWLClassExpression]:
         """Gets the class expressions that are the direct or indirect domains of this property with respect to the imports closure of the root ontology.
@@ -1,5 +1,5 @@
-from functools import singledispatchmethod
-from typing import Iterable, TypeVar
+from functools import singledispatchmethod, wraps
+from typing import Iterable, TypeVar, Optional as _Optional
 import jpype.imports
 
 from owlapy.class_expression import OWLDataOneOf, OWLFacetRestriction, OWLDatatypeRestriction, \
@@ -20,22 +20,26 @@ from owlapy.owl_axiom import OWLDeclarationAxiom, OWLAnnotation, OWLAnnotationPr
     OWLIrreflexiveObjectPropertyAxiom, OWLNegativeDataPropertyAssertionAxiom, OWLReflexiveObjectPropertyAxiom, \
     OWLNegativeObjectPropertyAssertionAxiom, OWLSameIndividualAxiom, OWLSymmetricObjectPropertyAxiom, \
     OWLTransitiveObjectPropertyAxiom, OWLAnnotationAssertionAxiom, OWLAnnotationPropertyDomainAxiom, \
-    OWLAnnotationPropertyRangeAxiom, OWLSubAnnotationPropertyOfAxiom
+    OWLAnnotationPropertyRangeAxiom, OWLSubAnnotationPropertyOfAxiom, OWLAxiom
 from owlapy.owl_data_ranges import OWLDataIntersectionOf, OWLDataComplementOf, OWLDataUnionOf, OWLNaryDataRange
 from owlapy.owl_datatype import OWLDatatype
 from owlapy.owl_individual import OWLNamedIndividual
+from owlapy.owl_object import OWLObject
 from owlapy.owl_literal import (OWLLiteral, PositiveIntegerOWLDatatype, NegativeIntegerOWLDatatype,
                                 NonPositiveIntegerOWLDatatype, NonNegativeIntegerOWLDatatype)
 from owlapy.owl_ontology import OWLOntologyID
 from owlapy.owl_property import OWLObjectProperty, OWLDataProperty, OWLObjectInverseOf
+from owlapy.rdf_writer import LexicalLiteral
 from owlapy.static_funcs import startJVM
+from owlapy.utils import LRUCache
 from owlapy.vocab import OWLFacet
 
 if not jpype.isJVMStarted():
     startJVM()
-from org.semanticweb.owlapi.model import IRI as owlapi_IRI, OWLOntologyID as owlapi_OWLOntologyID
+from org.semanticweb.owlapi.model import IRI as owlapi_IRI, OWLOntologyID as owlapi_OWLOntologyID, \
+    OWLAxiom as owlapi_OWLAxiom, OWLLiteral as owlapi_OWLLiteral
 from org.semanticweb.owlapi.vocab import OWLFacet as owlapi_OWLFacet
-from java.util import ArrayList, List, Set, LinkedHashSet, Optional, Collections
+from java.util import ArrayList, Arrays, List, Set, LinkedHashSet, Optional, Collections
 from java.util.stream import Stream
 from uk.ac.manchester.cs.owl.owlapi import (OWLClassImpl, OWLDataAllValuesFromImpl, OWL2DatatypeImpl,
                                             OWLDataExactCardinalityImpl,OWLDataHasValueImpl, OWLObjectInverseOfImpl,
@@ -89,12 +93,64 @@ def init(the_class):
         return globals().get(cls_name + "Impl")
 
 
+def _cached(method):
+    """Memoize a mapping method in the cache of the direction it maps to.
+
+    Only used for IRIs, entities and class expressions, which are immutable and reused a lot across queries. Their
+    mapping only depends on the data factory and not on the content of an ontology, so the caches stay valid when
+    axioms are added or removed.
+    """
+    @wraps(method)
+    def wrapper(self, e):
+        cache = self._to_owlapi if isinstance(e, OWLObject) else self._from_owlapi
+        if cache is None:
+            return method(self, e)
+        if e in cache:
+            ret = cache[e]
+            if ret is not None:  # could have been evicted by another thread in the meantime
+                return ret
+        ret = method(self, e)
+        cache[e] = ret
+        return ret
+    return wrapper
+
+
 _SO = TypeVar('_SO', bound='SyncOntology')  # noqa: F821
 
 
 class OWLAPIMapper:
     """A bridge between owlapy and owlapi owl-related classes."""
 
+    def __init__(self, cache_size: _Optional[int] = 16384):
+        """A bridge between owlapy and owlapi owl-related classes.
+
+        Args:
+            cache_size: Maximum number of IRIs, entities and class expressions memoized per mapping direction, None for
+                no limit and 0 to disable the caches.
+        """
+        if cache_size == 0:
+            self._to_owlapi = self._from_owlapi = None
+        else:
+            self._to_owlapi = LRUCache(maxsize=cache_size)
+            self._from_owlapi = LRUCache(maxsize=cache_size)
+
+    def cache_info(self):
+        """Report the statistics of the mapping caches.
+
+        Returns:
+            Dictionary with the CacheInfo of the owlapy to owlapi ('to_owlapi') and the owlapi to owlapy
+            ('from_owlapi') cache or None if caching is disabled.
+        """
+        if self._to_owlapi is None:
+            return None
+        return {'to_owlapi': self._to_owlapi.cache_info(), 'from_owlapi': self._from_owlapi.cache_info()}
+
+    def cache_clear(self):
+        """Clear the mapping caches and their statistics."""
+        if self._to_owlapi is not None:
+            self._to_owlapi.cache_clear()
+            self._from_owlapi.cache_clear()
+
     @singledispatchmethod
     def map_(self, e):
         """ (owlapy <--> owlapi) entity mapping.
@@ -108,10 +164,12 @@ class OWLAPIMapper:
         raise NotImplementedError(f"Not implemented type: {e}")
 
     @map_.register
+    @_cached
     def _(self, e: IRI):
         return owlapi_IRI.create(e.str)
 
     @map_.register
+    @_cached
     def _(self, e: owlapi_IRI):
         return IRI.create(str(e.getIRIString()))
 
@@ -121,6 +179,7 @@ class OWLAPIMapper:
     @map_.register(OWLDatatype)
     @map_.register(OWLAnnotationProperty)
     @map_.register(OWLClass)
+    @_cached
     def _(self, e):
         return init(e)(self.map_(e.iri))
 
@@ -130,18 +189,22 @@ class OWLAPIMapper:
     @map_.register(OWLDatatypeImpl)
     @map_.register(OWLAnnotationPropertyImpl)
     @map_.register(OWLClassImpl)
+    @_cached
     def _(self, e):
         return init(e)(self.map_(e.getIRI()))
 
     @map_.register(OWL2DatatypeImpl)
+    @_cached
     def _(self, e):
         return OWLDatatype(self.map_(e.getIRI()))
 
     @map_.register
+    @_cached
     def _(self, e: OWLObjectComplementOf):
         return init(e)(self.map_(e.get_operand()))
 
     @map_.register
+    @_cached
     def _(self, e: OWLObjectComplementOfImpl):
         return init(e)(self.map_(e.getOperand()))
 
@@ -151,6 +214,7 @@ class OWLAPIMapper:
     @map_.register(OWLDataMinCardinality)
     @map_.register(OWLDataMaxCardinality)
     @map_.register(OWLDataExactCardinality)
+    @_cached
     def _(self, e):
         return init(e)(self.map_(e.get_property()), e.get_cardinality(), self.map_(e.get_filler()))
 
@@ -160,14 +224,17 @@ class OWLAPIMapper:
     @map_.register(OWLDataMinCardinalityImpl)
     @map_.register(OWLDataMaxCardinalityImpl)
     @map_.register(OWLDataExactCardinalityImpl)
+    @_cached
     def _(self, e):
         return init(e)(e.getCardinality(), self.map_(e.getProperty()), self.map_(e.getFiller()))
 
     @map_.register(OWLObjectHasSelf)
+    @_cached
     def _(self, e):
         return init(e)(self.map_(e.get_property()))
 
     @map_.register(OWLObjectHasSelfImpl)
+    @_cached
     def _(self, e):
         return init(e)(self.map_(e.getProperty()))
 
@@ -177,6 +244,7 @@ class OWLAPIMapper:
     @map_.register(OWLDataSomeValuesFrom)
     @map_.register(OWLDataAllValuesFrom)
     @map_.register(OWLDataHasValue)
+    @_cached
     def _(self, e):
         return init(e)(self.map_(e.get_property()), self.map_(e.get_filler()))
 
@@ -186,6 +254,7 @@ class OWLAPIMapper:
     @map_.register(OWLDataSomeValuesFromImpl)
     @map_.register(OWLDataAllValuesFromImpl)
     @map_.register(OWLDataHasValueImpl)
+    @_cached
     def _(self, e):
         return init(e)(self.map_(e.getProperty()), self.map_(e.getFiller()))
 
@@ -245,10 +314,12 @@ class OWLAPIMapper:
             return OWLLiteral(literal_val)
 
     @map_.register
+    @_cached
     def _(self, e: OWLObjectInverseOf):
         return init(e)(self.map_(e.get_named_property()))
 
     @map_.register
+    @_cached
     def _(self, e: OWLObjectInverseOfImpl):
         return init(e)(self.map_(e.getNamedProperty()))
 
@@ -258,6 +329,7 @@ class OWLAPIMapper:
     @map_.register(OWLNaryDataRange)
     @map_.register(OWLObjectIntersectionOf)
     @map_.register(OWLObjectUnionOf)
+    @_cached
     def _(self, e):
         return init(e)(self.map_(e.operands()))
 
@@ -268,10 +340,12 @@ class OWLAPIMapper:
     @map_.register(OWLObjectIntersectionOfImpl)
     @map_.register(OWLObjectUnionOfImpl)
     @map_.register(OWLObjectOneOfImpl)
+    @_cached
     def _(self, e):
         return init(e)(self.map_(e.getOperandsAsList()))
 
     @map_.register(OWLObjectOneOf)
+    @_cached
     def _(self, e):
         return init(e)(self.map_(e.operands()).stream())
 
@@ -576,7 +650,59 @@ class OWLAPIMapper:
         for en in self.to_list(e):
             yield self.map_(en)
 
+    def map_axioms(self, axioms: Iterable[OWLAxiom]):
+        """Map owlapy axioms to a java.util.List of owlapi axioms in the same order.
+
+        Unlike map_ on a list, which adds the axioms to an ArrayList one call at a time, the owlapi axioms are
+        collected in Python and copied into a Java array in a single call. Class and property assertions with a named
+        class or property skip the dispatch on the axiom type.
+
+        Args:
+            axioms: owlapy axioms.
+
+        Returns:
+            Fixed-size java.util.List of the owlapi axioms.
+        """
+        no_annotations = Collections.emptyList()
+        java_axioms = []
+        for axiom in axioms:
+            axiom_type = type(axiom)
+            if axiom.is_annotated():
+                java_axioms.append(self.map_(axiom))
+            elif axiom_type is OWLClassAssertionAxiom:
+                java_axioms.append(OWLClassAssertionAxiomImpl(self.map_(axiom.get_individual()),
+                                                              self.map_(axiom.get_class_expression()),
+                                                              no_annotations))
+            elif axiom_type is OWLObjectPropertyAssertionAxiom:
+                java_axioms.append(OWLObjectPropertyAssertionAxiomImpl(self.map_(axiom.get_subject()),
+                                                                       self.map_(axiom.get_property()),
+                                                                       self.map_(axiom.get_object()),
+                                                                       no_annotations))
+            elif axiom_type is OWLDataPropertyAssertionAxiom:
+                java_axioms.append(OWLDataPropertyAssertionAxiomImpl(self.map_(axiom.get_subject()),
+                                                                     self.map_(axiom.get_property()),
+                                                                     self.map_(axiom.get_object()),
+                                                                     no_annotations))
+            else:
+                java_axioms.append(self.map_(axiom))
+        return Arrays.asList(jpype.JArray(owlapi_OWLAxiom)(java_axioms))
+
     @staticmethod
     def to_list(stream_obj):
         """Converts Java Stream object to Python list"""
         return stream_obj.collect(jpype.JClass("java.util.stream.Collectors").toList())
+
+
+class LexicalOWLAPIMapper(OWLAPIMapper):
+    """An OWLAPIMapper that maps the literals of owlapi to :class:`~owlapy.rdf_writer.LexicalLiteral`, keeping their
+    lexical form, datatype and language tag.
+
+    The literal mapping of OWLAPIMapper converts the value to a Python type, which changes the datatype of e.g.
+    xsd:decimal or xsd:dateTime literals. This mapper is used where the mapped axioms are written back as RDF.
+    """
+
+    def map_(self, e):
+        if isinstance(e, owlapi_OWLLiteral):
+            return LexicalLiteral(str(e.getLiteral()), self.map_(e.getDatatype()),
+                                  str(e.getLang()) if e.hasLang() else None)
+        return super().map_(e)
@@ -0,0 +1,574 @@
+"""Streaming serialisation of OWL axioms to RDF."""
+import re
+from functools import singledispatchmethod
+from typing import Final, Iterable, List, Mapping, Optional, Sequence, TextIO
+
+from owlapy import namespaces
+from owlapy.iri import IRI
+from owlapy.owl_axiom import OWLAxiom, OWLClassAssertionAxiom, OWLSubClassOfAxiom, OWLEquivalentClassesAxiom, \
+    OWLDisjointClassesAxiom, OWLSubObjectPropertyOfAxiom, OWLSubDataPropertyOfAxiom, \
+    OWLEquivalentObjectPropertiesAxiom, OWLEquivalentDataPropertiesAxiom, OWLDisjointObjectPropertiesAxiom, \
+    OWLDisjointDataPropertiesAxiom, OWLInverseObjectPropertiesAxiom, OWLFunctionalObjectPropertyAxiom, \
+    OWLInverseFunctionalObjectPropertyAxiom, OWLSymmetricObjectPropertyAxiom, OWLAsymmetricObjectPropertyAxiom, \
+    OWLReflexiveObjectPropertyAxiom, OWLIrreflexiveObjectPropertyAxiom, OWLTransitiveObjectPropertyAxiom, \
+    OWLFunctionalDataPropertyAxiom, OWLObjectPropertyAssertionAxiom, OWLDataPropertyAssertionAxiom, \
+    OWLDeclarationAxiom, OWLSameIndividualAxiom, OWLDifferentIndividualsAxiom, OWLAnnotationProperty, \
+    OWLAnnotation, OWLAnnotationAssertionAxiom, OWLSubAnnotationPropertyOfAxiom, OWLAnnotationPropertyDomainAxiom, \
+    OWLAnnotationPropertyRangeAxiom, OWLObjectPropertyDomainAxiom, OWLDataPropertyDomainAxiom, \
+    OWLObjectPropertyRangeAxiom, OWLDataPropertyRangeAxiom, OWLDisjointUnionAxiom, OWLSubPropertyChainAxiom, \
+    OWLHasKeyAxiom, OWLDatatypeDefinitionAxiom, OWLNegativeObjectPropertyAssertionAxiom, \
+    OWLNegativeDataPropertyAssertionAxiom
+from owlapy.class_expression import OWLClass, OWLObjectIntersectionOf, OWLObjectUnionOf, OWLObjectComplementOf, \
+    OWLObjectOneOf, OWLObjectSomeValuesFrom, OWLObjectAllValuesFrom, OWLObjectHasValue, OWLObjectHasSelf, \
+    OWLObjectMinCardinality, OWLObjectMaxCardinality, OWLObjectExactCardinality, OWLDataSomeValuesFrom, \
+    OWLDataAllValuesFrom, OWLDataHasValue, OWLDataMinCardinality, OWLDataMaxCardinality, OWLDataExactCardinality, \
+    OWLDataOneOf, OWLDatatypeRestriction, OWLCardinalityRestriction, OWLObjectCardinalityRestriction, OWLThing
+from owlapy.owl_data_ranges import OWLDataIntersectionOf, OWLDataUnionOf, OWLDataComplementOf
+from owlapy.owl_datatype import OWLDatatype
+from owlapy.owl_individual import OWLNamedIndividual
+from owlapy.owl_literal import OWLLiteral, TopOWLDatatype
+from owlapy.owl_object import OWLEntity, OWLObject
+from owlapy.owl_property import OWLObjectInverseOf, OWLObjectProperty, OWLDataProperty
+
+RDF_TYPE: Final = namespaces.RDF.ns + "type"  #:
+RDF_FIRST: Final = namespaces.RDF.ns + "first"  #:
+RDF_REST: Final = namespaces.RDF.ns + "rest"  #:
+RDF_NIL: Final = namespaces.RDF.ns + "nil"  #:
+RDFS_SUBCLASSOF: Final = namespaces.RDFS.ns + "subClassOf"  #:
+RDFS_SUBPROPERTYOF: Final = namespaces.RDFS.ns + "subPropertyOf"  #:
+RDFS_DOMAIN: Final = namespaces.RDFS.ns + "domain"  #:
+RDFS_RANGE: Final = namespaces.RDFS.ns + "range"  #:
+RDFS_DATATYPE: Final = namespaces.RDFS.ns + "Datatype"  #:
+OWL_ONTOLOGY: Final = namespaces.OWL.ns + "Ontology"  #:
+OWL_IMPORTS: Final = namespaces.OWL.ns + "imports"  #:
+OWL_VERSION_IRI: Final = namespaces.OWL.ns + "versionIRI"  #:
+OWL_CLASS: Final = namespaces.OWL.ns + "Class"  #:
+OWL_RESTRICTION: Final = namespaces.OWL.ns + "Restriction"  #:
+OWL_ON_PROPERTY: Final = namespaces.OWL.ns + "onProperty"  #:
+OWL_AXIOM: Final = namespaces.OWL.ns + "Axiom"  #:
+OWL_ANNOTATED_SOURCE: Final = namespaces.OWL.ns + "annotatedSource"  #:
+OWL_ANNOTATED_PROPERTY: Final = namespaces.OWL.ns + "annotatedProperty"  #:
+OWL_ANNOTATED_TARGET: Final = namespaces.OWL.ns + "annotatedTarget"  #:
+OWL_EQUIVALENT_CLASS: Final = namespaces.OWL.ns + "equivalentClass"  #:
+OWL_EQUIVALENT_PROPERTY: Final = namespaces.OWL.ns + "equivalentProperty"  #:
+OWL_DISJOINT_WITH: Final = namespaces.OWL.ns + "disjointWith"  #:
+OWL_PROPERTY_DISJOINT_WITH: Final = namespaces.OWL.ns + "propertyDisjointWith"  #:
+OWL_INVERSE_OF: Final = namespaces.OWL.ns + "inverseOf"  #:
+OWL_MEMBERS: Final = namespaces.OWL.ns + "members"  #:
+OWL_SAME_AS: Final = namespaces.OWL.ns + "sameAs"  #:
+OWL_DIFFERENT_FROM: Final = namespaces.OWL.ns + "differentFrom"  #:
+
+# RDF formats that can be written one triple at a time, keys are the user facing format strings
+RDF_STREAM_FORMATS: Final = {"nt": "nt", "ntriples": "nt", "nq": "nq", "nquads": "nq", "ttl": "ttl",
+                             "turtle": "ttl"}
+
+_ENTITY_TYPES: Final = ((OWLClass, OWL_CLASS), (OWLObjectProperty, namespaces.OWL.ns + "ObjectProperty"),
+                        (OWLDataProperty, namespaces.OWL.ns + "DatatypeProperty"),
+                        (OWLNamedIndividual, namespaces.OWL.ns + "NamedIndividual"), (OWLDatatype, RDFS_DATATYPE),
+                        (OWLAnnotationProperty, namespaces.OWL.ns + "AnnotationProperty"))
+# cardinality restriction => OWL predicate of the unqualified restriction
+_CARDINALITIES: Final = {OWLObjectMinCardinality: "minCardinality", OWLObjectMaxCardinality: "maxCardinality",
+                         OWLObjectExactCardinality: "cardinality", OWLDataMinCardinality: "minCardinality",
+                         OWLDataMaxCardinality: "maxCardinality", OWLDataExactCardinality: "cardinality"}
+_QUALIFIED_CARDINALITIES: Final = {"minCardinality": "minQualifiedCardinality",
+                                   "maxCardinality": "maxQualifiedCardinality",
+                                   "cardinality": "qualifiedCardinality"}
+_ESCAPES: Final = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r', '\t': '\\t'})
+_SPECIAL_FLOATS: Final = {"nan": "NaN", "inf": "INF", "-inf": "-INF"}
+_PN_LOCAL: Final = re.compile(r'[A-Za-z_][A-Za-z0-9_\-]*')
+
+
+class LexicalLiteral(OWLLiteral):
+    """A literal given by its lexical form, datatype and optional language tag, written as is.
+
+    Used for literals read from another OWL implementation, so that their lexical form and datatype are written
+    without being converted to a Python value first.
+    """
+    __slots__ = '_v', '_datatype', '_lang'
+
+    def __new__(cls, lexical: str, datatype: OWLDatatype, lang: Optional[str] = None):
+        return object.__new__(cls)
+
+    def __init__(self, lexical: str, datatype: OWLDatatype, lang: Optional[str] = None):
+        """
+        Args:
+            lexical: Lexical form of the literal.
+            datatype: Datatype of the literal, rdf:langString for literals with a language tag.
+            lang: Language tag or None.
+        """
+        self._v = lexical
+        self._datatype = datatype
+        self._lang = lang or None
+
+    def get_datatype(self) -> OWLDatatype:
+        return self._datatype
+
+    def get_lang(self) -> Optional[str]:
+        """Gets the language tag of this literal, None if it has none."""
+        return self._lang
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            return self._v == other._v and self._datatype == other._datatype and self._lang == other._lang
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(("LexicalLiteral", self._v, self._datatype, self._lang))
+
+    def __repr__(self):
+        return f'LexicalLiteral({self._v!r}, {self._datatype}, {self._lang!r})'
+
+
+class RDFStreamWriter:
+    """Write OWL axioms as RDF triples to a text stream, one axiom at a time and without keeping them in memory.
+
+    N-Triples and N-Quads are written with one statement per line. Turtle is written as one triple per statement with
+    prefixed names where possible, so the output can be produced without grouping the triples by subject first.
+
+    Axioms are mapped to RDF as specified by the OWL 2 mapping to RDF graphs, anonymous class expressions, data ranges
+    and inverse properties become blank nodes and axiom annotations are written as reified owl:Axiom nodes.
+    """
+    __slots__ = '_out', '_format', '_prefixes', '_graph', '_bnodes', '_annotations', 'triples'
+
+    def __init__(self, out: TextIO, rdf_format: str = "nt", prefixes: Optional[Mapping[str, str]] = None,
+                 graph: Optional[str] = None):
+        """
+        Args:
+            out: Text stream to write to.
+            rdf_format: One of "nt"/"ntriples", "nq"/"nquads" or "ttl"/"turtle".
+            prefixes: Additional prefix to namespace mapping used for Turtle, rdf, rdfs, owl and xsd are always
+                declared.
+            graph: IRI of the graph the N-Quads statements belong to, None for the default graph.
+        """
+        fmt = RDF_STREAM_FORMATS.get(rdf_format.strip().lower())
+        if fmt is None:
+            raise ValueError(f"Unsupported RDF format '{rdf_format}'. "
+                             f"Supported formats: {', '.join(sorted(RDF_STREAM_FORMATS))}")
+        self._out = out
+        self._format = fmt
+        self._bnodes = 0
+        self._annotations: Sequence[OWLAnnotation] = ()
+        self.triples = 0
+        self._prefixes = {}
+        self._graph = ""
+        if fmt == "ttl":
+            ns = {n.prefix: n.ns for n in (namespaces.RDF, namespaces.RDFS, namespaces.OWL, namespaces.XSD)}
+            ns.update(prefixes or {})
+            # longest namespace first so that nested namespaces get the most specific prefix
+            self._prefixes = dict(sorted(((v, k) for k, v in ns.items()), key=lambda t: -len(t[0])))
+            out.write("".join(f"@prefix {p}: <{n}> .\n" for p, n in ns.items()) + "\n")
+        elif fmt == "nq" and graph is not None:
+            self._graph = f" <{graph}>"
+
+    def iri(self, iri: str) -> str:
+        """Render an IRI as RDF term."""
+        if self._prefixes:
+            for ns, prefix in self._prefixes.items():
+                if iri.startswith(ns):
+                    local = iri[len(ns):]
+                    if _PN_LOCAL.fullmatch(local):
+                        return f"{prefix}:{local}"
+                    break
+        return f"<{iri}>"
+
+    def literal(self, literal: OWLLiteral) -> str:
+        """Render a literal as RDF term."""
+        lexical = literal.get_literal()
+        if isinstance(literal, LexicalLiteral):
+            if literal.get_lang() is not None:
+                return f'"{lexical.translate(_ESCAPES)}"@{literal.get_lang()}'
+        elif literal.is_double() or literal.is_float():
+            lexical = _SPECIAL_FLOATS.get(lexical, lexical)
+        elif literal.is_datetime():
+            lexical = literal.parse_datetime().isoformat()
+        return f'"{lexical.translate(_ESCAPES)}"^^{self.iri(literal.get_datatype().iri.as_str())}'
+
+    def bnode(self) -> str:
+        """Create a new blank node term."""
+        self._bnodes += 1
+        return f"_:b{self._bnodes}"
+
+    def triple(self, s: str, p: str, o: str):
+        """Write a triple of already rendered terms."""
+        self._out.write(f"{s} {p} {o}{self._graph} .\n")
+        self.triples += 1
+
+    def iri_triple(self, s: str, p: str, o: str):
+        """Write a triple between three IRIs."""
+        self.triple(self.iri(s), self.iri(p), self.iri(o))
+
+    def term(self, o: OWLObject) -> str:
+        """Render an OWL object as RDF term, writing the triples of the blank nodes of anonymous class expressions, data
+        ranges and inverse properties.
+
+        Raises:
+            NotImplementedError: If the object has no RDF representation.
+        """
+        if isinstance(o, OWLEntity):
+            return self.iri(o.iri.as_str())
+        if isinstance(o, OWLLiteral):
+            return self.literal(o)
+        if isinstance(o, IRI):
+            return self.iri(o.as_str())
+        return self._node(o)
+
+    def rdf_list(self, items: Iterable[OWLObject]) -> str:
+        """Write an RDF list and return its head."""
+        return self._term_list([self.term(i) for i in items])
+
+    def _term_list(self, terms: List[str]) -> str:
+        head = rest = self.iri(RDF_NIL)
+        for t in reversed(terms):
+            head = self.bnode()
+            self.triple(head, self.iri(RDF_FIRST), t)
+            self.triple(head, self.iri(RDF_REST), rest)
+            rest = head
+        return head
+
+    def annotation(self, subject: str, annotation: OWLAnnotation):
+        """Write an annotation of an already rendered subject."""
+        self.triple(subject, self.term(annotation.get_property()), self.term(annotation.get_value()))
+
+    def _typed_node(self, type_: str) -> str:
+        node = self.bnode()
+        self.triple(node, self.iri(RDF_TYPE), self.iri(type_))
+        return node
+
+    def _main(self, s: str, p: str, o: str):
+        """Write the main triple of an axiom, reified if the axiom is annotated."""
+        self.triple(s, p, o)
+        if self._annotations:
+            node = self._typed_node(OWL_AXIOM)
+            self.triple(node, self.iri(OWL_ANNOTATED_SOURCE), s)
+            self.triple(node, self.iri(OWL_ANNOTATED_PROPERTY), p)
+            self.triple(node, self.iri(OWL_ANNOTATED_TARGET), o)
+            for a in self._annotations:
+                self.annotation(node, a)
+
+    def _main_node(self, type_: str) -> str:
+        """Create the blank node of an axiom that is written as a node, carrying the annotations of the axiom."""
+        node = self._typed_node(type_)
+        for a in self._annotations:
+            self.annotation(node, a)
+        return node
+
+    def _pairwise(self, predicate: str, operands: List[OWLObject]):
+        for first, second in zip(operands, operands[1:]):
+            self._main(self.term(first), self.iri(predicate), self.term(second))
+
+    def _all_disjoint(self, kind: str, operands: List[OWLObject]):
+        node = self._main_node(namespaces.OWL.ns + kind)
+        self.triple(node, self.iri(OWL_MEMBERS), self.rdf_list(operands))
+
+    def _characteristic(self, axiom, kind: str):
+        self._main(self.term(axiom.get_property()), self.iri(RDF_TYPE), self.iri(namespaces.OWL.ns + kind))
+
+    def _negative_assertion(self, axiom, target: str):
+        node = self._main_node(namespaces.OWL.ns + "NegativePropertyAssertion")
+        self.triple(node, self.iri(namespaces.OWL.ns + "sourceIndividual"), self.term(axiom.get_subject()))
+        self.triple(node, self.iri(namespaces.OWL.ns + "assertionProperty"), self.term(axiom.get_property()))
+        self.triple(node, self.iri(namespaces.OWL.ns + target), self.term(axiom.get_object()))
+
+    def write_all(self, axioms: Iterable[OWLAxiom]) -> int:
+        """Write all axioms.
+
+        Returns:
+            Number of axioms written.
+        """
+        count = 0
+        for ax in axioms:
+            self.write(ax)
+            count += 1
+        return count
+
+    def write(self, axiom: OWLAxiom):
+        """Write the triples of an axiom.
+
+        Raises:
+            NotImplementedError: If the axiom cannot be written as RDF.
+        """
+        self._annotations = axiom.annotations() or ()
+        try:
+            self._write(axiom)
+        finally:
+            self._annotations = ()
+
+    # class expressions and data ranges
+
+    @singledispatchmethod
+    def _node(self, o: OWLObject) -> str:
+        raise NotImplementedError(f"Cannot write {o} as RDF term")
+
+    @_node.register
+    def _(self, o: OWLObjectInverseOf) -> str:
+        node = self.bnode()
+        self.triple(node, self.iri(OWL_INVERSE_OF), self.term(o.get_named_property()))
+        return node
+
+    @_node.register
+    def _(self, o: OWLObjectIntersectionOf) -> str:
+        operands = self.rdf_list(o.operands())
+        node = self._typed_node(OWL_CLASS)
+        self.triple(node, self.iri(namespaces.OWL.ns + "intersectionOf"), operands)
+        return node
+
+    @_node.register
+    def _(self, o: OWLObjectUnionOf) -> str:
+        operands = self.rdf_list(o.operands())
+        node = self._typed_node(OWL_CLASS)
+        self.triple(node, self.iri(namespaces.OWL.ns + "unionOf"), operands)
+        return node
+
+    @_node.register
+    def _(self, o: OWLObjectComplementOf) -> str:
+        operand = self.term(o.get_operand())
+        node = self._typed_node(OWL_CLASS)
+        self.triple(node, self.iri(namespaces.OWL.ns + "complementOf"), operand)
+        return node
+
+    @_node.register
+    def _(self, o: OWLObjectOneOf) -> str:
+        individuals = self.rdf_list(o.individuals())
+        node = self._typed_node(OWL_CLASS)
+        self.triple(node, self.iri(namespaces.OWL.ns + "oneOf"), individuals)
+        return node
+
+    def _restriction(self, o, predicate: str, value: str) -> str:
+        prop = self.term(o.get_property())
+        node = self._typed_node(OWL_RESTRICTION)
+        self.triple(node, self.iri(OWL_ON_PROPERTY), prop)
+        self.triple(node, self.iri(namespaces.OWL.ns + predicate), value)
+        return node
+
+    @_node.register(OWLObjectSomeValuesFrom)
+    @_node.register(OWLDataSomeValuesFrom)
+    def _(self, o) -> str:
+        return self._restriction(o, "someValuesFrom", self.term(o.get_filler()))
+
+    @_node.register(OWLObjectAllValuesFrom)
+    @_node.register(OWLDataAllValuesFrom)
+    def _(self, o) -> str:
+        return self._restriction(o, "allValuesFrom", self.term(o.get_filler()))
+
+    @_node.register(OWLObjectHasValue)
+    @_node.register(OWLDataHasValue)
+    def _(self, o) -> str:
+        return self._restriction(o, "hasValue", self.term(o.get_filler()))
+
+    @_node.register
+    def _(self, o: OWLObjectHasSelf) -> str:
+        return self._restriction(o, "hasSelf", f'"true"^^{self.iri(namespaces.XSD.ns + "boolean")}')
+
+    @_node.register
+    def _(self, o: OWLCardinalityRestriction) -> str:
+        predicate = _CARDINALITIES[type(o)]
+        filler = o.get_filler()
+        cardinality = f'"{o.get_cardinality()}"^^{self.iri(namespaces.XSD.ns + "nonNegativeInteger")}'
+        # restrictions on owl:Thing and rdfs:Literal are written unqualified
+        if filler == OWLThing or filler == TopOWLDatatype:
+            return self._restriction(o, predicate, cardinality)
+        filler_term = self.term(filler)
+        node = self._restriction(o, _QUALIFIED_CARDINALITIES[predicate], cardinality)
+        on = "onClass" if isinstance(o, OWLObjectCardinalityRestriction) else "onDataRange"
+        self.triple(node, self.iri(namespaces.OWL.ns + on), filler_term)
+        return node
+
+    @_node.register
+    def _(self, o: OWLDataIntersectionOf) -> str:
+        operands = self.rdf_list(o.operands())
+        node = self._typed_node(RDFS_DATATYPE)
+        self.triple(node, self.iri(namespaces.OWL.ns + "intersectionOf"), operands)
+        return node
+
+    @_node.register
+    def _(self, o: OWLDataUnionOf) -> str:
+        operands = self.rdf_list(o.operands())
+        node = self._typed_node(RDFS_DATATYPE)
+        self.triple(node, self.iri(namespaces.OWL.ns + "unionOf"), operands)
+        return node
+
+    @_node.register
+    def _(self, o: OWLDataComplementOf) -> str:
+        operand = self.term(o.get_data_range())
+        node = self._typed_node(RDFS_DATATYPE)
+        self.triple(node, self.iri(namespaces.OWL.ns + "datatypeComplementOf"), operand)
+        return node
+
+    @_node.register
+    def _(self, o: OWLDataOneOf) -> str:
+        values = self.rdf_list(o.values())
+        node = self._typed_node(RDFS_DATATYPE)
+        self.triple(node, self.iri(namespaces.OWL.ns + "oneOf"), values)
+        return node
+
+    @_node.register
+    def _(self, o: OWLDatatypeRestriction) -> str:
+        facets = []
+        for fr in o.get_facet_restrictions():
+            facet = self.bnode()
+            self.triple(facet, self.iri(fr.get_facet().iri.as_str()), self.term(fr.get_facet_value()))
+            facets.append(facet)
+        restrictions = self._term_list(facets)
+        node = self._typed_node(RDFS_DATATYPE)
+        self.triple(node, self.iri(namespaces.OWL.ns + "onDatatype"), self.term(o.get_datatype()))
+        self.triple(node, self.iri(namespaces.OWL.ns + "withRestrictions"), restrictions)
+        return node
+
+    # axioms
+
+    @singledispatchmethod
+    def _write(self, axiom: OWLAxiom):
+        raise NotImplementedError(f"Cannot write {axiom} as RDF")
+
+    @_write.register
+    def _(self, axiom: OWLDeclarationAxiom):
+        entity = axiom.get_entity()
+        for t, type_ in _ENTITY_TYPES:
+            if isinstance(entity, t):
+                self._main(self.term(entity), self.iri(RDF_TYPE), self.iri(type_))
+                return
+        raise NotImplementedError(f"Cannot write {axiom} as RDF")
+
+    @_write.register
+    def _(self, axiom: OWLClassAssertionAxiom):
+        self._main(self.term(axiom.get_individual()), self.iri(RDF_TYPE), self.term(axiom.get_class_expression()))
+
+    @_write.register
+    def _(self, axiom: OWLSubClassOfAxiom):
+        self._main(self.term(axiom.get_sub_class()), self.iri(RDFS_SUBCLASSOF), self.term(axiom.get_super_class()))
+
+    @_write.register
+    def _(self, axiom: OWLEquivalentClassesAxiom):
+        self._pairwise(OWL_EQUIVALENT_CLASS, list(axiom.class_expressions()))
+
+    @_write.register
+    def _(self, axiom: OWLDisjointClassesAxiom):
+        operands = list(axiom.class_expressions())
+        if len(operands) == 2:
+            self._pairwise(OWL_DISJOINT_WITH, operands)
+        else:
+            self._all_disjoint("AllDisjointClasses", operands)
+
+    @_write.register
+    def _(self, axiom: OWLDisjointUnionAxiom):
+        self._main(self.term(axiom.get_owl_class()), self.iri(namespaces.OWL.ns + "disjointUnionOf"),
+                   self.rdf_list(axiom.get_class_expressions()))
+
+    @_write.register(OWLSubObjectPropertyOfAxiom)
+    @_write.register(OWLSubDataPropertyOfAxiom)
+    @_write.register(OWLSubAnnotationPropertyOfAxiom)
+    def _(self, axiom):
+        self._main(self.term(axiom.get_sub_property()), self.iri(RDFS_SUBPROPERTYOF),
+                   self.term(axiom.get_super_property()))
+
+    @_write.register
+    def _(self, axiom: OWLSubPropertyChainAxiom):
+        self._main(self.term(axiom.get_super_property()), self.iri(namespaces.OWL.ns + "propertyChainAxiom"),
+                   self.rdf_list(axiom.get_property_chain()))
+
+    @_write.register(OWLEquivalentObjectPropertiesAxiom)
+    @_write.register(OWLEquivalentDataPropertiesAxiom)
+    def _(self, axiom):
+        self._pairwise(OWL_EQUIVALENT_PROPERTY, list(axiom.properties()))
+
+    @_write.register(OWLDisjointObjectPropertiesAxiom)
+    @_write.register(OWLDisjointDataPropertiesAxiom)
+    def _(self, axiom):
+        operands = list(axiom.properties())
+        if len(operands) == 2:
+            self._pairwise(OWL_PROPERTY_DISJOINT_WITH, operands)
+        else:
+            self._all_disjoint("AllDisjointProperties", operands)
+
+    @_write.register
+    def _(self, axiom: OWLInverseObjectPropertiesAxiom):
+        self._main(self.term(axiom.get_first_property()), self.iri(OWL_INVERSE_OF),
+                   self.term(axiom.get_second_property()))
+
+    @_write.register(OWLObjectPropertyDomainAxiom)
+    @_write.register(OWLDataPropertyDomainAxiom)
+    @_write.register(OWLAnnotationPropertyDomainAxiom)
+    def _(self, axiom):
+        self._main(self.term(axiom.get_property()), self.iri(RDFS_DOMAIN), self.term(axiom.get_domain()))
+
+    @_write.register(OWLObjectPropertyRangeAxiom)
+    @_write.register(OWLDataPropertyRangeAxiom)
+    @_write.register(OWLAnnotationPropertyRangeAxiom)
+    def _(self, axiom):
+        self._main(self.term(axiom.get_property()), self.iri(RDFS_RANGE), self.term(axiom.get_range()))
+
+    @_write.register
+    def _(self, axiom: OWLFunctionalObjectPropertyAxiom):
+        self._characteristic(axiom, "FunctionalProperty")
+
+    @_write.register
+    def _(self, axiom: OWLFunctionalDataPropertyAxiom):
+        self._characteristic(axiom, "FunctionalProperty")
+
+    @_write.register
+    def _(self, axiom: OWLInverseFunctionalObjectPropertyAxiom):
+        self._characteristic(axiom, "InverseFunctionalProperty")
+
+    @_write.register
+    def _(self, axiom: OWLSymmetricObjectPropertyAxiom):
+        self._characteristic(axiom, "SymmetricProperty")
+
+    @_write.register
+    def _(self, axiom: OWLAsymmetricObjectPropertyAxiom):
+        self._characteristic(axiom, "AsymmetricProperty")
+
+    @_write.register
+    def _(self, axiom: OWLReflexiveObjectPropertyAxiom):
+        self._characteristic(axiom, "ReflexiveProperty")
+
+    @_write.register
+    def _(self, axiom: OWLIrreflexiveObjectPropertyAxiom):
+        self._characteristic(axiom, "IrreflexiveProperty")
+
+    @_write.register
+    def _(self, axiom: OWLTransitiveObjectPropertyAxiom):
+        self._characteristic(axiom, "TransitiveProperty")
+
+    @_write.register
+    def _(self, axiom: OWLHasKeyAxiom):
+        self._main(self.term(axiom.get_class_expression()), self.iri(namespaces.OWL.ns + "hasKey"),
+                   self.rdf_list(axiom.get_property_expressions()))
+
+    @_write.register
+    def _(self, axiom: OWLDatatypeDefinitionAxiom):
+        self._main(self.term(axiom.get_datatype()), self.iri(OWL_EQUIVALENT_CLASS), self.term(axiom.get_datarange()))
+
+    @_write.register
+    def _(self, axiom: OWLObjectPropertyAssertionAxiom):
+        s, p, o = axiom.get_subject(), axiom.get_property(), axiom.get_object()
+        if isinstance(p, OWLObjectInverseOf):
+            s, p, o = o, p.get_named_property(), s
+        self._main(self.term(s), self.term(p), self.term(o))
+
+    @_write.register
+    def _(self, axiom: OWLDataPropertyAssertionAxiom):
+        self._main(self.term(axiom.get_subject()), self.term(axiom.get_property()), self.term(axiom.get_object()))
+
+    @_write.register
+    def _(self, axiom: OWLNegativeObjectPropertyAssertionAxiom):
+        self._negative_assertion(axiom, "targetIndividual")
+
+    @_write.register
+    def _(self, axiom: OWLNegativeDataPropertyAssertionAxiom):
+        self._negative_assertion(axiom, "targetValue")
+
+    @_write.register
+    def _(self, axiom: OWLSameIndividualAxiom):
+        self._pairwise(OWL_SAME_AS, list(axiom.individuals()))
+
+    @_write.register
+    def _(self, axiom: OWLDifferentIndividualsAxiom):
+        operands = list(axiom.individuals())
+        if len(operands) == 2:
+            self._pairwise(OWL_DIFFERENT_FROM, operands)
+        else:
+            self._all_disjoint("AllDifferent", operands)
+
+    @_write.register
+    def _(self, axiom: OWLAnnotationAssertionAxiom):
+        self._main(self.term(axiom.get_subject()), self.term(axiom.get_property()), self.term(axiom.get_value()))
@@ -5,14 +5,14 @@ from fastapi import FastAPI
 from pydantic import BaseModel
 
 from owlapy.owl_ontology import SyncOntology
-from owlapy.owl_reasoner import SyncReasoner
+from owlapy.owl_reasoner import SyncReasonerPool
 from owlapy.class_expression import OWLClass
 from owlapy.static_funcs import stopJVM
 from contextlib import asynccontextmanager
 from enum import Enum
 
 ontology = None
-reasoner = None
+reasoner_pool = None
 
 
 class InferenceType(str, Enum):
@@ -42,10 +42,10 @@ class AxiomRequest(BaseModel):
     axiom: str
 
 
-def create_app(ontology_path: str, reasoner_name: str):
+def create_app(ontology_path: str, reasoner_name: str, pool_size: int = 1, infer_workers: int = 1):
     @asynccontextmanager
     async def lifespan(app: FastAPI):
-        global ontology, reasoner
+        global ontology, reasoner_pool
         # Startup logic
         # Load the ontology
         if not os.path.exists(ontology_path):
@@ -56,18 +56,23 @@ def create_app(ontology_path: str, reasoner_name: str):
         valid_reasoners = ['Pellet', 'HermiT', 'JFact', 'Openllet']
         if reasoner_name not in valid_reasoners:
             raise ValueError(f"Invalid reasoner '{reasoner_name}'. Valid options are: {', '.join(valid_reasoners)}")
-        reasoner = SyncReasoner(ontology=ontology, reasoner=reasoner_name)
+        # Every reasoner of the pool serves one request at a time, requests on different reasoners run concurrently
+        reasoner_pool = SyncReasonerPool(ontology, reasoner=reasoner_name, size=pool_size)
 
         yield
+        reasoner_pool.close()
         stopJVM()
 
     app = FastAPI(title="OWLAPY API", lifespan=lifespan)
 
+    # Reasoning endpoints are plain functions so that FastAPI runs them in its thread pool instead of blocking the
+    # event loop. The reasoner stays checked out until the reasoning is done, hence no timeout is used.
     @app.post("/instances")
-    async def get_instances(request: ClassIRIRequest):
+    def get_instances(request: ClassIRIRequest):
         class_iri = request.class_iri
         owl_class = OWLClass(class_iri)
-        instances = reasoner.instances(owl_class, direct=False)
+        with reasoner_pool.checked_out() as reasoner:
+            instances = reasoner.instances(owl_class, direct=False, timeout=None)
         instance_iris = [ind.__str__() for ind in instances]
         return {"instances": instance_iris}
 
@@ -102,14 +107,15 @@ def create_app(ontology_path: str, reasoner_name: str):
         return {"tbox": [axiom.__str__() for axiom in tbox]}
         
     @app.post("/infer_axioms")
-    async def infer_axioms(request: InfrenceTypeRequest):
+    def infer_axioms(request: InfrenceTypeRequest):
         inference_type = request.inference_type
-        if inference_type == InferenceType.All:
-            inferred_axioms = []
-            for inference_type in {it for it in InferenceType if it != InferenceType.All}:
-                inferred_axioms.extend(reasoner.infer_axioms(inference_type.value))
-        else:
-            inferred_axioms = reasoner.infer_axioms(request.inference_type.value)
+        with reasoner_pool.checked_out() as reasoner:
+            if inference_type == InferenceType.All:
+                # the generators are independent, run them concurrently on infer_workers reasoner instances
+                inferred_axioms = list(reasoner.infer_axioms([it.value for it in InferenceType
+                                                              if it != InferenceType.All], workers=infer_workers))
+            else:
+                inferred_axioms = list(reasoner.infer_axioms(request.inference_type.value))
 
         return {"inferred_axioms": [axiom.__str__() for axiom in inferred_axioms]}
 
@@ -126,9 +132,13 @@ def main():
                         help='Host to listen on')
     parser.add_argument('--port', type=int, default=8000,
                         help='Port to listen on')
+    parser.add_argument('--pool_size', type=int, default=1,
+                        help='Number of reasoner instances serving /instances and /infer_axioms requests concurrently')
+    parser.add_argument('--infer_workers', type=int, default=1,
+                        help='Number of axiom generators run concurrently for /infer_axioms with inference type "all"')
     args = parser.parse_args()
 
-    app = create_app(args.path_kb, args.reasoner)
+    app = create_app(args.path_kb, args.reasoner, args.pool_size, args.infer_workers)
     uvicorn.run(app, host=args.host, port=args.port)
 
 
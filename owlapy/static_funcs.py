@@ -1,8 +1,10 @@
 """Static functions for general purposes."""
 import os
+import shlex
 import subprocess
 import platform
 import shutil
+from typing import Final, Iterable, List, Optional, Sequence
 import jpype
 import jpype.imports
 import importlib.resources as resources
@@ -43,21 +45,84 @@ def download_external_files(ftp_link: str):
         shutil.move(current_dir, root_dir)
 
 
-def startJVM():
+# Jars that are only needed by a single reasoner, matched by file name prefix. All other jars (OWLAPI and its
+# dependencies) are always on the classpath.
+_REASONER_JARS: Final = {
+    "HermiT": ("org.semanticweb.hermit", "automaton"),
+    "ELK": ("elk-",),
+    "JFact": ("jfact-",),
+    "Pellet": ("openllet-", "jgrapht-core"),
+    "Openllet": ("openllet-", "jgrapht-core"),
+    "Structural": (),
+}
+
+
+def _jvm_classpath(jar_folder: str, reasoners: Optional[Iterable[str]] = None) -> List[str]:
+    """Get the jar files to put on the classpath.
+
+    Args:
+        jar_folder: Folder with the jar files.
+        reasoners: Names of the reasoners whose jars are loaded, None for all reasoners.
+
+    Returns:
+        Sorted paths of the jar files, the order matters for class data sharing archives.
+    """
+    excluded = ()
+    if reasoners is not None:
+        reasoners = set(reasoners)
+        unknown = reasoners - _REASONER_JARS.keys()
+        if unknown:
+            raise ValueError(f"Unknown reasoners {sorted(unknown)}. Available reasoners: {list(_REASONER_JARS)}")
+        needed = {prefix for r in reasoners for prefix in _REASONER_JARS[r]}
+        excluded = tuple({prefix for prefixes in _REASONER_JARS.values() for prefix in prefixes} - needed)
+    return sorted(os.path.join(jar_folder, f) for f in os.listdir(jar_folder)
+                  if f.endswith('.jar') and not f.startswith(excluded))
+
+
+def _jvm_options(jvm_options: Optional[Sequence[str]] = None, cds_archive: Optional[str] = None) -> List[str]:
+    """Get the options the JVM is started with.
+
+    Options from the OWLAPY_JVM_OPTIONS environment variable come first, so the given options take precedence.
+    """
+    options = shlex.split(os.environ.get("OWLAPY_JVM_OPTIONS", ""))
+    options.extend(jvm_options or ())
+    if cds_archive is not None:
+        if os.path.exists(cds_archive):
+            options.append(f"-XX:SharedArchiveFile={cds_archive}")
+        else:
+            # record the classes loaded by this run, the archive is written when the JVM exits (needs Java 13+)
+            options.append(f"-XX:ArchiveClassesAtExit={cds_archive}")
+    return options
+
+
+def startJVM(jvm_options: Optional[Sequence[str]] = None, reasoners: Optional[Iterable[str]] = None,
+             cds_archive: Optional[str] = None):
     """Start the JVM with jar dependencies. This method is called automatically on object initialization,
-    if the JVM is not started yet."""
+    if the JVM is not started yet.
+
+    Every argument can also be given as environment variable, which is used when the JVM is started automatically.
+    Explicit arguments take precedence.
+
+    Args:
+        jvm_options: Options for the JVM such as ["-Xmx8g", "-XX:+UseParallelGC"]. They are appended to the options
+            in the OWLAPY_JVM_OPTIONS environment variable (e.g. "-Xmx8g -XX:+UseParallelGC").
+        reasoners: Only load the jars of these reasoners (see SyncReasoner) to speed up the start, None for all
+            reasoners. Environment variable: OWLAPY_JVM_REASONERS, comma separated (e.g. "ELK,HermiT").
+        cds_archive: Path of a class data sharing archive. If it does not exist yet, the classes loaded by this run
+            are written to it when the JVM exits and later starts load them from the archive. The archive only fits
+            the same Java version and jars. Environment variable: OWLAPY_JVM_CDS_ARCHIVE.
+    """
+    if reasoners is None and os.environ.get("OWLAPY_JVM_REASONERS"):
+        reasoners = [r.strip() for r in os.environ["OWLAPY_JVM_REASONERS"].split(",") if r.strip()]
+    if cds_archive is None:
+        cds_archive = os.environ.get("OWLAPY_JVM_CDS_ARCHIVE") or None
 
     # Access the jar_dependencies folder inside the 'owlapy' package
     with resources.path('owlapy', 'jar_dependencies') as jar_folder_path:
-        jar_folder = str(jar_folder_path)
-        jar_files = [
-            os.path.join(jar_folder, f)
-            for f in os.listdir(jar_folder)
-            if f.endswith('.jar')
-        ]
+        jar_files = _jvm_classpath(str(jar_folder_path), reasoners)
 
     # Start JVM with the found jar files
-    jpype.startJVM(classpath=jar_files)
+    jpype.startJVM(*_jvm_options(jvm_options, cds_archive), classpath=jar_files)
 
 
 def stopJVM() -> None:
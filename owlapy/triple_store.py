@@ -0,0 +1,247 @@
+"""Compact triple store of dictionary-encoded integer triples in NumPy arrays."""
+import hashlib
+import json
+import os
+from array import array
+from typing import Dict, Final, Iterable, List, Optional, Tuple
+
+import numpy as np
+import rdflib
+
+_FORMAT_VERSION: Final = 1
+_HEADER_FILE: Final = "store.json"
+# Rows of each permutation, as positions in a subject, predicate, object triple
+_PERMUTATIONS: Final = {"spo": (0, 1, 2), "pos": (1, 2, 0), "osp": (2, 0, 1)}
+
+
+def encode_term(node: rdflib.term.Node) -> str:
+    """Encode an rdflib IRI or literal as a term of the dictionary.
+
+    IRIs are kept as they are, literals are written as ``"lexical"``, ``"lexical"^^datatype`` or
+    ``"lexical"@language`` without escaping the lexical form. Blank nodes are labelled by the store, see
+    :func:`TripleStore.from_rdf`.
+    """
+    if isinstance(node, rdflib.Literal):
+        if node.datatype is not None:
+            return f'"{node}"^^{node.datatype}'
+        if node.language is not None:
+            return f'"{node}"@{node.language}'
+        return f'"{node}"'
+    return str(node)
+
+
+def decode_literal(term: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """Split a literal term of the dictionary into its lexical form, datatype IRI and language tag."""
+    end = term.rindex('"')
+    suffix = term[end + 1:]
+    if suffix.startswith("^^"):
+        return term[1:end], suffix[2:], None
+    if suffix.startswith("@"):
+        return term[1:end], None, suffix[1:]
+    return term[1:end], None, None
+
+
+class _TermDictionary:
+    """Sorted terms stored as one utf-8 buffer and the offsets of the terms in it.
+
+    Since the terms are sorted by code point (which is the order of their utf-8 bytes), the id of a term is found by
+    binary search on the buffer, and both arrays can be used directly from a memory-mapped file.
+    """
+    __slots__ = 'buffer', 'offsets'
+
+    def __init__(self, buffer: np.ndarray, offsets: np.ndarray):
+        self.buffer = buffer
+        self.offsets = offsets
+
+    @classmethod
+    def from_sorted(cls, terms: List[str]) -> '_TermDictionary':
+        encoded = [t.encode() for t in terms]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        return cls(np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self.buffer[self.offsets[i]:self.offsets[i + 1]].tobytes().decode()
+
+    def bisect(self, term: str) -> int:
+        """Get the id of the first term that is not smaller than the given term."""
+        # rdflib terms are str subclasses with their own ordering
+        term = str(term)
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self[mid] < term:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def id_of(self, term: str) -> Optional[int]:
+        term = str(term)
+        i = self.bisect(term)
+        return i if i < len(self) and self[i] == term else None
+
+
+class TripleStore:
+    """Read-only set of RDF triples encoded as integers.
+
+    Every term (IRI, blank node or literal) is replaced by its id in a sorted term dictionary. The triples are kept in
+    three sorted permutations, SPO, POS and OSP, each a (3, n) array with one row per position in that order, so that
+    every triple pattern is answered by binary searches over a contiguous range of one permutation. The arrays are
+    saved as .npy files by :func:`TripleStore.save` and memory-mapped by :func:`TripleStore.load`, so opening a large
+    store only reads the pages that are queried.
+    """
+    __slots__ = 'terms', 'spo', 'pos', 'osp', '_literals', '_blank_nodes', '_content_hash'
+
+    def __init__(self, terms: _TermDictionary, spo: np.ndarray, pos: np.ndarray, osp: np.ndarray,
+                 content_hash: Optional[str] = None):
+        self.terms = terms
+        self.spo = spo
+        self.pos = pos
+        self.osp = osp
+        self._content_hash = content_hash
+        # literals start with '"' and blank nodes with '_:', so each kind is a contiguous range of ids
+        self._literals = terms.bisect('"'), terms.bisect('#')
+        self._blank_nodes = terms.bisect('_:'), terms.bisect('_;')
+
+    @classmethod
+    def from_rdf(cls, triples: Iterable[Tuple[rdflib.term.Node, rdflib.term.Node, rdflib.term.Node]]) \
+            -> 'TripleStore':
+        """Encode rdflib triples, e.g. from an N-Triples parser.
+
+        Blank nodes are labelled _:b0, _:b1, ... in the order they first occur, so that the same document always
+        gives the same store. Duplicate triples are removed.
+        """
+        node_ids: Dict[rdflib.term.Node, int] = dict()
+        term_ids: Dict[str, int] = dict()
+        n_blank_nodes = 0
+        encoded = array('q')
+        for triple in triples:
+            for node in triple:
+                i = node_ids.get(node)
+                if i is None:
+                    if isinstance(node, rdflib.BNode):
+                        term = f"_:b{n_blank_nodes}"
+                        n_blank_nodes += 1
+                    else:
+                        term = encode_term(node)
+                    i = term_ids.get(term)
+                    if i is None:
+                        i = term_ids[term] = len(term_ids)
+                    node_ids[node] = i
+                encoded.append(i)
+        del node_ids
+        terms = list(term_ids)
+        del term_ids
+        order = sorted(range(len(terms)), key=terms.__getitem__)
+        rank = np.empty(len(terms), dtype=np.int64)
+        rank[order] = np.arange(len(terms), dtype=np.int64)
+        dtype = np.int32 if len(terms) < 2 ** 31 else np.int64
+        spo = rank[np.frombuffer(encoded, dtype=np.int64)].astype(dtype).reshape(-1, 3)
+        return cls(_TermDictionary.from_sorted([terms[i] for i in order]), *cls._permutations(spo))
+
+    @staticmethod
+    def _permutations(triples: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Sort the (n, 3) triples into the SPO, POS and OSP permutations, removing duplicates."""
+        ret = []
+        for rows in _PERMUTATIONS.values():
+            perm = triples[:, rows]
+            perm = perm[np.lexsort((perm[:, 2], perm[:, 1], perm[:, 0]))]
+            if len(perm) > 1:
+                keep = np.ones(len(perm), dtype=bool)
+                keep[1:] = (perm[1:] != perm[:-1]).any(axis=1)
+                perm = perm[keep]
+            ret.append(np.ascontiguousarray(perm.T))
+        return tuple(ret)
+
+    def save(self, directory: str):
+        """Save the store as .npy files into a directory, replacing a store saved there before."""
+        os.makedirs(directory, exist_ok=True)
+        arrays = {"terms": self.terms.buffer, "term_offsets": self.terms.offsets,
+                  "spo": self.spo, "pos": self.pos, "osp": self.osp}
+        for name, a in arrays.items():
+            np.save(os.path.join(directory, f"{name}.npy"), a)
+        header = {"version": _FORMAT_VERSION, "terms": len(self.terms), "triples": len(self),
+                  "content_hash": self.content_hash()}
+        with open(os.path.join(directory, _HEADER_FILE), "w") as f:
+            json.dump(header, f)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> 'TripleStore':
+        """Load a store saved by :func:`TripleStore.save`.
+
+        Args:
+            directory: Directory of the store.
+            mmap: Whether to memory-map the arrays instead of reading them into memory.
+        """
+        with open(os.path.join(directory, _HEADER_FILE)) as f:
+            header = json.load(f)
+        if header.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"{directory} has version {header.get('version')} of the triple store format, "
+                             f"expected {_FORMAT_VERSION}")
+        mmap_mode = "r" if mmap else None
+        arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mmap_mode)
+                  for name in ("terms", "term_offsets", "spo", "pos", "osp")}
+        return cls(_TermDictionary(arrays["terms"], arrays["term_offsets"]),
+                   arrays["spo"], arrays["pos"], arrays["osp"], header["content_hash"])
+
+    def __len__(self) -> int:
+        return self.spo.shape[1]
+
+    def id_of(self, term: str) -> Optional[int]:
+        """Get the id of an encoded term (see :func:`encode_term`), None if it does not occur in the store."""
+        return self.terms.id_of(term)
+
+    def term(self, i: int) -> str:
+        return self.terms[i]
+
+    def is_iri(self, ids: np.ndarray) -> np.ndarray:
+        """Get the mask of the ids that are IRIs and not literals or blank nodes."""
+        return ~(((ids >= self._literals[0]) & (ids < self._literals[1])) |
+                 ((ids >= self._blank_nodes[0]) & (ids < self._blank_nodes[1])))
+
+    def is_literal(self, ids: np.ndarray) -> np.ndarray:
+        return (ids >= self._literals[0]) & (ids < self._literals[1])
+
+    def match(self, s: Optional[int] = None, p: Optional[int] = None, o: Optional[int] = None) \
+            -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the subjects, predicates and objects of the triples matching a pattern, None matches any term.
+
+        The arrays are views on one permutation, sorted by the bound positions first.
+        """
+        if s is not None and p is None and o is not None:
+            name, key = "osp", (o, s)
+        elif s is not None:
+            name, key = "spo", (s, p, o)
+        elif p is not None:
+            name, key = "pos", (p, o)
+        else:
+            name, key = "osp", (o,)
+        perm = getattr(self, name)
+        lo, hi = 0, perm.shape[1]
+        for row, k in enumerate(key):
+            if k is None:
+                break
+            column = perm[row, lo:hi]
+            lo, hi = lo + int(np.searchsorted(column, k, "left")), lo + int(np.searchsorted(column, k, "right"))
+        rows = _PERMUTATIONS[name]
+        return perm[rows.index(0), lo:hi], perm[rows.index(1), lo:hi], perm[rows.index(2), lo:hi]
+
+    def objects(self, s: int, p: int) -> np.ndarray:
+        return self.match(s, p)[2]
+
+    def subjects(self, p: int, o: int) -> np.ndarray:
+        return self.match(None, p, o)[0]
+
+    def content_hash(self) -> str:
+        """Hash of the terms and triples, which are stored in a canonical order."""
+        if self._content_hash is None:
+            h = hashlib.blake2b(digest_size=16)
+            h.update(np.ascontiguousarray(self.terms.buffer).tobytes())
+            h.update(np.ascontiguousarray(self.terms.offsets, dtype=np.int64).tobytes())
+            h.update(np.ascontiguousarray(self.spo, dtype=np.int64).tobytes())
+            self._content_hash = h.hexdigest()
+        return self._content_hash
@@ -1,7 +1,7 @@
 """Owlapy utils."""
 from collections import Counter
 from copy import copy
-from itertools import repeat
+from itertools import count, repeat
 
 from owlapy.owl_individual import OWLNamedIndividual
 from sortedcontainers import SortedSet
@@ -27,6 +27,11 @@ from .owl_object import OWLObject
 from .owl_datatype import OWLDatatype
 
 import concurrent.futures
+import os
+import queue
+import threading
+import time
+from collections import namedtuple
 
 from .vocab import OWLFacet
 
@@ -73,14 +78,233 @@ def f1_set_similarity(set1, set2) -> float:
     
     return 2 * (precision * recall) / (precision + recall)
 
-def run_with_timeout(func, timeout, args=(), **kwargs):
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        future = executor.submit(func, *args, **kwargs)
+class QueryTimeoutError(TimeoutError):
+    """Raised by :func:`check_timeout` inside a task of :func:`run_with_timeout` whose deadline has passed."""
+    pass
+
+
+class TimeoutResult(set):
+    """Empty result returned by :func:`run_with_timeout` if the task did not finish in time."""
+    timed_out = True
+
+
+ExecutorInfo = namedtuple("ExecutorInfo", ["max_workers", "queued", "running", "completed", "timed_out", "stuck"])
+
+
+class _Task:
+    __slots__ = 'deadline', 'cancelled', 'running', 'replaced_in'
+
+    def __init__(self, deadline: float):
+        self.deadline = deadline
+        self.cancelled = False
+        self.running = False
+        # pool that got an extra worker because this task timed out while still running
+        self.replaced_in: Optional[_WorkerPool] = None
+
+
+class _WorkerPool:
+    """Daemon worker threads that run the tasks of :func:`run_with_timeout` from a shared queue.
+
+    Workers are started on demand, up to size plus one extra worker per task that timed out while still running. A
+    worker that finishes a task while the pool has more threads than that exits, so the extra workers are stopped
+    once the stuck tasks return.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.lock = threading.Lock()
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.threads = self.idle = self.pending = self.extra = 0
+        self.closed = False
+        self._names = count()
+
+    def submit(self, fn, *args) -> concurrent.futures.Future:
+        future = concurrent.futures.Future()
+        with self.lock:
+            self.pending += 1
+            self._start_worker()
+        self.queue.put((future, fn, args))
+        return future
+
+    def add_worker(self):
+        """Allow one more worker while a timed out task keeps its thread busy."""
+        with self.lock:
+            self.extra += 1
+            self._start_worker()
+
+    def remove_worker(self):
+        """Take back the worker added by :meth:`add_worker`, the next thread that becomes free exits."""
+        with self.lock:
+            self.extra -= 1
+
+    def shutdown(self):
+        """Stop the workers once the tasks already queued are done."""
+        with self.lock:
+            self.closed = True
+            threads = self.threads
+        for _ in range(threads):
+            self.queue.put(None)
+
+    def _start_worker(self):
+        # must hold the lock
+        if not self.closed and self.pending > self.idle and self.threads < self.size + self.extra:
+            self.threads += 1
+            threading.Thread(target=self._work, name=f"owlapy-timeout_{next(self._names)}", daemon=True).start()
+
+    def _work(self):
+        while True:
+            with self.lock:
+                if self.threads > self.size + self.extra:
+                    self.threads -= 1
+                    return
+                self.idle += 1
+            item = self.queue.get()
+            with self.lock:
+                self.idle -= 1
+                if item is None:
+                    self.threads -= 1
+                    return
+                self.pending -= 1
+            future, fn, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+
+class _TimeoutExecutor:
+    """Process wide worker pool that runs the tasks of :func:`run_with_timeout`."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pool: Optional[_WorkerPool] = None
+        self.max_workers: Optional[int] = None
+        self.local = threading.local()
+        self.queued = self.running = self.completed = self.timed_out = self.stuck = 0
+
+    def get_pool(self) -> _WorkerPool:
+        with self.lock:
+            if self.pool is None:
+                # same default as concurrent.futures.ThreadPoolExecutor
+                self.pool = _WorkerPool(self.max_workers or min(32, (os.cpu_count() or 1) + 4))
+            return self.pool
+
+    def replace_worker(self, task: _Task, pool: _WorkerPool):
+        """Add a worker to pool for as long as the timed out task keeps its thread busy.
+
+        Tasks that never call :func:`check_timeout` (e.g. a blocking call into the JVM) cannot be stopped, without a
+        replacement they would occupy the pool until later tasks time out while still queued. Must hold the lock.
+        """
+        task.replaced_in = pool
+        self.stuck += 1
+        pool.add_worker()
+
+    def current_task(self) -> Optional[_Task]:
+        return getattr(self.local, 'task', None)
+
+    def run(self, task: _Task, func, args, kwargs):
+        with self.lock:
+            self.queued -= 1
+            if task.cancelled:
+                return None
+            self.running += 1
+            task.running = True
+        self.local.task = task
         try:
-            result = future.result(timeout=timeout)
-            return result
-        except concurrent.futures.TimeoutError:
-            return set()
+            return func(*args, **kwargs)
+        finally:
+            self.local.task = None
+            with self.lock:
+                self.running -= 1
+                self.completed += 1
+                task.running = False
+                if task.replaced_in is not None:
+                    # this thread is free again, so the pool gives the extra worker back
+                    task.replaced_in.remove_worker()
+                    self.stuck -= 1
+
+
+_timeout_executor = _TimeoutExecutor()
+
+
+def set_timeout_executor_max_workers(max_workers: Optional[int]):
+    """Set the number of worker threads used by :func:`run_with_timeout`.
+
+    The workers of the current pool stop once their tasks are done, a new pool is created on the next call.
+
+    Args:
+        max_workers: Number of worker threads, None for the default of concurrent.futures.ThreadPoolExecutor.
+    """
+    with _timeout_executor.lock:
+        pool = _timeout_executor.pool
+        _timeout_executor.pool = None
+        _timeout_executor.max_workers = max_workers
+    if pool is not None:
+        pool.shutdown()
+
+
+def timeout_executor_info() -> ExecutorInfo:
+    """Report the number of queued, running, completed and timed out tasks of :func:`run_with_timeout`.
+
+    stuck counts the tasks that timed out but are still running, each of them got a replacement worker.
+    """
+    ex = _timeout_executor
+    with ex.lock:
+        max_workers = ex.pool.size if ex.pool is not None else ex.max_workers
+        return ExecutorInfo(max_workers, ex.queued, ex.running, ex.completed, ex.timed_out, ex.stuck)
+
+
+def check_timeout():
+    """Cooperative cancellation checkpoint for long-running computations.
+
+    Raises:
+        QueryTimeoutError: If called from a task of :func:`run_with_timeout` that exceeded its deadline.
+    """
+    task = _timeout_executor.current_task()
+    if task is not None and (task.cancelled or time.monotonic() > task.deadline):
+        raise QueryTimeoutError
+
+
+def run_with_timeout(func, timeout, args=(), **kwargs):
+    """Run a function on the shared worker pool and wait at most timeout seconds for its result.
+
+    The function can call :func:`check_timeout` to stop early once the deadline has passed. A function that keeps
+    running after its deadline is abandoned and its worker is replaced, so it does not block later calls. If called
+    from within a task the function runs directly in the current thread under the deadline of the outer task.
+
+    Args:
+        func: Function to call.
+        timeout: Maximum number of seconds to wait, None for no limit.
+        args: Positional arguments of func.
+        **kwargs: Keyword arguments of func.
+
+    Returns:
+        The result of func or an empty :class:`TimeoutResult` if the deadline was exceeded.
+    """
+    ex = _timeout_executor
+    if ex.current_task() is not None:
+        return func(*args, **kwargs)
+
+    task = _Task(time.monotonic() + timeout if timeout is not None else float('inf'))
+    with ex.lock:
+        ex.queued += 1
+    pool = ex.get_pool()
+    future = pool.submit(ex.run, task, func, args, kwargs)
+    try:
+        return future.result(timeout=timeout)
+    except (concurrent.futures.TimeoutError, QueryTimeoutError):
+        with ex.lock:
+            task.cancelled = True
+            if future.cancel():
+                ex.queued -= 1
+            elif task.running:
+                ex.replace_worker(task, pool)
+            ex.timed_out += 1
+        return TimeoutResult()
 
 
 def concept_reducer(concepts:Iterable, opt:Callable):
@@ -1728,7 +1952,16 @@ class LRUCache(Generic[_K, _V]):
     sentinel = object()
     PREV, NEXT, KEY, RESULT = 0, 1, 2, 3  # names for the link fields
 
-    def __init__(self, maxsize: Optional[int] = None):
+    def __init__(self, maxsize: Optional[int] = None, maxbytes: Optional[int] = None,
+                 sizeof: Optional[Callable[[_V], int]] = None):
+        """Least recently used cache.
+
+        Args:
+            maxsize: Maximum number of entries, None for no limit.
+            maxbytes: Maximum total size of the cached values in bytes, None for no limit.
+            sizeof: Function to estimate the size of a value in bytes, defaults to sys.getsizeof. Only used if maxbytes
+                is set.
+        """
         from _thread import RLock
 
         self.cache = {}
@@ -1740,6 +1973,13 @@ class LRUCache(Generic[_K, _V]):
         self.root = []  # root of the circular doubly linked list
         self.root[:] = [self.root, self.root, None, None]  # initialize by pointing to self
         self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        if sizeof is None:
+            import sys
+            sizeof = sys.getsizeof
+        self.sizeof = sizeof
+        self.sizes = {}  # key => size of the value in bytes, only maintained if maxbytes is set
+        self.currbytes = 0
 
     def __contains__(self, item: _K) -> bool:
         with self.lock:
@@ -1793,22 +2033,45 @@ class LRUCache(Generic[_K, _V]):
                 # for last, after the root and links have been put in
                 # a consistent state.
                 self.cache[key] = oldroot
+                if self.maxbytes is not None:
+                    self.currbytes -= self.sizes.pop(oldkey)
+                    self._add_size(key, value)
             else:
                 # Put result in a new link at the front of the queue.
                 last = self.root[LRUCache.PREV]
                 link = [last, self.root, key, value]
                 last[LRUCache.NEXT] = self.root[LRUCache.PREV] = self.cache[key] = link
+                if self.maxbytes is not None:
+                    self._add_size(key, value)
                 # Use the cache_len bound method instead of the len() function
                 # which could potentially be wrapped in an lru_cache itself.
                 if self.maxsize is not None:
                     self.full = (self.cache_len() >= self.maxsize)
 
+    def _add_size(self, key: _K, value: _V):
+        """Account for the size of a new entry and evict the oldest entries while above maxbytes."""
+        size = self.sizeof(value)
+        self.sizes[key] = size
+        self.currbytes += size
+        # never evict the entry that was just added
+        while self.currbytes > self.maxbytes and self.cache_len() > 1:
+            oldest = self.root[LRUCache.NEXT]
+            if oldest[LRUCache.KEY] == key:
+                break
+            oldest_next = oldest[LRUCache.NEXT]
+            self.root[LRUCache.NEXT] = oldest_next
+            oldest_next[LRUCache.PREV] = self.root
+            oldkey = oldest[LRUCache.KEY]
+            del self.cache[oldkey]
+            self.currbytes -= self.sizes.pop(oldkey)
+            self.full = False
+
     def cache_info(self):
         """Report cache statistics."""
         with self.lock:
             from collections import namedtuple
-            return namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])(
-                self.hits, self.misses, self.maxsize, self.cache_len())
+            return namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize", "maxbytes", "currbytes"])(
+                self.hits, self.misses, self.maxsize, self.cache_len(), self.maxbytes, self.currbytes)
 
     def cache_clear(self):
         """Clear the cache and cache statistics."""
@@ -1817,6 +2080,8 @@ class LRUCache(Generic[_K, _V]):
             self.root[:] = [self.root, self.root, None, None]
             self.hits = self.misses = 0
             self.full = False
+            self.sizes.clear()
+            self.currbytes = 0
 
 
 transformer = CESimplifier()
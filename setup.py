@@ -4,6 +4,7 @@ from setuptools import setup, find_packages
 _deps = [
     "scikit-learn>=1.5.2",
     "pandas>=1.5.0",
+    "numpy>=1.24.0",
     "requests>=2.32.3",
     "rdflib>=6.0.2",
     "parsimonious>=0.8.1",
@@ -30,6 +31,7 @@ extras = dict()
 extras["min"] = deps_list(
     "scikit-learn",
     "pandas",
+    "numpy",
     "requests",
     "rdflib",
     "parsimonious",
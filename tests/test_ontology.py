@@ -1,10 +1,11 @@
 import unittest
+from unittest.mock import patch
 import os
 from owlapy.owl_ontology import SyncOntology, Ontology, RDFLibOntology
-from owlapy.class_expression import OWLClass
+from owlapy.class_expression import OWLClass, OWLObjectSomeValuesFrom, OWLObjectUnionOf
 from owlapy.owl_property import OWLObjectProperty, OWLDataProperty
 from owlapy.owl_individual import OWLNamedIndividual
-from owlapy.owl_literal import OWLLiteral
+from owlapy.owl_literal import OWLLiteral, IntegerOWLDatatype
 from owlapy.iri import IRI
 from owlapy.owl_axiom import (
     OWLClassAssertionAxiom, OWLObjectPropertyAssertionAxiom,
@@ -13,7 +14,7 @@ from owlapy.owl_axiom import (
     OWLObjectPropertyDomainAxiom, OWLObjectPropertyRangeAxiom,
     OWLDataPropertyDomainAxiom, OWLDataPropertyRangeAxiom,
     OWLFunctionalObjectPropertyAxiom, OWLInverseFunctionalObjectPropertyAxiom,
-    OWLFunctionalDataPropertyAxiom,
+    OWLFunctionalDataPropertyAxiom, OWLSameIndividualAxiom, OWLDifferentIndividualsAxiom,
 )
 from owlapy.owl_reasoner import SyncReasoner
 
@@ -104,6 +105,45 @@ class TestOntologyCreation(unittest.TestCase):
 
         self.assertGreater(len(individuals), 0)
 
+    def test_signature_cache(self):
+        """Test that the signature of an Ontology is kept until it is modified."""
+        onto = Ontology("KGs/Family/father.owl")
+        signature = onto.signature()
+        self.assertIs(onto.signature(), signature)
+        self.assertEqual(list(onto.individuals_in_signature()), list(signature.individuals))
+        self.assertEqual(signature.counts, {"classes": 3, "object_properties": 1, "data_properties": 0,
+                                            "individuals": 6})
+
+        ind = OWLNamedIndividual(IRI.create("http://example.com/father#", "zoe"))
+        onto.add_axiom(OWLClassAssertionAxiom(ind, OWLClass(IRI.create("http://example.com/father#", "female"))))
+        updated = onto.signature()
+        self.assertEqual(updated.revision, onto.revision)
+        self.assertEqual(set(updated.individuals), set(signature.individuals) | {ind})
+        # entities of the previous signature are reused
+        self.assertTrue(all(any(e is u for u in updated.individuals) for e in signature.individuals))
+        self.assertEqual(updated.classes, signature.classes)
+
+    def test_statistics(self):
+        """Test counting the triples, axioms and entities of an ontology."""
+        expected = {"Declaration": 10, "SubClassOf": 3, "ObjectPropertyDomain": 1, "ObjectPropertyRange": 1,
+                    "ClassAssertion": 6, "ObjectPropertyAssertion": 4}
+        onto = Ontology("KGs/Family/father.owl")
+        statistics = onto.statistics()
+        self.assertEqual(len(onto), len(list(onto._onto.get_triples())))
+        self.assertEqual(dict(statistics.axioms_per_type), expected)
+        self.assertEqual(statistics.axioms, 25)
+        self.assertEqual(dict(statistics.entities), onto.signature().counts)
+        self.assertIs(onto.statistics(), statistics)
+
+        onto.add_axiom(OWLClassAssertionAxiom(OWLNamedIndividual(IRI.create("http://example.com/father#", "zoe")),
+                                              OWLClass(IRI.create("http://example.com/father#", "female"))))
+        updated = onto.statistics()
+        self.assertEqual(updated.axioms_per_type["ClassAssertion"], 7)
+        self.assertEqual(updated.entities["individuals"], 7)
+        self.assertEqual(len(onto), len(list(onto._onto.get_triples())))
+
+        self.assertEqual(dict(SyncOntology("KGs/Family/father.owl").statistics().axioms_per_type), expected)
+
 
 class TestAxiomOperations(unittest.TestCase):
     """Test axiom operations."""
@@ -273,6 +313,59 @@ class TestAxiomOperations(unittest.TestCase):
         self.assertNotIn(axiom, list(self.onto.get_abox_axioms()))
 
 
+class TestBulkAddAxioms(unittest.TestCase):
+    """Test adding axioms in bulk."""
+
+    ns = "http://example.com/test#"
+
+    def _axioms(self, n):
+        person = OWLClass(IRI.create(self.ns, "Person"))
+        knows = OWLObjectProperty(IRI.create(self.ns, "knows"))
+        has_age = OWLDataProperty(IRI.create(self.ns, "hasAge"))
+        for i in range(n):
+            ind = OWLNamedIndividual(IRI.create(self.ns, f"i{i}"))
+            yield OWLClassAssertionAxiom(ind, person)
+            yield OWLObjectPropertyAssertionAxiom(ind, knows, OWLNamedIndividual(IRI.create(self.ns, f"i{i + 1}")))
+            yield OWLDataPropertyAssertionAxiom(ind, has_age, OWLLiteral(i % 90))
+        yield OWLSubClassOfAxiom(OWLClass(IRI.create(self.ns, "Student")), person)
+
+    def test_bulk_add_axioms_sync(self):
+        onto = SyncOntology(self.ns, load=False)
+        stats = onto.bulk_add_axioms(self._axioms(100), chunk_size=30)
+        self.assertEqual(301, stats.axioms)
+        self.assertCountEqual(self._axioms(100), list(onto.get_abox_axioms()) + list(onto.get_tbox_axioms()))
+
+    def test_add_axiom_keeps_mapper_cache(self):
+        onto = SyncOntology(self.ns, load=False)
+        onto.add_axiom(list(self._axioms(10)))
+        size = onto.mapper.cache_info()['to_owlapi'].currsize
+        self.assertGreater(size, 0)
+        student = OWLSubClassOfAxiom(OWLClass(IRI.create(self.ns, "Student")), OWLClass(IRI.create(self.ns, "Person")))
+        onto.remove_axiom(student)
+        self.assertEqual(size, onto.mapper.cache_info()['to_owlapi'].currsize)
+        self.assertNotIn(student, list(onto.get_tbox_axioms()))
+        onto.add_axiom(student)
+        self.assertIn(student, list(onto.get_tbox_axioms()))
+
+    def test_bulk_add_axioms_owlready(self):
+        expected = Ontology(IRI.create("http://example.com/test"), load=False)
+        expected.add_axiom(self._axioms(100))
+        onto = Ontology(IRI.create("http://example.com/test"), load=False)
+        stats = onto.bulk_add_axioms(self._axioms(100), chunk_size=30)
+        self.assertEqual(301, stats.axioms)
+        self.assertEqual(expected.revision, onto.revision)
+        self.assertEqual(expected.changes_since(0), onto.changes_since(0))
+        self.assertCountEqual(expected.individuals_in_signature(), onto.individuals_in_signature())
+        self.assertCountEqual(expected.classes_in_signature(), onto.classes_in_signature())
+        self.assertEqual(len(expected), len(onto))
+        i5 = onto._world[self.ns + "i5"]
+        self.assertEqual(["Person"], [c.name for c in i5.is_a])
+        self.assertEqual(["i6"], [i.name for i in i5.knows])
+        self.assertEqual([5], i5.hasAge)
+        with self.assertRaises(ValueError):
+            onto.bulk_add_axioms(self._axioms(1), chunk_size=0)
+
+
 class TestOntologySaveLoad(unittest.TestCase):
     """Test saving and loading ontologies."""
 
@@ -344,6 +437,79 @@ class TestRDFLibOntology(unittest.TestCase):
 
         self.assertGreater(len(tbox) + len(abox), 0)
 
+    def test_rdflib_streaming(self):
+        """Test reading the axioms of an N-Triples file without keeping the graph in memory."""
+        import rdflib
+        import tempfile
+
+        onto = RDFLibOntology("KGs/Family/father.owl")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "father.nt")
+            graph = rdflib.Graph().parse("KGs/Family/father.owl")
+            graph.add((rdflib.URIRef("http://example.com/father#anna"), rdflib.URIRef("http://example.com/father#age"),
+                       rdflib.Literal(42)))
+            graph.serialize(path, format="nt", encoding="utf-8")
+            streamed = RDFLibOntology(path, streaming=True)
+
+            self.assertIsNone(streamed.rdflib_graph)
+            self.assertEqual(len(graph), len(streamed))
+            # the number of triples is counted once while the signature is read
+            with patch('owlapy.owl_ontology._stream_ntriples', side_effect=AssertionError):
+                self.assertEqual(len(graph), len(streamed))
+            self.assertEqual(set(onto.get_tbox_axioms()), set(streamed.get_tbox_axioms()))
+            abox = set(streamed.get_abox_axioms())
+            self.assertIn(OWLDataPropertyAssertionAxiom(OWLNamedIndividual("http://example.com/father#anna"),
+                                                        OWLDataProperty("http://example.com/father#age"),
+                                                        OWLLiteral(42)), abox)
+            self.assertEqual(set(onto.get_abox_axioms()), {ax for ax in abox
+                                                           if not isinstance(ax, OWLDataPropertyAssertionAxiom)})
+            self.assertCountEqual(onto.classes_in_signature(), streamed.classes_in_signature())
+            self.assertCountEqual(onto.individuals_in_signature(), streamed.individuals_in_signature())
+        with self.assertRaises(ValueError):
+            RDFLibOntology("KGs/Family/father.owl", streaming=True)
+
+
+class TestOntologyAxiomStreams(unittest.TestCase):
+    """Test streaming the axioms of an Ontology from the quadstore."""
+
+    def test_father(self):
+        onto = Ontology("KGs/Family/father.owl")
+        abox = set(onto.get_abox_axioms())
+        self.assertEqual(abox, set(RDFLibOntology("KGs/Family/father.owl").get_abox_axioms()))
+        self.assertEqual(list(onto.get_abox_axioms(batch_size=1)), list(onto.get_abox_axioms()))
+        self.assertEqual(set(onto.get_abox_axioms_between_individuals()),
+                         {ax for ax in abox if isinstance(ax, OWLObjectPropertyAssertionAxiom)})
+        self.assertEqual(set(onto.get_abox_axioms_between_individuals_and_classes()),
+                         {ax for ax in abox if isinstance(ax, OWLClassAssertionAxiom)})
+        ns = "http://example.com/father#"
+        person, has_child = OWLClass(IRI.create(ns, "person")), OWLObjectProperty(IRI.create(ns, "hasChild"))
+        self.assertEqual(set(onto.get_tbox_axioms()),
+                         {OWLSubClassOfAxiom(OWLClass(IRI.create(ns, "male")), person),
+                          OWLSubClassOfAxiom(OWLClass(IRI.create(ns, "female")), person),
+                          OWLSubClassOfAxiom(person, OWLClass(IRI.create("http://www.w3.org/2002/07/owl#", "Thing"))),
+                          OWLObjectPropertyDomainAxiom(has_child, person),
+                          OWLObjectPropertyRangeAxiom(has_child, person)})
+        with self.assertRaises(ValueError):
+            next(iter(onto.get_abox_axioms(batch_size=0)))
+
+    def test_added_axioms(self):
+        ns = "http://example.com/stream#"
+        a, b, c = (OWLClass(IRI.create(ns, n)) for n in "ABC")
+        p, d = OWLObjectProperty(IRI.create(ns, "p")), OWLDataProperty(IRI.create(ns, "d"))
+        i, j, k = (OWLNamedIndividual(IRI.create(ns, n)) for n in "ijk")
+        tbox = [OWLSubClassOfAxiom(a, OWLObjectSomeValuesFrom(p, b)), OWLEquivalentClassesAxiom([c, OWLObjectUnionOf([a, b])]),
+                OWLDisjointClassesAxiom([a, b]), OWLDisjointClassesAxiom([a, b, c]), OWLObjectPropertyDomainAxiom(p, a),
+                OWLObjectPropertyRangeAxiom(p, b), OWLDataPropertyRangeAxiom(d, IntegerOWLDatatype),
+                OWLFunctionalObjectPropertyAxiom(p), OWLFunctionalDataPropertyAxiom(d)]
+        abox = [OWLClassAssertionAxiom(i, a), OWLClassAssertionAxiom(j, OWLObjectSomeValuesFrom(p, b)),
+                OWLObjectPropertyAssertionAxiom(i, p, j), OWLDataPropertyAssertionAxiom(i, d, OWLLiteral(3)),
+                OWLSameIndividualAxiom([j, k]), OWLDifferentIndividualsAxiom([i, j])]
+        onto = Ontology(ns, load=False)
+        onto.add_axiom(tbox + abox)
+        self.assertEqual(set(onto.get_abox_axioms()), set(abox))
+        # owlready2 adds SubClassOf(C, owl:Thing) for new classes
+        self.assertLessEqual(set(tbox), set(onto.get_tbox_axioms()))
+
 
 class TestOntologyQueries(unittest.TestCase):
     """Test ontology query methods."""
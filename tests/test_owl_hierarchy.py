@@ -371,6 +371,49 @@ class TestClassHierarchy(unittest.TestCase):
         self.assertIn(self.person, items)
         self.assertIn(self.male, items)
 
+    def test_redundant_edges(self):
+        """Test that sub classes which are also reachable through another sub class are not direct."""
+        hierarchy_data = [
+            (self.person, [self.male, self.father]),
+            (self.male, [self.father]),
+            (self.father, [])
+        ]
+
+        hierarchy = ClassHierarchy(hierarchy_data)
+
+        self.assertEqual({self.male}, set(hierarchy.children(self.person, direct=True)))
+        self.assertEqual({self.male}, set(hierarchy.parents(self.father, direct=True)))
+        self.assertEqual({self.person, self.male}, set(hierarchy.parents(self.father, direct=False)))
+
+    def test_equivalent_classes_cycle(self):
+        """Test a hierarchy in which two classes are sub classes of each other."""
+        hierarchy_data = [
+            (self.person, [self.male]),
+            (self.male, [self.person, self.father]),
+            (self.father, [])
+        ]
+
+        hierarchy = ClassHierarchy(hierarchy_data)
+
+        self.assertEqual({self.person, self.male, self.father}, set(hierarchy.children(self.person, direct=False)))
+        self.assertEqual({self.person, self.male}, set(hierarchy.parents(self.father, direct=False)))
+        self.assertTrue(hierarchy.is_child_of(self.person, self.male))
+        self.assertTrue(hierarchy.is_child_of(self.male, self.person))
+
+    def test_deep_hierarchy(self):
+        """Test a chain of sub classes that is deeper than the recursion limit."""
+        chain = [OWLClass(IRI.create(self.ns, f"C{i}")) for i in range(2000)]
+        hierarchy_data = [(c, [sub]) for c, sub in zip(chain, chain[1:])] + [(chain[-1], [])]
+
+        hierarchy = ClassHierarchy(hierarchy_data)
+
+        self.assertEqual([chain[0]], list(hierarchy.roots()))
+        self.assertEqual([chain[-1]], list(hierarchy.leaves()))
+        self.assertEqual([chain[1]], list(hierarchy.children(chain[0], direct=True)))
+        self.assertEqual(len(chain) - 1, len(list(hierarchy.children(chain[0], direct=False))))
+        self.assertTrue(hierarchy.is_parent_of(chain[0], chain[-1]))
+        self.assertFalse(hierarchy.is_parent_of(chain[-1], chain[0]))
+
 
 class TestObjectPropertyHierarchy(unittest.TestCase):
     """Test object property hierarchy functionality."""
@@ -80,6 +80,24 @@ class TestOWLAPIMapper(unittest.TestCase):
         self.assertEqual(ce_1, ce)
         self.assertEqual(ce_2, ce)
 
+    def test_cache(self):
+        mapper = OWLAPIMapper()
+        ce = OWLObjectIntersectionOf([self.c, OWLObjectSomeValuesFrom(self.op, OWLThing)])
+        owlapi_ce = mapper.map_(ce)
+        self.assertIs(owlapi_ce, mapper.map_(ce))
+        self.assertEqual(mapper.cache_info()['to_owlapi'].hits, 1)
+        self.assertIs(mapper.map_(owlapi_ce), mapper.map_(owlapi_ce))
+        self.assertEqual(mapper.cache_info()['from_owlapi'].hits, 1)
+        self.assertEqual(mapper.map_(owlapi_ce), ce)
+
+        mapper.cache_clear()
+        self.assertEqual(mapper.cache_info()['to_owlapi'].currsize, 0)
+        self.assertEqual(mapper.map_(ce), owlapi_ce)
+
+        uncached_mapper = OWLAPIMapper(cache_size=0)
+        self.assertIsNone(uncached_mapper.cache_info())
+        self.assertEqual(uncached_mapper.map_(ce), owlapi_ce)
+
     def test_entity_mapping(self):
 
         iri = IRI.create(self.test_ns + "test")
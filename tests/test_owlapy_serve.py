@@ -111,3 +111,24 @@ def test_infer_axioms_all(mock_stop_jvm):
                 expected_axioms.extend(reasoner.infer_axioms(inference_type.value))
         
         assert set(response.json()["inferred_axioms"]) == set([axiom.__str__() for axiom in expected_axioms])
+
+
+def test_concurrent_instances(mock_stop_jvm):
+    from concurrent.futures import ThreadPoolExecutor
+    with TestClient(create_app(ontology_path, reasoner_name, pool_size=2)) as client:
+        class_iris = ["http://www.benchmark.org/family#Child", "http://www.benchmark.org/family#Parent",
+                      "http://www.benchmark.org/family#Male", "http://www.benchmark.org/family#Female"]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            responses = list(executor.map(lambda iri: client.post("/instances", json={"class_iri": iri}), class_iris))
+        for class_iri, response in zip(class_iris, responses):
+            assert response.status_code == 200
+            expected_instances = {ind.__str__() for ind in reasoner.instances(OWLClass(class_iri), direct=False)}
+            assert set(response.json()["instances"]) == expected_instances
+
+
+def test_infer_axioms_all_parallel(mock_stop_jvm):
+    with TestClient(create_app(ontology_path, reasoner_name, infer_workers=4)) as client:
+        response = client.post("/infer_axioms", json={"inference_type": "all"})
+        assert response.status_code == 200
+        expected_axioms = reasoner.infer_axioms([it.value for it in InferenceType if it != InferenceType.All])
+        assert set(response.json()["inferred_axioms"]) == {axiom.__str__() for axiom in expected_axioms}
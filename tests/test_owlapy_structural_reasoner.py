@@ -1,4 +1,6 @@
 from datetime import date, datetime
+import os
+import tempfile
 import unittest
 
 from owlapy.class_expression import OWLObjectOneOf, OWLObjectSomeValuesFrom, OWLThing, OWLObjectComplementOf, \
@@ -6,7 +8,8 @@ from owlapy.class_expression import OWLObjectOneOf, OWLObjectSomeValuesFrom, OWL
     OWLDataOneOf, OWLDataSomeValuesFrom, OWLObjectExactCardinality, OWLObjectMaxCardinality, OWLObjectMinCardinality, \
     OWLObjectIntersectionOf
 from owlapy.iri import IRI
-from owlapy.owl_axiom import OWLSubDataPropertyOfAxiom, OWLInverseObjectPropertiesAxiom, OWLSubObjectPropertyOfAxiom
+from owlapy.owl_axiom import OWLSubDataPropertyOfAxiom, OWLInverseObjectPropertiesAxiom, OWLSubObjectPropertyOfAxiom, \
+    OWLClassAssertionAxiom, OWLObjectPropertyAssertionAxiom, OWLSubClassOfAxiom
 from owlapy.owl_data_ranges import OWLDataComplementOf, OWLDataIntersectionOf, OWLDataUnionOf
 from owlapy.owl_individual import OWLNamedIndividual
 from owlapy.owl_literal import DoubleOWLDatatype, OWLLiteral
@@ -14,6 +17,7 @@ from owlapy.owl_ontology import Ontology
 from owlapy.owl_property import OWLObjectInverseOf, OWLObjectProperty, OWLDataProperty
 from owlready2.prop import DataProperty
 
+from owlapy.owl_hierarchy import ClassHierarchy
 from owlapy.owl_reasoner import StructuralReasoner
 
 from owlapy.providers import owl_datatype_min_max_inclusive_restriction, owl_datatype_min_max_exclusive_restriction, \
@@ -378,9 +382,302 @@ class Owlapy_StructuralReasoner_Test(unittest.TestCase):
         self.assertEqual(parents_expr, parents)
         self.assertEqual(parents_expr_inverse, parents)
 
-        onto.remove_axiom(OWLSubObjectPropertyOfAxiom(has_child, super_has_child))
         onto.remove_axiom(OWLInverseObjectPropertiesAxiom(super_has_child, super_has_child_inverse))
 
+        # without a named inverse the inverses of the sub properties are used
+        reasoner = StructuralReasoner(onto, sub_properties=True)
+        children = frozenset(reasoner.instances(OWLObjectSomeValuesFrom(OWLObjectInverseOf(has_child), OWLThing)))
+        self.assertTrue(children)
+        self.assertEqual(
+            frozenset(reasoner.instances(OWLObjectSomeValuesFrom(OWLObjectInverseOf(super_has_child), OWLThing))),
+            children)
+        onto.remove_axiom(OWLSubObjectPropertyOfAxiom(has_child, super_has_child))
+
+
+    def test_bitset_retrieval(self):
+        ns = "http://example.com/father#"
+        onto = Ontology(IRI.create("file://KGs/Family/father.owl"))
+
+        male = OWLClass(IRI.create(ns, 'male'))
+        female = OWLClass(IRI.create(ns, 'female'))
+        has_child = OWLObjectProperty(IRI(ns, 'hasChild'))
+        anna = OWLNamedIndividual(IRI(ns, 'anna'))
+
+        reasoner = StructuralReasoner(onto)
+        bitset_reasoner = StructuralReasoner(onto, bitset_retrieval=True)
+
+        expressions = [
+            male,
+            OWLThing,
+            OWLNothing,
+            OWLObjectComplementOf(female),
+            OWLObjectIntersectionOf((male, OWLObjectSomeValuesFrom(property=has_child, filler=female))),
+            OWLObjectSomeValuesFrom(property=OWLObjectInverseOf(has_child), filler=female),
+            OWLObjectAllValuesFrom(property=has_child, filler=male),
+            OWLObjectHasValue(property=has_child, individual=anna),
+            OWLObjectOneOf((anna, OWLNamedIndividual(IRI(ns, 'heinz')))),
+            OWLObjectMinCardinality(cardinality=2, property=has_child, filler=OWLThing),
+            OWLObjectMaxCardinality(cardinality=1, property=has_child, filler=male),
+            OWLObjectExactCardinality(cardinality=1, property=has_child, filler=female),
+        ]
+        for ce in expressions:
+            self.assertEqual(frozenset(reasoner.instances(ce)), frozenset(bitset_reasoner.instances(ce)), ce)
+
+        no_cache_reasoner = StructuralReasoner(onto, class_cache=False, property_cache=False, bitset_retrieval=True)
+        for ce in expressions:
+            self.assertEqual(frozenset(reasoner.instances(ce)), frozenset(no_cache_reasoner.instances(ce)), ce)
+
+        # without the class cache the individual index is rebuilt per query, the property bitsets must follow it
+        property_cache_reasoner = StructuralReasoner(onto, class_cache=False, bitset_retrieval=True)
+        for ce in expressions:
+            self.assertEqual(frozenset(reasoner.instances(ce)), frozenset(property_cache_reasoner.instances(ce)), ce)
+        property_cache_reasoner._obj_prop_bits[has_child] = {0: 0}
+        property_cache_reasoner.instances(OWLObjectSomeValuesFrom(property=has_child, filler=female))
+        self.assertNotEqual(property_cache_reasoner._obj_prop_bits[has_child], {0: 0})
+
+
+    def test_expression_cache(self):
+        ns = "http://example.com/father#"
+        onto = Ontology(IRI.create("file://KGs/Family/father.owl"))
+
+        male = OWLClass(IRI.create(ns, 'male'))
+        female = OWLClass(IRI.create(ns, 'female'))
+        has_child = OWLObjectProperty(IRI(ns, 'hasChild'))
+        has_daughter = OWLObjectSomeValuesFrom(property=has_child, filler=female)
+
+        reasoner = StructuralReasoner(onto)
+        cached_reasoner = StructuralReasoner(onto, expression_cache=True, expression_cache_maxsize=2)
+        self.assertIsNone(reasoner.expression_cache_info())
+
+        expressions = [OWLObjectIntersectionOf((male, has_daughter)),
+                       OWLObjectIntersectionOf((female, has_daughter)),
+                       OWLObjectComplementOf(has_daughter)]
+        for ce in expressions:
+            self.assertEqual(frozenset(reasoner.instances(ce)), frozenset(cached_reasoner.instances(ce)))
+        info = cached_reasoner.expression_cache_info()
+        self.assertEqual(info.hits, 2)
+        self.assertEqual(info.currsize, 2)
+
+        cached_reasoner = StructuralReasoner(onto, expression_cache=True, expression_cache_maxsize=None,
+                                             expression_cache_maxbytes=1)
+        for ce in expressions:
+            self.assertEqual(frozenset(reasoner.instances(ce)), frozenset(cached_reasoner.instances(ce)))
+        self.assertEqual(cached_reasoner.expression_cache_info().currsize, 1)
+
+
+    def test_incremental_cache_invalidation(self):
+        ns = "http://example.com/father#"
+        onto = Ontology(IRI.create("file://KGs/Family/father.owl"))
+
+        male = OWLClass(IRI.create(ns, 'male'))
+        female = OWLClass(IRI.create(ns, 'female'))
+        has_child = OWLObjectProperty(IRI(ns, 'hasChild'))
+        anna = OWLNamedIndividual(IRI(ns, 'anna'))
+        heinz = OWLNamedIndividual(IRI(ns, 'heinz'))
+        lisa = OWLNamedIndividual(IRI(ns, 'lisa'))
+        has_daughter = OWLObjectSomeValuesFrom(property=has_child, filler=female)
+
+        reasoner = StructuralReasoner(onto, expression_cache=True)
+        females = frozenset(reasoner.instances(female))
+        individuals = frozenset(reasoner.instances(OWLThing))
+        parents_of_daughters = frozenset(reasoner.instances(has_daughter))
+        revision = onto.revision
+
+        onto.add_axiom(OWLClassAssertionAxiom(lisa, female))
+        onto.add_axiom(OWLObjectPropertyAssertionAxiom(heinz, has_child, lisa))
+        changes = onto.changes_since(revision)
+        self.assertEqual(len(changes), 2)
+        self.assertTrue(all(ch.added for ch in changes))
+        self.assertEqual(changes[0].entities, frozenset({lisa, female}))
+
+        self.assertEqual(frozenset(reasoner.instances(female)), females | {lisa})
+        self.assertEqual(frozenset(reasoner.instances(OWLThing)), individuals | {lisa})
+        self.assertEqual(frozenset(reasoner.instances(has_daughter)), parents_of_daughters | {heinz})
+        self.assertTrue(reasoner.class_cache)
+        self.assertTrue(reasoner._property_cache)
+
+        onto.remove_axiom(OWLObjectPropertyAssertionAxiom(heinz, has_child, lisa))
+        self.assertEqual(frozenset(reasoner.instances(has_daughter)), parents_of_daughters)
+
+        # changes to the TBox reset all caches but keep them enabled
+        male_parents = OWLObjectIntersectionOf((male, OWLObjectSomeValuesFrom(property=has_child, filler=OWLThing)))
+        self.assertNotIn(anna, frozenset(reasoner.instances(male_parents)))
+        onto.add_axiom(OWLSubClassOfAxiom(female, male))
+        self.assertIn(anna, frozenset(reasoner.instances(male)))
+        self.assertIn(anna, frozenset(reasoner.instances(male_parents)))
+        self.assertEqual(frozenset(reasoner.instances(male_parents)),
+                         frozenset(StructuralReasoner(onto).instances(male_parents)))
+        self.assertTrue(reasoner.class_cache)
+        onto.remove_axiom(OWLSubClassOfAxiom(female, male))
+        onto.remove_axiom(OWLClassAssertionAxiom(lisa, female))
+
+
+    def test_instances_batch(self):
+        ns = "http://example.com/father#"
+        onto = Ontology(IRI.create("file://KGs/Family/father.owl"))
+
+        male = OWLClass(IRI.create(ns, 'male'))
+        female = OWLClass(IRI.create(ns, 'female'))
+        has_child = OWLObjectProperty(IRI(ns, 'hasChild'))
+        has_daughter = OWLObjectSomeValuesFrom(property=has_child, filler=female)
+        expressions = [OWLObjectIntersectionOf((male, has_daughter)),
+                       OWLObjectIntersectionOf((female, has_daughter)),
+                       OWLObjectComplementOf(has_daughter),
+                       male,
+                       OWLObjectIntersectionOf((male, has_daughter))]
+
+        for reasoner in (StructuralReasoner(onto), StructuralReasoner(onto, bitset_retrieval=True),
+                         StructuralReasoner(onto, class_cache=False, property_cache=False)):
+            expected = [frozenset(reasoner.instances(ce)) for ce in expressions]
+            self.assertEqual(reasoner.instances_batch(expressions), expected)
+            self.assertEqual(reasoner.count_instances_batch(expressions), [len(inds) for inds in expected])
+            self.assertIsNone(reasoner.expression_cache_info())
+
+    def test_timeout_waits_for_running_query(self):
+        ns = "http://example.com/father#"
+        onto = Ontology(IRI.create("file://KGs/Family/father.owl"))
+        male = OWLClass(IRI.create(ns, 'male'))
+        has_son = OWLObjectSomeValuesFrom(property=OWLObjectProperty(IRI(ns, 'hasChild')), filler=male)
+
+        for reasoner in (StructuralReasoner(onto), StructuralReasoner(onto, bitset_retrieval=True)):
+            expected = frozenset(StructuralReasoner(onto).instances(has_son))
+            # a query that still holds the caches makes the next one wait instead of running next to it
+            with reasoner._lock:
+                self.assertTrue(getattr(reasoner.instances(has_son, timeout=0.1), 'timed_out', False))
+                self.assertEqual(reasoner.count_instances_batch([has_son, male], timeout=0.1), [None, None])
+            self.assertEqual(frozenset(reasoner.instances(has_son)), expected)
+            self.assertEqual(reasoner.count_instances_batch([has_son, male]), [len(expected), 4])
+
+
+    def test_instances_parallel(self):
+        ns = "http://example.com/father#"
+        onto = Ontology(IRI.create("file://KGs/Family/father.owl"))
+
+        male = OWLClass(IRI.create(ns, 'male'))
+        female = OWLClass(IRI.create(ns, 'female'))
+        has_child = OWLObjectProperty(IRI(ns, 'hasChild'))
+        expressions = [male,
+                       OWLObjectIntersectionOf((male, OWLObjectSomeValuesFrom(property=has_child, filler=female))),
+                       OWLObjectSomeValuesFrom(property=OWLObjectInverseOf(has_child), filler=female),
+                       OWLObjectComplementOf(female),
+                       OWLObjectAllValuesFrom(property=has_child, filler=male),
+                       OWLObjectMaxCardinality(cardinality=1, property=has_child, filler=OWLThing),
+                       OWLObjectHasValue(property=has_child, individual=OWLNamedIndividual(IRI(ns, 'heinz')))]
+
+        reasoner = StructuralReasoner(onto)
+        try:
+            result = reasoner.instances_parallel(expressions, processes=2)
+            self.assertEqual(result, [frozenset(reasoner.instances(ce)) for ce in expressions])
+            # the worker pool is reused as long as the ontology is not modified
+            pool = reasoner._snapshot_pool
+            reasoner.instances_parallel(expressions[:2], processes=2)
+            self.assertIs(pool, reasoner._snapshot_pool)
+        finally:
+            reasoner.close_parallel_pool()
+
+
+    def test_csr_index(self):
+        ns = "http://example.com/father#"
+        onto = Ontology(IRI.create("file://KGs/Family/father.owl"))
+
+        male = OWLClass(IRI.create(ns, 'male'))
+        female = OWLClass(IRI.create(ns, 'female'))
+        has_child = OWLObjectProperty(IRI(ns, 'hasChild'))
+        expressions = [OWLObjectSomeValuesFrom(property=has_child, filler=female),
+                       OWLObjectSomeValuesFrom(property=OWLObjectInverseOf(has_child), filler=male),
+                       OWLObjectMinCardinality(cardinality=2, property=has_child, filler=OWLThing),
+                       OWLObjectMaxCardinality(cardinality=1, property=has_child, filler=male),
+                       OWLObjectExactCardinality(cardinality=1, property=has_child, filler=female),
+                       OWLObjectAllValuesFrom(property=has_child, filler=male)]
+
+        reasoner = StructuralReasoner(onto)
+        csr_reasoner = StructuralReasoner(onto, csr_index=True)
+        for ce in expressions:
+            self.assertEqual(frozenset(reasoner.instances(ce)), frozenset(csr_reasoner.instances(ce)), ce)
+
+        # assertions of the property invalidate the index
+        lisa = OWLNamedIndividual(IRI(ns, 'lisa'))
+        heinz = OWLNamedIndividual(IRI(ns, 'heinz'))
+        onto.add_axiom(OWLClassAssertionAxiom(lisa, female))
+        onto.add_axiom(OWLObjectPropertyAssertionAxiom(heinz, has_child, lisa))
+        for ce in expressions:
+            self.assertEqual(frozenset(reasoner.instances(ce)), frozenset(csr_reasoner.instances(ce)), ce)
+        onto.remove_axiom(OWLObjectPropertyAssertionAxiom(heinz, has_child, lisa))
+        onto.remove_axiom(OWLClassAssertionAxiom(lisa, female))
+
+    def test_data_columns(self):
+        NS = "http://dl-learner.org/mutagenesis#"
+        onto = Ontology(IRI.create("file://KGs/Mutagenesis/mutagenesis.owl"))
+
+        act = OWLDataProperty(IRI(NS, 'act'))
+        lumo = OWLDataProperty(IRI(NS, 'lumo'))
+        charge = OWLDataProperty(IRI(NS, 'charge'))
+        fused_rings = OWLDataProperty(IRI(NS, 'hasThreeOrMoreFusedRings'))
+        expressions = [OWLDataSomeValuesFrom(property=lumo,
+                                             filler=owl_datatype_min_max_inclusive_restriction(-3.0, -2.8)),
+                       OWLDataSomeValuesFrom(property=charge,
+                                             filler=owl_datatype_min_max_exclusive_restriction(-2.0, 0.88)),
+                       OWLDataSomeValuesFrom(property=charge, filler=owl_datatype_max_inclusive_restriction(-0.5)),
+                       OWLDataSomeValuesFrom(property=charge,
+                                             filler=OWLDataComplementOf(
+                                                 owl_datatype_min_max_exclusive_restriction(-2.0, 0.88))),
+                       OWLDataSomeValuesFrom(property=act, filler=OWLDataOneOf((OWLLiteral(2.11), OWLLiteral(-1.0)))),
+                       OWLDataHasValue(property=act, value=OWLLiteral(2.11)),
+                       OWLDataHasValue(property=fused_rings, value=OWLLiteral(True))]
+
+        reasoner = StructuralReasoner(onto)
+        columns_reasoner = StructuralReasoner(onto, data_columns=True)
+        for ce in expressions:
+            self.assertEqual(frozenset(reasoner.instances(ce)), frozenset(columns_reasoner.instances(ce)), ce)
+
+    def test_save_load_index(self):
+        ns = "http://example.com/father#"
+        onto = Ontology(IRI.create("file://KGs/Family/father.owl"))
+
+        male = OWLClass(IRI.create(ns, 'male'))
+        female = OWLClass(IRI.create(ns, 'female'))
+        person = OWLClass(IRI.create(ns, 'person'))
+        has_child = OWLObjectProperty(IRI(ns, 'hasChild'))
+        expressions = [male, female, OWLObjectSomeValuesFrom(property=has_child, filler=female),
+                       OWLObjectSomeValuesFrom(property=OWLObjectInverseOf(has_child), filler=male),
+                       OWLObjectAllValuesFrom(property=has_child, filler=male), OWLObjectComplementOf(male)]
+        reasoner = StructuralReasoner(onto)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'father.idx')
+            reasoner.save_index(path)
+
+            loaded_onto = Ontology(IRI.create("file://KGs/Family/father.owl"))
+            loaded = StructuralReasoner(loaded_onto)
+            self.assertTrue(loaded.load_index(path))
+            for ce in expressions:
+                self.assertEqual(frozenset(reasoner.instances(ce)), frozenset(loaded.instances(ce)), ce)
+            self.assertEqual(set(reasoner.sub_classes(person, direct=True)),
+                             set(loaded.sub_classes(person, direct=True)))
+            self.assertEqual(set(reasoner.super_classes(male, direct=True)),
+                             set(loaded.super_classes(male, direct=True)))
+
+            # changes to the ontology drop the index
+            anna = OWLNamedIndividual(IRI(ns, 'anna'))
+            loaded_onto.add_axiom(OWLClassAssertionAxiom(anna, male))
+            self.assertIn(anna, frozenset(loaded.instances(male)))
+
+            # indexes of other ontologies or configurations are rejected
+            self.assertFalse(StructuralReasoner(loaded_onto).load_index(path))
+            self.assertFalse(StructuralReasoner(onto, sub_properties=True).load_index(path))
+            self.assertFalse(StructuralReasoner(onto).load_index(os.path.join(tmp, 'missing.idx')))
+
+    def test_class_hierarchy_down(self):
+        onto = Ontology(IRI.create("file://KGs/Family/father.owl"))
+        reasoner = StructuralReasoner(onto)
+
+        expected = {c: set(reasoner.sub_classes(c, direct=True)) for c in onto.classes_in_signature()}
+        self.assertEqual(expected, {c: set(subs) for c, subs in reasoner.class_hierarchy_down()})
+
+        hierarchy = ClassHierarchy(reasoner)
+        for c in onto.classes_in_signature():
+            self.assertEqual(set(reasoner.sub_classes(c, direct=False)), set(hierarchy.sub_classes(c, direct=False)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,158 @@
+import io
+import unittest
+
+import rdflib
+import rdflib.collection
+from rdflib.compare import isomorphic
+
+from owlapy.class_expression import OWLClass, OWLThing, OWLObjectSomeValuesFrom, OWLObjectIntersectionOf, \
+    OWLObjectMaxCardinality, OWLObjectMinCardinality, OWLDataSomeValuesFrom
+from owlapy.owl_axiom import OWLClassAssertionAxiom, OWLSubClassOfAxiom, OWLDisjointClassesAxiom, \
+    OWLEquivalentClassesAxiom, OWLInverseObjectPropertiesAxiom, OWLObjectPropertyAssertionAxiom, \
+    OWLDataPropertyAssertionAxiom, OWLTransitiveObjectPropertyAxiom, OWLSubObjectPropertyOfAxiom, \
+    OWLDeclarationAxiom, OWLAnnotation, OWLAnnotationProperty, OWLAnnotationAssertionAxiom, \
+    OWLDataPropertyRangeAxiom, OWLNegativeObjectPropertyAssertionAxiom
+from owlapy.owl_data_ranges import OWLDataUnionOf
+from owlapy.owl_individual import OWLNamedIndividual
+from owlapy.owl_literal import OWLLiteral, IntegerOWLDatatype, DoubleOWLDatatype
+from owlapy.owl_property import OWLObjectProperty, OWLDataProperty
+from owlapy.providers import owl_datatype_min_inclusive_restriction
+from owlapy.owl_datatype import OWLDatatype
+from owlapy.rdf_writer import RDFStreamWriter, LexicalLiteral
+
+NS = "http://example.com/writer#"
+A, B, C = OWLClass(NS + "A"), OWLClass(NS + "B"), OWLClass(NS + "C")
+i, j = OWLNamedIndividual(NS + "i"), OWLNamedIndividual(NS + "j.1")
+r, s = OWLObjectProperty(NS + "r"), OWLObjectProperty(NS + "s")
+d = OWLDataProperty(NS + "d")
+
+
+class TestRDFStreamWriter(unittest.TestCase):
+    axioms = [OWLDeclarationAxiom(A), OWLClassAssertionAxiom(i, A), OWLClassAssertionAxiom(i, OWLThing),
+              OWLSubClassOfAxiom(A, B), OWLDisjointClassesAxiom([A, B]), OWLDisjointClassesAxiom([A, B, C]),
+              OWLEquivalentClassesAxiom([A, B, C]), OWLInverseObjectPropertiesAxiom(r, s),
+              OWLObjectPropertyAssertionAxiom(i, r, j), OWLObjectPropertyAssertionAxiom(i, s.get_inverse_property(), j),
+              OWLDataPropertyAssertionAxiom(i, d, OWLLiteral('say "hi"\n')),
+              OWLDataPropertyAssertionAxiom(i, d, OWLLiteral(1.5)),
+              OWLTransitiveObjectPropertyAxiom(r), OWLSubObjectPropertyOfAxiom(s.get_inverse_property(), r)]
+
+    def _write(self, rdf_format):
+        out = io.StringIO()
+        writer = RDFStreamWriter(out, rdf_format, prefixes={"ex": NS})
+        self.assertEqual(writer.write_all(self.axioms), len(self.axioms))
+        graph = rdflib.Graph()
+        graph.parse(data=out.getvalue(), format="nt" if rdf_format == "nt" else "turtle")
+        self.assertEqual(len(graph), writer.triples)
+        return graph
+
+    def test_ntriples(self):
+        graph = self._write("nt")
+        ex = rdflib.Namespace(NS)
+        self.assertIn((ex.i, rdflib.RDF.type, ex.A), graph)
+        self.assertIn((ex.i, rdflib.RDF.type, rdflib.OWL.Thing), graph)
+        self.assertIn((ex.A, rdflib.RDFS.subClassOf, ex.B), graph)
+        self.assertIn((ex.A, rdflib.OWL.disjointWith, ex.B), graph)
+        self.assertIn((ex.i, ex.r, ex["j.1"]), graph)
+        self.assertIn((ex["j.1"], ex.s, ex.i), graph)
+        self.assertIn((ex.i, ex.d, rdflib.Literal('say "hi"\n', datatype=rdflib.XSD.string)), graph)
+        self.assertIn((ex.i, ex.d, rdflib.Literal("1.5", datatype=rdflib.XSD.double)), graph)
+        self.assertEqual(len(list(graph.subjects(rdflib.RDF.type, rdflib.OWL.AllDisjointClasses))), 1)
+        self.assertEqual(len(list(graph.subject_objects(rdflib.OWL.equivalentClass))), 2)
+
+    def test_turtle(self):
+        self.assertTrue(isomorphic(self._write("ttl"), self._write("nt")))
+
+    def test_class_expressions(self):
+        axioms = [OWLSubClassOfAxiom(A, OWLObjectSomeValuesFrom(r, OWLObjectIntersectionOf(
+                      [B, C.get_object_complement_of()]))),
+                  OWLSubClassOfAxiom(B, OWLObjectMaxCardinality(3, r, OWLThing)),
+                  OWLEquivalentClassesAxiom([C, OWLObjectMinCardinality(2, s.get_inverse_property(), B)]),
+                  OWLSubClassOfAxiom(C, OWLDataSomeValuesFrom(d, owl_datatype_min_inclusive_restriction(5))),
+                  OWLDataPropertyRangeAxiom(d, OWLDataUnionOf([IntegerOWLDatatype, DoubleOWLDatatype])),
+                  OWLNegativeObjectPropertyAssertionAxiom(i, r, j)]
+        out = io.StringIO()
+        writer = RDFStreamWriter(out, "nt")
+        writer.write_all(axioms)
+        graph = rdflib.Graph()
+        graph.parse(data=out.getvalue(), format="nt")
+        self.assertEqual(len(graph), writer.triples)
+        ex, owl = rdflib.Namespace(NS), rdflib.OWL
+        some = graph.value(ex.A, rdflib.RDFS.subClassOf)
+        self.assertEqual(graph.value(some, owl.onProperty), ex.r)
+        operands = list(rdflib.collection.Collection(graph, graph.value(graph.value(some, owl.someValuesFrom),
+                                                                         owl.intersectionOf)))
+        self.assertEqual(operands[0], ex.B)
+        self.assertEqual(graph.value(operands[1], owl.complementOf), ex.C)
+        max_card = graph.value(ex.B, rdflib.RDFS.subClassOf)
+        self.assertEqual(graph.value(max_card, owl.maxCardinality).toPython(), 3)
+        min_card = graph.value(ex.C, owl.equivalentClass)
+        self.assertEqual(graph.value(min_card, owl.minQualifiedCardinality).toPython(), 2)
+        self.assertEqual(graph.value(min_card, owl.onClass), ex.B)
+        self.assertEqual(graph.value(graph.value(min_card, owl.onProperty), owl.inverseOf), ex.s)
+        restriction = graph.value(graph.value(ex.C, rdflib.RDFS.subClassOf), owl.someValuesFrom)
+        self.assertEqual(graph.value(restriction, owl.onDatatype), rdflib.XSD.integer)
+        facet = rdflib.collection.Collection(graph, graph.value(restriction, owl.withRestrictions))[0]
+        self.assertEqual(graph.value(facet, rdflib.XSD.minInclusive).toPython(), 5)
+        self.assertEqual(list(rdflib.collection.Collection(graph, graph.value(graph.value(ex.d, rdflib.RDFS.range),
+                                                                              owl.unionOf))),
+                         [rdflib.XSD.integer, rdflib.XSD.double])
+        negative = graph.value(predicate=rdflib.RDF.type, object=owl.NegativePropertyAssertion)
+        self.assertEqual(graph.value(negative, owl.targetIndividual), ex["j.1"])
+
+    def test_annotations(self):
+        note = OWLAnnotationProperty(NS + "note")
+        out = io.StringIO()
+        writer = RDFStreamWriter(out, "nt")
+        writer.write(OWLSubClassOfAxiom(A, B, [OWLAnnotation(note, OWLLiteral("x"))]))
+        writer.write(OWLDisjointClassesAxiom([A, B, C], [OWLAnnotation(note, OWLLiteral("y"))]))
+        writer.write(OWLAnnotationAssertionAxiom(A.iri, OWLAnnotation(note, OWLLiteral("z"))))
+        graph = rdflib.Graph()
+        graph.parse(data=out.getvalue(), format="nt")
+        ex, owl = rdflib.Namespace(NS), rdflib.OWL
+        self.assertIn((ex.A, rdflib.RDFS.subClassOf, ex.B), graph)
+        axiom = graph.value(predicate=rdflib.RDF.type, object=owl.Axiom)
+        self.assertEqual(graph.value(axiom, owl.annotatedSource), ex.A)
+        self.assertEqual(graph.value(axiom, owl.annotatedProperty), rdflib.RDFS.subClassOf)
+        self.assertEqual(graph.value(axiom, owl.annotatedTarget), ex.B)
+        self.assertEqual(graph.value(axiom, ex.note).toPython(), "x")
+        disjoint = graph.value(predicate=rdflib.RDF.type, object=owl.AllDisjointClasses)
+        self.assertEqual(graph.value(disjoint, ex.note).toPython(), "y")
+        self.assertEqual(graph.value(ex.A, ex.note).toPython(), "z")
+
+    def test_nquads(self):
+        out = io.StringIO()
+        writer = RDFStreamWriter(out, "nquads", graph="http://example.com/writer")
+        writer.write_all(self.axioms)
+        dataset = rdflib.Dataset()
+        dataset.parse(data=out.getvalue(), format="nquads")
+        graph = dataset.graph(rdflib.URIRef("http://example.com/writer"))
+        self.assertEqual(len(graph), writer.triples)
+        self.assertTrue(isomorphic(graph, self._write("nt")))
+
+    def test_lexical_literals(self):
+        xsd = "http://www.w3.org/2001/XMLSchema#"
+        literals = [LexicalLiteral("2020-01-01T10:00:00", OWLDatatype(xsd + "dateTime")),
+                    LexicalLiteral("1.50", OWLDatatype(xsd + "decimal")),
+                    LexicalLiteral("007", OWLDatatype(xsd + "short")),
+                    LexicalLiteral("x", OWLDatatype(NS + "custom")),
+                    LexicalLiteral('"hallo"', OWLDatatype("http://www.w3.org/1999/02/22-rdf-syntax-ns#langString"),
+                                   "de")]
+        out = io.StringIO()
+        writer = RDFStreamWriter(out, "nt")
+        writer.write_all(OWLDataPropertyAssertionAxiom(i, d, lit) for lit in literals)
+        graph = rdflib.Graph()
+        graph.parse(data=out.getvalue(), format="nt")
+        # the lexical forms are kept, rdflib compares literals by lexical form and datatype
+        self.assertEqual(set(graph.objects(rdflib.URIRef(NS + "i"), rdflib.URIRef(NS + "d"))),
+                         {rdflib.Literal("2020-01-01T10:00:00", datatype=rdflib.XSD.dateTime),
+                          rdflib.Literal("1.50", datatype=rdflib.XSD.decimal),
+                          rdflib.Literal("007", datatype=rdflib.XSD.short),
+                          rdflib.Literal("x", datatype=rdflib.URIRef(NS + "custom")),
+                          rdflib.Literal('"hallo"', lang="de")})
+
+    def test_unsupported(self):
+        with self.assertRaises(ValueError):
+            RDFStreamWriter(io.StringIO(), "rdf/xml")
+
+if __name__ == '__main__':
+    unittest.main()
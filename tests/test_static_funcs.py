@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from owlapy.static_funcs import _jvm_classpath, _jvm_options
+
+
+class TestJVMStartup(unittest.TestCase):
+    jars = ["owlapi-distribution-5.1.9.jar", "guava-22.0.jar", "org.semanticweb.hermit-1.4.3.517.jar",
+            "automaton-1.11-8.jar", "elk-owlapi-0.6.0.jar", "elk-reasoner-0.6.0.jar", "jfact-5.0.3.jar",
+            "openllet-core-2.6.5.jar", "jgrapht-core-1.2.0.jar"]
+
+    def _classpath(self, reasoners):
+        with tempfile.TemporaryDirectory() as folder:
+            for jar in self.jars + ["README.txt"]:
+                open(os.path.join(folder, jar), "w").close()
+            return [os.path.basename(p) for p in _jvm_classpath(folder, reasoners)]
+
+    def test_classpath(self):
+        self.assertEqual(self._classpath(None), sorted(self.jars))
+        self.assertEqual(self._classpath(["ELK"]), ["elk-owlapi-0.6.0.jar", "elk-reasoner-0.6.0.jar",
+                                                    "guava-22.0.jar", "owlapi-distribution-5.1.9.jar"])
+        self.assertEqual(self._classpath(["HermiT", "Pellet"]),
+                         ["automaton-1.11-8.jar", "guava-22.0.jar", "jgrapht-core-1.2.0.jar",
+                          "openllet-core-2.6.5.jar", "org.semanticweb.hermit-1.4.3.517.jar",
+                          "owlapi-distribution-5.1.9.jar"])
+        self.assertEqual(self._classpath(["Structural"]), ["guava-22.0.jar", "owlapi-distribution-5.1.9.jar"])
+        with self.assertRaises(ValueError):
+            self._classpath(["Konclude"])
+
+    def test_options(self):
+        with patch.dict(os.environ, {"OWLAPY_JVM_OPTIONS": "-Xmx2g -Dname='a b'"}):
+            self.assertEqual(_jvm_options(["-Xmx4g"]), ["-Xmx2g", "-Dname=a b", "-Xmx4g"])
+        with patch.dict(os.environ, {"OWLAPY_JVM_OPTIONS": ""}), tempfile.TemporaryDirectory() as folder:
+            archive = os.path.join(folder, "owlapy.jsa")
+            self.assertEqual(_jvm_options(None, archive), [f"-XX:ArchiveClassesAtExit={archive}"])
+            open(archive, "w").close()
+            self.assertEqual(_jvm_options(None, archive), [f"-XX:SharedArchiveFile={archive}"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,15 +10,23 @@ Formats are split into two groups:
 OWL API–backed
     Written directly by OWL API's built-in storers.
 
+Streamed
+    Written in one pass from the axioms by owlapy.rdf_writer.  These
+    are: ntriples / nt, nt11, nquads / nq. Literals are written with
+    their lexical form and datatype.
+
 rdflib-backed
     Written by first dumping to a temporary RDF/XML file via OWL API,
     then re-serialising with rdflib.  These are: turtle2, json-ld /
-    jsonld, ntriples / nt, nt11, n3, trig, trix, nquads / nq.
+    jsonld, n3, trig, trix.
 """
 import glob
 import os
 import unittest
 
+import rdflib
+from rdflib.compare import isomorphic
+
 from owlapy.owl_ontology import SyncOntology
 
 _HERE = os.path.dirname(os.path.abspath(__file__))
@@ -75,6 +83,17 @@ class TestSyncOntologySaveFormats(unittest.TestCase):
         self.assertEqual(self.expected_tbox, tbox,
                          f"TBox count mismatch after roundtrip ({path})")
 
+    def _assert_same_graph(self, path: str, rdf_format: str):
+        """Parse file with rdflib and compare it to the RDF/XML serialisation of the source."""
+        expected_path = _out("father_expected.owl")
+        self.source.save(path=expected_path, document_format="rdfxml")
+        expected = rdflib.Graph().parse(expected_path, format="xml")
+        actual = rdflib.Graph()
+        for triple in rdflib.Dataset().parse(path, format=rdf_format).quads((None, None, None, None)):
+            actual.add(triple[:3])
+        self.assertTrue(isomorphic(expected, actual),
+                        f"Graph differs from the RDF/XML serialisation ({path})")
+
     # ==================================================================
     # OWL API–backed formats
     # ==================================================================
@@ -182,10 +201,11 @@ class TestSyncOntologySaveFormats(unittest.TestCase):
         self._assert_file_exists_and_nonempty(path)
 
     def test_save_ntriples(self):
-        """N-Triples via rdflib ('ntriples' key)."""
+        """N-Triples written directly from the axioms ('ntriples' key)."""
         path = _out("father_ntriples.nt")
         self.source.save(path=path, document_format="ntriples")
         self._assert_file_exists_and_nonempty(path)
+        self._assert_same_graph(path, "nt")
 
     def test_save_nt_alias(self):
         """Alias 'nt' for N-Triples via rdflib."""
@@ -218,10 +238,11 @@ class TestSyncOntologySaveFormats(unittest.TestCase):
         self._assert_file_exists_and_nonempty(path)
 
     def test_save_nquads(self):
-        """N-Quads via rdflib ('nquads' key)."""
+        """N-Quads written directly from the axioms ('nquads' key)."""
         path = _out("father_nquads.nq")
         self.source.save(path=path, document_format="nquads")
         self._assert_file_exists_and_nonempty(path)
+        self._assert_same_graph(path, "nquads")
 
     def test_save_nq_alias(self):
         """Alias 'nq' for N-Quads via rdflib."""
@@ -281,6 +302,30 @@ class TestSyncOntologySaveFormats(unittest.TestCase):
         self.assertEqual(set(), leftover,
                          f"Temp file(s) not cleaned up: {leftover}")
 
+    def test_save_ntriples_keeps_literals(self):
+        """Literals keep their lexical form and datatype when written directly."""
+        ex = rdflib.Namespace("http://example.com/literals#")
+        source = rdflib.Graph()
+        source.add((ex.Onto, rdflib.RDF.type, rdflib.OWL.Ontology))
+        source.add((ex.d, rdflib.RDF.type, rdflib.OWL.DatatypeProperty))
+        source.add((ex.i, rdflib.RDF.type, rdflib.OWL.NamedIndividual))
+        source.add((ex.i, ex.d, rdflib.Literal("2020-01-01T10:00:00", datatype=rdflib.XSD.dateTime)))
+        source.add((ex.i, ex.d, rdflib.Literal("1.50", datatype=rdflib.XSD.decimal)))
+        source_path = _out("literals_source.owl")
+        source.serialize(source_path, format="xml")
+        onto = SyncOntology(source_path)
+        for document_format, rdf_format in (("ntriples", "nt"), ("nquads", "nquads")):
+            path = _out(f"literals_{document_format}.{rdf_format[:2]}")
+            onto.save(path=path, document_format=document_format)
+            actual = rdflib.Graph()
+            for triple in rdflib.Dataset().parse(path, format=rdf_format).quads((None, None, None, None)):
+                actual.add(triple[:3])
+            self.assertEqual(set(actual.objects(ex.i, ex.d)), set(source.objects(ex.i, ex.d)))
+            # the same graph as the OWL API serialisation
+            expected_path = _out("literals_expected.owl")
+            onto.save(path=expected_path, document_format="rdfxml")
+            self.assertTrue(isomorphic(rdflib.Graph().parse(expected_path, format="xml"), actual))
+
 
 if __name__ == "__main__":
     unittest.main()
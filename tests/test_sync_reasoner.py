@@ -1,5 +1,7 @@
 import os
+import tempfile
 import unittest
+from unittest.mock import patch
 
 from owlapy.class_expression import OWLClass, OWLDataSomeValuesFrom, OWLObjectIntersectionOf, OWLNothing, OWLThing, \
     OWLClassExpression, OWLObjectSomeValuesFrom, OWLObjectOneOf
@@ -9,9 +11,10 @@ from owlapy.owl_axiom import OWLDisjointClassesAxiom, OWLDeclarationAxiom, OWLCl
 from owlapy.owl_individual import OWLNamedIndividual
 from owlapy.owl_literal import OWLBottomObjectProperty, OWLTopObjectProperty, OWLBottomDataProperty, OWLTopDataProperty, \
     OWLLiteral
-from owlapy.owl_ontology import Ontology
+from owlapy.owl_ontology import Ontology, SyncOntology
 from owlapy.owl_property import OWLDataProperty, OWLObjectProperty
-from owlapy.owl_reasoner import SyncReasoner
+from owlapy.owl_reasoner import SyncReasoner, SyncReasonerPool, _owlapi_ontology_hash, _sync_ontology_key, \
+    set_openllet_incremental_consistency
 from owlapy.providers import owl_datatype_min_inclusive_restriction
 
 
@@ -337,6 +340,189 @@ class TestSyncReasoner(unittest.TestCase):
                   OWLSubObjectPropertyOfAxiom(sub_property=OWLObjectProperty(IRI('http://www.semanticweb.org/stefan/ontologies/2023/1/untitled-ontology-11#', 'r3')),super_property=OWLObjectProperty(IRI('http://www.semanticweb.org/stefan/ontologies/2023/1/untitled-ontology-11#', 'r4')),annotations=[]),
                   OWLSubObjectPropertyOfAxiom(sub_property=OWLObjectProperty(IRI('http://www.semanticweb.org/stefan/ontologies/2023/1/untitled-ontology-11#', 'r6')),super_property=OWLObjectProperty(IRI('http://www.w3.org/2002/07/owl#', 'topObjectProperty')),annotations=[])])
 
+    def test_bulk_retrieval(self):
+        from owlapy.owl_reasoner import _java_entity_iris, _java_simple_axioms
+        owlapi_reasoner = reasoner2._owlapi_reasoner
+        instances = owlapi_reasoner.getInstances(reasoner2.mapper.map_(OWLThing), False).getFlattened()
+        self.assertCountEqual(map(OWLNamedIndividual, _java_entity_iris(instances)),
+                              [reasoner2.mapper.map_(i) for i in instances])
+        types = owlapi_reasoner.getTypes(reasoner2.mapper.map_(c), False).getFlattened()
+        self.assertCountEqual(map(OWLClass, _java_entity_iris(types)), [reasoner2.mapper.map_(t) for t in types])
+
+        from org.semanticweb.owlapi.util import InferredClassAssertionAxiomGenerator
+        axioms = InferredClassAssertionAxiomGenerator().createAxioms(
+            reasoner2._owlapi_manager.getOWLDataFactory(), owlapi_reasoner)
+        self.assertCountEqual(_java_simple_axioms(axioms), [reasoner2.mapper.map_(ax) for ax in axioms])
+
+    def test_reasoner_pool(self):
+        pool = SyncReasonerPool(self.ontology_path, size=2)
+        self.assertEqual(len(pool), 2)
+        r1 = pool.checkout()
+        r2 = pool.checkout()
+        self.assertIsNot(r1, r2)
+        self.assertEqual(pool.available(), 0)
+        with self.assertRaises(TimeoutError):
+            pool.checkout(timeout=0.01)
+        pool.checkin(r1)
+        with pool.checked_out() as r:
+            self.assertIs(r, r1)
+            self.assertEqual(set(r.instances(self.nitrogen38)), set(self.reasoner.instances(self.nitrogen38)))
+        pool.checkin(r2)
+        self.assertEqual(pool.available(), 2)
+        pool.close()
+
+    def test_stream_inferred_axioms(self):
+        import io
+        import tempfile
+        import rdflib
+        from owlapy.rdf_writer import RDFStreamWriter
+        inference_types = ["InferredClassAssertionAxiomGenerator", "InferredSubObjectPropertyAxiomGenerator"]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "inferred.nt")
+            counts = reasoner2.stream_inferred_axioms(path, "nt", inference_types, shard=True)
+            streamed = rdflib.Graph()
+            for inference_type in inference_types:
+                streamed.parse(os.path.join(tmp, f"inferred_{inference_type}.nt"), format="nt")
+        axioms = list(reasoner2.infer_axioms(inference_types))
+        self.assertEqual(sum(counts.values()), len(axioms))
+        out = io.StringIO()
+        RDFStreamWriter(out).write_all(axioms)
+        self.assertEqual(set(streamed), set(rdflib.Graph().parse(data=out.getvalue(), format="nt")))
+
+    def test_infer_axioms_parallel(self):
+        inference_types = ["InferredClassAssertionAxiomGenerator", "InferredSubClassAxiomGenerator",
+                           "InferredDisjointClassesAxiomGenerator", "InferredSubObjectPropertyAxiomGenerator",
+                           "InferredObjectPropertyCharacteristicAxiomGenerator"]
+        sequential = list(reasoner2.infer_axioms(inference_types))
+        parallel = list(reasoner2.infer_axioms(inference_types, workers=3))
+        self.assertEqual(len(parallel), len(set(parallel)))
+        self.assertEqual(set(parallel), set(sequential))
+        self.assertCountEqual(reasoner2.infer_axioms("InferredSubObjectPropertyAxiomGenerator"),
+                              reasoner2.infer_axioms(["InferredSubObjectPropertyAxiomGenerator"]))
+
+    def test_infer_axioms_unique(self):
+        # the sub class generator is requested twice, so its axioms are inferred by two generators
+        inference_types = ["InferredSubClassAxiomGenerator", "InferredEquivalentClassAxiomGenerator",
+                           "InferredClassAssertionAxiomGenerator", "InferredSubClassAxiomGenerator"]
+        sequential = list(reasoner2.infer_axioms(inference_types, workers=1))
+        self.assertEqual(len(sequential), len(set(sequential)))
+        self.assertCountEqual(sequential, list(reasoner2.infer_axioms(inference_types, workers=2)))
+
+    def test_close(self):
+        reasoner = SyncReasoner("KGs/Test/test_ontology.owl")
+        list(reasoner.infer_axioms(["InferredClassAssertionAxiomGenerator", "InferredSubClassAxiomGenerator"],
+                                   workers=2))
+        infer_reasoners = list(reasoner._infer_reasoners)
+        self.assertEqual(len(infer_reasoners), 1)
+        reasoner.close()
+        self.assertIsNone(reasoner._owlapi_reasoner)
+        self.assertEqual(reasoner._infer_reasoners, [])
+        # closing twice does nothing
+        reasoner.close()
+
+    def test_flush(self):
+        for reasoner_name in ["HermiT", "Pellet"]:
+            onto = SyncOntology("KGs/Test/test_ontology.owl")
+            reasoner = SyncReasoner(onto, reasoner=reasoner_name, incremental=True)
+            new_ind = OWLNamedIndividual(IRI(NS, "new_individual"))
+            before = set(reasoner.instances(K))
+            self.assertFalse(reasoner.has_pending_changes())
+            onto.add_axiom(OWLClassAssertionAxiom(new_ind, K))
+            self.assertTrue(reasoner.has_pending_changes())
+            self.assertEqual(reasoner.pending_changes(), ({OWLClassAssertionAxiom(new_ind, K)}, set()))
+            self.assertEqual(set(reasoner.instances(K)), before)
+            reasoner.flush()
+            self.assertFalse(reasoner.has_pending_changes())
+            self.assertEqual(set(reasoner.instances(K)), before | {new_ind})
+            onto.remove_axiom(OWLClassAssertionAxiom(new_ind, K))
+            reasoner.flush(precompute=True)
+            self.assertEqual(set(reasoner.instances(K)), before)
+        set_openllet_incremental_consistency(False)
+
+    def test_openllet_incremental_switch(self):
+        from openllet.core import OpenlletOptions
+        previous = (OpenlletOptions.USE_COMPLETION_QUEUE, OpenlletOptions.USE_INCREMENTAL_CONSISTENCY,
+                    OpenlletOptions.USE_SMART_RESTORE)
+        SyncReasoner("KGs/Test/test_ontology.owl", reasoner="Pellet", incremental=True)
+        self.assertTrue(OpenlletOptions.USE_INCREMENTAL_CONSISTENCY)
+        set_openllet_incremental_consistency(False)
+        self.assertEqual((OpenlletOptions.USE_COMPLETION_QUEUE, OpenlletOptions.USE_INCREMENTAL_CONSISTENCY,
+                          OpenlletOptions.USE_SMART_RESTORE), previous)
+
+    def test_classification_snapshot(self):
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            onto = SyncOntology("KGs/Test/test_ontology.owl")
+            live = SyncReasoner(onto)
+            reasoner = SyncReasoner(onto, snapshot_dir=snapshot_dir)
+            self.assertIsNone(reasoner._snapshot)
+            reasoner.precompute()
+            self.assertEqual(len(os.listdir(snapshot_dir)), 1)
+
+            # a new reasoner over the same ontology file loads the snapshot instead of classifying, without hashing
+            # all axioms
+            with patch('owlapy.owl_reasoner._owlapi_ontology_hash', side_effect=AssertionError):
+                reasoner = SyncReasoner("KGs/Test/test_ontology.owl", snapshot_dir=snapshot_dir)
+            self.assertIsNotNone(reasoner._snapshot)
+            for direct in [True, False]:
+                for cls in [OWLThing, A, B, D, K, OWLNothing]:
+                    self.assertEqual(set(reasoner.sub_classes(cls, direct)), set(live.sub_classes(cls, direct)))
+                    self.assertEqual(set(reasoner.super_classes(cls, direct)), set(live.super_classes(cls, direct)))
+                for prop in [r1, r2, OWLTopObjectProperty]:
+                    self.assertEqual(set(reasoner.sub_object_properties(prop, direct)),
+                                     set(live.sub_object_properties(prop, direct)))
+                    self.assertEqual(set(reasoner.super_object_properties(prop, direct)),
+                                     set(live.super_object_properties(prop, direct)))
+                for prop in [dp1, dp2]:
+                    self.assertEqual(set(reasoner.sub_data_properties(prop, direct)),
+                                     set(live.sub_data_properties(prop, direct)))
+                    self.assertEqual(set(reasoner.super_data_properties(prop, direct)),
+                                     set(live.super_data_properties(prop, direct)))
+                for ind in [a, b, c, ind1]:
+                    self.assertEqual(set(reasoner.types(ind, direct)), set(live.types(ind, direct)))
+            self.assertEqual(set(reasoner.sub_classes(A, include_bottom_entity=True)),
+                             set(live.sub_classes(A, include_bottom_entity=True)))
+            self.assertEqual(set(reasoner.equivalent_classes(A)), set(live.equivalent_classes(A)))
+
+            # the snapshot is dropped once changes of the ontology are flushed
+            reasoner.ontology.add_axiom(OWLSubClassOfAxiom(A, B))
+            reasoner.flush()
+            self.assertIsNone(reasoner._snapshot)
+            self.assertIn(B, set(reasoner.super_classes(A)))
+            self.assertFalse(os.path.exists(reasoner._snapshot_path(_sync_ontology_key(reasoner.ontology))))
+
+            # an ontology changed in memory is matched by the hash of its axioms, even if the axiom count is the same
+            changed = SyncOntology("KGs/Test/test_ontology.owl")
+            file_key = _sync_ontology_key(changed)
+            changed.remove_axiom(next(iter(changed.get_tbox_axioms())))
+            changed.add_axiom(OWLSubClassOfAxiom(A, B))
+            self.assertEqual(changed.revision, 2)
+            self.assertNotEqual(_sync_ontology_key(changed), file_key)
+            self.assertEqual(_sync_ontology_key(changed), _owlapi_ontology_hash(changed.owlapi_ontology))
+            SyncReasoner(onto, snapshot_dir=snapshot_dir).precompute()
+            self.assertIsNone(SyncReasoner(changed, snapshot_dir=snapshot_dir)._snapshot)
+
+            # an ontology that was not loaded from a file is matched by the hash of its axioms
+            created = SyncOntology(IRI.create("http://example.com/snapshot"), load=False)
+            created.add_axiom(OWLSubClassOfAxiom(A, B))
+            self.assertEqual(_sync_ontology_key(created), _owlapi_ontology_hash(created.owlapi_ontology))
+
+    def test_ontology_hash(self):
+        import owlapy.owl_reasoner as owl_reasoner
+        first = SyncOntology("KGs/Test/test_ontology.owl")
+        second = SyncOntology("KGs/Test/test_ontology.owl")
+        digest = _owlapi_ontology_hash(first.owlapi_ontology)
+        self.assertEqual(_owlapi_ontology_hash(second.owlapi_ontology), digest)
+        # the hash is computed over several chunks of axioms
+        chunk = owl_reasoner._ONTOLOGY_HASH_CHUNK
+        try:
+            owl_reasoner._ONTOLOGY_HASH_CHUNK = 3
+            self.assertEqual(_owlapi_ontology_hash(first.owlapi_ontology),
+                             _owlapi_ontology_hash(second.owlapi_ontology))
+        finally:
+            owl_reasoner._ONTOLOGY_HASH_CHUNK = chunk
+        second.add_axiom(OWLSubClassOfAxiom(A, B))
+        self.assertNotEqual(_owlapi_ontology_hash(second.owlapi_ontology), digest)
+
     def test_entailment(self):
         self.assertTrue(reasoner2.is_entailed(OWLSubClassOfAxiom(sub_class=OWLClass(IRI('http://www.semanticweb.org/stefan/ontologies/2023/1/untitled-ontology-11#', 'D')), super_class=OWLClass(IRI('http://www.semanticweb.org/stefan/ontologies/2023/1/untitled-ontology-11#', 'B')), annotations=[])))
         self.assertFalse(reasoner2.is_entailed(OWLSubClassOfAxiom(sub_class=OWLClass(IRI('http://www.semanticweb.org/stefan/ontologies/2023/1/untitled-ontology-11#', 'B')), super_class=OWLClass(IRI('http://www.semanticweb.org/stefan/ontologies/2023/1/untitled-ontology-11#', 'D')), annotations=[])))
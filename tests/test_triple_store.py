@@ -0,0 +1,157 @@
+import os
+import tempfile
+import unittest
+from itertools import product
+
+import numpy as np
+import rdflib
+
+from owlapy.class_expression import OWLClass, OWLThing, OWLObjectSomeValuesFrom, OWLObjectComplementOf, \
+    OWLObjectMinCardinality, OWLObjectAllValuesFrom, OWLDataHasValue
+from owlapy.owl_individual import OWLNamedIndividual
+from owlapy.owl_literal import OWLLiteral
+from owlapy.owl_ontology import Ontology, TripleStoreOntology
+from owlapy.owl_property import OWLObjectProperty, OWLDataProperty
+from owlapy.owl_reasoner import StructuralReasoner
+from owlapy.triple_store import TripleStore, decode_literal, encode_term
+
+EX = rdflib.Namespace("http://example.com/store#")
+
+
+class TestTripleStore(unittest.TestCase):
+    triples = [(EX.a, EX.knows, EX.b), (EX.a, EX.knows, EX.c), (EX.b, EX.knows, EX.c), (EX.c, EX.knows, EX.a),
+               (EX.a, rdflib.RDF.type, EX.Person), (EX.a, EX.knows, EX.b),
+               (EX.a, EX.name, rdflib.Literal('say "hi"\nagain')), (EX.a, EX.age, rdflib.Literal(30)),
+               (EX.b, EX.name, rdflib.Literal("B", lang="en")), (EX.a, EX.friend, rdflib.BNode("x")),
+               (rdflib.BNode("x"), EX.knows, EX.c)]
+
+    def test_match(self):
+        store = TripleStore.from_rdf(self.triples)
+        encoded = {tuple(store.id_of(encode_term(n)) if not isinstance(n, rdflib.BNode) else -1 for n in t)
+                   for t in self.triples}
+        # duplicates are removed
+        self.assertEqual(len(store), len(set(self.triples)))
+        ids = [None, *range(len(store.terms))]
+        for s, p, o in product(ids, ids, ids):
+            expected = {(s_, p_, o_) for s_, p_, o_ in zip(*store.match()) if (s is None or s == s_) and
+                        (p is None or p == p_) and (o is None or o == o_)}
+            self.assertEqual(set(zip(*(a.tolist() for a in store.match(s, p, o)))), expected)
+        # all triples without blank nodes are found with their ids
+        self.assertTrue({t for t in encoded if -1 not in t} <= set(zip(*(a.tolist() for a in store.match()))))
+
+    def test_terms(self):
+        store = TripleStore.from_rdf(self.triples)
+        terms = [store.term(i) for i in range(len(store.terms))]
+        self.assertEqual(terms, sorted(terms))
+        self.assertIn("_:b0", terms)
+        self.assertEqual(decode_literal(encode_term(rdflib.Literal('say "hi"\nagain'))), ('say "hi"\nagain', None, None))
+        self.assertEqual(decode_literal(encode_term(rdflib.Literal("B", lang="en"))), ("B", None, "en"))
+        self.assertEqual(decode_literal(encode_term(rdflib.Literal(30))), ("30", str(rdflib.XSD.integer), None))
+        ids = np.arange(len(store.terms))
+        self.assertEqual([store.term(i) for i in ids[store.is_literal(ids)]],
+                         [t for t in terms if t.startswith('"')])
+        self.assertEqual([store.term(i) for i in ids[store.is_iri(ids)]],
+                         [t for t in terms if not t.startswith('"') and not t.startswith("_:")])
+        self.assertIsNone(store.id_of(EX.unknown))
+        self.assertEqual(store.term(store.id_of(EX.a)), str(EX.a))
+
+    def test_save_load(self):
+        store = TripleStore.from_rdf(self.triples)
+        with tempfile.TemporaryDirectory() as tmp:
+            store.save(tmp)
+            for mmap in (True, False):
+                loaded = TripleStore.load(tmp, mmap=mmap)
+                self.assertEqual(isinstance(loaded.spo, np.memmap), mmap)
+                self.assertEqual(loaded.content_hash(), store.content_hash())
+                for a, b in zip(loaded.match(p=store.id_of(EX.knows)), store.match(p=store.id_of(EX.knows))):
+                    np.testing.assert_array_equal(a, b)
+                self.assertEqual([loaded.term(i) for i in range(len(loaded.terms))],
+                                 [store.term(i) for i in range(len(store.terms))])
+                del loaded
+        # the same document gives the same store
+        self.assertEqual(TripleStore.from_rdf(self.triples).content_hash(), store.content_hash())
+
+
+class TestTripleStoreOntology(unittest.TestCase):
+    ns = "http://example.com/father#"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, "father.nt")
+        rdflib.Graph().parse("KGs/Family/father.owl").serialize(cls.path, format="nt", encoding="utf-8")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_signature_and_axioms(self):
+        onto = TripleStoreOntology(self.path)
+        ref = Ontology("KGs/Family/father.owl")
+        self.assertEqual(set(onto.classes_in_signature()), set(ref.classes_in_signature()))
+        self.assertEqual(set(onto.individuals_in_signature()), set(ref.individuals_in_signature()))
+        self.assertEqual(set(onto.object_properties_in_signature()), set(ref.object_properties_in_signature()))
+        self.assertEqual(onto.get_ontology_id(), ref.get_ontology_id())
+        has_child = OWLObjectProperty(self.ns + "hasChild")
+        self.assertEqual(set(onto.object_property_domain_axioms(has_child)),
+                         set(ref.object_property_domain_axioms(has_child)))
+        self.assertEqual(len(list(onto.get_abox_axioms())), 10)
+        with self.assertRaises(NotImplementedError):
+            onto.add_axiom(next(iter(onto.get_abox_axioms())))
+        with self.assertRaises(ValueError):
+            TripleStoreOntology("KGs/Family/father.owl")
+
+    def test_tbox_axioms(self):
+        onto = TripleStoreOntology(self.path)
+        ref = Ontology("KGs/Family/father.owl")
+        self.assertCountEqual(list(onto.get_tbox_axioms()), list(ref.get_tbox_axioms()))
+        self.assertCountEqual(list(onto.get_abox_axioms()), list(ref.get_abox_axioms()))
+
+    def test_structural_reasoner(self):
+        male, female, person = (OWLClass(self.ns + c) for c in ("male", "female", "person"))
+        has_child = OWLObjectProperty(self.ns + "hasChild")
+        ces = [male, female, person, OWLThing, OWLObjectSomeValuesFrom(has_child, female),
+               OWLObjectComplementOf(OWLObjectSomeValuesFrom(has_child, OWLThing)),
+               OWLObjectMinCardinality(2, has_child, OWLThing), OWLObjectAllValuesFrom(has_child, male),
+               OWLObjectSomeValuesFrom(has_child.get_inverse_property(), male)]
+        ref = StructuralReasoner(Ontology("KGs/Family/father.owl"))
+        with tempfile.TemporaryDirectory() as tmp:
+            TripleStoreOntology(self.path).save(tmp)
+            for onto in (TripleStoreOntology(self.path), TripleStoreOntology(tmp)):
+                for kwargs in (dict(), dict(csr_index=True), dict(bitset_retrieval=True), dict(property_cache=False),
+                               dict(sub_properties=True)):
+                    reasoner = StructuralReasoner(onto, **kwargs)
+                    for ce in ces:
+                        self.assertEqual(set(reasoner.instances(ce)), set(ref.instances(ce)), (ce, kwargs))
+                for c in (male, person, OWLThing):
+                    for direct in (True, False):
+                        self.assertEqual(set(reasoner.sub_classes(c, direct=direct)),
+                                         set(ref.sub_classes(c, direct=direct)))
+                        self.assertEqual(set(reasoner.super_classes(c, direct=direct)),
+                                         set(ref.super_classes(c, direct=direct)))
+                for ind in onto.individuals_in_signature():
+                    self.assertEqual(set(reasoner.types(ind)), set(ref.types(ind)))
+                    self.assertEqual(set(reasoner.types(ind, direct=True)), set(ref.types(ind, direct=True)))
+                    self.assertEqual(set(reasoner.object_property_values(ind, has_child)),
+                                     set(ref.object_property_values(ind, has_child)))
+                del onto, reasoner
+
+    def test_data_properties(self):
+        path = os.path.join(self.tmp.name, "data.nt")
+        g = rdflib.Graph()
+        age = rdflib.URIRef(self.ns + "age")
+        g.add((age, rdflib.RDF.type, rdflib.OWL.DatatypeProperty))
+        g.add((rdflib.URIRef(self.ns + "anna"), rdflib.RDF.type, rdflib.OWL.NamedIndividual))
+        g.add((rdflib.URIRef(self.ns + "anna"), age, rdflib.Literal(7)))
+        g.add((rdflib.URIRef(self.ns + "anna"), age, rdflib.Literal("1.5", datatype=rdflib.XSD.decimal)))
+        g.serialize(path, format="nt", encoding="utf-8")
+        reasoner = StructuralReasoner(TripleStoreOntology(path))
+        anna = OWLNamedIndividual(self.ns + "anna")
+        self.assertEqual(set(reasoner.data_property_values(anna, OWLDataProperty(self.ns + "age"))),
+                         {OWLLiteral(7), OWLLiteral(1.5)})
+        self.assertEqual(set(reasoner.instances(OWLDataHasValue(OWLDataProperty(self.ns + "age"), OWLLiteral(7)))),
+                         {anna})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,7 +23,8 @@ from owlapy.utils import (
     concept_reducer_properties, OWLClassExpressionLengthMetric, get_expression_length,
     EvaluatedDescriptionSet, _avoid_overly_redundand_operands, _sort_by_ordered_owl_object,
     get_top_level_cnf, get_top_level_dnf, get_remaining, factor_nary_expression,
-    _factor_negation_outof_oneofs, OrderedOWLObject
+    _factor_negation_outof_oneofs, OrderedOWLObject, check_timeout, timeout_executor_info, QueryTimeoutError,
+    set_timeout_executor_max_workers
 )
 
 # Test namespaces
@@ -123,6 +124,57 @@ class TestRunWithTimeout(unittest.TestCase):
 
         result = run_with_timeout(slow_func, 0.1, args=())
         self.assertEqual(result, set())
+        self.assertTrue(result.timed_out)
+
+    def test_run_with_timeout_cooperative_cancellation(self):
+        """Test that check_timeout stops a task once its deadline has passed"""
+        stopped = []
+
+        def cooperative_func():
+            try:
+                while True:
+                    check_timeout()
+                    time.sleep(0.01)
+            except QueryTimeoutError:
+                stopped.append(True)
+                raise
+
+        timed_out = timeout_executor_info().timed_out
+        result = run_with_timeout(cooperative_func, 0.1)
+        self.assertEqual(result, set())
+        self.assertEqual(timeout_executor_info().timed_out, timed_out + 1)
+        time.sleep(0.2)
+        self.assertEqual(stopped, [True])
+        # outside of a task there is no deadline
+        check_timeout()
+
+    def test_run_with_timeout_reuses_threads(self):
+        """Test that the worker threads are shared between calls"""
+        import threading
+        threads = {run_with_timeout(threading.get_ident, 1.0) for _ in range(20)}
+        self.assertLessEqual(len(threads), timeout_executor_info().max_workers or 32)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_run_with_timeout_replaces_stuck_workers(self):
+        """Test that tasks ignoring check_timeout do not block the pool after their timeout"""
+        import threading
+        release = threading.Event()
+        set_timeout_executor_max_workers(2)
+        try:
+            for _ in range(4):
+                self.assertTrue(run_with_timeout(release.wait, 0.05).timed_out)
+            self.assertEqual(timeout_executor_info().stuck, 4)
+            self.assertEqual(timeout_executor_info().max_workers, 2)
+            self.assertEqual(run_with_timeout(lambda: "done", 1.0), "done")
+            release.set()
+            time.sleep(0.1)
+            # the replacement workers stop once the stuck tasks return
+            self.assertEqual(timeout_executor_info().stuck, 0)
+            workers = [t for t in threading.enumerate() if t.name.startswith("owlapy-timeout")]
+            self.assertLessEqual(len(workers), 2)
+        finally:
+            release.set()
+            set_timeout_executor_max_workers(None)
 
 
 class TestConceptReducer(unittest.TestCase):
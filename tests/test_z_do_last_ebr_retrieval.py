@@ -283,6 +283,14 @@ class TestEmbeddingBasedReasonerRetrieval:
         print(f"Average Jaccard Similarity: {avg_jaccard:.4f}")
         print(f"Average F1 Score: {avg_f1:.4f}")
 
+    def test_instances_batch(self):
+        """Batched retrieval returns the same instances as one instances() call per concept."""
+        concepts = list(chain(self.nc, self.nnc, self.exist_nc_star, self.for_all_nc_star,
+                              self.min_cardinality_nc_star, self.max_cardinality_nc_star))
+        expected = [frozenset(self.neural_owl_reasoner.instances(ce)) for ce in concepts]
+        assert self.neural_owl_reasoner.instances_batch(concepts) == expected
+        assert self.neural_owl_reasoner.count_instances_batch(concepts) == [len(inds) for inds in expected]
+
 
 class TestNeuralOntologyPredictMissingEmbeddings:
     """Unit tests for NeuralOntology.predict with missing relations/entities.
@@ -405,4 +413,23 @@ class TestNeuralOntologyPredictMissingEmbeddings:
         )
         assert "http://example.org/unknownEntity" not in filtered_h, (
             "Unknown entity must be filtered out before calling predict_topk"
-        )
\ No newline at end of file
+        )
+
+    def test_predict_batch_splits_rows_per_query(self):
+        """predict_batch() must send all known queries in one predict_topk call and return one row per query."""
+        ontology = self._make_neural_ontology()
+        ontology.model.predict_topk.return_value = [[("http://example.org/alice", 0.9)],
+                                                    [("http://example.org/Person", 0.1)]]
+        type_ = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
+        rows = ontology.predict_batch(
+            h=None,
+            r=[type_, "http://example.org/hasCovering", type_],
+            t=["http://example.org/Person", "http://example.org/Person", "http://example.org/alice"],
+        )
+        ontology.model.predict_topk.assert_called_once()
+        call_kwargs = ontology.model.predict_topk.call_args.kwargs
+        assert call_kwargs["h"] is None
+        assert call_kwargs["r"] == [type_, type_]
+        assert call_kwargs["t"] == ["http://example.org/Person", "http://example.org/alice"]
+        # the unknown relation gets an empty row, scores below gamma are dropped
+        assert rows == [[("http://example.org/alice", 0.9)], [], []]